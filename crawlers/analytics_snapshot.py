@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Local analytical snapshot of the core tables for audit and report scripts.
+
+Audit/report tools (coverage_audit.py, data_health.py, festival_audit*.py,
+scripts/audit_*) page whole tables out of Supabase on every run.  ``export``
+copies events, places, sources, series and crawl_logs to local files once and
+then incrementally: each run fetches only rows changed since the table's
+watermark (``updated_at``; ``started_at`` with a lookback for crawl_logs) and
+appends them as a new part.  Reports read the snapshot instead of production,
+finish in seconds, can be rerun freely, and two snapshot directories can be
+diffed to see what a crawl changed.
+
+Layout (``.cache/analytics_snapshot`` by default)::
+
+    manifest.json                         per-table watermark + part counter
+    events/month=2026-05/part-000003-000.parquet
+    places/all/part-000001-000.parquet
+    ...
+
+Parts are Parquet when pyarrow is installed, gzip JSON lines otherwise.  Rows
+carry a ``_seq`` part number; readers keep the highest-``_seq`` copy of each
+id, so an event that moved to another month is read once.  ``compact`` folds
+a table's parts back into one per partition.  Hard deletes are not captured —
+the crawlers deactivate rows (``is_active``) rather than deleting them.
+
+Query layer:
+    snap = Snapshot()
+    for row in snap.rows("events", "id,start_date,category_id",
+                         [("gte", ("start_date", today))]):
+        ...
+    snap.sql("SELECT category_id, count(*) FROM events GROUP BY 1")  # needs duckdb
+
+Usage:
+    python3 analytics_snapshot.py export            # incremental
+    python3 analytics_snapshot.py export --full     # rebuild from scratch
+    python3 analytics_snapshot.py compact
+    python3 analytics_snapshot.py diff OLD_DIR NEW_DIR --table events
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import importlib.util
+import json
+import logging
+import shutil
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+
+from db.table_reader import Filter, iter_pages
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path(__file__).parent / ".cache" / "analytics_snapshot"
+MANIFEST_NAME = "manifest.json"
+UNPARTITIONED = "all"
+# Rows buffered per partition before a part file is written.
+PART_ROWS = 50_000
+
+
+@dataclass(frozen=True)
+class SnapshotTable:
+    name: str
+    watermark: Optional[str] = "updated_at"  # None: small table, re-exported in full
+    partition_by: Optional[str] = None  # date/timestamp column -> month=YYYY-MM
+    lookback: timedelta = timedelta(0)  # re-read window for rows updated without a bump
+
+
+TABLES = {
+    t.name: t
+    for t in (
+        SnapshotTable("events", partition_by="start_date"),
+        SnapshotTable("places"),
+        SnapshotTable("sources", watermark=None),
+        SnapshotTable("series"),
+        # Runs are written at start and updated on completion; re-read a day.
+        SnapshotTable(
+            "crawl_logs",
+            watermark="started_at",
+            partition_by="started_at",
+            lookback=timedelta(days=1),
+        ),
+    )
+}
+
+
+def _has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _partition(value: Any) -> str:
+    text = str(value or "")
+    return f"month={text[:7]}" if len(text) >= 7 else "month=unknown"
+
+
+def _flatten(value: Any) -> Any:
+    # jsonb objects vary in shape row to row; store them as JSON text so
+    # Parquet parts share a schema.
+    if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(v, dict) for v in value)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# Part files
+# ---------------------------------------------------------------------------
+
+
+def _write_part(directory: Path, seq: int, rows: list[dict]) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    chunk = len(list(directory.glob(f"part-{seq:06d}-*")))
+    stem = f"part-{seq:06d}-{chunk:03d}"
+    rows = [{**{k: _flatten(v) for k, v in row.items()}, "_seq": seq} for row in rows]
+    if _has_pyarrow():
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = directory / f"{stem}.parquet"
+        pq.write_table(pa.Table.from_pylist(rows), path)
+    else:
+        path = directory / f"{stem}.jsonl.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=str))
+                f.write("\n")
+    return path
+
+
+def _read_part(path: Path, columns: Optional[Sequence[str]] = None) -> Iterator[dict]:
+    if path.name.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        if columns:
+            table = table.select([c for c in columns if c in table.column_names])
+        yield from table.to_pylist()
+        return
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            yield {c: row.get(c) for c in columns} if columns else row
+
+
+def _parts(table_dir: Path) -> list[Path]:
+    parts = [p for p in table_dir.glob("*/part-*") if p.name.endswith((".parquet", ".jsonl.gz"))]
+    return sorted(parts, key=lambda p: p.name)
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+
+def load_manifest(root: Path) -> dict:
+    try:
+        with open(root / MANIFEST_NAME) as f:
+            return json.load(f) or {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(root: Path, manifest: dict) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    tmp = root / f"{MANIFEST_NAME}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    tmp.replace(root / MANIFEST_NAME)
+
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+
+
+def export_table(
+    spec: SnapshotTable,
+    root: Path = SNAPSHOT_DIR,
+    full: bool = False,
+    client=None,
+    page_size: int = 1000,
+) -> int:
+    """Append rows changed since the table's watermark; returns rows written."""
+    manifest = load_manifest(root)
+    state = manifest.get(spec.name) or {}
+    table_dir = root / spec.name
+    run_started = datetime.now(timezone.utc)
+
+    since = None if full or spec.watermark is None else state.get("watermark")
+    if since is None and table_dir.exists():
+        shutil.rmtree(table_dir)
+        state = {}
+
+    filters: list[Filter] = []
+    if since:
+        cutoff = datetime.fromisoformat(since) - spec.lookback
+        filters.append(("gte", (spec.watermark, cutoff.isoformat())))
+
+    seq = int(state.get("seq") or 0) + 1
+    buffers: dict[str, list[dict]] = {}
+    written = 0
+    wrote_parts = False
+    for page in iter_pages(spec.name, "*", filters, page_size=page_size, client=client):
+        for row in page:
+            key = _partition(row.get(spec.partition_by)) if spec.partition_by else UNPARTITIONED
+            rows = buffers.setdefault(key, [])
+            rows.append(row)
+            if len(rows) >= PART_ROWS:
+                _write_part(table_dir / key, seq, buffers.pop(key))
+                wrote_parts = True
+        written += len(page)
+    for key, rows in buffers.items():
+        _write_part(table_dir / key, seq, rows)
+        wrote_parts = True
+
+    manifest[spec.name] = {
+        "watermark": run_started.isoformat() if spec.watermark else None,
+        "seq": seq if wrote_parts else seq - 1,
+        "exported_at": run_started.isoformat(),
+        "last_rows": written,
+    }
+    save_manifest(root, manifest)
+    logger.info(
+        f"{spec.name}: {written} rows "
+        + (f"changed since {since}" if since else "(full export)")
+    )
+    return written
+
+
+def export_snapshot(
+    tables: Iterable[str] = TABLES,
+    root: Path = SNAPSHOT_DIR,
+    full: bool = False,
+    client=None,
+) -> dict[str, int]:
+    return {name: export_table(TABLES[name], root, full=full, client=client) for name in tables}
+
+
+def compact_table(name: str, root: Path = SNAPSHOT_DIR) -> int:
+    """Rewrite a table as one part per partition holding the latest rows."""
+    snap = Snapshot(root)
+    rows = list(snap.rows(name))
+    manifest = load_manifest(root)
+    state = manifest.get(name) or {}
+    seq = int(state.get("seq") or 0) + 1
+    spec = TABLES[name]
+
+    table_dir = root / name
+    staging = root / f".{name}.compact"
+    if staging.exists():
+        shutil.rmtree(staging)
+    buffers: dict[str, list[dict]] = {}
+    for row in rows:
+        row.pop("_seq", None)
+        key = _partition(row.get(spec.partition_by)) if spec.partition_by else UNPARTITIONED
+        buffers.setdefault(key, []).append(row)
+    for key, part_rows in buffers.items():
+        _write_part(staging / key, seq, part_rows)
+    if table_dir.exists():
+        shutil.rmtree(table_dir)
+    if staging.exists():
+        staging.replace(table_dir)
+
+    manifest[name] = {**state, "seq": seq}
+    save_manifest(root, manifest)
+    return len(rows)
+
+
+# ---------------------------------------------------------------------------
+# Query layer
+# ---------------------------------------------------------------------------
+
+_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda v, x: v == x,
+    "neq": lambda v, x: v != x,
+    "gt": lambda v, x: v is not None and v > x,
+    "gte": lambda v, x: v is not None and v >= x,
+    "lt": lambda v, x: v is not None and v < x,
+    "lte": lambda v, x: v is not None and v <= x,
+    "in_": lambda v, x: v in x,
+    "is_": lambda v, x: v is None if x in (None, "null") else v is x,
+}
+
+
+def _comparable(value: Any) -> Any:
+    # Snapshot values are JSON scalars; compare dates as their ISO text.
+    return value.isoformat() if isinstance(value, (date, datetime)) else value
+
+
+def _matcher(filters: Iterable[Filter]) -> Callable[[dict], bool]:
+    checks = []
+    for method, args in filters:
+        op = _OPS.get(method)
+        if op is None:
+            raise ValueError(f"Unsupported snapshot filter: {method}")
+        column, operand = args
+        if method == "in_":
+            operand = {_comparable(x) for x in operand}
+        else:
+            operand = _comparable(operand)
+        checks.append((column, op, operand))
+    return lambda row: all(op(row.get(col), operand) for col, op, operand in checks)
+
+
+class Snapshot:
+    """Read-only view of an exported snapshot directory."""
+
+    def __init__(self, root: Path = SNAPSHOT_DIR):
+        self.root = Path(root)
+        self.manifest = load_manifest(self.root)
+
+    def tables(self) -> list[str]:
+        return sorted(p.name for p in self.root.iterdir() if p.is_dir() and not p.name.startswith("."))
+
+    def rows(
+        self,
+        table: str,
+        select: str = "*",
+        filters: Iterable[Filter] = (),
+        where: Optional[Callable[[dict], bool]] = None,
+    ) -> Iterator[dict]:
+        """Latest copy of each row, optionally projected and filtered.
+
+        ``filters`` takes the same ``(method, args)`` tuples as
+        ``db.table_reader`` (eq/neq/gt/gte/lt/lte/in_/is_); ``where`` is a
+        predicate over the selected columns for anything else.
+        """
+        table_dir = self.root / table
+        if not table_dir.is_dir():
+            raise FileNotFoundError(f"No snapshot of {table} in {self.root} (run analytics_snapshot.py export)")
+        filters = list(filters)
+        columns = read_columns = None
+        if select.strip() != "*":
+            # id is always projected, as with db.table_reader.
+            columns = list(dict.fromkeys(["id", *(c.strip() for c in select.split(",") if c.strip())]))
+            read_columns = list(dict.fromkeys([*columns, *(args[0] for _method, args in filters)]))
+
+        latest: dict[Any, dict] = {}
+        for part in _parts(table_dir):
+            for row in _read_part(part, read_columns):
+                latest[row.get("id")] = row
+        match = _matcher(filters)
+        for row in latest.values():
+            if not match(row) or (where is not None and not where(row)):
+                continue
+            if columns is None:
+                row.pop("_seq", None)
+                yield row
+            else:
+                yield {c: row.get(c) for c in columns}
+
+    def by_id(self, table: str, select: str = "*") -> dict[Any, dict]:
+        return {row["id"]: row for row in self.rows(table, select)}
+
+    def sql(self, query: str) -> list[dict]:
+        """Run SQL with each snapshot table available as a view (requires duckdb)."""
+        try:
+            import duckdb
+        except ImportError as exc:
+            raise ImportError("Snapshot.sql requires duckdb (pip install duckdb)") from exc
+        con = duckdb.connect()
+        for table in self.tables():
+            parts = _parts(self.root / table)
+            if not parts:
+                continue
+            if parts[0].name.endswith(".parquet"):
+                reader = f"read_parquet('{self.root / table}/*/part-*.parquet', union_by_name=true)"
+            else:
+                reader = (
+                    f"read_json_auto('{self.root / table}/*/part-*.jsonl.gz', "
+                    f"format='newline_delimited', union_by_name=true)"
+                )
+            con.execute(
+                f"CREATE VIEW {table} AS SELECT * EXCLUDE (_seq) FROM {reader} "
+                f"QUALIFY row_number() OVER (PARTITION BY id ORDER BY _seq DESC) = 1"
+            )
+        cursor = con.execute(query)
+        names = [d[0] for d in cursor.description]
+        return [dict(zip(names, values)) for values in cursor.fetchall()]
+
+
+def diff_snapshots(old_root: Path, new_root: Path, table: str, select: str = "*") -> dict:
+    """Rows added, removed and changed between two snapshot directories."""
+    old = Snapshot(old_root).by_id(table, select)
+    new = Snapshot(new_root).by_id(table, select)
+    changed = [key for key in old.keys() & new.keys() if old[key] != new[key]]
+    return {
+        "added": sorted(new.keys() - old.keys(), key=str),
+        "removed": sorted(old.keys() - new.keys(), key=str),
+        "changed": sorted(changed, key=str),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Local analytical snapshot of core tables.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_p = sub.add_parser("export", help="Export changed rows since the last run")
+    export_p.add_argument("--dir", default=str(SNAPSHOT_DIR))
+    export_p.add_argument("--table", action="append", choices=sorted(TABLES))
+    export_p.add_argument("--full", action="store_true", help="Discard and re-export from scratch")
+
+    compact_p = sub.add_parser("compact", help="Fold incremental parts into one per partition")
+    compact_p.add_argument("--dir", default=str(SNAPSHOT_DIR))
+    compact_p.add_argument("--table", action="append", choices=sorted(TABLES))
+
+    diff_p = sub.add_parser("diff", help="Compare two snapshot directories")
+    diff_p.add_argument("old_dir")
+    diff_p.add_argument("new_dir")
+    diff_p.add_argument("--table", default="events", choices=sorted(TABLES))
+    diff_p.add_argument("--select", default="*", help="Columns to compare (default: all)")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "export":
+        counts = export_snapshot(args.table or TABLES, Path(args.dir), full=args.full)
+        for name, count in counts.items():
+            print(f"{name:<12} {count:>8} rows written")
+    elif args.command == "compact":
+        for name in args.table or TABLES:
+            if (Path(args.dir) / name).is_dir():
+                print(f"{name:<12} {compact_table(name, Path(args.dir)):>8} rows")
+    else:
+        result = diff_snapshots(Path(args.old_dir), Path(args.new_dir), args.table, args.select)
+        for kind in ("added", "removed", "changed"):
+            ids = result[kind]
+            sample = ", ".join(str(i) for i in ids[:10])
+            print(f"{kind:<8} {len(ids):>7}" + (f"  e.g. {sample}" if ids else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
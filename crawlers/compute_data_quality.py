@@ -5,18 +5,27 @@ Compute per-record data_quality scores (0-100) for all entity tables.
 Scores are deterministic, based on field completeness with weighted scoring.
 Higher scores = richer records suitable for feed promotion, search ranking, etc.
 
+Scores are COPYed into a temp table and applied with one set-based UPDATE;
+incremental runs only rescore rows updated since the last run's watermark.
+The insert pipeline scores single events through score_event().
+
 Usage:
     python3 compute_data_quality.py              # All tables
     python3 compute_data_quality.py --table venues  # Single table
     python3 compute_data_quality.py --dry-run     # Preview without writing
+    python3 compute_data_quality.py --incremental # Only rows updated since last run
+    python3 compute_data_quality.py --table events --ids 12,34  # Specific rows
 """
 
+import io
+import json
 import os
 import sys
 import argparse
 import logging
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, Optional
 
 import psycopg2
 import psycopg2.extras
@@ -25,7 +34,9 @@ from dotenv import load_dotenv
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 sys.path.insert(0, str(Path(__file__).parent))
+from config import get_config
 from db import get_client
+from db.table_reader import iter_rows
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -145,166 +156,204 @@ def score_record(record: dict, weights: Dict[str, int]) -> int:
     return min(score, 100)
 
 
-def fetch_all(client, table: str, select: str, extra_filters=None) -> list:
-    """Fetch all records from a table with pagination."""
-    all_records = []
-    offset = 0
-    batch_size = 1000
-    while True:
-        q = client.table(table).select(select)
-        if extra_filters:
-            for method, args in extra_filters:
-                q = getattr(q, method)(*args)
-        q = q.order("id").range(offset, offset + batch_size - 1)
-        r = q.execute()
-        if not r.data:
-            break
-        all_records.extend(r.data)
-        if len(r.data) < batch_size:
-            break
-        offset += batch_size
-    return all_records
-
-
-def update_scores(client, table: str, scores: Dict[str, int], dry_run: bool = False):
-    """Batch-update data_quality scores via direct Postgres for speed."""
-    if dry_run:
-        return
+def score_event(record: dict) -> int:
+    """Score one event row or insert payload.
 
-    database_url = os.environ.get("DATABASE_URL")
+    Shared by the insert pipeline (``_step_data_quality``, smart updates) and
+    the nightly table pass so both always agree.  Accepts either the pipeline's
+    ``category`` key or the DB's ``category_id`` column.
+    """
+    if "category_id" in record and "category" not in record:
+        record = {**record, "category": record["category_id"]}
+    return score_record(record, EVENT_WEIGHTS)
+
+
+# table -> (weights, scorer, DB columns needed to score a row)
+TABLE_SPECS = {
+    "venues": (VENUE_WEIGHTS, None, list(VENUE_WEIGHTS.keys())),
+    "events": (
+        EVENT_WEIGHTS,
+        score_event,
+        # DB column is category_id, but EVENT_WEIGHTS uses "category";
+        # title feeds the title-as-description penalty.
+        [f if f != "category" else "category_id" for f in EVENT_WEIGHTS.keys()] + ["title"],
+    ),
+    "series": (SERIES_WEIGHTS, None, list(SERIES_WEIGHTS.keys())),
+    "festivals": (FESTIVAL_WEIGHTS, None, list(FESTIVAL_WEIGHTS.keys())),
+    "organizations": (ORG_WEIGHTS, None, list(ORG_WEIGHTS.keys())),
+}
+
+WATERMARK_PATH = Path(__file__).parent / ".cache" / "data_quality_watermarks.json"
+
+# IN-list size for changed-ID fetches (keeps PostgREST URLs short)
+_ID_CHUNK_SIZE = 200
+
+
+def fetch_all(client, table: str, select: str, extra_filters=None) -> Iterator[dict]:
+    """Stream all matching records, keyset-paginated by id."""
+    return iter_rows(table, select, extra_filters or (), client=client)
+
+
+def fetch_changed(
+    client,
+    table: str,
+    select: str,
+    since: Optional[str] = None,
+    ids: Optional[Iterable] = None,
+) -> Iterator[dict]:
+    """Stream only rows whose inputs may have changed.
+
+    ``ids`` (e.g. the event IDs touched by a crawl) wins over ``since``; with
+    neither, this is a full-table fetch.
+    """
+    if ids is not None:
+        id_list = sorted(set(ids), key=str)
+        for i in range(0, len(id_list), _ID_CHUNK_SIZE):
+            chunk = id_list[i:i + _ID_CHUNK_SIZE]
+            yield from fetch_all(client, table, select, [("in_", ("id", chunk))])
+    elif since:
+        yield from fetch_all(client, table, select, [("gte", ("updated_at", since))])
+    else:
+        yield from fetch_all(client, table, select)
+
+
+def load_watermark(table: str, path: Optional[Path] = None) -> Optional[str]:
+    """Return the ISO timestamp of the last successful incremental run."""
+    path = path or WATERMARK_PATH
+    try:
+        with open(path) as f:
+            return (json.load(f) or {}).get(table)
+    except (OSError, ValueError):
+        return None
+
+
+def save_watermark(table: str, value: str, path: Optional[Path] = None) -> None:
+    path = path or WATERMARK_PATH
+    try:
+        with open(path) as f:
+            data = json.load(f) or {}
+    except (OSError, ValueError):
+        data = {}
+    data[table] = value
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+    except OSError as e:
+        logger.warning(f"Could not save data_quality watermark: {e}")
+
+
+def _database_url() -> str:
+    database_url = get_config().database.active_database_url or os.environ.get("DATABASE_URL")
     if not database_url:
         raise RuntimeError("DATABASE_URL not set")
+    return database_url
 
-    conn = psycopg2.connect(database_url)
-    cur = conn.cursor()
-
-    # Use executemany with batched updates for efficiency
-    items = list(scores.items())
-    batch_size = 500
-    for i in range(0, len(items), batch_size):
-        batch = items[i:i+batch_size]
-        psycopg2.extras.execute_batch(
-            cur,
-            f"UPDATE {table} SET data_quality = %s WHERE id = %s",
-            [(score, record_id) for record_id, score in batch],
-            page_size=100,
-        )
-        conn.commit()
 
-    cur.close()
-    conn.close()
+def update_scores(client, table: str, scores: Dict[str, int], dry_run: bool = False) -> int:
+    """Apply data_quality scores with one set-based UPDATE via direct Postgres.
 
+    Scores are COPYed into a temp table shaped like ``table`` and applied with
+    a single ``UPDATE ... FROM``.  Rows whose score didn't change are left
+    untouched.  Returns the number of rows updated.
+    """
+    if dry_run or not scores:
+        return 0
+
+    buf = io.StringIO()
+    for record_id, score in scores.items():
+        buf.write(f"{record_id}\t{int(score)}\n")
+    buf.seek(0)
+
+    conn = psycopg2.connect(_database_url())
+    try:
+        with conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"CREATE TEMP TABLE _dq_scores ON COMMIT DROP AS "
+                    f"SELECT id, data_quality AS score FROM {table} WITH NO DATA"
+                )
+                cur.copy_expert("COPY _dq_scores (id, score) FROM STDIN", buf)
+                cur.execute(
+                    f"UPDATE {table} AS t SET data_quality = s.score "
+                    f"FROM _dq_scores AS s "
+                    f"WHERE t.id = s.id AND t.data_quality IS DISTINCT FROM s.score"
+                )
+                return cur.rowcount
+    finally:
+        conn.close()
+
+
+def compute_table(
+    client,
+    table: str,
+    dry_run: bool = False,
+    incremental: bool = False,
+    ids: Optional[Iterable] = None,
+) -> dict:
+    """Compute and store quality scores for one table.
+
+    Args:
+        incremental: Only rescore rows updated since the stored watermark;
+            the watermark advances after a successful non-dry run.
+        ids: Only rescore these rows (e.g. IDs changed by a crawl).
+    """
+    weights, scorer, columns = TABLE_SPECS[table]
+    scorer = scorer or (lambda r: score_record(r, weights))
+    fields = ",".join(["id"] + list(dict.fromkeys(columns)))
 
-def compute_venues(client, dry_run: bool = False) -> dict:
-    """Compute and store venue quality scores."""
-    fields = ",".join(["id"] + list(VENUE_WEIGHTS.keys()))
-    records = fetch_all(client, "venues", fields)
-    logger.info(f"Venues: scoring {len(records)} records")
+    since = load_watermark(table) if incremental and ids is None else None
+    run_started = datetime.now(timezone.utc).isoformat()
+    scope = f" (updated since {since})" if since else (" (changed IDs)" if ids is not None else "")
 
     scores = {}
     distribution = {0: 0, 25: 0, 50: 0, 75: 0, 90: 0}
 
-    for r in records:
-        s = score_record(r, VENUE_WEIGHTS)
+    count = 0
+    for r in fetch_changed(client, table, fields, since=since, ids=ids):
+        count += 1
+        s = scorer(r)
         scores[r["id"]] = s
         for threshold in sorted(distribution.keys(), reverse=True):
             if s >= threshold:
                 distribution[threshold] += 1
                 break
 
-    update_scores(client, "venues", scores, dry_run)
-    return {"count": len(records), "scores": scores, "distribution": distribution}
-
+    logger.info(f"{table.capitalize()}: scored {count} records{scope}")
+    updated = update_scores(client, table, scores, dry_run)
+    if incremental and ids is None and not dry_run:
+        save_watermark(table, run_started)
+    return {
+        "count": count,
+        "updated": updated,
+        "scores": scores,
+        "distribution": distribution,
+    }
 
-def compute_events(client, dry_run: bool = False) -> dict:
-    """Compute and store event quality scores."""
-    # DB column is category_id, but EVENT_WEIGHTS uses "category"
-    db_fields = [f if f != "category" else "category_id" for f in EVENT_WEIGHTS.keys()]
-    # Include title for title-as-description penalty check
-    extra_fields = {"title"} - set(db_fields)
-    fields = ",".join(["id"] + db_fields + list(extra_fields))
-    records = fetch_all(client, "events", fields)
-    logger.info(f"Events: scoring {len(records)} records")
 
-    scores = {}
-    distribution = {0: 0, 25: 0, 50: 0, 75: 0, 90: 0}
+def compute_venues(client, dry_run: bool = False, **kwargs) -> dict:
+    """Compute and store venue quality scores."""
+    return compute_table(client, "venues", dry_run=dry_run, **kwargs)
 
-    for r in records:
-        # Map category_id back to category for scoring
-        if "category_id" in r and "category" not in r:
-            r["category"] = r["category_id"]
-        s = score_record(r, EVENT_WEIGHTS)
-        scores[r["id"]] = s
-        for threshold in sorted(distribution.keys(), reverse=True):
-            if s >= threshold:
-                distribution[threshold] += 1
-                break
 
-    update_scores(client, "events", scores, dry_run)
-    return {"count": len(records), "scores": scores, "distribution": distribution}
+def compute_events(client, dry_run: bool = False, **kwargs) -> dict:
+    """Compute and store event quality scores."""
+    return compute_table(client, "events", dry_run=dry_run, **kwargs)
 
 
-def compute_series(client, dry_run: bool = False) -> dict:
+def compute_series(client, dry_run: bool = False, **kwargs) -> dict:
     """Compute and store series quality scores."""
-    fields = ",".join(["id"] + list(SERIES_WEIGHTS.keys()))
-    records = fetch_all(client, "series", fields)
-    logger.info(f"Series: scoring {len(records)} records")
+    return compute_table(client, "series", dry_run=dry_run, **kwargs)
 
-    scores = {}
-    distribution = {0: 0, 25: 0, 50: 0, 75: 0, 90: 0}
 
-    for r in records:
-        s = score_record(r, SERIES_WEIGHTS)
-        scores[r["id"]] = s
-        for threshold in sorted(distribution.keys(), reverse=True):
-            if s >= threshold:
-                distribution[threshold] += 1
-                break
-
-    update_scores(client, "series", scores, dry_run)
-    return {"count": len(records), "scores": scores, "distribution": distribution}
-
-
-def compute_festivals(client, dry_run: bool = False) -> dict:
+def compute_festivals(client, dry_run: bool = False, **kwargs) -> dict:
     """Compute and store festival quality scores."""
-    fields = ",".join(["id"] + list(FESTIVAL_WEIGHTS.keys()))
-    records = fetch_all(client, "festivals", fields)
-    logger.info(f"Festivals: scoring {len(records)} records")
+    return compute_table(client, "festivals", dry_run=dry_run, **kwargs)
 
-    scores = {}
-    distribution = {0: 0, 25: 0, 50: 0, 75: 0, 90: 0}
-
-    for r in records:
-        s = score_record(r, FESTIVAL_WEIGHTS)
-        scores[r["id"]] = s
-        for threshold in sorted(distribution.keys(), reverse=True):
-            if s >= threshold:
-                distribution[threshold] += 1
-                break
 
-    update_scores(client, "festivals", scores, dry_run)
-    return {"count": len(records), "scores": scores, "distribution": distribution}
-
-
-def compute_organizations(client, dry_run: bool = False) -> dict:
+def compute_organizations(client, dry_run: bool = False, **kwargs) -> dict:
     """Compute and store organization quality scores."""
-    fields = ",".join(["id"] + list(ORG_WEIGHTS.keys()))
-    records = fetch_all(client, "organizations", fields)
-    logger.info(f"Organizations: scoring {len(records)} records")
-
-    scores = {}
-    distribution = {0: 0, 25: 0, 50: 0, 75: 0, 90: 0}
-
-    for r in records:
-        s = score_record(r, ORG_WEIGHTS)
-        scores[r["id"]] = s
-        for threshold in sorted(distribution.keys(), reverse=True):
-            if s >= threshold:
-                distribution[threshold] += 1
-                break
-
-    update_scores(client, "organizations", scores, dry_run)
-    return {"count": len(records), "scores": scores, "distribution": distribution}
+    return compute_table(client, "organizations", dry_run=dry_run, **kwargs)
 
 
 def print_results(name: str, result: dict):
@@ -345,7 +394,16 @@ def main():
     parser.add_argument("--table", choices=["venues", "events", "series", "festivals", "organizations"],
                         help="Only compute for a specific table")
     parser.add_argument("--dry-run", action="store_true", help="Preview without writing")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only rescore rows updated since the last incremental run")
+    parser.add_argument("--ids", type=str, default=None,
+                        help="Comma-separated IDs to rescore (requires --table)")
     args = parser.parse_args()
+    if args.ids and not args.table:
+        parser.error("--ids requires --table")
+    ids = None
+    if args.ids:
+        ids = [int(v) if v.strip().isdigit() else v.strip() for v in args.ids.split(",") if v.strip()]
 
     client = get_client()
     logger.info("Computing data_quality scores...")
@@ -364,7 +422,7 @@ def main():
     for key, (name, fn) in computors.items():
         if args.table and args.table != key:
             continue
-        results[name] = fn(client, dry_run=args.dry_run)
+        results[name] = fn(client, dry_run=args.dry_run, incremental=args.incremental, ids=ids)
         print_results(name, results[name])
 
     total_records = sum(r["count"] for r in results.values())
@@ -377,7 +435,8 @@ def main():
     if args.dry_run:
         logger.info("[DRY RUN — nothing written]")
     else:
-        logger.info("All scores written to data_quality column")
+        total_updated = sum(r["updated"] for r in results.values())
+        logger.info(f"Scores written to data_quality column ({total_updated} rows changed)")
     logger.info(f"{'='*60}")
 
 
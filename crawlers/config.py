@@ -58,6 +58,14 @@ class DatabaseConfig(BaseModel):
         )
     )
 
+    # "rest" (PostgREST via supabase-py) or "direct" (pooled psycopg2, see db/pg_writer.py)
+    write_backend: str = Field(
+        default_factory=lambda: os.getenv("CRAWLER_WRITE_BACKEND", "rest").strip().lower()
+    )
+    write_pool_size: int = Field(
+        default_factory=lambda: int(os.getenv("CRAWLER_WRITE_POOL_SIZE", "8"))
+    )
+
     @property
     def active_target(self) -> str:
         return _normalize_database_target(self.target)
@@ -111,6 +119,13 @@ class LLMConfig(BaseModel):
     openai_model: str = Field(default_factory=lambda: os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
     max_tokens: int = 16384  # Increased to handle pages with many events
     temperature: float = 0.0
+    # Concurrent in-flight requests per provider, shared by all threads in the process
+    max_concurrency: int = Field(default_factory=lambda: int(os.getenv("LLM_MAX_CONCURRENCY", "4")))
+    # Per provider/model ceilings; 0 = unlimited (429 Retry-After still pauses callers)
+    requests_per_minute: float = Field(default_factory=lambda: float(os.getenv("LLM_REQUESTS_PER_MINUTE", "0")))
+    tokens_per_minute: float = Field(default_factory=lambda: float(os.getenv("LLM_TOKENS_PER_MINUTE", "0")))
+    # Send the request to the alternate provider too once it's this slow; 0 = off
+    hedge_after_seconds: float = Field(default_factory=lambda: float(os.getenv("LLM_HEDGE_AFTER_SECONDS", "25")))
 
 
 class APIConfig(BaseModel):
@@ -5,6 +5,7 @@ Queries Supabase to identify coverage gaps in crawlers, neighborhoods,
 activity types, genres, and more.
 """
 
+import argparse
 import os
 import re
 import sys
@@ -409,28 +410,18 @@ def query_8_crawler_inventory(sources_list):
             print(f"    ... and {len(no_freq) - 20} more")
 
 
-def main():
-    print("=" * 80)
-    print("LOSTCITY ATLANTA -- RECURRING EVENTS CONTENT COVERAGE AUDIT")
-    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 80)
-
-    today = datetime.now().strftime("%Y-%m-%d")
-    next_week = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-
-    print(f"\nDate range: {today} to {next_week}")
+def _fetch_from_supabase(events_cols, today, next_week):
+    """Fetch recurring events in the window plus their venues and all sources."""
     print("Fetching data from Supabase...\n")
 
     client = get_client()
 
-    EVENTS_COLS = "id,title,start_date,start_time,category_id,genres,tags,source_id,place_id,is_recurring,series_id"
-
     # ---- Fetch recurring events (series_id IS NOT NULL, next 7 days) ----
     print("  Fetching recurring events (series_id IS NOT NULL)...")
     def build_recurring_q():
         return (
             client.table("events")
-            .select(EVENTS_COLS)
+            .select(events_cols)
             .not_.is_("series_id", "null")
             .gte("start_date", today)
             .lte("start_date", next_week)
@@ -444,7 +435,7 @@ def main():
     def build_is_recurring_q():
         return (
             client.table("events")
-            .select(EVENTS_COLS)
+            .select(events_cols)
             .eq("is_recurring", True)
             .gte("start_date", today)
             .lte("start_date", next_week)
@@ -482,6 +473,71 @@ def main():
     sources_list = fetch_all_paged(build_sources_q)
     sources_map = {s["id"]: s for s in sources_list}
     print(f"  -> {len(sources_list)} total sources")
+    return recurring_events, all_recurring, venues_map, sources_list, sources_map
+
+
+def _fetch_from_snapshot(snapshot_dir, events_cols, today, next_week):
+    """Same inputs as ``_fetch_from_supabase``, read from an analytics snapshot."""
+    from analytics_snapshot import Snapshot
+
+    snap = Snapshot(snapshot_dir)
+    window = [("gte", ("start_date", today)), ("lte", ("start_date", next_week))]
+    in_window = sorted(snap.rows("events", events_cols, window), key=lambda e: e.get("start_date") or "")
+    recurring_events = [e for e in in_window if e.get("series_id") is not None]
+    all_recurring = [e for e in in_window if e.get("series_id") is not None or e.get("is_recurring") is True]
+    venue_ids = {e.get("place_id") for e in all_recurring if e.get("place_id")}
+    venues_map = {
+        v["id"]: v
+        for v in snap.rows(
+            "places",
+            "id,name,slug,neighborhood,venue_type,city,state",
+            [("in_", ("id", venue_ids))],
+        )
+    }
+    sources_list = list(snap.rows("sources", "id,name,slug,is_active,crawl_frequency"))
+    return recurring_events, all_recurring, venues_map, sources_list
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recurring events content coverage audit.")
+    parser.add_argument(
+        "--snapshot",
+        nargs="?",
+        const="",
+        metavar="DIR",
+        help="Read from a local analytics snapshot (see analytics_snapshot.py) instead of Supabase",
+    )
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("LOSTCITY ATLANTA -- RECURRING EVENTS CONTENT COVERAGE AUDIT")
+    print(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print("=" * 80)
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    next_week = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+    print(f"\nDate range: {today} to {next_week}")
+
+    EVENTS_COLS = "id,title,start_date,start_time,category_id,genres,tags,source_id,place_id,is_recurring,series_id"
+
+    if args.snapshot is not None:
+        from analytics_snapshot import SNAPSHOT_DIR
+
+        snapshot_dir = args.snapshot or SNAPSHOT_DIR
+        print(f"Reading analytics snapshot {snapshot_dir}...\n")
+        recurring_events, all_recurring, venues_map, sources_list = _fetch_from_snapshot(
+            snapshot_dir, EVENTS_COLS, today, next_week
+        )
+        sources_map = {s["id"]: s for s in sources_list}
+        print(
+            f"  -> {len(recurring_events)} recurring events, {len(all_recurring)} incl. is_recurring, "
+            f"{len(venues_map)} venues, {len(sources_list)} sources"
+        )
+    else:
+        recurring_events, all_recurring, venues_map, sources_list, sources_map = _fetch_from_supabase(
+            EVENTS_COLS, today, next_week
+        )
 
     # ---- Run all queries ----
     query_1_activity_type_distribution(recurring_events)
@@ -22,10 +22,13 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Optional
@@ -44,6 +47,8 @@ from db import (
     find_event_by_hash,
 )
 from dedupe import generate_content_hash
+from extraction_cache import memoized_extractor
+from extractors.offload import run_extraction
 from utils import setup_logging, slugify, is_likely_non_event_image
 
 logger = logging.getLogger(__name__)
@@ -125,6 +130,30 @@ class SessionData:
         return f"Session({self.title!r}, {self.start_date}, {self.start_time})"
 
 
+def _dump_sessions(sessions: list[SessionData]) -> list[dict]:
+    return [vars(session) for session in sessions]
+
+
+def _load_sessions(rows: list[dict]) -> list[SessionData]:
+    return [SessionData(**row) for row in rows]
+
+
+def _memoized_strategy(name: str, *, dated: bool = False):
+    """Memoize a page-parsing strategy by page content (see extraction_cache).
+
+    ``dated`` strategies infer missing years from today's date, so their
+    entries are only reused on the same day.  Strategies that fetch secondary
+    pages are not memoized: their result depends on more than this page.
+    """
+    return memoized_extractor(
+        f"festival.{name}",
+        version="1",
+        dump=_dump_sessions,
+        load=_load_sessions,
+        key_extra=(lambda: date.today().isoformat()) if dated else None,
+    )
+
+
 _PAGE_SUMMARY_CACHE: dict[str, Optional[str]] = {}
 
 
@@ -321,15 +350,20 @@ def _decode_brotli_response(resp: requests.Response) -> str:
     return resp.text
 
 
-def _fetch_with_playwright(url: str) -> str:
-    from playwright.sync_api import sync_playwright
+_PLAYWRIGHT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+)
+# Upper bound on waiting for a pooled render (queueing plus a ~40s page load).
+PLAYWRIGHT_FETCH_TIMEOUT_SECONDS = 180.0
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080},
-        )
+
+def _render_page(browser, url: str) -> str:
+    """Load a page in a fresh context, scroll for lazy content, return its HTML."""
+    context = browser.new_context(
+        user_agent=_PLAYWRIGHT_USER_AGENT,
+        viewport={"width": 1920, "height": 1080},
+    )
+    try:
         page = context.new_page()
         page.goto(url, wait_until="domcontentloaded", timeout=30000)
         page.wait_for_timeout(3000)
@@ -339,9 +373,154 @@ def _fetch_with_playwright(url: str) -> str:
             page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             page.wait_for_timeout(800)
 
-        html = page.content()
-        browser.close()
-        return html
+        return page.content()
+    finally:
+        context.close()
+
+
+class PlaywrightFetchPool:
+    """Fixed set of browser-owning threads serving page renders from a shared queue.
+
+    The sync Playwright API is bound to the thread that started it, so browsers
+    cannot be handed between crawl threads.  Instead each pool thread owns one
+    browser for its lifetime and callers block on a Future for the rendered HTML.
+    This lets the concurrent festival pass share a couple of warm browsers rather
+    than launching Chromium for every candidate URL.  Threads start on the first
+    fetch, so a pass without render_js festivals never starts Playwright.
+    """
+
+    def __init__(self, size: int = 2):
+        self._size = max(1, size)
+        self._queue: queue.Queue = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._failed: Optional[BaseException] = None
+
+    def fetch(self, url: str, timeout: float = PLAYWRIGHT_FETCH_TIMEOUT_SECONDS) -> str:
+        future: Future = Future()
+        with self._lock:
+            if self._failed is not None:
+                raise RuntimeError(f"Playwright pool unavailable: {self._failed}")
+            if not self._threads:
+                self._start()
+            self._queue.put((url, future))
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            threads = list(self._threads)
+            self._threads.clear()
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join(timeout=30)
+
+    def _start(self) -> None:
+        for i in range(self._size):
+            thread = threading.Thread(
+                target=self._worker,
+                name=f"festival-playwright-{i + 1}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        sentinels = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                sentinels += 1
+                continue
+            _url, future = item
+            if future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+        # Leave shutdown sentinels for the other workers.
+        for _ in range(sentinels):
+            self._queue.put(None)
+
+    def _worker(self) -> None:
+        try:
+            from playwright.sync_api import sync_playwright
+
+            manager = sync_playwright()
+            p = manager.start()
+        except Exception as exc:
+            logger.warning(f"Playwright pool failed to start: {exc}")
+            with self._lock:
+                self._failed = exc
+            self._fail_pending(exc)
+            return
+
+        browser = None
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                url, future = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if browser is None or not browser.is_connected():
+                        browser = p.chromium.launch(headless=True)
+                    future.set_result(_render_page(browser, url))
+                except Exception as exc:
+                    future.set_exception(exc)
+        finally:
+            if browser is not None:
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+            manager.stop()
+
+
+_PLAYWRIGHT_POOL: Optional[PlaywrightFetchPool] = None
+_PLAYWRIGHT_POOL_LOCK = threading.Lock()
+
+
+def start_playwright_pool(size: int = 2) -> None:
+    """Route render_js fetches through a shared browser pool until stopped.
+
+    Browsers start with the first render_js fetch, not here.
+    """
+    global _PLAYWRIGHT_POOL
+    with _PLAYWRIGHT_POOL_LOCK:
+        if _PLAYWRIGHT_POOL is not None:
+            return
+        _PLAYWRIGHT_POOL = PlaywrightFetchPool(size=size)
+
+
+def stop_playwright_pool() -> None:
+    """Shut down the shared browser pool; later fetches launch their own browser."""
+    global _PLAYWRIGHT_POOL
+    with _PLAYWRIGHT_POOL_LOCK:
+        pool, _PLAYWRIGHT_POOL = _PLAYWRIGHT_POOL, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def _fetch_with_playwright(url: str) -> str:
+    pool = _PLAYWRIGHT_POOL
+    if pool is not None:
+        return pool.fetch(url)
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            return _render_page(browser, url)
+        finally:
+            browser.close()
 
 
 # ---------------------------------------------------------------------------
@@ -349,6 +528,7 @@ def _fetch_with_playwright(url: str) -> str:
 # ---------------------------------------------------------------------------
 
 
+@_memoized_strategy("jsonld")
 def extract_sessions_jsonld(html: str, base_url: str) -> list[SessionData]:
     """Extract sessions from JSON-LD @type: Event blocks."""
     soup = BeautifulSoup(html, "lxml")
@@ -449,6 +629,7 @@ def _parse_jsonld_event(item: dict, base_url: str) -> Optional[SessionData]:
     )
 
 
+@_memoized_strategy("wp_events_calendar", dated=True)
 def extract_sessions_wp_events_calendar(html: str, base_url: str) -> list[SessionData]:
     """Extract sessions from WordPress 'The Events Calendar' plugin markup."""
     soup = BeautifulSoup(html, "lxml")
@@ -883,6 +1064,7 @@ def _parse_wp_event_element(el: Tag, base_url: str) -> Optional[SessionData]:
     )
 
 
+@_memoized_strategy("html_table", dated=True)
 def extract_sessions_html_table(html: str, base_url: str) -> list[SessionData]:
     """Extract sessions from HTML table schedule grids (common for conventions)."""
     soup = BeautifulSoup(html, "lxml")
@@ -1011,6 +1193,7 @@ def _parse_month_day_range_text(value: str) -> list[str]:
         return []
 
 
+@_memoized_strategy("collect_a_con_page")
 def extract_sessions_collect_a_con_page(html: str, base_url: str) -> list[SessionData]:
     """Extract Atlanta fall daily hours from the official Collect-A-Con page."""
     normalized_url = (base_url or "").rstrip("/")
@@ -1311,6 +1494,7 @@ def extract_sessions_conjuration_homepage(
     return sessions
 
 
+@_memoized_strategy("toylanta_schedule")
 def extract_sessions_toylanta_schedule(html: str, base_url: str) -> list[SessionData]:
     """Extract public Toylanta floor hours and public after-hours swap from the schedule page."""
     normalized_url = (base_url or "").rstrip("/")
@@ -1417,6 +1601,7 @@ def extract_sessions_toylanta_schedule(html: str, base_url: str) -> list[Session
     return sessions
 
 
+@_memoized_strategy("southeastern_stamp_expo_homepage")
 def extract_sessions_southeastern_stamp_expo_homepage(
     html: str, base_url: str
 ) -> list[SessionData]:
@@ -1500,6 +1685,7 @@ def extract_sessions_southeastern_stamp_expo_homepage(
     return sessions
 
 
+@_memoized_strategy("atlanta_pen_show_schedule")
 def extract_sessions_atlanta_pen_show_schedule(
     html: str, base_url: str
 ) -> list[SessionData]:
@@ -1589,6 +1775,7 @@ def extract_sessions_atlanta_pen_show_schedule(
     return sessions
 
 
+@_memoized_strategy("ipms_event_page")
 def extract_sessions_ipms_event_page(html: str, base_url: str) -> list[SessionData]:
     """Extract a single event from an IPMS event detail page."""
     normalized_url = (base_url or "").rstrip("/")
@@ -2273,6 +2460,7 @@ def _parse_month_day_tab_label(label: str, year: int) -> Optional[str]:
     return None
 
 
+@_memoized_strategy("tabbed_button_schedule", dated=True)
 def extract_sessions_tabbed_button_schedule(
     html: str, base_url: str
 ) -> list[SessionData]:
@@ -2460,6 +2648,48 @@ def insert_sessions(
 # ---------------------------------------------------------------------------
 
 
+def extract_sessions_structured(html: str, url: str) -> list[SessionData]:
+    """Run the generic structured extraction strategies in order of quality.
+
+    Returns the first non-empty result, or [] when none match.  Everything here
+    is plain parsing (plus a few requests-only fetches), so it can run in an
+    extraction worker process.
+    """
+    sessions = extract_sessions_jsonld(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_wp_events_calendar(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_atl_science_festival_grid(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_html_table(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_tabbed_button_schedule(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_collect_a_con_page(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_blade_show_schedule(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_toylanta_schedule(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_southeastern_stamp_expo_homepage(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_atlanta_pen_show_schedule(html, url)
+
+    if not sessions:
+        sessions = extract_sessions_ipms_event_page(html, url)
+
+    return sessions
+
+
 def crawl_festival_schedule(
     slug: str,
     url: str,
@@ -2519,41 +2749,13 @@ def crawl_festival_schedule(
             llm_model=llm_model,
         )
     else:
-        # Try strategies in order of quality
+        # Try strategies in order of quality. CONjuration renders a second page
+        # with the shared Playwright pool, so it stays on this thread; the rest
+        # are offloaded when the extraction pool is enabled.
         sessions = extract_sessions_conjuration_homepage(html, url)
 
         if not sessions:
-            sessions = extract_sessions_jsonld(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_wp_events_calendar(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_atl_science_festival_grid(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_html_table(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_tabbed_button_schedule(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_collect_a_con_page(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_blade_show_schedule(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_toylanta_schedule(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_southeastern_stamp_expo_homepage(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_atlanta_pen_show_schedule(html, url)
-
-        if not sessions:
-            sessions = extract_sessions_ipms_event_page(html, url)
+            sessions = run_extraction("festival_sessions", html, url)
 
         if not sessions:
             logger.info("No structured data found, falling back to LLM extraction")
@@ -0,0 +1,692 @@
+"""
+Offline record/replay of source crawls.
+
+``record`` runs one source live and captures everything it talks to into a
+cassette (``.cache/cassettes/<slug>.json.gz``):
+
+  * HTTP exchanges made through ``requests`` (incl. ``utils.fetch_page`` and
+    cloudscraper sessions) and ``httpx`` (incl. the LLM SDKs)
+  * rendered HTML returned by Playwright ``page.content()``
+  * every Supabase/PostgREST call (reads and writes)
+
+``replay`` runs the same source with no network: HTTP and page content come
+from the cassette, and the database is an in-memory stand-in that answers
+reads from the recorded responses (or from rows written earlier in the same
+replay) and absorbs writes.  Replays are deterministic enough to compare
+crawler and pipeline performance run over run — see
+``scripts/benchmark_crawlers.py``.
+
+Recording runs with DB writes disabled unless ``--allow-writes`` is given;
+replay always runs with writes enabled against the stand-in, so the insert
+pipeline is exercised end to end.
+
+Known gaps: async Playwright is not captured, and the replayed Playwright page
+only serves ``goto``/``content``/``inner_text``/``title`` — interactions
+(clicks, selectors, ``evaluate``) return empty results.
+
+Usage:
+    python3 crawl_replay.py record atlanta-history-center
+    python3 crawl_replay.py replay atlanta-history-center
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+from unittest import mock
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_DIR = Path(__file__).resolve().parent / ".cache" / "cassettes"
+REPLAY_SUPABASE_URL = "http://replay.invalid"
+REPLAY_SUPABASE_KEY = "replay.replay.replay"
+
+_TEXT_TYPES = ("text/", "json", "xml", "javascript", "html")
+
+
+def cassette_path(slug: str, root: Path = CASSETTE_DIR) -> Path:
+    return root / f"{slug}.json.gz"
+
+
+def _body_digest(body: Any) -> str:
+    if not body:
+        return ""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, (bytes, bytearray)):
+        body = json.dumps(body, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(body).hexdigest()[:12]
+
+
+def _http_key(method: str, url: str, body: Any = None) -> str:
+    digest = _body_digest(body)
+    return f"{method.upper()} {url}" + (f" #{digest}" if digest else "")
+
+
+def _http_fallback_key(method: str, url: str) -> str:
+    # Same endpoint, any query string (cache busters, date windows).
+    parts = urlsplit(url)
+    return f"{method.upper()} {urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))}"
+
+
+def _encode_content(content: bytes, content_type: str) -> dict:
+    if any(t in (content_type or "").lower() for t in _TEXT_TYPES):
+        try:
+            return {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            pass
+    return {"b64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_content(entry: dict) -> bytes:
+    if "text" in entry:
+        return entry["text"].encode("utf-8")
+    return base64.b64decode(entry.get("b64") or "")
+
+
+@dataclass
+class ReplayStats:
+    """Counters and time spent in each I/O layer during a replay."""
+
+    http_requests: int = 0
+    http_misses: int = 0
+    http_seconds: float = 0.0
+    pages: int = 0
+    db_reads: int = 0
+    db_read_misses: int = 0
+    db_writes: int = 0
+    db_seconds: float = 0.0
+
+
+class Cassette:
+    """Recorded HTTP exchanges, Playwright page content and PostgREST calls."""
+
+    def __init__(
+        self,
+        slug: str,
+        http: Optional[dict[str, list[dict]]] = None,
+        pages: Optional[dict[str, list[str]]] = None,
+        db: Optional[dict[str, list[dict]]] = None,
+        meta: Optional[dict] = None,
+    ):
+        self.slug = slug
+        self.http = http or {}
+        self.pages = pages or {}
+        self.db = db or {}
+        self.meta = meta or {}
+        self._lock = threading.Lock()
+        self._cursors: dict[tuple[str, str], int] = {}
+        self._http_fallback: dict[str, list[str]] = {}
+        self._db_fallback: dict[str, list[str]] = {}
+        self._reindex()
+
+    def _reindex(self) -> None:
+        self._http_fallback.clear()
+        for key in self.http:
+            method, url = key.split(" #")[0].split(" ", 1)
+            self._http_fallback.setdefault(_http_fallback_key(method, url), []).append(key)
+        self._db_fallback.clear()
+        for key in self.db:
+            self._db_fallback.setdefault(_db_fallback_key(key), []).append(key)
+
+    # -- persistence -----------------------------------------------------
+
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            data.get("slug") or path.name.split(".")[0],
+            http=data.get("http"),
+            pages=data.get("pages"),
+            db=data.get("db"),
+            meta=data.get("meta"),
+        )
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(
+                {"slug": self.slug, "meta": self.meta, "http": self.http, "pages": self.pages, "db": self.db},
+                f,
+                default=str,
+            )
+        tmp_path.replace(path)
+
+    # -- recording -------------------------------------------------------
+
+    def _append(self, bucket: dict, key: str, entry: Any) -> None:
+        with self._lock:
+            bucket.setdefault(key, []).append(entry)
+
+    def add_http(self, key: str, entry: dict) -> None:
+        self._append(self.http, key, entry)
+
+    def add_page(self, url: str, html: str) -> None:
+        self._append(self.pages, url, html)
+
+    def add_db(self, key: str, entry: dict) -> None:
+        self._append(self.db, key, entry)
+
+    # -- replay ----------------------------------------------------------
+
+    def _next(self, bucket_name: str, bucket: dict, key: str) -> Any:
+        # Successive calls walk the recorded sequence; the last entry repeats.
+        entries = bucket.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            pos = self._cursors.get((bucket_name, key), 0)
+            self._cursors[(bucket_name, key)] = pos + 1
+        return entries[min(pos, len(entries) - 1)]
+
+    def next_http(self, method: str, url: str, body: Any = None) -> Optional[dict]:
+        key = _http_key(method, url, body)
+        if key not in self.http:
+            candidates = self._http_fallback.get(_http_fallback_key(method, url))
+            if not candidates:
+                return None
+            key = candidates[0]
+        return self._next("http", self.http, key)
+
+    def next_page(self, url: str) -> Optional[str]:
+        return self._next("pages", self.pages, url)
+
+    def next_db(self, key: str) -> Optional[dict]:
+        if key not in self.db:
+            candidates = self._db_fallback.get(_db_fallback_key(key))
+            if not candidates:
+                return None
+            key = candidates[0]
+        return self._next("db", self.db, key)
+
+
+# ---------------------------------------------------------------------------
+# PostgREST
+# ---------------------------------------------------------------------------
+
+
+def _db_request_parts(req) -> tuple[str, str, list[tuple[str, str]], Any]:
+    method = str(getattr(req.http_method, "value", req.http_method)).upper()
+    path = str(req.path)
+    table = path.split("/rest/v1/", 1)[-1] if "/rest/v1/" in path else path.rsplit("/", 1)[-1]
+    params = sorted((str(k), str(v)) for k, v in req.params.multi_items())
+    return method, table, params, req.json
+
+
+def _db_key(req) -> str:
+    method, table, params, body = _db_request_parts(req)
+    query = "&".join(f"{k}={v}" for k, v in params)
+    digest = _body_digest(body)
+    return f"{method} {table}?{query}" + (f" #{digest}" if digest else "")
+
+
+def _db_fallback_key(key: str) -> str:
+    # Same table and projection, any filter values (dates move between runs).
+    head = key.split(" #")[0]
+    method_table, _, query = head.partition("?")
+    select = [p for p in query.split("&") if p.startswith("select=")]
+    return f"{method_table}?{'&'.join(select)}"
+
+
+class MemoryDB:
+    """In-memory stand-in for the Supabase tables a replayed crawl writes."""
+
+    def __init__(self):
+        self.tables: dict[str, list[dict]] = {}
+        self._ids = itertools.count(10_000_000)
+        self._lock = threading.Lock()
+
+    def write(self, method: str, table: str, body: Any) -> list[dict]:
+        if method != "POST" or table.startswith("rpc/"):
+            return []
+        rows = body if isinstance(body, list) else [body or {}]
+        stored = []
+        with self._lock:
+            for row in rows:
+                row = dict(row)
+                row.setdefault("id", next(self._ids))
+                self.tables.setdefault(table, []).append(row)
+                stored.append(row)
+        return stored
+
+    def select(self, table: str, params: list[tuple[str, str]]) -> Optional[list[dict]]:
+        """Rows matching simple eq/is filters, or None when filters are too complex."""
+        filters = []
+        for name, value in params:
+            if name in ("select", "order", "limit", "offset"):
+                continue
+            op, _, operand = value.partition(".")
+            if op == "eq":
+                filters.append(lambda row, n=name, v=operand: str(row.get(n)) == v)
+            elif op == "is" and operand == "null":
+                filters.append(lambda row, n=name: row.get(n) is None)
+            else:
+                return None
+        with self._lock:
+            rows = list(self.tables.get(table, ()))
+        return [row for row in rows if all(f(row) for f in filters)]
+
+
+def _json_response(req, status: int, data: Any, headers: Optional[dict] = None) -> httpx.Response:
+    return httpx.Response(
+        status,
+        headers={"content-type": "application/json", **(headers or {})},
+        content=json.dumps(data, default=str).encode("utf-8"),
+        request=httpx.Request(str(getattr(req.http_method, "value", req.http_method)), str(req.path)),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Playwright replay fakes
+# ---------------------------------------------------------------------------
+
+
+class _Null:
+    """Falsy, empty, callable placeholder for unsupported Playwright calls."""
+
+    def __call__(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, _name):
+        return self
+
+    def __iter__(self):
+        return iter(())
+
+    def __bool__(self):
+        return False
+
+    def __len__(self):
+        return 0
+
+    def __str__(self):
+        return ""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _Null()
+
+
+class _ReplayPage:
+    def __init__(self, session: "_Session"):
+        self._session = session
+        self.url = "about:blank"
+
+    def goto(self, url: str, **_kwargs):
+        self.url = url
+        return _Null()
+
+    def content(self) -> str:
+        self._session.stats.pages += 1
+        return self._session.cassette.next_page(self.url) or "<html><body></body></html>"
+
+    def inner_text(self, _selector: str = "body", **_kwargs) -> str:
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.content(), "html.parser").get_text("\n", strip=True)
+
+    def title(self) -> str:
+        return ""
+
+    def close(self, **_kwargs) -> None:
+        return None
+
+    def __getattr__(self, _name):
+        return _NULL
+
+
+class _ReplayContext:
+    def __init__(self, session: "_Session"):
+        self._session = session
+
+    def new_page(self, **_kwargs) -> _ReplayPage:
+        return _ReplayPage(self._session)
+
+    def new_context(self, **_kwargs) -> "_ReplayContext":
+        return _ReplayContext(self._session)
+
+    def __getattr__(self, _name):
+        return _NULL
+
+
+class _ReplayBrowserType:
+    def __init__(self, session: "_Session"):
+        self._session = session
+
+    def launch(self, **_kwargs) -> _ReplayContext:
+        return _ReplayContext(self._session)
+
+    def launch_persistent_context(self, *_args, **_kwargs) -> _ReplayContext:
+        return _ReplayContext(self._session)
+
+
+class _ReplayPlaywright:
+    def __init__(self, session: "_Session"):
+        self.chromium = self.firefox = self.webkit = _ReplayBrowserType(session)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def start(self):
+        return self
+
+    def stop(self) -> None:
+        return None
+
+
+_ACTIVE_SESSION: Optional["_Session"] = None
+
+
+def _replay_sync_playwright():
+    if _ACTIVE_SESSION is None:
+        raise RuntimeError("sync_playwright() called outside an active crawl replay")
+    return _ReplayPlaywright(_ACTIVE_SESSION)
+
+
+# ---------------------------------------------------------------------------
+# Sessions
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Session:
+    cassette: Cassette
+    stats: ReplayStats = field(default_factory=ReplayStats)
+    db: MemoryDB = field(default_factory=MemoryDB)
+
+
+@contextmanager
+def recording(cassette: Cassette) -> Iterator[Cassette]:
+    """Capture live HTTP, Playwright and PostgREST traffic into ``cassette``."""
+    from postgrest._sync import request_builder
+
+    real_requests_send = requests.Session.send
+    real_httpx_send = httpx.Client.send
+    real_db_send = request_builder.send_with_retry
+
+    def requests_send(self, request, **kwargs):
+        response = real_requests_send(self, request, **kwargs)
+        cassette.add_http(
+            _http_key(request.method, request.url, request.body),
+            {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "url": response.url,
+                **_encode_content(response.content, response.headers.get("content-type", "")),
+            },
+        )
+        return response
+
+    def httpx_send(self, request, **kwargs):
+        response = real_httpx_send(self, request, **kwargs)
+        response.read()
+        cassette.add_http(
+            _http_key(request.method, str(request.url), request.content),
+            {
+                "status": response.status_code,
+                "headers": dict(response.headers),
+                "url": str(response.url),
+                **_encode_content(response.content, response.headers.get("content-type", "")),
+            },
+        )
+        return response
+
+    def db_send(req):
+        response = real_db_send(req)
+        cassette.add_db(
+            _db_key(req),
+            {
+                "status": response.status_code,
+                "content_range": response.headers.get("content-range"),
+                "text": response.text,
+            },
+        )
+        return response
+
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.object(requests.Session, "send", requests_send))
+        stack.enter_context(mock.patch.object(httpx.Client, "send", httpx_send))
+        stack.enter_context(mock.patch.object(request_builder, "send_with_retry", db_send))
+        try:
+            from playwright.sync_api._generated import Page
+        except ImportError:
+            Page = None
+        if Page is not None:
+            real_content = Page.content
+
+            def page_content(self):
+                html = real_content(self)
+                cassette.add_page(self.url, html)
+                return html
+
+            stack.enter_context(mock.patch.object(Page, "content", page_content))
+        cassette.meta.setdefault("recorded_at", datetime.now(timezone.utc).isoformat())
+        yield cassette
+
+
+@contextmanager
+def replaying(cassette: Cassette) -> Iterator[_Session]:
+    """Serve HTTP, Playwright and PostgREST from ``cassette`` with no network."""
+    global _ACTIVE_SESSION
+    from postgrest._sync import request_builder
+
+    from config import set_database_target
+    from db.client import reset_client
+
+    session = _Session(cassette)
+    stats = session.stats
+
+    def requests_send(self, request, **kwargs):
+        started = time.perf_counter()
+        stats.http_requests += 1
+        entry = cassette.next_http(request.method, request.url, request.body)
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if entry is None:
+            stats.http_misses += 1
+            response.status_code = 404
+            response._content = b""
+            response.reason = "Not in cassette"
+        else:
+            response.status_code = entry["status"]
+            response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+            response._content = _decode_content(entry)
+            response.url = entry.get("url") or request.url
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        stats.http_seconds += time.perf_counter() - started
+        return response
+
+    def httpx_send(self, request, **kwargs):
+        started = time.perf_counter()
+        stats.http_requests += 1
+        entry = cassette.next_http(request.method, str(request.url), request.content)
+        if entry is None:
+            stats.http_misses += 1
+            response = httpx.Response(404, content=b"", request=request)
+        else:
+            headers = {
+                k: v
+                for k, v in (entry.get("headers") or {}).items()
+                if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+            }
+            response = httpx.Response(entry["status"], headers=headers, content=_decode_content(entry), request=request)
+        stats.http_seconds += time.perf_counter() - started
+        return response
+
+    def db_send(req):
+        started = time.perf_counter()
+        method, table, params, body = _db_request_parts(req)
+        try:
+            if method in ("GET", "HEAD"):
+                stats.db_reads += 1
+                entry = cassette.next_db(_db_key(req))
+                if entry is not None:
+                    headers = {"content-range": entry["content_range"]} if entry.get("content_range") else {}
+                    return httpx.Response(
+                        entry["status"],
+                        headers={"content-type": "application/json", **headers},
+                        content=(entry.get("text") or "").encode("utf-8"),
+                        request=httpx.Request(method, str(req.path)),
+                    )
+                stats.db_read_misses += 1
+                rows = session.db.select(table, params) or []
+            else:
+                stats.db_writes += 1
+                rows = session.db.write(method, table, body)
+            if "vnd.pgrst.object" in req.headers.get("accept", ""):
+                # .single() / .maybe_single(): exactly one row as an object.
+                if len(rows) != 1:
+                    return _json_response(req, 406, {"code": "PGRST116", "message": "replay: no single row"})
+                return _json_response(req, 200, rows[0])
+            return _json_response(req, 201 if method == "POST" else 200, rows)
+        finally:
+            stats.db_seconds += time.perf_counter() - started
+
+    env = {
+        "SUPABASE_URL": REPLAY_SUPABASE_URL,
+        "SUPABASE_SERVICE_KEY": REPLAY_SUPABASE_KEY,
+        "SUPABASE_KEY": REPLAY_SUPABASE_KEY,
+        "DATABASE_URL": "",
+        "CRAWLER_WRITE_BACKEND": "rest",
+    }
+    with ExitStack() as stack:
+        stack.enter_context(mock.patch.dict(os.environ, env))
+        stack.enter_context(mock.patch.object(requests.Session, "send", requests_send))
+        stack.enter_context(mock.patch.object(httpx.Client, "send", httpx_send))
+        stack.enter_context(mock.patch.object(request_builder, "send_with_retry", db_send))
+        try:
+            import playwright.sync_api as pw_sync
+        except ImportError:
+            pw_sync = None
+        if pw_sync is not None:
+            real_factory = pw_sync.sync_playwright
+            stack.enter_context(mock.patch.object(pw_sync, "sync_playwright", _replay_sync_playwright))
+            # Source modules imported before the replay hold their own reference.
+            for module in list(sys.modules.values()):
+                if getattr(module, "sync_playwright", None) is real_factory:
+                    stack.enter_context(mock.patch.object(module, "sync_playwright", _replay_sync_playwright))
+
+        set_database_target("production")
+        reset_client()
+        _ACTIVE_SESSION = session
+        try:
+            yield session
+        finally:
+            _ACTIVE_SESSION = None
+            reset_client()
+    set_database_target(os.getenv("CRAWLER_DB_TARGET", "production"))
+
+
+# ---------------------------------------------------------------------------
+# Running a source
+# ---------------------------------------------------------------------------
+
+
+def run_source_crawl(slug: str) -> tuple[int, int, int]:
+    """Run one source's crawler the way main.run_source does, minus bookkeeping."""
+    import main
+    from db import get_source_by_slug
+
+    source = get_source_by_slug(slug)
+    if not source:
+        raise RuntimeError(f"Source not found: {slug}")
+    return main.run_crawler(source)
+
+
+def record_source(slug: str, root: Path = CASSETTE_DIR, allow_writes: bool = False) -> Path:
+    """Crawl ``slug`` live and save its cassette; returns the cassette path."""
+    from db import configure_write_mode
+
+    cassette = Cassette(slug)
+    configure_write_mode(allow_writes, "" if allow_writes else "recording cassette")
+    try:
+        with recording(cassette):
+            found, new, updated = run_source_crawl(slug)
+    finally:
+        configure_write_mode(True)
+    cassette.meta.update(events_found=found, events_new=new, events_updated=updated)
+    path = cassette_path(slug, root)
+    cassette.save(path)
+    logger.info(
+        "Recorded %s: %d HTTP, %d pages, %d DB calls -> %s",
+        slug,
+        sum(len(v) for v in cassette.http.values()),
+        sum(len(v) for v in cassette.pages.values()),
+        sum(len(v) for v in cassette.db.values()),
+        path,
+    )
+    return path
+
+
+def replay_source(slug: str, root: Path = CASSETTE_DIR) -> tuple[tuple[int, int, int], ReplayStats]:
+    """Replay ``slug`` from its cassette; returns the crawl result and I/O stats."""
+    from db import configure_write_mode
+
+    cassette = Cassette.load(cassette_path(slug, root))
+    configure_write_mode(True)
+    with replaying(cassette) as session:
+        result = run_source_crawl(slug)
+    return result, session.stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Record or replay a source crawl offline.")
+    parser.add_argument("mode", choices=("record", "replay"))
+    parser.add_argument("slugs", nargs="+", help="Source slugs")
+    parser.add_argument("--cassette-dir", default=str(CASSETTE_DIR))
+    parser.add_argument(
+        "--allow-writes",
+        action="store_true",
+        help="Let the recording crawl write to the database (default: dry run)",
+    )
+    args = parser.parse_args()
+
+    from utils import setup_logging
+
+    setup_logging()
+    root = Path(args.cassette_dir)
+    for slug in args.slugs:
+        if args.mode == "record":
+            record_source(slug, root, allow_writes=args.allow_writes)
+        else:
+            (found, new, updated), stats = replay_source(slug, root)
+            print(
+                f"{slug}: {found} found, {new} new, {updated} updated | "
+                f"http {stats.http_requests} ({stats.http_misses} missed), pages {stats.pages}, "
+                f"db reads {stats.db_reads} ({stats.db_read_misses} missed), db writes {stats.db_writes}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,312 @@
+"""
+History-aware scheduling for the split Playwright/requests crawl pools.
+
+``_run_split_pool`` used to submit sources in database order, so the slow
+sources (chain cinemas, ArtCallEntry, ...) often started late and set the
+wall-clock end of the run.  This module predicts each source's duration from
+``crawl_runs.duration_seconds`` and dispatches longest-first:
+
+  * every source gets a resource class — ``playwright``, ``requests`` or
+    ``llm`` (profile-backed LLM discovery)
+  * Playwright workers take Playwright sources first and steal the longest
+    remaining requests/LLM source once their own queue is empty; requests
+    workers never take Playwright sources, so the browser cap still holds
+  * LLM sources share a concurrency cap so they don't all hit the provider at
+    once
+
+The same dispatch policy drives ``simulate_makespan``, which lets a run log its
+predicted makespan next to the database-order baseline and the actual wall
+time.
+
+Usage:
+    from crawl_scheduler import CrawlScheduler, predict_durations
+
+    estimates = predict_durations(slugs, get_duration_history(), classify)
+    scheduler = CrawlScheduler(estimates, {"playwright": 2, "requests": 8})
+    results = scheduler.run(lambda slug: run_source(slug, True), timeout=3600)
+    scheduler.report  # predicted vs actual makespan
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import re
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_PLAYWRIGHT = "playwright"
+RESOURCE_REQUESTS = "requests"
+RESOURCE_LLM = "llm"
+
+POOL_PLAYWRIGHT = "playwright"
+POOL_REQUESTS = "requests"
+
+# Which resource classes each pool's workers may run.  Playwright workers can
+# run anything; requests workers must not launch browsers.
+POOL_ELIGIBLE_CLASSES = {
+    POOL_PLAYWRIGHT: (RESOURCE_PLAYWRIGHT, RESOURCE_REQUESTS, RESOURCE_LLM),
+    POOL_REQUESTS: (RESOURCE_REQUESTS, RESOURCE_LLM),
+}
+# Without work stealing each pool only runs its own classes (the old split).
+_POOL_OWN_CLASSES = {
+    POOL_PLAYWRIGHT: (RESOURCE_PLAYWRIGHT,),
+    POOL_REQUESTS: (RESOURCE_REQUESTS, RESOURCE_LLM),
+}
+
+DEFAULT_PREDICTED_SECONDS = 60.0
+
+_PROFILE_DIR = Path(__file__).resolve().parent / "sources" / "profiles"
+_HTML_DISCOVERY_RE = re.compile(r"^discovery:\s*\n(?:[ \t]+.*\n)*?[ \t]+type:\s*['\"]?html\b", re.M)
+_LLM_PROFILE_SLUGS: Optional[frozenset[str]] = None
+
+
+@dataclass(frozen=True)
+class SourceEstimate:
+    slug: str
+    predicted_seconds: float
+    resource_class: str
+    has_history: bool = False
+
+
+def llm_profile_slugs(profile_dir: Path = _PROFILE_DIR) -> frozenset[str]:
+    """Slugs whose profile uses LLM (``type: html``) discovery. Cached per process."""
+    global _LLM_PROFILE_SLUGS
+    if _LLM_PROFILE_SLUGS is not None and profile_dir == _PROFILE_DIR:
+        return _LLM_PROFILE_SLUGS
+    slugs = set()
+    for path in profile_dir.glob("*.y*ml"):
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        if _HTML_DISCOVERY_RE.search(text):
+            slugs.add(path.stem)
+    result = frozenset(slugs)
+    if profile_dir == _PROFILE_DIR:
+        _LLM_PROFILE_SLUGS = result
+    return result
+
+
+def predict_durations(
+    slugs: Iterable[str],
+    history: dict[str, list[float]],
+    resource_class: Callable[[str], str],
+) -> list[SourceEstimate]:
+    """Median of each source's recent durations; unknown sources get the fleet median."""
+    known = {
+        slug: statistics.median(durations)
+        for slug, durations in history.items()
+        if durations
+    }
+    fallback = statistics.median(known.values()) if known else DEFAULT_PREDICTED_SECONDS
+    return [
+        SourceEstimate(
+            slug=slug,
+            predicted_seconds=known.get(slug, fallback),
+            resource_class=resource_class(slug),
+            has_history=slug in known,
+        )
+        for slug in slugs
+    ]
+
+
+def _build_queues(
+    estimates: list[SourceEstimate], longest_first: bool
+) -> dict[str, list[SourceEstimate]]:
+    queues: dict[str, list[SourceEstimate]] = {
+        RESOURCE_PLAYWRIGHT: [],
+        RESOURCE_REQUESTS: [],
+        RESOURCE_LLM: [],
+    }
+    for est in estimates:
+        queues.setdefault(est.resource_class, []).append(est)
+    if longest_first:
+        for queue in queues.values():
+            # Stable sort keeps DB order among equal predictions.
+            queue.sort(key=lambda e: e.predicted_seconds, reverse=True)
+    return queues
+
+
+def _pick(
+    pool: str,
+    queues: dict[str, list[SourceEstimate]],
+    running: dict[str, int],
+    class_limits: dict[str, int],
+    work_stealing: bool = True,
+) -> Optional[SourceEstimate]:
+    """Next source for an idle worker of ``pool``, or None if nothing is eligible."""
+    if pool == POOL_PLAYWRIGHT and queues.get(RESOURCE_PLAYWRIGHT):
+        return queues[RESOURCE_PLAYWRIGHT].pop(0)
+    eligible = (POOL_ELIGIBLE_CLASSES if work_stealing else _POOL_OWN_CLASSES)[pool]
+    candidates = [
+        cls
+        for cls in eligible
+        if queues.get(cls) and running.get(cls, 0) < class_limits.get(cls, float("inf"))
+    ]
+    if not candidates:
+        return None
+    cls = max(candidates, key=lambda c: queues[c][0].predicted_seconds)
+    return queues[cls].pop(0)
+
+
+def simulate_makespan(
+    estimates: list[SourceEstimate],
+    pool_sizes: dict[str, int],
+    class_limits: Optional[dict[str, int]] = None,
+    longest_first: bool = True,
+    work_stealing: bool = True,
+) -> float:
+    """Predicted wall-clock seconds to run ``estimates`` under the dispatch policy."""
+    class_limits = class_limits or {}
+    queues = _build_queues(estimates, longest_first)
+    running: dict[str, int] = {}
+    idle = [
+        (pool, i)
+        for pool in (POOL_PLAYWRIGHT, POOL_REQUESTS)
+        for i in range(pool_sizes.get(pool, 0))
+    ]
+    in_flight: list[tuple[float, int, str, str, int]] = []
+    now = 0.0
+    seq = 0
+    while True:
+        still_idle = []
+        for pool, i in idle:
+            job = _pick(pool, queues, running, class_limits, work_stealing)
+            if job is None:
+                still_idle.append((pool, i))
+                continue
+            running[job.resource_class] = running.get(job.resource_class, 0) + 1
+            heapq.heappush(in_flight, (now + job.predicted_seconds, seq, job.resource_class, pool, i))
+            seq += 1
+        idle = still_idle
+        if not in_flight:
+            return now
+        now, _, cls, pool, i = heapq.heappop(in_flight)
+        running[cls] -= 1
+        idle.append((pool, i))
+
+
+class CrawlScheduler:
+    """Runs sources on Playwright/requests worker threads, longest predicted first."""
+
+    def __init__(
+        self,
+        estimates: list[SourceEstimate],
+        pool_sizes: dict[str, int],
+        class_limits: Optional[dict[str, int]] = None,
+    ):
+        self.estimates = list(estimates)
+        self.pool_sizes = {pool: max(0, n) for pool, n in pool_sizes.items()}
+        if self.pool_sizes.get(POOL_REQUESTS, 0) < 1:
+            self.pool_sizes[POOL_REQUESTS] = 1
+        if any(e.resource_class == RESOURCE_PLAYWRIGHT for e in self.estimates):
+            self.pool_sizes[POOL_PLAYWRIGHT] = max(1, self.pool_sizes.get(POOL_PLAYWRIGHT, 0))
+        self.class_limits = dict(class_limits or {})
+        self.report: dict = {}
+
+    def run(
+        self,
+        run_fn: Callable[[str], bool],
+        timeout: Optional[float] = None,
+    ) -> dict[str, bool]:
+        """Run every source; unfinished sources are marked failed after ``timeout``."""
+        queues = _build_queues(self.estimates, longest_first=True)
+        running: dict[str, int] = {}
+        cond = threading.Condition()
+        results: dict[str, bool] = {}
+        actual: dict[str, float] = {}
+        stopped = False
+
+        def worker(pool: str) -> None:
+            while True:
+                with cond:
+                    while True:
+                        if stopped:
+                            return
+                        job = _pick(pool, queues, running, self.class_limits)
+                        if job is not None:
+                            running[job.resource_class] = running.get(job.resource_class, 0) + 1
+                            break
+                        if not any(queues.values()):
+                            return
+                        cond.wait()
+                started = time.monotonic()
+                try:
+                    ok = bool(run_fn(job.slug))
+                except Exception as e:
+                    logger.error("Parallel execution failed for %s: %s", job.slug, e)
+                    ok = False
+                with cond:
+                    running[job.resource_class] -= 1
+                    results.setdefault(job.slug, ok)
+                    actual[job.slug] = time.monotonic() - started
+                    cond.notify_all()
+
+        threads = [
+            threading.Thread(target=worker, args=(pool,), name=f"crawl-{pool}-{i}", daemon=True)
+            for pool in (POOL_PLAYWRIGHT, POOL_REQUESTS)
+            for i in range(self.pool_sizes.get(pool, 0))
+        ]
+        run_started = time.monotonic()
+        deadline = run_started + timeout if timeout else None
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            thread.join(remaining)
+            if thread.is_alive():
+                break
+
+        if any(thread.is_alive() for thread in threads):
+            logger.error(
+                "Split-pool crawl batch exceeded timeout budget (%ss). "
+                "Marking unfinished sources as failed.",
+                timeout,
+            )
+            with cond:
+                stopped = True
+                for est in self.estimates:
+                    results.setdefault(est.slug, False)
+                cond.notify_all()
+            for thread in threads:
+                thread.join()
+
+        actual_makespan = time.monotonic() - run_started
+        self.report = self._build_report(actual, actual_makespan)
+        return results
+
+    def _build_report(self, actual: dict[str, float], actual_makespan: float) -> dict:
+        predicted = simulate_makespan(self.estimates, self.pool_sizes, self.class_limits)
+        baseline = simulate_makespan(
+            self.estimates,
+            self.pool_sizes,
+            longest_first=False,
+            work_stealing=False,
+        )
+        misses = sorted(
+            (
+                (est.slug, est.predicted_seconds, actual[est.slug])
+                for est in self.estimates
+                if est.slug in actual
+            ),
+            key=lambda row: abs(row[2] - row[1]),
+            reverse=True,
+        )
+        return {
+            "sources": len(self.estimates),
+            "with_history": sum(1 for e in self.estimates if e.has_history),
+            "predicted_makespan_seconds": round(predicted, 1),
+            "baseline_predicted_makespan_seconds": round(baseline, 1),
+            "actual_makespan_seconds": round(actual_makespan, 1),
+            "largest_misses": [
+                {"slug": slug, "predicted": round(p, 1), "actual": round(a, 1)}
+                for slug, p, a in misses[:5]
+            ],
+        }
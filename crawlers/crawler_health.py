@@ -5,12 +5,20 @@ Tracks crawl results, classifies errors, calculates health scores,
 and provides adaptive rate limiting recommendations.
 
 Uses SQLite for local storage to ensure reliability tracking works
-even when network/database is unstable.
+even when network/database is unstable. Each process keeps one connection
+open, commits run events in small batches, and mirrors per-source health in
+memory so scheduling-time checks don't touch the database. Runs older than
+the raw retention window are compacted into daily rollups rather than
+deleted.
 """
 
+import atexit
 import sqlite3
 import os
 import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from typing import Optional
@@ -146,23 +154,57 @@ def classify_error(error_message: str) -> ErrorClassification:
     return ERROR_CLASSIFICATIONS["unknown"]
 
 
-@contextmanager
-def get_db():
-    """Get a database connection with automatic cleanup."""
-    conn = sqlite3.connect(HEALTH_DB_PATH, timeout=10)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA busy_timeout = 10000")
-    conn.execute("PRAGMA journal_mode = WAL")
-    try:
-        yield conn
-    finally:
-        conn.close()
-
+# How long a batch of telemetry writes may stay uncommitted, and how many
+# statements it may hold, before it is flushed.
+FLUSH_INTERVAL_SECONDS = 2.0
+FLUSH_EVERY = 50
+# Window for the socket-error rate behind get_recommended_workers().
+RECENT_WINDOW = timedelta(hours=1)
+
+_HEALTH_COLUMNS = (
+    "consecutive_failures",
+    "total_crawls",
+    "successful_crawls",
+    "last_success_at",
+    "last_failure_at",
+    "last_error_type",
+    "health_score",
+    "updated_at",
+)
+
+
+class _TelemetryStore:
+    """One long-lived SQLite connection plus in-memory per-source aggregates.
+
+    Run events are written inside an open transaction that is committed in
+    batches (every FLUSH_EVERY statements or FLUSH_INTERVAL_SECONDS, before
+    any SQL read of ``crawl_runs``, and at exit).  ``source_health`` rows and
+    the last hour of run outcomes are mirrored in memory and updated with the
+    same arithmetic as the SQL, so health checks during scheduling are dict
+    lookups.
+    """
 
-def init_health_db():
-    """Initialize the health tracking database schema."""
-    with get_db() as conn:
-        cursor = conn.cursor()
+    def __init__(self, path: str):
+        self.path = path
+        self.pid = os.getpid()
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA busy_timeout = 10000")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self._create_schema()
+        self._pending = 0
+        self._pending_since = 0.0
+        self._flush_timer: Optional[threading.Timer] = None
+        self._health: Optional[dict[str, dict]] = None
+        self._score_sum = 0.0
+        self._open_runs: dict[int, tuple[str, datetime]] = {}
+        self._recent: deque[tuple[datetime, int]] = deque()
+        self._recent_errors: dict[int, Optional[str]] = {}
+
+    def _create_schema(self) -> None:
+        cursor = self.conn.cursor()
 
         # Crawl runs - one row per crawl attempt
         cursor.execute("""
@@ -197,13 +239,323 @@ def init_health_db():
             )
         """)
 
+        # Daily rollups - compacted history of runs older than the raw window
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_run_rollups (
+                day TEXT NOT NULL,
+                source_slug TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error_type TEXT NOT NULL DEFAULT '',
+                runs INTEGER NOT NULL DEFAULT 0,
+                events_found INTEGER NOT NULL DEFAULT 0,
+                events_new INTEGER NOT NULL DEFAULT 0,
+                events_updated INTEGER NOT NULL DEFAULT 0,
+                duration_seconds_sum REAL NOT NULL DEFAULT 0,
+                duration_seconds_max REAL,
+                PRIMARY KEY (day, source_slug, status, error_type)
+            )
+        """)
+
         # Indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_slug ON crawl_runs(source_slug)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_runs_started ON crawl_runs(started_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_rollups_slug ON crawl_run_rollups(source_slug, day)")
 
-        conn.commit()
+        self.conn.commit()
         logger.debug("Health database initialized")
 
+    # ----- write batching -----
+
+    def _wrote(self, statements: int = 1) -> None:
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending += statements
+        if (
+            self._pending >= FLUSH_EVERY
+            or time.monotonic() - self._pending_since >= FLUSH_INTERVAL_SECONDS
+        ):
+            self.flush()
+        elif self._flush_timer is None:
+            timer = threading.Timer(FLUSH_INTERVAL_SECONDS, self._timed_flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def _timed_flush(self) -> None:
+        with self.lock:
+            self._flush_timer = None
+            self.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._pending:
+                self.conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            try:
+                self.flush()
+            finally:
+                self.conn.close()
+
+    # ----- in-memory aggregates -----
+
+    def invalidate(self) -> None:
+        """Drop the mirrors after raw SQL writes through ``get_db()``."""
+        with self.lock:
+            self._health = None
+            self._recent.clear()
+            self._recent_errors.clear()
+
+    def _health_rows(self) -> dict[str, dict]:
+        if self._health is None:
+            rows = self.conn.execute("SELECT * FROM source_health").fetchall()
+            self._health = {
+                row["source_slug"]: {col: row[col] for col in _HEALTH_COLUMNS} for row in rows
+            }
+            self._score_sum = sum(float(h["health_score"] or 0.0) for h in self._health.values())
+            cutoff = datetime.utcnow() - RECENT_WINDOW
+            recent = self.conn.execute(
+                "SELECT id, started_at, error_type FROM crawl_runs WHERE started_at >= ? ORDER BY started_at",
+                (cutoff.isoformat(),),
+            ).fetchall()
+            self._recent = deque((datetime.fromisoformat(r["started_at"]), r["id"]) for r in recent)
+            self._recent_errors = {r["id"]: r["error_type"] for r in recent}
+        return self._health
+
+    def _apply_health(self, slug: str, success: bool, now: str, error_type: Optional[str], penalty: float) -> None:
+        health = self._health_rows()
+        row = health.get(slug)
+        if row is None:
+            row = {
+                "consecutive_failures": 0,
+                "total_crawls": 0,
+                "successful_crawls": 0,
+                "last_success_at": None,
+                "last_failure_at": None,
+                "last_error_type": None,
+                "health_score": 100.0 if success else 100.0 - penalty,
+                "updated_at": now,
+            }
+            health[slug] = row
+            self._score_sum += row["health_score"]
+        else:
+            old_score = float(row["health_score"] or 0.0)
+            if success:
+                new_score = min(100.0, old_score + 5.0)
+            else:
+                new_score = max(0.0, old_score - penalty)
+            self._score_sum += new_score - old_score
+            row["health_score"] = new_score
+        row["total_crawls"] = (row["total_crawls"] or 0) + 1
+        row["updated_at"] = now
+        if success:
+            row["consecutive_failures"] = 0
+            row["successful_crawls"] = (row["successful_crawls"] or 0) + 1
+            row["last_success_at"] = now
+        else:
+            row["consecutive_failures"] = (row["consecutive_failures"] or 0) + 1
+            row["last_failure_at"] = now
+            row["last_error_type"] = error_type
+
+    def source_health_row(self, slug: str) -> Optional[dict]:
+        with self.lock:
+            row = self._health_rows().get(slug)
+            return dict(row) if row else None
+
+    def all_health_rows(self) -> dict[str, dict]:
+        with self.lock:
+            return {slug: dict(row) for slug, row in self._health_rows().items()}
+
+    def average_health(self) -> Optional[float]:
+        with self.lock:
+            health = self._health_rows()
+            return self._score_sum / len(health) if health else None
+
+    def recent_counts(self) -> tuple[int, int]:
+        """(runs started, socket errors) within RECENT_WINDOW."""
+        with self.lock:
+            self._health_rows()
+            cutoff = datetime.utcnow() - RECENT_WINDOW
+            while self._recent and self._recent[0][0] < cutoff:
+                _, run_id = self._recent.popleft()
+                self._recent_errors.pop(run_id, None)
+            socket_errors = sum(1 for e in self._recent_errors.values() if e == "socket")
+            return len(self._recent), socket_errors
+
+    # ----- run events -----
+
+    def start(self, source_slug: str) -> int:
+        with self.lock:
+            started = datetime.utcnow()
+            cursor = self.conn.execute(
+                """
+                INSERT INTO crawl_runs (source_slug, started_at, status)
+                VALUES (?, ?, 'running')
+                """,
+                (source_slug, started.isoformat()),
+            )
+            run_id = cursor.lastrowid
+            self._open_runs[run_id] = (source_slug, started)
+            if self._health is not None:
+                self._recent.append((started, run_id))
+                self._recent_errors[run_id] = None
+            self._wrote()
+            return run_id
+
+    def _run_info(self, run_id: int) -> Optional[tuple[str, datetime]]:
+        info = self._open_runs.pop(run_id, None)
+        if info is not None:
+            return info
+        row = self.conn.execute(
+            "SELECT started_at, source_slug FROM crawl_runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        if not row:
+            return None
+        return row["source_slug"], datetime.fromisoformat(row["started_at"])
+
+    def finish_success(self, run_id: int, events_found: int, events_new: int, events_updated: int) -> Optional[str]:
+        with self.lock:
+            info = self._run_info(run_id)
+            if info is None:
+                return None
+            source_slug, started_at = info
+            self._health_rows()  # load the mirror before changing what it mirrors
+            now_dt = datetime.utcnow()
+            now = now_dt.isoformat()
+            duration = (now_dt - started_at).total_seconds()
+
+            # Update crawl run
+            self.conn.execute("""
+                UPDATE crawl_runs
+                SET completed_at = ?, duration_seconds = ?, status = 'success',
+                    events_found = ?, events_new = ?, events_updated = ?
+                WHERE id = ?
+            """, (now, duration, events_found, events_new, events_updated, run_id))
+
+            # Update source health - reset failures, boost score
+            self.conn.execute("""
+                INSERT INTO source_health (source_slug, consecutive_failures, total_crawls,
+                                           successful_crawls, last_success_at, health_score, updated_at)
+                VALUES (?, 0, 1, 1, ?, 100.0, ?)
+                ON CONFLICT(source_slug) DO UPDATE SET
+                    consecutive_failures = 0,
+                    total_crawls = total_crawls + 1,
+                    successful_crawls = successful_crawls + 1,
+                    last_success_at = excluded.last_success_at,
+                    health_score = MIN(100.0, health_score + 5.0),
+                    updated_at = excluded.updated_at
+            """, (source_slug, now, now))
+
+            self._apply_health(source_slug, True, now, None, 0.0)
+            self._wrote(2)
+            return source_slug
+
+    def finish_failure(self, run_id: int, error_message: str, error_class: ErrorClassification) -> Optional[str]:
+        with self.lock:
+            info = self._run_info(run_id)
+            if info is None:
+                return None
+            source_slug, started_at = info
+            self._health_rows()  # load the mirror before changing what it mirrors
+            now_dt = datetime.utcnow()
+            now = now_dt.isoformat()
+            duration = (now_dt - started_at).total_seconds()
+
+            # Update crawl run
+            self.conn.execute("""
+                UPDATE crawl_runs
+                SET completed_at = ?, duration_seconds = ?, status = 'failed',
+                    error_message = ?, error_type = ?, is_transient = ?
+                WHERE id = ?
+            """, (now, duration, error_message[:500], error_class.error_type,
+                  error_class.is_transient, run_id))
+
+            # Calculate health penalty - transient errors penalize less
+            health_penalty = 5.0 if error_class.is_transient else 15.0
+
+            # Update source health
+            self.conn.execute("""
+                INSERT INTO source_health (source_slug, consecutive_failures, total_crawls,
+                                           last_failure_at, last_error_type, health_score, updated_at)
+                VALUES (?, 1, 1, ?, ?, ?, ?)
+                ON CONFLICT(source_slug) DO UPDATE SET
+                    consecutive_failures = consecutive_failures + 1,
+                    total_crawls = total_crawls + 1,
+                    last_failure_at = excluded.last_failure_at,
+                    last_error_type = excluded.last_error_type,
+                    health_score = MAX(0.0, health_score - ?),
+                    updated_at = excluded.updated_at
+            """, (source_slug, now, error_class.error_type, 100.0 - health_penalty,
+                  now, health_penalty))
+
+            self._apply_health(source_slug, False, now, error_class.error_type, health_penalty)
+            if run_id in self._recent_errors:
+                self._recent_errors[run_id] = error_class.error_type
+            self._wrote(2)
+            return source_slug
+
+
+_STORE: Optional[_TelemetryStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def _store() -> _TelemetryStore:
+    """The process-wide store for the current HEALTH_DB_PATH (reopened after fork)."""
+    global _STORE
+    with _STORE_LOCK:
+        store = _STORE
+        if store is not None and store.path == HEALTH_DB_PATH and store.pid == os.getpid():
+            return store
+        if store is not None and store.pid == os.getpid():
+            store.close()
+        _STORE = _TelemetryStore(HEALTH_DB_PATH)
+        return _STORE
+
+
+def flush_health_writes() -> None:
+    """Commit any batched telemetry writes now."""
+    store = _STORE
+    if store is not None and store.pid == os.getpid():
+        store.flush()
+
+
+atexit.register(flush_health_writes)
+
+
+@contextmanager
+def _reader():
+    """The shared connection with batched writes committed, for internal reads."""
+    store = _store()
+    with store.lock:
+        store.flush()
+        yield store.conn
+
+
+@contextmanager
+def get_db():
+    """The shared health DB connection, for ad-hoc SQL.
+
+    Batched writes are committed first so reads see them, and the in-memory
+    aggregates are reloaded afterwards in case the caller wrote to them.
+    """
+    store = _store()
+    with store.lock:
+        store.flush()
+        try:
+            yield store.conn
+        finally:
+            store.invalidate()
+
+
+def init_health_db():
+    """Initialize the health tracking database schema."""
+    _store()
+
 
 def cancel_stale_runs(
     *,
@@ -211,11 +563,10 @@ def cancel_stale_runs(
     reason: str = "Auto-cancelled stale local crawl run during maintenance.",
 ) -> int:
     """Mark stale local crawl runs as cancelled so health reports stop treating them as active."""
-    init_health_db()
     cutoff = (datetime.utcnow() - timedelta(minutes=max_age_minutes)).isoformat()
     now = datetime.utcnow().isoformat()
 
-    with get_db() as conn:
+    with _reader() as conn:
         cursor = conn.cursor()
         cursor.execute(
             """
@@ -244,15 +595,7 @@ def cancel_stale_runs(
 
 def record_crawl_start(source_slug: str) -> int:
     """Record the start of a crawl. Returns the run ID."""
-    init_health_db()
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO crawl_runs (source_slug, started_at, status)
-            VALUES (?, ?, 'running')
-        """, (source_slug, datetime.utcnow().isoformat()))
-        conn.commit()
-        return cursor.lastrowid
+    return _store().start(source_slug)
 
 
 def record_crawl_success(
@@ -262,164 +605,73 @@ def record_crawl_success(
     events_updated: int
 ):
     """Record a successful crawl completion."""
-    with get_db() as conn:
-        cursor = conn.cursor()
-        now = datetime.utcnow().isoformat()
-
-        # Get start time and source
-        cursor.execute("SELECT started_at, source_slug FROM crawl_runs WHERE id = ?", (run_id,))
-        row = cursor.fetchone()
-        if not row:
-            return
-
-        started_at = datetime.fromisoformat(row["started_at"])
-        source_slug = row["source_slug"]
-        duration = (datetime.utcnow() - started_at).total_seconds()
-
-        # Update crawl run
-        cursor.execute("""
-            UPDATE crawl_runs
-            SET completed_at = ?, duration_seconds = ?, status = 'success',
-                events_found = ?, events_new = ?, events_updated = ?
-            WHERE id = ?
-        """, (now, duration, events_found, events_new, events_updated, run_id))
-
-        # Update source health - reset failures, boost score
-        cursor.execute("""
-            INSERT INTO source_health (source_slug, consecutive_failures, total_crawls,
-                                       successful_crawls, last_success_at, health_score, updated_at)
-            VALUES (?, 0, 1, 1, ?, 100.0, ?)
-            ON CONFLICT(source_slug) DO UPDATE SET
-                consecutive_failures = 0,
-                total_crawls = total_crawls + 1,
-                successful_crawls = successful_crawls + 1,
-                last_success_at = excluded.last_success_at,
-                health_score = MIN(100.0, health_score + 5.0),
-                updated_at = excluded.updated_at
-        """, (source_slug, now, now))
-
-        conn.commit()
+    source_slug = _store().finish_success(run_id, events_found, events_new, events_updated)
+    if source_slug:
         logger.debug(f"Recorded success for {source_slug}: {events_found} events")
 
 
 def record_crawl_failure(run_id: int, error_message: str):
     """Record a failed crawl."""
     error_class = classify_error(error_message)
-
-    with get_db() as conn:
-        cursor = conn.cursor()
-        now = datetime.utcnow().isoformat()
-
-        # Get source slug and calculate duration
-        cursor.execute("SELECT started_at, source_slug FROM crawl_runs WHERE id = ?", (run_id,))
-        row = cursor.fetchone()
-        if not row:
-            return
-
-        started_at = datetime.fromisoformat(row["started_at"])
-        source_slug = row["source_slug"]
-        duration = (datetime.utcnow() - started_at).total_seconds()
-
-        # Update crawl run
-        cursor.execute("""
-            UPDATE crawl_runs
-            SET completed_at = ?, duration_seconds = ?, status = 'failed',
-                error_message = ?, error_type = ?, is_transient = ?
-            WHERE id = ?
-        """, (now, duration, error_message[:500], error_class.error_type,
-              error_class.is_transient, run_id))
-
-        # Calculate health penalty - transient errors penalize less
-        health_penalty = 5.0 if error_class.is_transient else 15.0
-
-        # Update source health
-        cursor.execute("""
-            INSERT INTO source_health (source_slug, consecutive_failures, total_crawls,
-                                       last_failure_at, last_error_type, health_score, updated_at)
-            VALUES (?, 1, 1, ?, ?, ?, ?)
-            ON CONFLICT(source_slug) DO UPDATE SET
-                consecutive_failures = consecutive_failures + 1,
-                total_crawls = total_crawls + 1,
-                last_failure_at = excluded.last_failure_at,
-                last_error_type = excluded.last_error_type,
-                health_score = MAX(0.0, health_score - ?),
-                updated_at = excluded.updated_at
-        """, (source_slug, now, error_class.error_type, 100.0 - health_penalty,
-              now, health_penalty))
-
-        conn.commit()
+    source_slug = _store().finish_failure(run_id, error_message, error_class)
+    if source_slug:
         logger.debug(f"Recorded failure for {source_slug}: {error_class.error_type}")
 
 
 def get_source_health(source_slug: str) -> Optional[SourceHealth]:
-    """Get health information for a source."""
-    init_health_db()
-
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT * FROM source_health WHERE source_slug = ?
-        """, (source_slug,))
-        row = cursor.fetchone()
-
-        if not row:
-            return None
-
-        total = row["total_crawls"] or 1
-        success = row["successful_crawls"] or 0
-        failures = row["consecutive_failures"] or 0
-
-        # Calculate recommended delay based on health and failure pattern
-        base_delay = 1.0
-        if failures >= 5:
-            recommended_delay = base_delay * 10  # 10 second delay for frequently failing
-        elif failures >= 3:
-            recommended_delay = base_delay * 5
-        elif failures >= 1:
-            recommended_delay = base_delay * 2
-        else:
-            recommended_delay = base_delay
-
-        return SourceHealth(
-            source_slug=source_slug,
-            health_score=row["health_score"],
-            consecutive_failures=failures,
-            total_crawls=total,
-            successful_crawls=success,
-            success_rate=success / total if total > 0 else 0.0,
-            last_success_at=row["last_success_at"],
-            last_failure_at=row["last_failure_at"],
-            last_error_type=row["last_error_type"],
-            recommended_delay_seconds=recommended_delay
-        )
+    """Get health information for a source (an in-memory lookup)."""
+    row = _store().source_health_row(source_slug)
+    if not row:
+        return None
+    return _to_source_health(source_slug, row)
+
+
+def _to_source_health(source_slug: str, row: dict) -> SourceHealth:
+    total = row["total_crawls"] or 1
+    success = row["successful_crawls"] or 0
+    failures = row["consecutive_failures"] or 0
+
+    # Calculate recommended delay based on health and failure pattern
+    base_delay = 1.0
+    if failures >= 5:
+        recommended_delay = base_delay * 10  # 10 second delay for frequently failing
+    elif failures >= 3:
+        recommended_delay = base_delay * 5
+    elif failures >= 1:
+        recommended_delay = base_delay * 2
+    else:
+        recommended_delay = base_delay
+
+    return SourceHealth(
+        source_slug=source_slug,
+        health_score=row["health_score"],
+        consecutive_failures=failures,
+        total_crawls=total,
+        successful_crawls=success,
+        success_rate=success / total if total > 0 else 0.0,
+        last_success_at=row["last_success_at"],
+        last_failure_at=row["last_failure_at"],
+        last_error_type=row["last_error_type"],
+        recommended_delay_seconds=recommended_delay
+    )
 
 
 def get_all_source_health() -> list[SourceHealth]:
     """Get health information for all tracked sources."""
-    init_health_db()
-
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT source_slug FROM source_health ORDER BY health_score ASC")
-        slugs = [row["source_slug"] for row in cursor.fetchall()]
-
-    return [h for slug in slugs if (h := get_source_health(slug)) is not None]
+    rows = _store().all_health_rows()
+    ordered = sorted(rows.items(), key=lambda item: item[1]["health_score"])
+    return [_to_source_health(slug, row) for slug, row in ordered]
 
 
 def get_unhealthy_sources(min_failures: int = 3) -> list[SourceHealth]:
     """Get sources with consecutive failures above threshold."""
-    init_health_db()
-
-    with get_db() as conn:
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT source_slug FROM source_health
-            WHERE consecutive_failures >= ?
-            ORDER BY consecutive_failures DESC
-        """, (min_failures,))
-        slugs = [row["source_slug"] for row in cursor.fetchall()]
-
-    return [h for slug in slugs if (h := get_source_health(slug)) is not None]
+    rows = _store().all_health_rows()
+    flagged = [
+        (slug, row) for slug, row in rows.items()
+        if (row["consecutive_failures"] or 0) >= min_failures
+    ]
+    flagged.sort(key=lambda item: item[1]["consecutive_failures"], reverse=True)
+    return [_to_source_health(slug, row) for slug, row in flagged]
 
 
 def get_recommended_workers() -> int:
@@ -429,27 +681,10 @@ def get_recommended_workers() -> int:
     If many sources are failing due to socket exhaustion, reduce workers.
     If everything is healthy, allow more parallelism.
     """
-    init_health_db()
-
-    # Check recent socket/resource errors
-    cutoff = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+    store = _store()
 
-    with get_db() as conn:
-        cursor = conn.cursor()
-
-        # Count recent socket errors
-        cursor.execute("""
-            SELECT COUNT(*) as socket_errors
-            FROM crawl_runs
-            WHERE started_at >= ? AND error_type = 'socket'
-        """, (cutoff,))
-        socket_errors = cursor.fetchone()["socket_errors"] or 0
-
-        # Count recent total crawls
-        cursor.execute("""
-            SELECT COUNT(*) as total FROM crawl_runs WHERE started_at >= ?
-        """, (cutoff,))
-        total_recent = cursor.fetchone()["total"] or 0
+    # Recent socket errors vs total crawls (last hour, kept in memory)
+    total_recent, socket_errors = store.recent_counts()
 
     # If more than 10% socket errors in last hour, reduce workers
     if total_recent > 10:
@@ -462,11 +697,10 @@ def get_recommended_workers() -> int:
             return 3
 
     # Default: check system-wide health
-    all_health = get_all_source_health()
-    if not all_health:
+    avg_health = store.average_health()
+    if avg_health is None:
         return 2  # No data yet, be conservative
 
-    avg_health = sum(h.health_score for h in all_health) / len(all_health)
     if avg_health < 50:
         return 2
     elif avg_health < 70:
@@ -475,6 +709,36 @@ def get_recommended_workers() -> int:
         return 4  # Good health, allow more parallelism
 
 
+def get_duration_history(days: int = 30, per_source: int = 5) -> dict[str, list[float]]:
+    """Most recent completed crawl durations per source (newest first).
+
+    Failed runs are included: a source that keeps timing out still occupies a
+    worker for that long.
+    """
+    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+    with _reader() as conn:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT source_slug, duration_seconds FROM (
+                SELECT source_slug, duration_seconds,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY source_slug ORDER BY started_at DESC
+                       ) AS rn
+                FROM crawl_runs
+                WHERE started_at >= ? AND duration_seconds IS NOT NULL
+                  AND status IN ('success', 'failed')
+            )
+            WHERE rn <= ?
+            ORDER BY source_slug, rn
+        """, (cutoff, per_source))
+        history: dict[str, list[float]] = {}
+        for row in cursor.fetchall():
+            history.setdefault(row["source_slug"], []).append(float(row["duration_seconds"]))
+
+    return history
+
+
 def get_recommended_delay(source_slug: str) -> float:
     """Get recommended delay before crawling this source.
 
@@ -574,9 +838,7 @@ def get_all_circuit_states() -> list[CircuitState]:
 
 def get_system_health_summary() -> dict:
     """Get overall system health summary."""
-    init_health_db()
-
-    with get_db() as conn:
+    with _reader() as conn:
         cursor = conn.cursor()
 
         # Today's stats
@@ -604,16 +866,14 @@ def get_system_health_summary() -> dict:
         """, (f"{today}%",))
         error_breakdown = {row["error_type"]: row["count"] for row in cursor.fetchall()}
 
-        # Health distribution
-        cursor.execute("""
-            SELECT
-                SUM(CASE WHEN health_score >= 80 THEN 1 ELSE 0 END) as healthy,
-                SUM(CASE WHEN health_score >= 50 AND health_score < 80 THEN 1 ELSE 0 END) as degraded,
-                SUM(CASE WHEN health_score < 50 THEN 1 ELSE 0 END) as unhealthy,
-                COUNT(*) as total
-            FROM source_health
-        """)
-        health_dist = cursor.fetchone()
+    # Health distribution
+    scores = [row["health_score"] for row in _store().all_health_rows().values()]
+    health_dist = {
+        "healthy": sum(1 for score in scores if score >= 80),
+        "degraded": sum(1 for score in scores if 50 <= score < 80),
+        "unhealthy": sum(1 for score in scores if score < 50),
+        "total": len(scores),
+    }
 
     total = today_stats["total"] or 0
     success = today_stats["success"] or 0
@@ -639,16 +899,81 @@ def get_system_health_summary() -> dict:
     }
 
 
-def cleanup_old_data(days_to_keep: int = 30):
-    """Remove data older than specified days."""
+def rollup_old_runs(days_to_keep: int = 30) -> int:
+    """Compact finished runs older than ``days_to_keep`` into daily rollups.
+
+    Rows are summed into ``crawl_run_rollups`` per (day, source, status,
+    error_type) and then removed from ``crawl_runs``, so long history stays
+    queryable for trends at a fraction of the size. Returns rows compacted.
+    """
     cutoff = (datetime.utcnow() - timedelta(days=days_to_keep)).isoformat()
 
-    with get_db() as conn:
+    with _reader() as conn:
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM crawl_runs WHERE started_at < ?", (cutoff,))
-        deleted = cursor.rowcount
+        cursor.execute("""
+            INSERT INTO crawl_run_rollups (
+                day, source_slug, status, error_type, runs, events_found,
+                events_new, events_updated, duration_seconds_sum, duration_seconds_max
+            )
+            SELECT substr(started_at, 1, 10), source_slug, status, COALESCE(error_type, ''),
+                   COUNT(*), COALESCE(SUM(events_found), 0), COALESCE(SUM(events_new), 0),
+                   COALESCE(SUM(events_updated), 0), COALESCE(SUM(duration_seconds), 0),
+                   MAX(duration_seconds)
+            FROM crawl_runs
+            WHERE started_at < ? AND status != 'running'
+            GROUP BY 1, 2, 3, 4
+            ON CONFLICT(day, source_slug, status, error_type) DO UPDATE SET
+                runs = runs + excluded.runs,
+                events_found = events_found + excluded.events_found,
+                events_new = events_new + excluded.events_new,
+                events_updated = events_updated + excluded.events_updated,
+                duration_seconds_sum = duration_seconds_sum + excluded.duration_seconds_sum,
+                duration_seconds_max = MAX(COALESCE(duration_seconds_max, 0),
+                                           COALESCE(excluded.duration_seconds_max, 0))
+        """, (cutoff,))
+        cursor.execute(
+            "DELETE FROM crawl_runs WHERE started_at < ? AND status != 'running'", (cutoff,)
+        )
+        compacted = cursor.rowcount
         conn.commit()
-        logger.info(f"Cleaned up {deleted} crawl runs older than {days_to_keep} days")
+    return compacted
+
+
+def get_daily_trend(source_slug: Optional[str] = None, days: int = 180) -> list[dict]:
+    """Per-day run counts, outcomes and durations from rollups plus recent raw runs."""
+    cutoff = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%d")
+    slug_filter = "AND source_slug = ?" if source_slug else ""
+    params: tuple = (cutoff, source_slug) if source_slug else (cutoff,)
+
+    with _reader() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT day,
+                   SUM(runs) AS runs,
+                   SUM(CASE WHEN status = 'success' THEN runs ELSE 0 END) AS successes,
+                   SUM(CASE WHEN status = 'failed' THEN runs ELSE 0 END) AS failures,
+                   SUM(events_found) AS events_found,
+                   SUM(duration_seconds_sum) AS duration_seconds
+            FROM (
+                SELECT day, source_slug, status, runs, events_found, duration_seconds_sum
+                FROM crawl_run_rollups
+                UNION ALL
+                SELECT substr(started_at, 1, 10), source_slug, status, 1,
+                       COALESCE(events_found, 0), COALESCE(duration_seconds, 0)
+                FROM crawl_runs
+                WHERE status != 'running'
+            )
+            WHERE day >= ? {slug_filter}
+            GROUP BY day
+            ORDER BY day
+        """, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+
+def cleanup_old_data(days_to_keep: int = 30):
+    """Compact data older than specified days into daily rollups."""
+    compacted = rollup_old_runs(days_to_keep)
+    logger.info(f"Rolled up {compacted} crawl runs older than {days_to_keep} days")
 
 
 def print_health_report():
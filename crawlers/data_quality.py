@@ -3,13 +3,16 @@ Data Quality Analysis for LostCity Crawlers.
 
 Monitors event data quality across sources, identifies issues,
 tracks quality trends over time, and flags crawlers needing attention.
+Fleet-wide reports read per-source counts from the shared health snapshot
+(health_analytics); the single-source helpers still query directly.
 """
 
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass, field
 from typing import Optional
 from db import get_client
+from health_analytics import load_source_health_snapshot, quality_counts
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,9 @@ TBA_PATTERNS = [
 ]
 
 
+CINEMA_SLUG_KEYWORDS = ("theatre", "theater", "cinema", "film")
+
+
 def detect_tba_content(text: str) -> bool:
     """Check if text contains TBA/placeholder patterns."""
     if not text:
@@ -59,18 +65,9 @@ def detect_tba_content(text: str) -> bool:
     return any(pattern in text_lower for pattern in TBA_PATTERNS)
 
 
-def calculate_source_quality(source_id: int, source_slug: str, source_name: str, days: int = 30) -> QualityMetrics:
-    """Calculate quality metrics for a source's recent events."""
-    client = get_client()
-    cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
-
-    # Get recent events
-    result = client.table("events").select(
-        "id, title, description, start_time, image_url, price_min, is_free, is_all_day, created_at"
-    ).eq("source_id", source_id).gte("created_at", cutoff).execute()
-
-    events = result.data or []
-    total = len(events)
+def metrics_from_counts(source_slug: str, source_name: str, counts: dict, days: int = 30) -> QualityMetrics:
+    """Build QualityMetrics from aggregated counts (see health_analytics.quality_counts)."""
+    total = int(counts.get("total") or 0)
 
     if total == 0:
         return QualityMetrics(
@@ -89,29 +86,16 @@ def calculate_source_quality(source_id: int, source_slug: str, source_name: str,
             issues=["No events in last {days} days"]
         )
 
-    # Calculate metrics
-    with_time = sum(1 for e in events if e.get("start_time"))
-    with_image = sum(1 for e in events if e.get("image_url"))
-    with_description = sum(1 for e in events if e.get("description") and len(e.get("description", "")) > 20)
-    with_price = sum(1 for e in events if e.get("price_min") is not None or e.get("is_free"))
-
-    # Detect TBA/placeholder content
-    tba_count = 0
-    coming_soon_count = 0
-    for e in events:
-        title = e.get("title", "")
-        desc = e.get("description", "")
-        if detect_tba_content(title) or detect_tba_content(desc):
-            tba_count += 1
-        if desc and "coming soon" in desc.lower():
-            coming_soon_count += 1
-
-    # Missing times (non-all-day events without times)
-    missing_time = sum(1 for e in events if not e.get("start_time") and not e.get("is_all_day"))
+    with_time = int(counts["with_time"])
+    with_image = int(counts["with_image"])
+    with_description = int(counts["with_description"])
+    with_price = int(counts["with_price"])
+    tba_count = int(counts["tba"])
+    coming_soon_count = int(counts["coming_soon"])
+    missing_time = int(counts["missing_time"])
 
     # Average description length
-    desc_lengths = [len(e.get("description", "")) for e in events if e.get("description")]
-    avg_desc_len = sum(desc_lengths) / len(desc_lengths) if desc_lengths else 0
+    avg_desc_len = counts["desc_len_sum"] / counts["desc_count"] if counts.get("desc_count") else 0
 
     # Calculate completeness score (0-100)
     # Weight: time=30, image=25, description=20, no-TBA=15, price=10
@@ -155,6 +139,20 @@ def calculate_source_quality(source_id: int, source_slug: str, source_name: str,
     )
 
 
+def calculate_source_quality(source_id: int, source_slug: str, source_name: str, days: int = 30) -> QualityMetrics:
+    """Calculate quality metrics for a single source's recent events."""
+    client = get_client()
+    cutoff = datetime.utcnow() - timedelta(days=days)
+
+    # Get recent events
+    result = client.table("events").select(
+        "id, title, description, start_time, image_url, price_min, is_free, is_all_day, created_at"
+    ).eq("source_id", source_id).gte("created_at", cutoff.isoformat()).execute()
+
+    counts = quality_counts(result.data or [], cutoff.replace(tzinfo=timezone.utc))
+    return metrics_from_counts(source_slug, source_name, counts, days)
+
+
 def get_quality_trend(source_id: int, source_slug: str) -> Optional[QualityTrend]:
     """Compare quality between last 7 days and previous 7 days."""
     client = get_client()
@@ -210,17 +208,51 @@ def get_quality_trend(source_id: int, source_slug: str) -> Optional[QualityTrend
     )
 
 
-def get_all_source_quality(days: int = 30, min_events: int = 5) -> list[QualityMetrics]:
-    """Get quality metrics for all sources with recent events."""
-    client = get_client()
+def trend_from_counts(source_slug: str, counts: dict, now: Optional[datetime] = None) -> Optional[QualityTrend]:
+    """Compare the last 7 days with the previous 7 from aggregated counts."""
+    recent_total = counts.get("recent_total") or 0
+    previous_total = counts.get("previous_total") or 0
+    if not recent_total or not previous_total:
+        return None
 
-    # Get active sources
-    sources = client.table("sources").select("id, slug, name").eq("is_active", True).execute()
+    def calc_score(prefix, total):
+        return (
+            (counts[f"{prefix}_with_time"] / total) * 40
+            + (counts[f"{prefix}_with_image"] / total) * 35
+            + (counts[f"{prefix}_with_description"] / total) * 25
+        )
+
+    score_now = calc_score("recent", recent_total)
+    score_then = calc_score("previous", previous_total)
+    change = score_now - score_then
+
+    if change > 5:
+        direction = "improving"
+    elif change < -5:
+        direction = "declining"
+    else:
+        direction = "stable"
+
+    now = now or datetime.utcnow()
+    return QualityTrend(
+        source_slug=source_slug,
+        period_start=(now - timedelta(days=14)).isoformat()[:10],
+        period_end=now.isoformat()[:10],
+        completeness_then=score_then,
+        completeness_now=score_now,
+        change=change,
+        direction=direction
+    )
+
+
+def get_all_source_quality(days: int = 30, min_events: int = 5) -> list[QualityMetrics]:
+    """Get quality metrics for all sources with recent events (from the health snapshot)."""
+    snapshot = load_source_health_snapshot(days)
 
     results = []
-    for source in sources.data or []:
-        metrics = calculate_source_quality(
-            source["id"], source["slug"], source["name"], days
+    for source in snapshot.sources:
+        metrics = metrics_from_counts(
+            source["slug"], source["name"], snapshot.quality_for(source["id"]), days
         )
         if metrics.total_events >= min_events:
             results.append(metrics)
@@ -238,12 +270,11 @@ def get_sources_needing_attention(threshold: float = 70) -> list[QualityMetrics]
 
 def get_declining_sources() -> list[QualityTrend]:
     """Get sources where quality is declining."""
-    client = get_client()
-    sources = client.table("sources").select("id, slug").eq("is_active", True).execute()
+    snapshot = load_source_health_snapshot()
 
     declining = []
-    for source in sources.data or []:
-        trend = get_quality_trend(source["id"], source["slug"])
+    for source in snapshot.sources:
+        trend = trend_from_counts(source["slug"], snapshot.quality_for(source["id"]))
         if trend and trend.direction == "declining":
             declining.append(trend)
 
@@ -253,12 +284,7 @@ def get_declining_sources() -> list[QualityTrend]:
 
 def get_cinema_quality_report() -> dict:
     """Get detailed quality report for cinema/film sources."""
-    client = get_client()
-
-    # Find film-related sources
-    result = client.table("sources").select("id, slug, name").or_(
-        "slug.ilike.%theatre%,slug.ilike.%theater%,slug.ilike.%cinema%,slug.ilike.%film%"
-    ).eq("is_active", True).execute()
+    snapshot = load_source_health_snapshot(days=30)
 
     report = {
         "sources": [],
@@ -269,8 +295,13 @@ def get_cinema_quality_report() -> dict:
         }
     }
 
-    for source in result.data or []:
-        metrics = calculate_source_quality(source["id"], source["slug"], source["name"], days=30)
+    for source in snapshot.sources:
+        # Film-related sources
+        if not any(kw in (source.get("slug") or "").lower() for kw in CINEMA_SLUG_KEYWORDS):
+            continue
+        metrics = metrics_from_counts(
+            source["slug"], source["name"], snapshot.quality_for(source["id"]), days=30
+        )
         if metrics.total_events > 0:
             report["sources"].append({
                 "slug": metrics.source_slug,
@@ -2,21 +2,92 @@
 Shared date parsing and normalization utilities for crawler ingestion.
 
 Primary goal: avoid bad year rollover creating far-future events.
+
+Parsing is on the path of every event from 150+ sources, so the common shapes
+("2026-03-06", "Fri, Mar 6", "March 6th, 2026", "6 March", "3/6/2026",
+"7pm-10pm", "Doors 7 / Show 8") are matched by precompiled patterns and built
+directly; only strings the grammar does not recognize go to dateutil.  The
+date fast path accepts exactly the inputs where it agrees with
+``dateutil.parser.parse(fuzzy=True)``, so rollover and year normalization are
+unchanged.  Results are memoized per (text, reference date) in bounded LRU
+caches.
 """
 
 from __future__ import annotations
 
 import re
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 from dateutil import parser as dateparser
 
 MAX_FUTURE_DAYS_DEFAULT = 270
 ROLLOVER_GRACE_DAYS_DEFAULT = 30
+PARSE_CACHE_SIZE = 16384
 
 _YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
 
+# Month and weekday tokens as dateutil's parserinfo knows them.
+_MONTHS = {
+    name: number
+    for number, names in enumerate(
+        (
+            ("jan", "january"),
+            ("feb", "february"),
+            ("mar", "march"),
+            ("apr", "april"),
+            ("may",),
+            ("jun", "june"),
+            ("jul", "july"),
+            ("aug", "august"),
+            ("sep", "sept", "september"),
+            ("oct", "october"),
+            ("nov", "november"),
+            ("dec", "december"),
+        ),
+        start=1,
+    )
+    for name in names
+}
+_MONTH = "(" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?"
+_WEEKDAY_NAME = (
+    r"(?:(?:mon|tue|tues|wed|thu|thur|thurs|fri|sat|sun)|"
+    r"(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday))"
+)
+_WEEKDAY = _WEEKDAY_NAME + r"[.,]?\s+"
+_DAY = r"(\d{1,2})(?:st|nd|rd|th)?"
+_YEAR_SUFFIX = r"(?:,?\s+(\d{4}))?"
+
+# "Fri, Mar 6", "March 6th, 2026"
+_MONTH_DAY_RE = re.compile(rf"^(?:{_WEEKDAY})?{_MONTH}\s+{_DAY}{_YEAR_SUFFIX}$", re.IGNORECASE)
+# "6 March", "Friday 6th March 2026"
+_DAY_MONTH_RE = re.compile(rf"^(?:{_WEEKDAY})?{_DAY}\s+{_MONTH}{_YEAR_SUFFIX}$", re.IGNORECASE)
+# "2026-03-06", "2026-03-06T19:00:00-05:00"
+_ISO_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?$"
+)
+# "3/6/2026" (month first, as dateutil reads it when the month is <= 12)
+_US_NUMERIC_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+
+_MERIDIEM = r"([ap])\.?\s*m\.?"
+_CLOCK_12H_RE = re.compile(rf"\b(\d{{1,2}})(?::(\d{{2}}))?\s*{_MERIDIEM}(?![a-z])", re.IGNORECASE)
+# "7-10pm", "7:30 – 9:30 p.m.": the first time shares the range's meridiem,
+# unless the range crosses noon/midnight ("10-4pm", "11-12pm").
+_CLOCK_RANGE_RE = re.compile(
+    rf"\b(\d{{1,2}})(?::(\d{{2}}))?\s*(?:-|–|—|to)\s*(\d{{1,2}})(?::\d{{2}})?\s*{_MERIDIEM}(?![a-z])",
+    re.IGNORECASE,
+)
+# A month or weekday right before a range's first number makes it a day of
+# the month ("March 6 - 7pm", "Sat 14 - 8pm"), not a start time.
+_DATE_TOKEN_BEFORE_RE = re.compile(rf"\b(?:{_MONTH}|{_WEEKDAY_NAME})[.,]?\s*$", re.IGNORECASE)
+_SHOW_TIME_RE = re.compile(
+    rf"\bshow(?:time)?s?\b\W*(\d{{1,2}})(?::(\d{{2}}))?\s*(?:{_MERIDIEM}(?![a-z]))?",
+    re.IGNORECASE,
+)
+_CLOCK_24H_RE = re.compile(r"(?<!\d)([01]?\d|2[0-3]):([0-5]\d)(?!\d)")
+_NOON_MIDNIGHT_RE = re.compile(r"\b(noon|midnight)\b", re.IGNORECASE)
+
 
 def extract_year(text: Optional[str]) -> Optional[int]:
     """Return the first 4-digit year found in text."""
@@ -85,6 +156,30 @@ def normalize_event_date(
     return candidate
 
 
+def _fast_parse_date(value: str, default_year: int) -> Optional[date]:
+    """Parse the common date shapes directly; None means "ask dateutil"."""
+    text = value.strip()
+    try:
+        match = _ISO_RE.match(text)
+        if match:
+            return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        match = _MONTH_DAY_RE.match(text)
+        if match:
+            month, day, year = match.groups()
+            return date(int(year) if year else default_year, _MONTHS[month.lower()], int(day))
+        match = _DAY_MONTH_RE.match(text)
+        if match:
+            day, month, year = match.groups()
+            return date(int(year) if year else default_year, _MONTHS[month.lower()], int(day))
+        match = _US_NUMERIC_RE.match(text)
+        if match and int(match.group(1)) <= 12:
+            return date(int(match.group(3)), int(match.group(1)), int(match.group(2)))
+    except ValueError:
+        # Out-of-range day/month: let dateutil decide, as before.
+        return None
+    return None
+
+
 def parse_human_date(
     value: Optional[str],
     *,
@@ -96,28 +191,43 @@ def parse_human_date(
     """Parse free-form date text into YYYY-MM-DD with normalization."""
     if not value:
         return None
-
     ref_today = today or date.today()
+    if not isinstance(value, str) or not isinstance(context_text, (str, type(None))):
+        return _parse_human_date(value, context_text, ref_today, max_future_days, rollover_grace_days)
+    return _parse_human_date_cached(value, context_text, ref_today, max_future_days, rollover_grace_days)
+
+
+def _parse_human_date(
+    value: str,
+    context_text: Optional[str],
+    ref_today: date,
+    max_future_days: int,
+    rollover_grace_days: int,
+    fast: bool = True,
+) -> Optional[str]:
     inferred_year = extract_year(value) or extract_year(context_text) or ref_today.year
 
-    default_dt = datetime(
-        inferred_year,
-        ref_today.month,
-        ref_today.day,
-        12,
-        0,
-        0,
-    )
+    parsed_date = _fast_parse_date(value, inferred_year) if fast else None
+    if parsed_date is None:
+        default_dt = datetime(
+            inferred_year,
+            ref_today.month,
+            ref_today.day,
+            12,
+            0,
+            0,
+        )
 
-    try:
-        parsed = dateparser.parse(value, fuzzy=True, default=default_dt)
-    except Exception:
-        return None
-    if not parsed:
-        return None
+        try:
+            parsed = dateparser.parse(value, fuzzy=True, default=default_dt)
+        except Exception:
+            return None
+        if not parsed:
+            return None
+        parsed_date = parsed.date()
 
     normalized = normalize_event_date(
-        parsed.date(),
+        parsed_date,
         raw_text=value,
         context_text=context_text,
         today=ref_today,
@@ -127,6 +237,69 @@ def parse_human_date(
     return normalized.isoformat() if normalized else None
 
 
+_parse_human_date_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(_parse_human_date)
+
+
+def _to_24h(hour: int, minute: int, meridiem: Optional[str]) -> Optional[str]:
+    if minute > 59:
+        return None
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return None
+        if meridiem.lower() == "p" and hour != 12:
+            hour += 12
+        elif meridiem.lower() == "a" and hour == 12:
+            hour = 0
+    elif hour > 23:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time_text(text: Optional[str]) -> Optional[str]:
+    """
+    Parse a start time out of free-form text into HH:MM.
+
+    Handles "7pm", "7:30 p.m.", "19:30", "noon", ranges ("7-10pm" -> 19:00, "10-4pm" -> 10:00)
+    and doors/show listings, where the show time wins ("Doors 7 / Show 8pm"
+    -> 20:00; a show time without a meridiem is taken as PM).  Returns None
+    when no time is recognized so callers can fall back to a fuzzier parser.
+    """
+    if not text:
+        return None
+
+    show = _SHOW_TIME_RE.search(text)
+    if show and re.search(r"\bdoors?\b", text, re.IGNORECASE):
+        hour, minute, meridiem = show.groups()
+        return _to_24h(int(hour), int(minute or 0), meridiem or "p")
+
+    clock = _CLOCK_12H_RE.search(text)
+    ranged = _CLOCK_RANGE_RE.search(text)
+    if ranged and _DATE_TOKEN_BEFORE_RE.search(text, 0, ranged.start()):
+        ranged = None
+    if ranged and (not clock or ranged.start() <= clock.start()):
+        hour, minute, end_hour, meridiem = ranged.groups()
+        start, end = int(hour), int(end_hour)
+        if start != 12 and (start > end or end == 12):
+            meridiem = "p" if meridiem.lower() == "a" else "a"
+        parsed = _to_24h(start, int(minute or 0), meridiem)
+        # "14 - 7pm" is no clock range; fall back to the plain time.
+        if parsed:
+            return parsed
+    if clock:
+        hour, minute, meridiem = clock.groups()
+        return _to_24h(int(hour), int(minute or 0), meridiem)
+
+    clock = _CLOCK_24H_RE.search(text)
+    if clock:
+        return _to_24h(int(clock.group(1)), int(clock.group(2)), None)
+
+    named = _NOON_MIDNIGHT_RE.search(text)
+    if named:
+        return "12:00" if named.group(1).lower() == "noon" else "00:00"
+    return None
+
+
 def normalize_iso_date(
     value: Optional[str],
     *,
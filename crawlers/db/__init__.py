@@ -87,6 +87,23 @@ from db.sources import (
     detect_zero_event_sources,
 )
 
+# ===== schema_capabilities.py =====
+from db.schema_capabilities import (
+    SchemaSnapshot,
+    load_schema_capabilities,
+    capability_from_snapshot,
+    clear_schema_capabilities,
+)
+
+# ===== source_registry.py =====
+from db.source_registry import (
+    SourceRegistry,
+    load_source_registry,
+    get_source_registry,
+    invalidate_source_registry,
+    invalidate_source,
+)
+
 # ===== places.py (formerly venues.py) =====
 from db.places import (
     VIRTUAL_VENUE_SLUG,
@@ -165,12 +182,33 @@ from db.events import (
     find_events_by_date_and_venue_family,
     get_all_events,
     update_event_tags,
+    update_event_tags_bulk,
     upsert_event_images,
     upsert_event_links,
     update_event_extraction_metadata,
     deactivate_tba_events,
 )
 
+# ===== pg_writer.py =====
+from db.pg_writer import (
+    direct_writes_enabled,
+    get_write_pool,
+    close_write_pool,
+)
+
+# ===== event_records.py =====
+from db.event_records import (
+    EventRecord,
+    RecordTable,
+)
+
+# ===== table_reader.py =====
+from db.table_reader import (
+    iter_pages,
+    iter_rows,
+    iter_record_batches,
+)
+
 # ===== programs.py =====
 from db.programs import (
     infer_program_type,
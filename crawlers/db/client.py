@@ -12,6 +12,7 @@ from typing import Optional
 
 from supabase import create_client, Client
 from config import get_config
+from db.schema_capabilities import capability_from_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -302,6 +303,10 @@ def events_support_show_signal_columns() -> bool:
     global _EVENTS_HAS_SHOW_SIGNAL_COLUMNS
     if _EVENTS_HAS_SHOW_SIGNAL_COLUMNS is not None:
         return _EVENTS_HAS_SHOW_SIGNAL_COLUMNS
+    from_snapshot = capability_from_snapshot("events_show_signal_columns")
+    if from_snapshot is not None:
+        _EVENTS_HAS_SHOW_SIGNAL_COLUMNS = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -333,6 +338,10 @@ def events_support_is_show_column() -> bool:
     global _EVENTS_HAS_IS_SHOW_COLUMN
     if _EVENTS_HAS_IS_SHOW_COLUMN is not None:
         return _EVENTS_HAS_IS_SHOW_COLUMN
+    from_snapshot = capability_from_snapshot("events_is_show_column")
+    if from_snapshot is not None:
+        _EVENTS_HAS_IS_SHOW_COLUMN = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -356,6 +365,10 @@ def events_support_film_identity_columns() -> bool:
     global _EVENTS_HAS_FILM_IDENTITY_COLUMNS
     if _EVENTS_HAS_FILM_IDENTITY_COLUMNS is not None:
         return _EVENTS_HAS_FILM_IDENTITY_COLUMNS
+    from_snapshot = capability_from_snapshot("events_film_identity_columns")
+    if from_snapshot is not None:
+        _EVENTS_HAS_FILM_IDENTITY_COLUMNS = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -387,6 +400,10 @@ def events_support_content_kind_column() -> bool:
     global _EVENTS_HAS_CONTENT_KIND_COLUMN
     if _EVENTS_HAS_CONTENT_KIND_COLUMN is not None:
         return _EVENTS_HAS_CONTENT_KIND_COLUMN
+    from_snapshot = capability_from_snapshot("events_content_kind_column")
+    if from_snapshot is not None:
+        _EVENTS_HAS_CONTENT_KIND_COLUMN = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -410,6 +427,10 @@ def venues_support_features_table() -> bool:
     global _VENUES_HAS_FEATURES_TABLE
     if _VENUES_HAS_FEATURES_TABLE is not None:
         return _VENUES_HAS_FEATURES_TABLE
+    from_snapshot = capability_from_snapshot("venues_features_table")
+    if from_snapshot is not None:
+        _VENUES_HAS_FEATURES_TABLE = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -433,6 +454,10 @@ def venues_support_destination_details_table() -> bool:
     global _VENUES_HAS_DESTINATION_DETAILS_TABLE
     if _VENUES_HAS_DESTINATION_DETAILS_TABLE is not None:
         return _VENUES_HAS_DESTINATION_DETAILS_TABLE
+    from_snapshot = capability_from_snapshot("venues_destination_details_table")
+    if from_snapshot is not None:
+        _VENUES_HAS_DESTINATION_DETAILS_TABLE = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -456,6 +481,10 @@ def events_support_is_active_column() -> bool:
     global _EVENTS_HAS_IS_ACTIVE_COLUMN
     if _EVENTS_HAS_IS_ACTIVE_COLUMN is not None:
         return _EVENTS_HAS_IS_ACTIVE_COLUMN
+    from_snapshot = capability_from_snapshot("events_is_active_column")
+    if from_snapshot is not None:
+        _EVENTS_HAS_IS_ACTIVE_COLUMN = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -479,6 +508,10 @@ def events_support_field_metadata_columns() -> bool:
     global _EVENTS_HAS_FIELD_METADATA_COLUMNS
     if _EVENTS_HAS_FIELD_METADATA_COLUMNS is not None:
         return _EVENTS_HAS_FIELD_METADATA_COLUMNS
+    from_snapshot = capability_from_snapshot("events_field_metadata_columns")
+    if from_snapshot is not None:
+        _EVENTS_HAS_FIELD_METADATA_COLUMNS = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -504,6 +537,10 @@ def venues_support_location_designator() -> bool:
     global _VENUES_HAS_LOCATION_DESIGNATOR
     if _VENUES_HAS_LOCATION_DESIGNATOR is not None:
         return _VENUES_HAS_LOCATION_DESIGNATOR
+    from_snapshot = capability_from_snapshot("venues_location_designator")
+    if from_snapshot is not None:
+        _VENUES_HAS_LOCATION_DESIGNATOR = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -526,6 +563,10 @@ def has_event_extractions_table() -> bool:
     global _HAS_EVENT_EXTRACTIONS_TABLE
     if _HAS_EVENT_EXTRACTIONS_TABLE is not None:
         return _HAS_EVENT_EXTRACTIONS_TABLE
+    from_snapshot = capability_from_snapshot("event_extractions_table")
+    if from_snapshot is not None:
+        _HAS_EVENT_EXTRACTIONS_TABLE = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -549,6 +590,10 @@ def venues_support_destination_details_table() -> bool:
     global _VENUES_HAS_DESTINATION_DETAILS_TABLE
     if _VENUES_HAS_DESTINATION_DETAILS_TABLE is not None:
         return _VENUES_HAS_DESTINATION_DETAILS_TABLE
+    from_snapshot = capability_from_snapshot("venues_destination_details_table")
+    if from_snapshot is not None:
+        _VENUES_HAS_DESTINATION_DETAILS_TABLE = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -572,6 +617,10 @@ def screenings_support_tables() -> bool:
     global _HAS_SCREENING_TABLES
     if _HAS_SCREENING_TABLES is not None:
         return _HAS_SCREENING_TABLES
+    from_snapshot = capability_from_snapshot("screening_tables")
+    if from_snapshot is not None:
+        _HAS_SCREENING_TABLES = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -598,6 +647,10 @@ def events_support_taxonomy_v2_columns() -> bool:
     global _EVENTS_HAS_TAXONOMY_V2_COLUMNS
     if _EVENTS_HAS_TAXONOMY_V2_COLUMNS is not None:
         return _EVENTS_HAS_TAXONOMY_V2_COLUMNS
+    from_snapshot = capability_from_snapshot("events_taxonomy_v2_columns")
+    if from_snapshot is not None:
+        _EVENTS_HAS_TAXONOMY_V2_COLUMNS = from_snapshot
+        return from_snapshot
     client = get_client()
     try:
         client.table("events").select(
@@ -614,6 +667,10 @@ def events_support_image_dim_columns() -> bool:
     global _EVENTS_HAS_IMAGE_DIM_COLUMNS
     if _EVENTS_HAS_IMAGE_DIM_COLUMNS is not None:
         return _EVENTS_HAS_IMAGE_DIM_COLUMNS
+    from_snapshot = capability_from_snapshot("events_image_dim_columns")
+    if from_snapshot is not None:
+        _EVENTS_HAS_IMAGE_DIM_COLUMNS = from_snapshot
+        return from_snapshot
 
     client = get_client()
     try:
@@ -0,0 +1,96 @@
+"""
+Compact read-only event rows for prefetch caches and dedupe indexes.
+
+A ``select *`` events row as a dict carries its own hash table of ~100 keys;
+a source with tens of thousands of active events (cinema showtimes, volunteer
+shifts) keeps one per event resident for the whole crawl.  ``RecordTable``
+stores the column names once and each row as a tuple, and ``EventRecord`` is a
+slotted ``Mapping`` view over one row — so ``existing.get("title")`` and
+``{**existing, **updates}`` keep working in ``smart_update_existing_event``
+while each row costs one tuple plus a two-slot object.
+
+Records are read-only.  Code that needs to change a row makes its own copy
+(``existing.to_dict()``), so a prefetched row is never mutated behind the
+cache's back — the copy-on-write contract the insert pipeline relies on.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+_MISSING = object()
+
+
+class EventRecord(Mapping):
+    """Read-only mapping view over one row of a ``RecordTable``."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: dict[str, int], values: tuple):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        pos = self._index.get(key, _MISSING)
+        if pos is _MISSING:
+            return default
+        return self._values[pos]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def to_dict(self) -> dict:
+        """Mutable copy of the row."""
+        return dict(zip(self._index, self._values))
+
+    def __repr__(self) -> str:
+        return f"EventRecord({self.to_dict()!r})"
+
+
+class RecordTable:
+    """Rows sharing one column index, stored as tuples."""
+
+    __slots__ = ("columns", "_index", "records")
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = tuple(columns)
+        self._index = {col: pos for pos, col in enumerate(self.columns)}
+        self.records: list[EventRecord] = []
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict], columns: Optional[Sequence[str]] = None
+    ) -> "RecordTable":
+        """Build from dict rows; ``columns`` projects (missing keys become None)."""
+        table: Optional[RecordTable] = cls(columns) if columns is not None else None
+        for row in rows:
+            if table is None:
+                table = cls(tuple(row))
+            table.append(row)
+        return table if table is not None else cls(())
+
+    def append(self, row: dict) -> EventRecord:
+        record = EventRecord(self._index, tuple(row.get(col) for col in self.columns))
+        self.records.append(record)
+        return record
+
+    def index_by(self, column: str) -> dict[Any, EventRecord]:
+        """Records keyed by ``column``; rows with an empty key are skipped."""
+        pos = self._index[column]
+        return {rec._values[pos]: rec for rec in self.records if rec._values[pos]}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[EventRecord]:
+        return iter(self.records)
@@ -4,6 +4,7 @@ Event insert/update, dedup lookups, and event-level utilities.
 
 import re
 import logging
+from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field as dc_field
 from datetime import datetime, timedelta
@@ -44,6 +45,8 @@ from db.sources import (
     source_should_default_tentpole_event,
 )
 from db.enrichment import _queue_event_blurhash
+from db import pg_writer
+from db.event_records import EventRecord, RecordTable
 from db.series_linking import _force_update_series_day
 from db.artists import (
     parse_lineup_from_title,
@@ -61,7 +64,7 @@ from tag_inference import (
     infer_genres,
 )
 from genre_normalize import normalize_genres
-from series import get_or_create_series, update_series_metadata
+from series import get_or_create_series, get_series_registry, update_series_metadata
 from posters import get_metadata_for_film_event, extract_film_info
 from artist_images import get_info_for_music_event
 from show_signals import derive_show_signals
@@ -1467,9 +1470,9 @@ def _step_field_metadata(event_data: dict, ctx: InsertContext) -> dict:
 def _step_data_quality(event_data: dict, ctx: InsertContext) -> dict:
     """Compute and attach data_quality score."""
     try:
-        from compute_data_quality import score_record, EVENT_WEIGHTS
+        from compute_data_quality import score_event
 
-        event_data["data_quality"] = score_record(event_data, EVENT_WEIGHTS)
+        event_data["data_quality"] = score_event(event_data)
     except Exception as e:
         logger.debug(
             "data_quality scoring failed for '%s': %s",
@@ -1479,6 +1482,14 @@ def _step_data_quality(event_data: dict, ctx: InsertContext) -> dict:
     return event_data
 
 
+def _backfill_series(client, registry, series_id: str, updates: dict) -> None:
+    """Fill blank series fields now, or at the end of the source when a registry is active."""
+    if registry is not None:
+        registry.backfill(series_id, updates)
+    else:
+        update_series_metadata(client, series_id, updates)
+
+
 def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
     """Rename category→category_id, write genres, and clean up internal fields."""
     if ctx.genres:
@@ -1508,6 +1519,7 @@ def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
             if value is not None and not series_hint.get(key):
                 series_hint[key] = value
 
+    series_registry = get_series_registry(event_data.get("source_id"))
     if series_hint and not event_data.get("series_id") and writes_enabled():
         genres = ctx.genres
         if genres and not series_hint.get("genres"):
@@ -1517,14 +1529,16 @@ def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
             series_hint,
             event_data.get("category"),
             venue_id=series_hint.get("venue_id"),
+            registry=series_registry,
         )
         if series_id:
             event_data["series_id"] = series_id
             if genres:
-                update_series_metadata(ctx.client, series_id, {"genres": genres})
+                _backfill_series(ctx.client, series_registry, series_id, {"genres": genres})
             if ctx.film_metadata and series_hint.get("series_type") == "film":
-                update_series_metadata(
+                _backfill_series(
                     ctx.client,
+                    series_registry,
                     series_id,
                     {
                         "director": ctx.film_metadata.director,
@@ -1550,11 +1564,16 @@ def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
                     if series_hint.get(field):
                         backfill[field] = series_hint[field]
                 if backfill:
-                    update_series_metadata(ctx.client, series_id, backfill)
+                    _backfill_series(ctx.client, series_registry, series_id, backfill)
                 if series_hint.get("last_verified_at"):
-                    ctx.client.table("series").update(
-                        {"last_verified_at": series_hint["last_verified_at"]}
-                    ).eq("id", series_id).execute()
+                    if series_registry is not None:
+                        series_registry.touch(
+                            series_id, {"last_verified_at": series_hint["last_verified_at"]}
+                        )
+                    else:
+                        ctx.client.table("series").update(
+                            {"last_verified_at": series_hint["last_verified_at"]}
+                        ).eq("id", series_id).execute()
 
                 hint_dow = (series_hint.get("day_of_week") or "").strip().lower()
                 if hint_dow and event_data.get("start_date"):
@@ -1572,9 +1591,14 @@ def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
                             "sunday",
                         ][ev_date.weekday()]
                         if hint_dow == actual_dow:
-                            _force_update_series_day(
-                                ctx.client, series_id, series_hint["day_of_week"]
-                            )
+                            if series_registry is not None:
+                                series_registry.force_day(
+                                    series_id, series_hint["day_of_week"]
+                                )
+                            else:
+                                _force_update_series_day(
+                                    ctx.client, series_id, series_hint["day_of_week"]
+                                )
                     except (ValueError, IndexError):
                         pass
 
@@ -1591,7 +1615,7 @@ def _step_finalize(event_data: dict, ctx: InsertContext) -> dict:
         logger.debug(
             f"Promoting image to series {series_id} from event '{event_data.get('title', '')}'"
         )
-        update_series_metadata(ctx.client, series_id, {"image_url": event_image})
+        _backfill_series(ctx.client, series_registry, series_id, {"image_url": event_image})
 
     # category → category_id rename
     if "category" in event_data and "category_id" not in event_data:
@@ -1671,6 +1695,9 @@ def _write_event_extraction(client, event_id: int, extraction_data: dict) -> Non
         return
     try:
         payload = {"event_id": event_id, **extraction_data}
+        if pg_writer.direct_writes_enabled():
+            pg_writer.upsert_rows("event_extractions", [payload], ("event_id",))
+            return
         client.table("event_extractions").upsert(
             payload, on_conflict="event_id"
         ).execute()
@@ -1907,6 +1934,8 @@ def insert_event(
 @retry_on_network_error(max_retries=4, base_delay=0.5)
 def _insert_event_record(client, event_data: dict):
     """Insert event row with retries for transient socket/network errors."""
+    if pg_writer.direct_writes_enabled():
+        return pg_writer.WriteResult(pg_writer.insert_rows("events", [event_data]))
     return client.table("events").insert(event_data).execute()
 
 
@@ -1931,18 +1960,25 @@ def update_event(event_id: int, event_data: dict) -> None:
 @retry_on_network_error(max_retries=4, base_delay=0.5)
 def _update_event_record(client, event_id: int, event_data: dict):
     """Update event row with retries for transient socket/network errors."""
+    if pg_writer.direct_writes_enabled():
+        return pg_writer.WriteResult(
+            pg_writer.update_rows("events", event_data, "id", [event_id], returning=True)
+        )
     return client.table("events").update(event_data).eq("id", event_id).execute()
 
 
-def smart_update_existing_event(existing: dict, incoming: dict) -> bool:
-    """Compare existing DB event with incoming crawler data and update if incoming is better."""
+def smart_update_existing_event(existing: Mapping, incoming: dict) -> bool:
+    """Compare existing DB event with incoming crawler data and update if incoming is better.
+
+    Neither argument is mutated; ``existing`` may be a read-only EventRecord.
+    """
     event_id = existing.get("id")
     if not event_id:
         return False
 
-    incoming = dict(incoming or {})
+    incoming = incoming or {}
     suppress_title_participants = bool(
-        incoming.pop("_suppress_title_participants", False)
+        incoming.get("_suppress_title_participants", False)
     )
 
     updates: dict = {}
@@ -2318,15 +2354,9 @@ def smart_update_existing_event(existing: dict, incoming: dict) -> bool:
 
     if updates:
         try:
-            from compute_data_quality import (
-                score_record as _score_record,
-                EVENT_WEIGHTS as _EW,
-            )
+            from compute_data_quality import score_event
 
-            merged = {**existing, **updates}
-            if "category_id" in merged and "category" not in merged:
-                merged["category"] = merged["category_id"]
-            updates["data_quality"] = _score_record(merged, _EW)
+            updates["data_quality"] = score_event({**existing, **updates})
         except Exception as e:
             logger.debug(
                 "data_quality scoring failed for '%s': %s",
@@ -2567,11 +2597,11 @@ def prefetch_hashes(source_id: int = None, venue_id: int = None) -> set[str]:
         return set()
 
 
-def prefetch_events_by_source(source_id: int) -> dict[str, dict]:
+def prefetch_events_by_source(source_id: int) -> dict[str, EventRecord]:
     """Pre-fetch all active events for a source, keyed by content_hash.
 
-    Returns full event records so callers can pass them directly to
-    smart_update_existing_event() without individual DB lookups.
+    Returns full (read-only, compact) event records so callers can pass them
+    directly to smart_update_existing_event() without individual DB lookups.
     One query replaces ~1,000 individual find_event_by_hash() calls.
     """
     try:
@@ -2583,11 +2613,7 @@ def prefetch_events_by_source(source_id: int) -> dict[str, dict]:
             .eq("is_active", True)
             .execute()
         )
-        return {
-            row["content_hash"]: row
-            for row in (result.data or [])
-            if row.get("content_hash")
-        }
+        return RecordTable.from_rows(result.data or []).index_by("content_hash")
     except Exception as e:
         logger.warning(f"Failed to prefetch events for source {source_id}: {e}")
         return {}
@@ -2871,6 +2897,14 @@ def remove_stale_source_events(source_id: int, current_hashes: set[str]) -> int:
         )
         return len(stale_ids)
 
+    if pg_writer.direct_writes_enabled():
+        pg_writer.update_rows(
+            "events", {"canonical_event_id": None}, "canonical_event_id", stale_ids
+        )
+        deleted = pg_writer.delete_rows("events", "id", stale_ids)
+        logger.info(f"Removed {deleted} stale events from source {source_id}")
+        return deleted
+
     for stale_id in stale_ids:
         client.table("events").update({"canonical_event_id": None}).eq(
             "canonical_event_id", stale_id
@@ -2941,10 +2975,32 @@ def update_event_tags(event_id: int, tags: list[str]) -> None:
     if not writes_enabled():
         _log_write_skip(f"update events id={event_id} (tags)")
         return
+    if pg_writer.direct_writes_enabled():
+        pg_writer.update_rows("events", {"tags": tags}, "id", [event_id])
+        return
     client = get_client()
     client.table("events").update({"tags": tags}).eq("id", event_id).execute()
 
 
+def update_event_tags_bulk(tags_by_event: dict[int, list[str]]) -> int:
+    """Update the tags of many events; one statement per batch on the direct backend."""
+    if not tags_by_event:
+        return 0
+    if not writes_enabled():
+        _log_write_skip(f"update events count={len(tags_by_event)} (tags)")
+        return 0
+    if pg_writer.direct_writes_enabled():
+        return pg_writer.bulk_update(
+            "events",
+            "id",
+            [{"id": event_id, "tags": tags} for event_id, tags in tags_by_event.items()],
+        )
+    client = get_client()
+    for event_id, tags in tags_by_event.items():
+        client.table("events").update({"tags": tags}).eq("id", event_id).execute()
+    return len(tags_by_event)
+
+
 def upsert_event_images(event_id: int, images: list) -> None:
     """Upsert images for an event."""
     if not images:
@@ -2999,6 +3055,10 @@ def upsert_event_images(event_id: int, images: list) -> None:
     if not payload:
         return
 
+    if pg_writer.direct_writes_enabled():
+        pg_writer.upsert_rows("event_images", payload, ("event_id", "url"))
+        return
+
     client = get_client()
     client.table("event_images").upsert(payload, on_conflict="event_id,url").execute()
 
@@ -3052,6 +3112,10 @@ def upsert_event_links(event_id: int, links: list) -> None:
     if not payload:
         return
 
+    if pg_writer.direct_writes_enabled():
+        pg_writer.upsert_rows("event_links", payload, ("event_id", "type", "url"))
+        return
+
     client = get_client()
     client.table("event_links").upsert(
         payload, on_conflict="event_id,type,url"
@@ -3088,6 +3152,8 @@ def update_event_extraction_metadata(
     # Prefer the dedicated extraction table when available
     if has_event_extractions_table():
         _write_event_extraction(client, event_id, update_data)
+    elif pg_writer.direct_writes_enabled():
+        pg_writer.update_rows("events", update_data, "id", [event_id])
     else:
         client.table("events").update(update_data).eq("id", event_id).execute()
 
@@ -0,0 +1,292 @@
+"""
+Pooled direct-Postgres write backend for the heavy crawler write paths.
+
+By default every crawler write is a PostgREST call through supabase-py — one
+HTTP round trip per row operation.  Setting ``CRAWLER_WRITE_BACKEND=direct``
+(with ``DATABASE_URL`` / ``STAGING_DATABASE_URL`` for the active target) routes
+event inserts/updates, child-table upserts, stale-event removal and the tag
+backfill through a shared psycopg2 connection pool instead, batching rows into
+multi-row ``INSERT ... ON CONFLICT`` / ``UPDATE ... FROM (VALUES ...)``
+statements.  The pool works equally against Postgres directly or a
+transaction-mode PgBouncer (no session state or prepared statements are used).
+
+Callers keep their REST code path and only branch on ``direct_writes_enabled()``,
+so the two backends can be benchmarked against the same local database by
+flipping the env var.
+
+Usage:
+    from db.pg_writer import direct_writes_enabled, upsert_rows
+
+    if direct_writes_enabled():
+        upsert_rows("event_images", payload, conflict_cols=("event_id", "url"))
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+from psycopg2 import sql
+
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+WRITE_BACKENDS = ("rest", "direct")
+DEFAULT_PAGE_SIZE = 500
+
+_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_POOL_URL = ""
+_POOL_LOCK = threading.Lock()
+_COLUMN_TYPES: dict[str, dict[str, str]] = {}
+
+
+class WriteResult:
+    """Minimal stand-in for a PostgREST response so callers can read ``.data``."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: list[dict]):
+        self.data = data
+
+
+def direct_writes_enabled() -> bool:
+    """True when config selects the direct backend and a database URL is set."""
+    db_config = get_config().database
+    backend = (db_config.write_backend or "rest").strip().lower()
+    if backend not in WRITE_BACKENDS:
+        logger.warning("Unknown CRAWLER_WRITE_BACKEND=%r, using rest", backend)
+        return False
+    return backend == "direct" and bool(db_config.active_database_url)
+
+
+def get_write_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Process-wide connection pool for the active database target."""
+    global _POOL, _POOL_URL
+    db_config = get_config().database
+    database_url = db_config.active_database_url
+    if not database_url:
+        raise RuntimeError("No active DATABASE_URL configured for direct writes")
+
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_URL != database_url:
+            # Target switched (e.g. set_database_target("staging")).
+            _POOL.closeall()
+            _POOL = None
+            _COLUMN_TYPES.clear()
+        if _POOL is None:
+            _POOL = psycopg2.pool.ThreadedConnectionPool(
+                1, max(1, db_config.write_pool_size), database_url
+            )
+            _POOL_URL = database_url
+        return _POOL
+
+
+def close_write_pool() -> None:
+    """Close every pooled connection (registered at exit)."""
+    global _POOL, _POOL_URL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.closeall()
+        _POOL = None
+        _POOL_URL = ""
+        _COLUMN_TYPES.clear()
+
+
+atexit.register(close_write_pool)
+
+
+@contextmanager
+def _cursor() -> Iterator[psycopg2.extras.RealDictCursor]:
+    """Pooled cursor in its own transaction; committed on success, rolled back on error."""
+    pool = get_write_pool()
+    conn = pool.getconn()
+    broken = False
+    try:
+        with conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                yield cur
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        broken = True
+        raise
+    finally:
+        pool.putconn(conn, close=broken or bool(conn.closed))
+
+
+def _column_types(cur, table: str) -> dict[str, str]:
+    """Column name -> SQL type (``text[]``, ``jsonb``, ...), cached per table."""
+    types = _COLUMN_TYPES.get(table)
+    if types is None:
+        cur.execute(
+            """
+            SELECT attname, format_type(atttypid, atttypmod) AS type
+            FROM pg_attribute
+            WHERE attrelid = %s::regclass AND attnum > 0 AND NOT attisdropped
+            """,
+            (table,),
+        )
+        types = {row["attname"]: row["type"] for row in cur.fetchall()}
+        _COLUMN_TYPES[table] = types
+    return types
+
+
+def _adapt(value: Any, column_type: str) -> Any:
+    if value is None:
+        return None
+    if column_type in ("json", "jsonb") or isinstance(value, dict):
+        return psycopg2.extras.Json(value)
+    return value
+
+
+def _template(columns: Sequence[str], types: dict[str, str]) -> str:
+    """execute_values row template with explicit casts, so empty arrays and
+    NULLs inside VALUES lists resolve to the column's type."""
+    parts = []
+    for col in columns:
+        col_type = types.get(col)
+        parts.append(f"%s::{col_type}" if col_type else "%s")
+    return "(" + ", ".join(parts) + ")"
+
+
+def _group_by_columns(rows: Iterable[dict]) -> dict[tuple[str, ...], list[dict]]:
+    # PostgREST fills missing keys with column defaults; a multi-row VALUES
+    # list can't, so rows are written in groups that share a column set.
+    groups: dict[tuple[str, ...], list[dict]] = {}
+    for row in rows:
+        groups.setdefault(tuple(row), []).append(row)
+    return groups
+
+
+def insert_rows(table: str, rows: list[dict], page_size: int = DEFAULT_PAGE_SIZE) -> list[dict]:
+    """Multi-row INSERT; returns the inserted rows (``RETURNING *``)."""
+    inserted: list[dict] = []
+    if not rows:
+        return inserted
+    with _cursor() as cur:
+        types = _column_types(cur, table)
+        for columns, group in _group_by_columns(rows).items():
+            query = sql.SQL("INSERT INTO {} ({}) VALUES %s RETURNING *").format(
+                sql.Identifier(table),
+                sql.SQL(", ").join(map(sql.Identifier, columns)),
+            )
+            values = [tuple(_adapt(row[c], types.get(c, "")) for c in columns) for row in group]
+            inserted.extend(
+                psycopg2.extras.execute_values(
+                    cur, query, values, template=_template(columns, types),
+                    page_size=page_size, fetch=True,
+                )
+            )
+    return [dict(row) for row in inserted]
+
+
+def upsert_rows(
+    table: str,
+    rows: list[dict],
+    conflict_cols: Sequence[str],
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Multi-row ``INSERT ... ON CONFLICT DO UPDATE`` (PostgREST upsert semantics)."""
+    if not rows:
+        return 0
+    written = 0
+    with _cursor() as cur:
+        types = _column_types(cur, table)
+        for columns, group in _group_by_columns(rows).items():
+            updates = [c for c in columns if c not in conflict_cols]
+            if updates:
+                action = sql.SQL("DO UPDATE SET {}").format(
+                    sql.SQL(", ").join(
+                        sql.SQL("{0} = EXCLUDED.{0}").format(sql.Identifier(c)) for c in updates
+                    )
+                )
+            else:
+                action = sql.SQL("DO NOTHING")
+            query = sql.SQL("INSERT INTO {} ({}) VALUES %s ON CONFLICT ({}) {}").format(
+                sql.Identifier(table),
+                sql.SQL(", ").join(map(sql.Identifier, columns)),
+                sql.SQL(", ").join(map(sql.Identifier, conflict_cols)),
+                action,
+            )
+            # ON CONFLICT can't touch the same key twice in one statement.
+            deduped = {tuple(row[c] for c in conflict_cols): row for row in group}
+            values = [
+                tuple(_adapt(row[c], types.get(c, "")) for c in columns)
+                for row in deduped.values()
+            ]
+            psycopg2.extras.execute_values(
+                cur, query, values, template=_template(columns, types), page_size=page_size
+            )
+            written += len(values)
+    return written
+
+
+def update_rows(
+    table: str, values: dict, key_col: str, keys: Sequence[Any], returning: bool = False
+) -> list[dict]:
+    """``UPDATE table SET ... WHERE key_col = ANY(keys)`` as one statement."""
+    if not values or not keys:
+        return []
+    with _cursor() as cur:
+        types = _column_types(cur, table)
+        query = sql.SQL("UPDATE {} SET {} WHERE {} = ANY(%s){}").format(
+            sql.Identifier(table),
+            sql.SQL(", ").join(sql.SQL("{} = %s").format(sql.Identifier(c)) for c in values),
+            sql.Identifier(key_col),
+            sql.SQL(" RETURNING *") if returning else sql.SQL(""),
+        )
+        params = [_adapt(v, types.get(c, "")) for c, v in values.items()]
+        cur.execute(query, (*params, list(keys)))
+        return [dict(row) for row in cur.fetchall()] if returning else []
+
+
+def bulk_update(
+    table: str, key_col: str, rows: list[dict], page_size: int = DEFAULT_PAGE_SIZE
+) -> int:
+    """Per-row updates in one statement: ``UPDATE ... FROM (VALUES ...)``.
+
+    Every row must contain ``key_col``; its other keys are the columns to set.
+    """
+    if not rows:
+        return 0
+    updated = 0
+    with _cursor() as cur:
+        types = _column_types(cur, table)
+        for columns, group in _group_by_columns(rows).items():
+            set_cols = [c for c in columns if c != key_col]
+            if not set_cols:
+                continue
+            ordered = (key_col, *set_cols)
+            query = sql.SQL("UPDATE {t} SET {sets} FROM (VALUES %s) AS v ({cols}) WHERE {t}.{k} = v.{k}").format(
+                t=sql.Identifier(table),
+                sets=sql.SQL(", ").join(
+                    sql.SQL("{0} = v.{0}").format(sql.Identifier(c)) for c in set_cols
+                ),
+                cols=sql.SQL(", ").join(map(sql.Identifier, ordered)),
+                k=sql.Identifier(key_col),
+            )
+            values = [tuple(_adapt(row[c], types.get(c, "")) for c in ordered) for row in group]
+            psycopg2.extras.execute_values(
+                cur, query, values, template=_template(ordered, types), page_size=page_size
+            )
+            updated += len(values)
+    return updated
+
+
+def delete_rows(table: str, key_col: str, keys: Sequence[Any]) -> int:
+    """``DELETE FROM table WHERE key_col = ANY(keys)``; returns rows deleted."""
+    if not keys:
+        return 0
+    with _cursor() as cur:
+        cur.execute(
+            sql.SQL("DELETE FROM {} WHERE {} = ANY(%s)").format(
+                sql.Identifier(table), sql.Identifier(key_col)
+            ),
+            (list(keys),),
+        )
+        return cur.rowcount
@@ -280,7 +280,8 @@ def infer_location_designator(venue_data: dict) -> str:
 
 def _fetch_venue_web_metadata(url: str) -> dict:
     """
-    Fetch description and og:image from a venue website in a single HTTP request.
+    Fetch description and og:image from a venue website in a single request
+    (served from the shared venue corpus when the page is fresh there).
 
     Returns a dict with keys:
         - "description": str or None
@@ -293,18 +294,13 @@ def _fetch_venue_web_metadata(url: str) -> dict:
         logger.debug(f"Skipping venue web metadata fetch (SSRF check): {e}")
         return result
     try:
-        import requests
         from bs4 import BeautifulSoup
+        from venue_corpus import get_venue_corpus
 
-        resp = requests.get(
-            url,
-            timeout=5,
-            allow_redirects=True,
-            headers={"User-Agent": "Mozilla/5.0 (compatible; LostCity/1.0)"},
-        )
-        if resp.status_code != 200:
+        html = get_venue_corpus().get(url, timeout=5, allow_playwright=False)
+        if not html:
             return result
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
 
         # Description — first good meta tag wins
         for attr_key, attr_val in [
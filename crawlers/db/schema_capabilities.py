@@ -0,0 +1,248 @@
+"""
+Run-wide schema capability snapshot.
+
+``db.client`` exposes a dozen ``events_support_*`` / ``venues_support_*`` /
+``has_*_table`` flags that each used to run their own trial query, and
+``reset_client()`` (triggered by HTTP/2 resets mid-run) clears them all so they
+get re-probed.  This module answers all of them from one introspection call:
+the PostgREST OpenAPI document (one GET against ``/rest/v1/``), falling back to
+a single ``information_schema.columns`` query over direct Postgres.
+
+The snapshot is persisted to ``.cache/schema_capabilities.json`` keyed by DB
+target and the newest migration in ``supabase/migrations``, so a fresh process
+skips introspection entirely until a new migration lands or the entry ages
+out.  It lives outside the client caches and survives ``reset_client()``.
+
+When no snapshot is loaded (tests, ad-hoc scripts), every flag keeps its
+original lazy probe.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import psycopg2
+import requests
+
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+CAPABILITY_CACHE_PATH = Path(__file__).resolve().parents[1] / ".cache" / "schema_capabilities.json"
+CAPABILITY_CACHE_MAX_AGE_SECONDS = 24 * 3600
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "supabase" / "migrations"
+
+_MIGRATION_VERSION_RE = re.compile(r"^(\d{14})_")
+
+# capability name -> {table: columns that must all exist}
+CAPABILITY_REQUIREMENTS: dict[str, dict[str, tuple[str, ...]]] = {
+    "events_show_signal_columns": {
+        "events": ("doors_time", "age_policy", "ticket_status", "reentry_policy", "set_times_mentioned"),
+    },
+    "events_is_show_column": {"events": ("is_show",)},
+    "events_film_identity_columns": {
+        "events": (
+            "film_title",
+            "film_release_year",
+            "film_imdb_id",
+            "film_external_genres",
+            "film_identity_source",
+        ),
+    },
+    "events_content_kind_column": {"events": ("content_kind",)},
+    "events_is_active_column": {"events": ("is_active",)},
+    "events_field_metadata_columns": {"events": ("field_provenance", "field_confidence")},
+    "events_taxonomy_v2_columns": {
+        "events": ("classification_prompt_version", "duration", "significance"),
+    },
+    "events_image_dim_columns": {"events": ("image_width", "image_height")},
+    "venues_features_table": {"venue_features": ("id",)},
+    "venues_destination_details_table": {"venue_destination_details": ("place_id",)},
+    "venues_location_designator": {"places": ("location_designator",)},
+    "event_extractions_table": {"event_extractions": ("event_id",)},
+    "screening_tables": {
+        "screening_runs": ("id",),
+        "screening_titles": ("id",),
+        "screening_times": ("id",),
+    },
+}
+
+_TRACKED_TABLES = sorted(
+    {table for tables in CAPABILITY_REQUIREMENTS.values() for table in tables}
+)
+
+
+class SchemaSnapshot:
+    """Column sets for the tracked tables at a point in time."""
+
+    def __init__(self, columns_by_table: dict[str, set[str]], key: str = "", captured_at: float = 0.0):
+        self.columns_by_table = {t: frozenset(c) for t, c in columns_by_table.items()}
+        self.key = key
+        self.captured_at = captured_at or time.time()
+
+    def supports(self, capability: str) -> bool:
+        for table, columns in CAPABILITY_REQUIREMENTS[capability].items():
+            present = self.columns_by_table.get(table)
+            if present is None or not set(columns) <= present:
+                return False
+        return True
+
+    def to_json(self) -> dict:
+        return {
+            "key": self.key,
+            "captured_at": self.captured_at,
+            "tables": {t: sorted(c) for t, c in self.columns_by_table.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SchemaSnapshot":
+        return cls(
+            {t: set(c) for t, c in (data.get("tables") or {}).items()},
+            key=data.get("key", ""),
+            captured_at=float(data.get("captured_at") or 0.0),
+        )
+
+
+_SNAPSHOT: Optional[SchemaSnapshot] = None
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def latest_migration_version(migrations_dir: Path = MIGRATIONS_DIR) -> str:
+    """Return the newest timestamped migration prefix, or '' if none found."""
+    try:
+        names = [p.name for p in migrations_dir.iterdir()]
+    except OSError:
+        return ""
+    versions = [m.group(1) for m in map(_MIGRATION_VERSION_RE.match, names) if m]
+    return max(versions, default="")
+
+
+def _snapshot_key() -> str:
+    cfg = get_config()
+    return f"{cfg.database.active_target}:{latest_migration_version()}"
+
+
+def _introspect_openapi() -> dict[str, set[str]]:
+    """Read table columns from the PostgREST OpenAPI document (one request)."""
+    cfg = get_config()
+    url = (cfg.database.active_supabase_url or "").rstrip("/")
+    key = cfg.database.active_supabase_service_key
+    if not url or not key:
+        raise RuntimeError("Supabase URL/key not configured")
+    resp = requests.get(
+        f"{url}/rest/v1/",
+        headers={"apikey": key, "Authorization": f"Bearer {key}"},
+        timeout=30,
+    )
+    resp.raise_for_status()
+    definitions = resp.json().get("definitions") or {}
+    return {
+        table: set((definitions[table].get("properties") or {}).keys())
+        for table in _TRACKED_TABLES
+        if table in definitions
+    }
+
+
+def _introspect_information_schema() -> dict[str, set[str]]:
+    """Read table columns with one information_schema query over direct Postgres."""
+    database_url = get_config().database.active_database_url
+    if not database_url:
+        raise RuntimeError("No active DATABASE_URL configured")
+    columns: dict[str, set[str]] = {}
+    with psycopg2.connect(database_url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT table_name, column_name FROM information_schema.columns "
+                "WHERE table_schema = 'public' AND table_name = ANY(%s)",
+                (_TRACKED_TABLES,),
+            )
+            for table, column in cur.fetchall():
+                columns.setdefault(table, set()).add(column)
+    return columns
+
+
+def _read_cached(key: str, path: Path) -> Optional[SchemaSnapshot]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    entry = (data or {}).get(key)
+    if not entry:
+        return None
+    snapshot = SchemaSnapshot.from_json(entry)
+    if time.time() - snapshot.captured_at > CAPABILITY_CACHE_MAX_AGE_SECONDS:
+        return None
+    return snapshot
+
+
+def _write_cached(snapshot: SchemaSnapshot, path: Path) -> None:
+    try:
+        with open(path) as f:
+            data = json.load(f) or {}
+    except (OSError, ValueError):
+        data = {}
+    data[snapshot.key] = snapshot.to_json()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+    except OSError as e:
+        logger.debug("Could not persist schema capabilities: %s", e)
+
+
+def load_schema_capabilities(
+    refresh: bool = False, path: Optional[Path] = None
+) -> Optional[SchemaSnapshot]:
+    """Install the capability snapshot for this process.
+
+    Uses the on-disk entry for the current DB target/migration unless
+    ``refresh`` is set. Returns None (flags keep probing lazily) when
+    introspection fails.
+    """
+    global _SNAPSHOT
+    path = path or CAPABILITY_CACHE_PATH
+    key = _snapshot_key()
+
+    snapshot = None if refresh else _read_cached(key, path)
+    if snapshot is None:
+        columns = None
+        for introspect in (_introspect_openapi, _introspect_information_schema):
+            try:
+                columns = introspect()
+                break
+            except Exception as e:
+                logger.debug("Schema introspection via %s failed: %s", introspect.__name__, e)
+        if not columns:
+            logger.warning("Schema capability introspection failed; falling back to per-flag probes")
+            return None
+        snapshot = SchemaSnapshot(columns, key=key)
+        _write_cached(snapshot, path)
+
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = snapshot
+    missing = [name for name in CAPABILITY_REQUIREMENTS if not snapshot.supports(name)]
+    if missing:
+        logger.info("Schema capabilities unavailable: %s", ", ".join(missing))
+    return snapshot
+
+
+def capability_from_snapshot(capability: str) -> Optional[bool]:
+    """Return the snapshot's answer for ``capability``, or None if none is loaded."""
+    snapshot = _SNAPSHOT
+    if snapshot is None:
+        return None
+    return snapshot.supports(capability)
+
+
+def clear_schema_capabilities() -> None:
+    """Forget the in-process snapshot (the on-disk cache is left alone)."""
+    global _SNAPSHOT
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT = None
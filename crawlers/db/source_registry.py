@@ -0,0 +1,130 @@
+"""
+Run-scoped snapshot of source, portal and producer metadata.
+
+Pipeline steps look up source metadata per event (``_step_resolve_source``,
+the cross-source canonical sort key, producer and festival hints).  Instead of
+one REST round trip per lookup, a crawl run loads every source row (including
+``producer_id``, ``health_tags`` and ``active_months``) and every portal slug
+once, and the lookup helpers in ``db.sources`` answer from that snapshot.
+
+Rows are never mutated after the snapshot is built and the snapshot is
+swapped in atomically, so the split Playwright/requests pools can read it
+without locking.  Scripts that modify sources call
+``invalidate_source_registry()`` (whole snapshot) or
+``invalidate_source(source_id)`` (one row) so later lookups go back to the DB.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Optional
+
+from db.client import _SOURCE_CACHE, get_client
+
+logger = logging.getLogger(__name__)
+
+_PAGE_SIZE = 1000
+
+
+class SourceRegistry:
+    """Immutable id/slug-indexed view of sources and portals."""
+
+    def __init__(self, sources: list[dict], portals: list[dict]):
+        self._by_id: dict[int, dict] = {}
+        self._by_slug: dict[str, dict] = {}
+        for row in sources:
+            if row.get("id") is not None:
+                self._by_id[row["id"]] = row
+            if row.get("slug"):
+                self._by_slug[row["slug"]] = row
+        self._portal_id_by_slug: dict[str, str] = {
+            row["slug"]: row["id"] for row in portals if row.get("slug") and row.get("id")
+        }
+        self._stale_ids: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, source_id: int) -> Optional[dict]:
+        if source_id in self._stale_ids:
+            return None
+        return self._by_id.get(source_id)
+
+    def get_by_slug(self, slug: str) -> Optional[dict]:
+        row = self._by_slug.get(slug)
+        if row is None or row.get("id") in self._stale_ids:
+            return None
+        return row
+
+    def portal_id(self, slug: str) -> Optional[str]:
+        return self._portal_id_by_slug.get(slug)
+
+    def active_sources(self) -> list[dict]:
+        return [
+            dict(row)
+            for source_id, row in self._by_id.items()
+            if row.get("is_active") and source_id not in self._stale_ids
+        ]
+
+    def mark_stale(self, source_id: int) -> None:
+        self._stale_ids.add(source_id)
+
+
+_REGISTRY: Optional[SourceRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _fetch_paged(table: str, select: str) -> list[dict]:
+    client = get_client()
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        result = (
+            client.table(table)
+            .select(select)
+            .order("id")
+            .range(offset, offset + _PAGE_SIZE - 1)
+            .execute()
+        )
+        batch = result.data or []
+        rows.extend(batch)
+        if len(batch) < _PAGE_SIZE:
+            break
+        offset += _PAGE_SIZE
+    return rows
+
+
+def load_source_registry() -> SourceRegistry:
+    """Load (or reload) the snapshot for this run and install it."""
+    global _REGISTRY
+    sources = _fetch_paged("sources", "*")
+    portals = _fetch_paged("portals", "id, slug")
+    registry = SourceRegistry(sources, portals)
+    with _REGISTRY_LOCK:
+        _REGISTRY = registry
+    logger.info(
+        "Source registry loaded: %d sources, %d portals", len(sources), len(portals)
+    )
+    return registry
+
+
+def get_source_registry() -> Optional[SourceRegistry]:
+    """Return the installed snapshot, or None when lookups should hit the DB."""
+    return _REGISTRY
+
+
+def invalidate_source_registry() -> None:
+    """Drop the snapshot; lookups fall back to per-call queries until reloaded."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        _REGISTRY = None
+    _SOURCE_CACHE.clear()
+
+
+def invalidate_source(source_id: int) -> None:
+    """Force the next lookup of one source to re-read it from the DB."""
+    registry = _REGISTRY
+    if registry is not None:
+        registry.mark_stale(source_id)
+    _SOURCE_CACHE.pop(source_id, None)
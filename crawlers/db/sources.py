@@ -17,6 +17,7 @@ from db.client import (
     _SOURCE_CACHE,
 )
 from config import get_config
+from db.source_registry import get_source_registry, invalidate_source
 
 logger = logging.getLogger(__name__)
 
@@ -261,6 +262,11 @@ def infer_program_title(title: Optional[str]) -> Optional[str]:
 
 def get_source_info(source_id: int) -> Optional[dict]:
     """Fetch source info with caching."""
+    registry = get_source_registry()
+    if registry is not None:
+        row = registry.get(source_id)
+        if row is not None:
+            return row
     if source_id in _SOURCE_CACHE:
         return _SOURCE_CACHE[source_id]
 
@@ -317,6 +323,11 @@ def get_source_info(source_id: int) -> Optional[dict]:
 
 def get_source_by_slug(slug: str) -> Optional[dict]:
     """Fetch a source by its slug."""
+    registry = get_source_registry()
+    if registry is not None:
+        row = registry.get_by_slug(slug)
+        if row is not None:
+            return row
     client = get_client()
     result = client.table("sources").select("*").eq("slug", slug).single().execute()
     return result.data
@@ -324,6 +335,11 @@ def get_source_by_slug(slug: str) -> Optional[dict]:
 
 def get_portal_id_by_slug(slug: str) -> Optional[str]:
     """Fetch a portal's UUID by its slug."""
+    registry = get_source_registry()
+    if registry is not None:
+        portal_id = registry.portal_id(slug)
+        if portal_id:
+            return portal_id
     client = get_client()
     result = client.table("portals").select("id").eq("slug", slug).single().execute()
     if result.data:
@@ -333,6 +349,9 @@ def get_portal_id_by_slug(slug: str) -> Optional[str]:
 
 def get_active_sources() -> list[dict]:
     """Fetch all active sources."""
+    registry = get_source_registry()
+    if registry is not None:
+        return registry.active_sources()
     client = get_client()
     result = client.table("sources").select("*").eq("is_active", True).execute()
     return result.data or []
@@ -642,6 +661,7 @@ def update_source_health_tags(
         if active_months is not None:
             update_data["active_months"] = active_months
         client.table("sources").update(update_data).eq("id", source_id).execute()
+        invalidate_source(source_id)
         return True
     except Exception as e:
         print(f"Error updating source health tags: {e}")
@@ -650,6 +670,11 @@ def update_source_health_tags(
 
 def get_source_health_tags(source_id: int) -> tuple[list[str], Optional[list[int]]]:
     """Get the current health_tags and active_months for a source."""
+    registry = get_source_registry()
+    if registry is not None:
+        row = registry.get(source_id)
+        if row is not None:
+            return row.get("health_tags") or [], row.get("active_months")
     client = get_client()
     try:
         result = (
@@ -716,6 +741,7 @@ def detect_zero_event_sources() -> tuple[int, list[str]]:
                     "health_tags": existing_tags,
                 }
             ).eq("id", source["id"]).execute()
+            invalidate_source(source["id"])
 
             deactivated_slugs.append(source["slug"])
             logger.warning(
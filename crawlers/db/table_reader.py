@@ -0,0 +1,140 @@
+"""
+Streaming keyset-paginated readers for whole-table scans.
+
+OFFSET pagination makes Postgres walk and discard every earlier row on each
+page (quadratic over a full scan) and skips or repeats rows when a job updates
+the very rows it is paging through.  These readers page by the sort key
+instead — ``WHERE id > last_id ORDER BY id LIMIT n``, or the composite
+``(start_date, id)`` form for date-ordered scans — and yield page by page, so
+a scan holds one page in memory and costs one index range read per page.
+
+Filters use the same ``(method, args)`` tuples the post-crawl jobs already
+pass around, e.g. ``[("gte", ("start_date", today)), ("eq", ("is_active", True))]``.
+
+Usage:
+    from db.table_reader import iter_rows
+
+    for row in iter_rows("events", "id,title,start_time", filters):
+        ...
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+from db.client import get_client
+
+DEFAULT_PAGE_SIZE = 1000
+
+Filter = tuple[str, tuple]
+
+
+def _projection(select: str, keys: Sequence[str]) -> str:
+    columns = [c.strip() for c in select.split(",") if c.strip()]
+    if "*" in columns:
+        return select
+    missing = [k for k in keys if k not in columns]
+    return ",".join(columns + missing)
+
+
+def _literal(value: Any) -> str:
+    # Quoted PostgREST literal, safe inside or=(...) lists.
+    text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{text}"'
+
+
+def _after(query, keys: Sequence[str], cursor: tuple):
+    if len(keys) == 1:
+        return query.gt(keys[0], cursor[0])
+    lead, tie = keys
+    lead_value, tie_value = cursor
+    return query.or_(
+        f"{lead}.gt.{_literal(lead_value)},"
+        f"and({lead}.eq.{_literal(lead_value)},{tie}.gt.{_literal(tie_value)})"
+    )
+
+
+def iter_pages(
+    table: str,
+    select: str,
+    filters: Iterable[Filter] = (),
+    order_by: Sequence[str] = ("id",),
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client=None,
+) -> Iterator[list[dict]]:
+    """Yield pages of rows in ``order_by`` order using keyset pagination.
+
+    ``order_by`` is either ``("id",)`` or a ``(leading_column, "id")`` pair;
+    the last column must be unique.  Rows whose leading column is NULL are
+    excluded from composite scans (they have no position in the keyset).
+    """
+    keys = tuple(order_by)
+    if not 1 <= len(keys) <= 2:
+        raise ValueError("order_by must be (unique_key,) or (leading_column, unique_key)")
+    client = client or get_client()
+    projection = _projection(select, keys)
+    filters = list(filters)
+    cursor: Optional[tuple] = None
+
+    while True:
+        query = client.table(table).select(projection)
+        for method, args in filters:
+            query = getattr(query, method)(*args)
+        if len(keys) == 2:
+            query = query.not_.is_(keys[0], "null")
+        if cursor is not None:
+            query = _after(query, keys, cursor)
+        for key in keys:
+            query = query.order(key)
+        rows = query.limit(page_size).execute().data or []
+        if rows:
+            yield rows
+        if len(rows) < page_size:
+            return
+        cursor = tuple(rows[-1][key] for key in keys)
+
+
+def iter_rows(
+    table: str,
+    select: str,
+    filters: Iterable[Filter] = (),
+    order_by: Sequence[str] = ("id",),
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client=None,
+) -> Iterator[dict]:
+    """Yield rows one at a time; see ``iter_pages``."""
+    for page in iter_pages(table, select, filters, order_by, page_size, client):
+        yield from page
+
+
+def iter_record_batches(
+    table: str,
+    select: str,
+    filters: Iterable[Filter] = (),
+    order_by: Sequence[str] = ("id",),
+    page_size: int = DEFAULT_PAGE_SIZE,
+    client=None,
+    output: str = "arrow",
+) -> Iterator[Any]:
+    """Yield each page as a columnar batch for vectorized audits.
+
+    ``output="arrow"`` yields ``pyarrow.RecordBatch``; ``output="numpy"`` yields
+    ``{column: numpy.ndarray}``.  Both libraries are optional dependencies and
+    only imported here.
+    """
+    if output == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("iter_record_batches(output='arrow') requires pyarrow") from exc
+        for page in iter_pages(table, select, filters, order_by, page_size, client):
+            yield pa.RecordBatch.from_pylist(page)
+    elif output == "numpy":
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError("iter_record_batches(output='numpy') requires numpy") from exc
+        for page in iter_pages(table, select, filters, order_by, page_size, client):
+            yield {col: np.asarray([row.get(col) for row in page]) for col in page[0]}
+    else:
+        raise ValueError(f"Unknown output format: {output!r}")
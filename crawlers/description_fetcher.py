@@ -16,6 +16,7 @@ from typing import Optional
 
 from bs4 import BeautifulSoup
 from description_quality import classify_description
+from extractors.offload import run_extraction
 
 logger = logging.getLogger(__name__)
 
@@ -163,7 +164,7 @@ def fetch_description_from_url(url: str, session=None) -> Optional[str]:
                 response = client.get(url)
                 html = response.text
 
-        return extract_description_from_html(html)
+        return run_extraction("description", html)
 
     except Exception as e:
         logger.debug(f"Failed to fetch description from {url}: {e}")
@@ -187,7 +188,7 @@ def fetch_description_playwright(page, url: str) -> Optional[str]:
         page.goto(url, wait_until="domcontentloaded", timeout=15000)
         page.wait_for_timeout(1500)
         html = page.content()
-        return extract_description_from_html(html)
+        return run_extraction("description", html)
 
     except Exception as e:
         logger.debug(f"Failed to fetch description via Playwright from {url}: {e}")
@@ -27,6 +27,12 @@ Usage:
     python editorial_ingest.py --verbose                # Debug logging
     python editorial_ingest.py --days 14                # Last 14 days only
     python editorial_ingest.py --skip-fetch             # Skip page fetching (fast mode)
+    python editorial_ingest.py --full-refresh           # Ignore stored feed/sitemap validators
+
+Publications are ingested concurrently.  Requests share pooled connections and
+are paced per domain (``_FETCH_DELAY_SECONDS``), and feeds/sitemaps that report
+no change since the last committed run (ETag, Last-Modified, sitemap lastmod)
+are skipped.
 """
 
 from __future__ import annotations
@@ -35,7 +41,7 @@ import argparse
 import logging
 import re
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
@@ -52,6 +58,7 @@ load_dotenv(Path(__file__).parent.parent / "web" / ".env.local")
 
 sys.path.insert(0, str(Path(__file__).parent))
 from db import get_client, writes_enabled, configure_write_mode
+from feed_fetcher import FeedFetcher, FeedStateStore
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)-5s %(message)s")
 logger = logging.getLogger(__name__)
@@ -169,9 +176,14 @@ _MIN_NAME_CHARS = 4
 # Minimum word count for a venue name to be matched in body text
 _MIN_WORDS_FOR_BODY_MATCH = 2
 
-# Delay between page fetches (be polite)
+# Minimum spacing between requests to the same domain (be polite)
 _FETCH_DELAY_SECONDS = 1.5
 
+# Publications ingested in parallel (each on its own domain)
+_MAX_CONCURRENT_SOURCES = 4
+
+_FETCHER = FeedFetcher(_HEADERS, min_interval=_FETCH_DELAY_SECONDS)
+
 # Venue names that are too generic to match (city names, common words)
 _VENUE_NAME_BLOCKLIST = frozenset([
     # Cities
@@ -523,8 +535,7 @@ def fetch_article_text(url: str) -> tuple[Optional[str], Optional[str], Optional
     Returns (real_title, body_text, snippet) or (None, None, None) on failure.
     """
     try:
-        resp = requests.get(url, headers=_HEADERS, timeout=15, allow_redirects=True)
-        resp.raise_for_status()
+        resp = _FETCHER.get(url, timeout=15, allow_redirects=True)
     except requests.RequestException as exc:
         logger.debug("Failed to fetch %s: %s", url, exc)
         return None, None, None
@@ -576,16 +587,27 @@ def fetch_article_text(url: str) -> tuple[Optional[str], Optional[str], Optional
 # ---------------------------------------------------------------------------
 
 
-def fetch_rss_entries(source_config: dict, cutoff_dt: datetime) -> list[dict]:
-    """Parse RSS feed and return list of article dicts."""
+def fetch_rss_entries(
+    source_config: dict,
+    cutoff_dt: datetime,
+    state: Optional[FeedStateStore] = None,
+    scope: str = "",
+) -> list[dict]:
+    """Parse RSS feed and return list of article dicts.
+
+    With ``state``, the feed is fetched conditionally and an unchanged feed
+    yields no entries.
+    """
     feed_url = source_config["feed_url"]
     display_name = source_config["display_name"]
     category_filter: list[str] = source_config.get("category_filter", [])
 
     logger.info("Fetching %s RSS feed: %s", display_name, feed_url)
     try:
-        response = requests.get(feed_url, headers=_HEADERS, timeout=20)
-        response.raise_for_status()
+        response = _FETCHER.get_if_changed(feed_url, state, scope, timeout=20)
+        if response is None:
+            logger.info("%s RSS unchanged since last run", display_name)
+            return []
         feed = feedparser.parse(response.content)
     except requests.RequestException as exc:
         logger.error("Failed to fetch %s RSS: %s", display_name, exc)
@@ -671,8 +693,7 @@ def fetch_eater_archive_entries(
     for page in range(1, max_pages + 1):
         page_url = archive_url if page == 1 else f"{archive_url}/{page}"
         try:
-            resp = requests.get(page_url, headers=_HEADERS, timeout=15)
-            resp.raise_for_status()
+            resp = _FETCHER.get(page_url, timeout=15)
         except requests.RequestException as exc:
             logger.warning("Failed to fetch archive page %d: %s", page, exc)
             break
@@ -707,7 +728,6 @@ def fetch_eater_archive_entries(
         logger.info("  Archive page %d: %d articles", page, found_on_page)
         if found_on_page == 0:
             break
-        time.sleep(_FETCH_DELAY_SECONDS)
 
     logger.info("Found %d archive articles from %s", len(entries), display_name)
     return entries
@@ -718,16 +738,27 @@ def fetch_eater_archive_entries(
 # ---------------------------------------------------------------------------
 
 
-def fetch_sitemap_entries(source_config: dict, cutoff_dt: datetime) -> list[dict]:
-    """Fetch and parse XML sitemap, return article dicts."""
+def fetch_sitemap_entries(
+    source_config: dict,
+    cutoff_dt: datetime,
+    state: Optional[FeedStateStore] = None,
+    scope: str = "",
+) -> list[dict]:
+    """Fetch and parse XML sitemap, return article dicts.
+
+    With ``state``, the sitemap is fetched conditionally and an unchanged
+    sitemap yields no entries.
+    """
     sitemap_url = source_config["sitemap_url"]
     url_filter: str = source_config.get("url_filter", "")
     display_name = source_config["display_name"]
 
     logger.info("Fetching %s sitemap: %s", display_name, sitemap_url)
     try:
-        response = requests.get(sitemap_url, headers=_HEADERS, timeout=30)
-        response.raise_for_status()
+        response = _FETCHER.get_if_changed(sitemap_url, state, scope, timeout=30)
+        if response is None:
+            logger.info("%s sitemap unchanged since last run", display_name)
+            return []
         xml_content = response.content
     except requests.RequestException as exc:
         logger.error("Failed to fetch %s sitemap: %s", display_name, exc)
@@ -797,12 +828,17 @@ def fetch_sitemap_entries(source_config: dict, cutoff_dt: datetime) -> list[dict
 
 
 def fetch_sitemap_index_entries(
-    source_config: dict, cutoff_dt: datetime
+    source_config: dict,
+    cutoff_dt: datetime,
+    state: Optional[FeedStateStore] = None,
+    scope: str = "",
 ) -> list[dict]:
     """Fetch a sitemap index, iterate sub-sitemaps, collect article URLs.
 
     Eater's sitemap index at /sitemaps lists monthly sub-sitemaps like
     /sitemaps/entries/2026/3. We fetch the N most recent and extract URLs.
+    With ``state``, sub-sitemaps whose index ``<lastmod>`` matches the last
+    committed run are skipped without being fetched.
     """
     index_url = source_config["sitemap_index_url"]
     max_subs = source_config.get("max_sub_sitemaps", 12)
@@ -810,8 +846,7 @@ def fetch_sitemap_index_entries(
 
     logger.info("Fetching %s sitemap index: %s", display_name, index_url)
     try:
-        resp = requests.get(index_url, headers=_HEADERS, timeout=30)
-        resp.raise_for_status()
+        resp = _FETCHER.get(index_url, timeout=30)
     except requests.RequestException as exc:
         logger.error("Failed to fetch %s sitemap index: %s", display_name, exc)
         return []
@@ -824,6 +859,7 @@ def fetch_sitemap_index_entries(
 
     # Extract sub-sitemap URLs from the index
     all_sub_urls: list[str] = []
+    sub_lastmods: dict[str, str] = {}
     ns = _SITEMAP_NS
     sitemaps = root.findall("sm:sitemap", ns) or root.findall("sitemap")
     if not sitemaps:
@@ -836,7 +872,13 @@ def fetch_sitemap_index_entries(
         if loc_el is None:
             loc_el = sm.find("{http://www.sitemaps.org/schemas/sitemap/0.9}loc")
         if loc_el is not None and loc_el.text:
-            all_sub_urls.append(loc_el.text.strip())
+            sub_url = loc_el.text.strip()
+            all_sub_urls.append(sub_url)
+            lastmod_el = sm.find("sm:lastmod", ns)
+            if lastmod_el is None:
+                lastmod_el = sm.find("lastmod")
+            if lastmod_el is not None and lastmod_el.text:
+                sub_lastmods[sub_url] = lastmod_el.text.strip()
 
     if not all_sub_urls:
         logger.warning("No sub-sitemaps found in %s index", display_name)
@@ -860,11 +902,15 @@ def fetch_sitemap_index_entries(
     )
 
     all_entries: list[dict] = []
+    skipped_unchanged = 0
     for sub_url in sub_urls:  # Already newest first
+        lastmod = sub_lastmods.get(sub_url)
+        if state is not None and state.is_unchanged(sub_url, lastmod):
+            skipped_unchanged += 1
+            continue
         logger.info("  Fetching sub-sitemap: %s", sub_url.split("/sitemaps/")[-1] if "/sitemaps/" in sub_url else sub_url)
         try:
-            resp = requests.get(sub_url, headers=_HEADERS, timeout=20)
-            resp.raise_for_status()
+            resp = _FETCHER.get(sub_url, timeout=20)
         except requests.RequestException as exc:
             logger.warning("Failed to fetch sub-sitemap %s: %s", sub_url, exc)
             continue
@@ -926,8 +972,11 @@ def fetch_sitemap_index_entries(
             sub_count += 1
 
         logger.info("    → %d articles", sub_count)
-        time.sleep(0.5)  # Polite delay between sub-sitemap fetches
+        if state is not None:
+            state.stage(scope, sub_url, lastmod=lastmod)
 
+    if skipped_unchanged:
+        logger.info("Skipped %d unchanged sub-sitemaps", skipped_unchanged)
     logger.info("Found %d total articles from %s sitemap index", len(all_entries), display_name)
     return all_entries
 
@@ -1036,26 +1085,37 @@ def ingest_source(
     cutoff_dt: datetime,
     skip_fetch: bool = False,
     reprocess: bool = False,
+    state: Optional[FeedStateStore] = None,
 ) -> tuple[int, int, int]:
     """Ingest one source.
 
+    ``state`` enables skipping feeds and sub-sitemaps unchanged since the last
+    run; validators are committed only once the source finished and wrote,
+    and every article fetch succeeded.  Articles whose fetch failed are not
+    stored, so the next run (which re-reads the feed) retries them.
+
     Returns (articles_found, mentions_upserted, venues_matched).
     """
     method = source_config["method"]
+    if reprocess:
+        state = None
 
     # Phase 1: Discover article URLs
     if method == "rss":
-        raw_entries = fetch_rss_entries(source_config, cutoff_dt)
+        raw_entries = fetch_rss_entries(source_config, cutoff_dt, state, source_key)
     elif method == "sitemap":
-        raw_entries = fetch_sitemap_entries(source_config, cutoff_dt)
+        raw_entries = fetch_sitemap_entries(source_config, cutoff_dt, state, source_key)
     elif method == "sitemap_index":
-        raw_entries = fetch_sitemap_index_entries(source_config, cutoff_dt)
+        raw_entries = fetch_sitemap_index_entries(
+            source_config, cutoff_dt, state, source_key
+        )
     else:
         logger.error("Unknown method '%s' for source '%s'", method, source_key)
         return 0, 0, 0
 
     articles_found = len(raw_entries)
     if articles_found == 0:
+        _commit_feed_state(state, source_key)
         return 0, 0, 0
 
     # Check which URLs we already have in the DB
@@ -1078,8 +1138,9 @@ def ingest_source(
 
     mentions_upserted = 0
     venues_matched_total = 0
+    fetch_failures = 0
 
-    for i, entry in enumerate(new_entries):
+    for entry in new_entries:
         title = entry["title"]
         url = entry["url"]
         published_at: Optional[datetime] = entry.get("published_at")
@@ -1089,6 +1150,9 @@ def ingest_source(
         # Phase 2: Fetch the actual article page
         if not skip_fetch:
             real_title, page_body, page_snippet = fetch_article_text(url)
+            if real_title is None and page_body is None:
+                fetch_failures += 1
+                continue
 
             if real_title:
                 title = real_title
@@ -1097,10 +1161,6 @@ def ingest_source(
             if page_snippet and not snippet:
                 snippet = page_snippet
 
-            # Polite delay between fetches
-            if i < len(new_entries) - 1:
-                time.sleep(_FETCH_DELAY_SECONDS)
-
         mention_type, guide_name = classify_mention(title, url, source_key)
 
         # Match venues in title + full body text
@@ -1160,9 +1220,24 @@ def ingest_source(
             if upsert_mention(mention):
                 mentions_upserted += 1
 
+    if fetch_failures:
+        logger.warning("%d article fetches failed for %s; retrying next run", fetch_failures, source_key)
+        if state is not None:
+            state.discard(source_key)
+    _commit_feed_state(state, source_key)
     return articles_found, mentions_upserted, venues_matched_total
 
 
+def _commit_feed_state(state: Optional[FeedStateStore], source_key: str) -> None:
+    """Persist staged validators; dry runs discard them so real runs re-fetch."""
+    if state is None:
+        return
+    if writes_enabled():
+        state.commit(source_key)
+    else:
+        state.discard(source_key)
+
+
 def _build_mention_payload(
     source_key: str,
     url: str,
@@ -1235,6 +1310,11 @@ def main() -> None:
         action="store_true",
         help="Re-fetch and re-match existing articles (use after pipeline upgrades)",
     )
+    parser.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Ignore stored ETag/Last-Modified/lastmod state and fetch every feed",
+    )
     args = parser.parse_args()
 
     if args.verbose:
@@ -1265,19 +1345,37 @@ def main() -> None:
     total_venue_matches = 0
     source_count = 0
 
-    for source_key, source_config in sources_to_run.items():
+    state = None if args.full_refresh else FeedStateStore()
+
+    def _run(item: tuple[str, dict]) -> tuple[int, int, int]:
+        source_key, source_config = item
         logger.info("-" * 60)
-        articles, upserted, matched = ingest_source(
-            source_key, source_config, cutoff_dt,
-            skip_fetch=args.skip_fetch,
-            reprocess=args.reprocess,
-        )
+        try:
+            return ingest_source(
+                source_key, source_config, cutoff_dt,
+                skip_fetch=args.skip_fetch,
+                reprocess=args.reprocess,
+                state=state,
+            )
+        except Exception as exc:
+            logger.error("Source '%s' failed: %s", source_key, exc)
+            if state is not None:
+                state.discard(source_key)
+            return 0, 0, 0
+
+    with ThreadPoolExecutor(
+        max_workers=min(_MAX_CONCURRENT_SOURCES, len(sources_to_run))
+    ) as pool:
+        results = list(pool.map(_run, sources_to_run.items()))
+
+    for articles, upserted, matched in results:
         total_articles += articles
         total_upserted += upserted
         total_venue_matches += matched
         source_count += 1
-        if len(sources_to_run) > 1:
-            time.sleep(1)
+
+    if state is not None:
+        state.save()
 
     logger.info("=" * 60)
     logger.info(
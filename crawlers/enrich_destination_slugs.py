@@ -3,7 +3,7 @@
 Targeted destination enrichment for a list of venue slugs.
 
 Enrichment steps (best-effort, non-destructive):
-1. Geocode missing coordinates from address (Nominatim)
+1. Geocode missing coordinates from address (Nominatim, via the shared cache)
 2. Foursquare search + details (hours, image, website/phone/instagram, descriptions)
 3. Parking backfill (website extraction, then OSM fallback)
 4. Transit accessibility fields (MARTA/BeltLine score)
@@ -33,7 +33,7 @@ from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
 from db import get_client
-from geocode_venues import geocode_address
+from geocoding import get_geocoder
 from hydrate_venues_foursquare import (
     ATLANTA_LAT,
     ATLANTA_LNG,
@@ -962,15 +962,17 @@ def _maybe_geocode(venue: Dict[str, Any]) -> Dict[str, Any]:
     address = venue.get("address")
     if not address:
         return {}
-    coords = geocode_address(
-        address=address,
+    geo = get_geocoder().geocode(
+        address,
         city=venue.get("city") or "Atlanta",
         state=venue.get("state") or "GA",
     )
-    if not coords:
+    if not geo.found:
         return {}
-    lat, lng = coords
-    return {"lat": lat, "lng": lng}
+    updates: Dict[str, Any] = {"lat": geo.lat, "lng": geo.lng}
+    if geo.neighborhood and not venue.get("neighborhood"):
+        updates["neighborhood"] = geo.neighborhood
+    return updates
 
 
 def _maybe_foursquare_enrich(venue: Dict[str, Any]) -> Dict[str, Any]:
@@ -5,12 +5,15 @@ Converts raw HTML/text into structured event data.
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel
 
 from date_utils import normalize_iso_date, parse_human_date
-from llm_client import generate_text
+from extraction_cache import memoized_extractor, prompt_version
+from extractors.content_reduction import reduce_html
+from llm_client import generate_text, provider_concurrency
 
 logger = logging.getLogger(__name__)
 
@@ -277,32 +280,212 @@ class EventData(BaseModel):
     program_hint: Optional[ProgramHint] = None
 
 
+# Estimated tokens of page content per extraction request.
+EXTRACTION_TOKEN_BUDGET = 8000
+# Batched extraction packs up to this many pages into one request; a page is
+# packed only if its reduced text fits BATCH_PAGE_TOKEN_BUDGET, larger pages
+# get a request of their own (with the full EXTRACTION_TOKEN_BUDGET).
+BATCH_PAGES_PER_REQUEST = 4
+BATCH_PAGE_TOKEN_BUDGET = 3000
+
+BATCH_INSTRUCTIONS = """
+
+BATCH MODE:
+The content holds several separate pages. Each starts with a line
+"=== PAGE <n> | Source: <name> | URL: <url> ===". Extract each page's events
+independently, using only that page's content and the rules above, and return:
+{"pages": [{"page": <n>, "events": [ ...events as above... ]}]}
+with one entry per page (an empty "events" list when a page has none).
+"""
+
+
 class ExtractionResult(BaseModel):
     """Result of extraction."""
     events: list[EventData]
 
 
-def _strip_html_boilerplate(html: str) -> str:
-    """Strip scripts, styles, and other non-content elements from HTML.
+def _parse_llm_json(response_text: str):
+    """Parse the JSON in an LLM answer (fenced or bare, tolerating trailing commas)."""
+    json_str = response_text
+    if "```json" in response_text:
+        json_str = response_text.split("```json")[1].split("```")[0]
+    elif "```" in response_text:
+        json_str = response_text.split("```")[1].split("```")[0]
 
-    This dramatically reduces token count so the LLM sees actual event
-    content rather than kilobytes of CSS/JS boilerplate.
-    """
+    # Try to parse, with fallback for trailing commas
     try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, "lxml")
-        for tag in soup.find_all(["script", "style", "noscript", "link", "meta", "svg", "iframe"]):
-            tag.decompose()
-        # Remove head entirely — it's all metadata
-        if soup.head:
-            soup.head.decompose()
-        # Remove nav/footer which rarely contain event data
-        for tag in soup.find_all(["nav", "footer"]):
-            tag.decompose()
-        return str(soup)
-    except Exception:
-        # Fallback: return raw content if BeautifulSoup fails
-        return html
+        return json.loads(json_str)
+    except json.JSONDecodeError:
+        # Try fixing common issues: trailing commas, unquoted keys
+        import re
+        # Remove trailing commas before } or ]
+        fixed = re.sub(r',\s*([}\]])', r'\1', json_str)
+        return json.loads(fixed)
+
+
+# The raw LLM answer is memoized per page; the date/URL validation below always
+# re-runs because it depends on today's date.
+@memoized_extractor("llm_events", version=prompt_version("2", EXTRACTION_PROMPT), cache_empty=False)
+def _request_extraction(
+    raw_content: str,
+    source_url: str,
+    source_name: str,
+    llm_provider: Optional[str],
+    llm_model: Optional[str],
+) -> dict:
+    """Ask the LLM for the events on a page and return its parsed JSON."""
+    reduced = reduce_html(raw_content, source_url, token_budget=EXTRACTION_TOKEN_BUDGET, caller="extract_events")
+
+    user_message = f"""Source: {source_name}
+URL: {source_url}
+
+Content to extract:
+{reduced.text}"""
+
+    response_text = generate_text(
+        EXTRACTION_PROMPT,
+        user_message,
+        provider_override=llm_provider,
+        model_override=llm_model,
+        caller="extract_events",
+    )
+    return _parse_llm_json(response_text)
+
+
+@memoized_extractor(
+    "llm_events_batch",
+    version=prompt_version("1", EXTRACTION_PROMPT + BATCH_INSTRUCTIONS),
+    cache_empty=False,
+)
+def _request_batch_extraction(
+    packed_content: str,
+    llm_provider: Optional[str],
+    llm_model: Optional[str],
+) -> dict:
+    """Ask the LLM for the events on several packed pages; returns {"pages": [...]}."""
+    response_text = generate_text(
+        EXTRACTION_PROMPT + BATCH_INSTRUCTIONS,
+        packed_content,
+        provider_override=llm_provider,
+        model_override=llm_model,
+        caller="extract_events_batch",
+    )
+    return _parse_llm_json(response_text)
+
+
+def _validate_events(data: dict, source_url: str, source_name: str) -> list[EventData]:
+    """Normalize and validate the LLM's events for one page."""
+    # Clean up event data - filter out events with missing required fields
+    valid_events = []
+    for event_data in data.get("events", []):
+        raw_start_date = event_data.get("start_date")
+        if not raw_start_date:
+            logger.debug(f"Skipping event without date: {event_data.get('title', 'Unknown')}")
+            continue
+
+        context_text = " ".join(
+            filter(
+                None,
+                [
+                    str(event_data.get("title") or ""),
+                    str(event_data.get("description") or ""),
+                ],
+            )
+        )
+
+        # Normalize dates and heal common +1 year rollover artifacts.
+        normalized_start = normalize_iso_date(raw_start_date) or parse_human_date(
+            str(raw_start_date),
+            context_text=context_text,
+        )
+        if not normalized_start:
+            logger.debug(f"Skipping event with invalid/unusable date: {event_data.get('title', 'Unknown')} ({raw_start_date})")
+            continue
+        event_data["start_date"] = normalized_start
+
+        raw_end_date = event_data.get("end_date")
+        if raw_end_date:
+            normalized_end = normalize_iso_date(raw_end_date) or parse_human_date(
+                str(raw_end_date),
+                context_text=context_text,
+            )
+            if normalized_end:
+                event_data["end_date"] = normalized_end
+            else:
+                event_data["end_date"] = None
+
+        if event_data.get("end_date"):
+            try:
+                start_dt = datetime.strptime(event_data["start_date"], "%Y-%m-%d").date()
+                end_dt = datetime.strptime(event_data["end_date"], "%Y-%m-%d").date()
+                if end_dt < start_dt:
+                    event_data["end_date"] = None
+            except (TypeError, ValueError):
+                event_data["end_date"] = None
+
+        # Ensure venue has a name
+        if event_data.get("venue") and not event_data["venue"].get("name"):
+            # Use source name as venue name
+            event_data["venue"]["name"] = "Unknown Venue"
+
+        # Set defaults for missing boolean/list fields
+        if event_data.get("is_free") is None:
+            event_data["is_free"] = False
+        if event_data.get("is_all_day") is None:
+            event_data["is_all_day"] = False
+        if event_data.get("is_recurring") is None:
+            event_data["is_recurring"] = False
+        if event_data.get("artists") is None:
+            event_data["artists"] = []
+        if event_data.get("genres") is None:
+            event_data["genres"] = []
+        if event_data.get("tags") is None:
+            event_data["tags"] = []
+
+        # Clean up series_hint
+        if event_data.get("series_hint"):
+            if event_data["series_hint"].get("genres") is None:
+                event_data["series_hint"]["genres"] = []
+
+        # Normalize confidence to 0-1 range (LLM sometimes returns percentages like 85)
+        conf = event_data.get("confidence")
+        if conf is not None and conf > 1:
+            event_data["confidence"] = conf / 100.0
+
+        # Validate URLs are from source domain or known ticketing platforms
+        for url_field in ("ticket_url", "detail_url", "image_url"):
+            url_val = event_data.get(url_field)
+            if url_val and not _is_valid_event_url(url_val, source_url):
+                logger.debug(f"Stripping suspicious {url_field}: {url_val}")
+                event_data[url_field] = None
+
+        # Validate dates are in reasonable range (not 1970, not 2099)
+        try:
+            start_year = int(event_data["start_date"][:4])
+            if start_year < 2024 or start_year > 2028:
+                logger.debug(f"Skipping event with unreasonable year {start_year}: {event_data.get('title')}")
+                continue
+        except (ValueError, TypeError):
+            pass
+
+        # Validate prices are in reasonable range
+        for price_field in ("price_min", "price_max"):
+            price_val = event_data.get(price_field)
+            if price_val is not None:
+                try:
+                    if float(price_val) < 0 or float(price_val) > 10000:
+                        event_data[price_field] = None
+                except (ValueError, TypeError):
+                    event_data[price_field] = None
+
+        valid_events.append(event_data)
+
+
+    data["events"] = valid_events
+    result = ExtractionResult(**data)
+
+    logger.info(f"Extracted {len(result.events)} events from {source_name}")
+    return result.events
 
 
 def extract_events(
@@ -323,161 +506,126 @@ def extract_events(
     Returns:
         List of extracted EventData objects
     """
-    cleaned = _strip_html_boilerplate(raw_content)
-
-    user_message = f"""Source: {source_name}
-URL: {source_url}
-
-Content to extract:
-{cleaned[:50000]}"""  # Truncate very long content
-
     try:
-        response_text = generate_text(
-            EXTRACTION_PROMPT,
-            user_message,
-            provider_override=llm_provider,
-            model_override=llm_model,
-        )
-
-        # Try to extract JSON from response
-        json_str = response_text
-        if "```json" in response_text:
-            json_str = response_text.split("```json")[1].split("```")[0]
-        elif "```" in response_text:
-            json_str = response_text.split("```")[1].split("```")[0]
+        data = _request_extraction(raw_content, source_url, source_name, llm_provider, llm_model)
+        return _validate_events(data, source_url, source_name)
 
-        # Try to parse, with fallback for trailing commas
-        try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
-            # Try fixing common issues: trailing commas, unquoted keys
-            import re
-            # Remove trailing commas before } or ]
-            fixed = re.sub(r',\s*([}\]])', r'\1', json_str)
-            data = json.loads(fixed)
-
-        # Clean up event data - filter out events with missing required fields
-        valid_events = []
-        for event_data in data.get("events", []):
-            raw_start_date = event_data.get("start_date")
-            if not raw_start_date:
-                logger.debug(f"Skipping event without date: {event_data.get('title', 'Unknown')}")
-                continue
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse LLM response as JSON: {e}")
+        return []
+    except Exception as e:
+        logger.error(f"Extraction failed for {source_url}: {e}")
+        return []
 
-            context_text = " ".join(
-                filter(
-                    None,
-                    [
-                        str(event_data.get("title") or ""),
-                        str(event_data.get("description") or ""),
-                    ],
-                )
-            )
 
-            # Normalize dates and heal common +1 year rollover artifacts.
-            normalized_start = normalize_iso_date(raw_start_date) or parse_human_date(
-                str(raw_start_date),
-                context_text=context_text,
-            )
-            if not normalized_start:
-                logger.debug(f"Skipping event with invalid/unusable date: {event_data.get('title', 'Unknown')} ({raw_start_date})")
-                continue
-            event_data["start_date"] = normalized_start
-
-            raw_end_date = event_data.get("end_date")
-            if raw_end_date:
-                normalized_end = normalize_iso_date(raw_end_date) or parse_human_date(
-                    str(raw_end_date),
-                    context_text=context_text,
-                )
-                if normalized_end:
-                    event_data["end_date"] = normalized_end
-                else:
-                    event_data["end_date"] = None
+def _extract_packed(
+    pages: list[tuple[int, str, str, str, str]],
+    llm_provider: Optional[str],
+    llm_model: Optional[str],
+) -> dict[int, list[EventData]]:
+    """Extract a packed group of (index, raw_content, reduced_text, url, name) pages.
 
-            if event_data.get("end_date"):
+    Pages the answer doesn't cover (or a failed request) are re-extracted one
+    by one, so a bad batch answer costs extra requests, never events.
+    """
+    packed = "\n\n".join(
+        f"=== PAGE {n} | Source: {name} | URL: {url} ===\n{text}"
+        for n, (_, _, text, url, name) in enumerate(pages, start=1)
+    )
+    answers: dict[int, list] = {}
+    try:
+        data = _request_batch_extraction(packed, llm_provider, llm_model)
+        for entry in data.get("pages", []) if isinstance(data, dict) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("events"), list):
                 try:
-                    start_dt = datetime.strptime(event_data["start_date"], "%Y-%m-%d").date()
-                    end_dt = datetime.strptime(event_data["end_date"], "%Y-%m-%d").date()
-                    if end_dt < start_dt:
-                        event_data["end_date"] = None
+                    answers[int(entry.get("page"))] = entry["events"]
                 except (TypeError, ValueError):
-                    event_data["end_date"] = None
-
-            # Ensure venue has a name
-            if event_data.get("venue") and not event_data["venue"].get("name"):
-                # Use source name as venue name
-                event_data["venue"]["name"] = "Unknown Venue"
-
-            # Set defaults for missing boolean/list fields
-            if event_data.get("is_free") is None:
-                event_data["is_free"] = False
-            if event_data.get("is_all_day") is None:
-                event_data["is_all_day"] = False
-            if event_data.get("is_recurring") is None:
-                event_data["is_recurring"] = False
-            if event_data.get("artists") is None:
-                event_data["artists"] = []
-            if event_data.get("genres") is None:
-                event_data["genres"] = []
-            if event_data.get("tags") is None:
-                event_data["tags"] = []
-
-            # Clean up series_hint
-            if event_data.get("series_hint"):
-                if event_data["series_hint"].get("genres") is None:
-                    event_data["series_hint"]["genres"] = []
-
-            # Normalize confidence to 0-1 range (LLM sometimes returns percentages like 85)
-            conf = event_data.get("confidence")
-            if conf is not None and conf > 1:
-                event_data["confidence"] = conf / 100.0
-
-            # Validate URLs are from source domain or known ticketing platforms
-            for url_field in ("ticket_url", "detail_url", "image_url"):
-                url_val = event_data.get(url_field)
-                if url_val and not _is_valid_event_url(url_val, source_url):
-                    logger.debug(f"Stripping suspicious {url_field}: {url_val}")
-                    event_data[url_field] = None
-
-            # Validate dates are in reasonable range (not 1970, not 2099)
-            try:
-                start_year = int(event_data["start_date"][:4])
-                if start_year < 2024 or start_year > 2028:
-                    logger.debug(f"Skipping event with unreasonable year {start_year}: {event_data.get('title')}")
                     continue
-            except (ValueError, TypeError):
-                pass
-
-            # Validate prices are in reasonable range
-            for price_field in ("price_min", "price_max"):
-                price_val = event_data.get(price_field)
-                if price_val is not None:
-                    try:
-                        if float(price_val) < 0 or float(price_val) > 10000:
-                            event_data[price_field] = None
-                    except (ValueError, TypeError):
-                        event_data[price_field] = None
+    except Exception as e:
+        logger.warning(f"Batched extraction of {len(pages)} pages failed ({e}); extracting one by one")
 
-            valid_events.append(event_data)
+    results: dict[int, list[EventData]] = {}
+    for n, (index, raw_content, _, url, name) in enumerate(pages, start=1):
+        if n not in answers:
+            results[index] = extract_events(raw_content, url, name, llm_provider, llm_model)
+            continue
+        try:
+            results[index] = _validate_events({"events": answers[n]}, url, name)
+        except Exception as e:
+            logger.error(f"Extraction failed for {url}: {e}")
+            results[index] = []
+    return results
 
-        data["events"] = valid_events
-        result = ExtractionResult(**data)
 
-        logger.info(f"Extracted {len(result.events)} events from {source_name}")
-        return result.events
+def extract_events_by_page(
+    items: list[tuple[str, ...]],
+    source_name: Optional[str] = None,
+    llm_provider: Optional[str] = None,
+    llm_model: Optional[str] = None,
+    pages_per_request: int = BATCH_PAGES_PER_REQUEST,
+    max_workers: Optional[int] = None,
+) -> list[list[EventData]]:
+    """
+    Extract events from many pages with as few, concurrent, LLM requests as possible.
 
-    except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse LLM response as JSON: {e}")
-        return []
-    except Exception as e:
-        logger.error(f"Extraction failed for {source_url}: {e}")
-        return []
+    Small pages (after content reduction) are packed several to a request and
+    the answer is split back per page; large pages get their own request.
+    Requests run concurrently, bounded by the provider's slots in llm_client.
+
+    Args:
+        items: (raw_content, source_url) or (raw_content, source_url, source_name) tuples
+        source_name: Source name for items that don't carry their own
+
+    Returns:
+        One list of validated events per item, in item order
+    """
+    results: list[list[EventData]] = [[] for _ in items]
+    solo: list[tuple[int, str, str, str]] = []
+    packable: list[tuple[int, str, str, str, str]] = []
+    for index, item in enumerate(items):
+        raw_content, url = item[0], item[1]
+        name = item[2] if len(item) > 2 and item[2] else (source_name or "")
+        if not raw_content:
+            continue
+        if pages_per_request > 1:
+            reduced = reduce_html(
+                raw_content, url, token_budget=BATCH_PAGE_TOKEN_BUDGET, caller="extract_events_batch", templates=None
+            )
+            if not reduced.truncated:
+                packable.append((index, raw_content, reduced.text, url, name))
+                continue
+        solo.append((index, raw_content, url, name))
+
+    groups = [packable[i:i + pages_per_request] for i in range(0, len(packable), pages_per_request)]
+    # A lone small page is cheaper as a normal request than a batch prompt.
+    for group in [g for g in groups if len(g) == 1]:
+        index, raw_content, _, url, name = group[0]
+        solo.append((index, raw_content, url, name))
+    groups = [g for g in groups if len(g) > 1]
+
+    task_count = len(groups) + len(solo)
+    if not task_count:
+        return results
+    workers = max_workers or provider_concurrency(llm_provider)
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, task_count)), thread_name_prefix="llm-extract") as pool:
+        futures = [pool.submit(_extract_packed, group, llm_provider, llm_model) for group in groups]
+        solo_futures = {
+            pool.submit(extract_events, raw_content, url, name, llm_provider, llm_model): index
+            for index, raw_content, url, name in solo
+        }
+        for future in futures:
+            for index, events in future.result().items():
+                results[index] = events
+        for future, index in solo_futures.items():
+            results[index] = future.result()
+    return results
 
 
 def extract_events_batch(
-    items: list[tuple[str, str]],
-    source_name: str
+    items: list[tuple[str, ...]],
+    source_name: str,
+    llm_provider: Optional[str] = None,
+    llm_model: Optional[str] = None,
 ) -> list[EventData]:
     """
     Extract events from multiple content items.
@@ -490,7 +638,6 @@ def extract_events_batch(
         Combined list of all extracted events
     """
     all_events = []
-    for raw_content, source_url in items:
-        events = extract_events(raw_content, source_url, source_name)
+    for events in extract_events_by_page(items, source_name, llm_provider, llm_model):
         all_events.extend(events)
     return all_events
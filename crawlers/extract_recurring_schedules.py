@@ -19,6 +19,8 @@ import json
 import logging
 import sys
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Optional
@@ -31,7 +33,7 @@ from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeo
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config import get_config
-from llm_client import generate_text
+from llm_client import generate_text, provider_concurrency
 from db import (
     get_client,
     insert_event,
@@ -80,9 +82,8 @@ DAY_NAMES = [
     "sunday",
 ]
 
-# Rate limiting
+# Rate limiting (LLM calls are paced by llm_client's provider slots)
 FETCH_DELAY_SECONDS = 2.0
-CLAUDE_DELAY_SECONDS = 1.0
 
 # Playwright page-load timeout (milliseconds)
 PAGE_TIMEOUT_MS = 10_000
@@ -433,6 +434,61 @@ def insert_recurring_event(
 # Main processing loop
 # ---------------------------------------------------------------------------
 
+def _finish_venue(
+    venue: dict,
+    website: str,
+    extraction_source: str,
+    future: Future,
+    execute: bool,
+) -> dict:
+    """Validate (and with execute, insert) one venue's extracted events."""
+    raw_events = future.result()
+    venue_name = venue["name"]
+
+    # Validate
+    valid_events = []
+    for raw in raw_events:
+        ok, reason = validate_extracted_event(raw)
+        if ok:
+            valid_events.append(raw)
+        else:
+            logger.debug(f"  Dropped invalid event: {reason} — {raw}")
+
+    logger.info(
+        f"{venue_name}: extracted {len(raw_events)} events, "
+        f"{len(valid_events)} valid (source: {extraction_source})"
+    )
+
+    # Execute mode: insert into DB
+    total_attempted = 0
+    total_inserted = 0
+    if execute and valid_events:
+        for extracted in valid_events:
+            attempted, inserted = insert_recurring_event(
+                venue_record=venue,
+                extracted=extracted,
+            )
+            total_attempted += attempted
+            total_inserted += inserted
+        logger.info(
+            f"  Inserted {total_inserted}/{total_attempted} occurrences"
+        )
+
+    result_entry: dict = {
+        "place_id": venue["id"],
+        "venue_name": venue_name,
+        "venue_slug": venue["slug"],
+        "website": website,
+        "extraction_source": extraction_source,
+        "extracted_events": valid_events,
+    }
+    if execute:
+        result_entry["insert_attempted"] = total_attempted
+        result_entry["insert_succeeded"] = total_inserted
+
+    return result_entry
+
+
 def process_venues(
     venues: list[dict],
     execute: bool,
@@ -440,7 +496,8 @@ def process_venues(
     """
     For each venue:
       1. Fetch page content with Playwright
-      2. Extract recurring events with the configured LLM
+      2. Extract recurring events with the configured LLM (in the background,
+         overlapping the next fetches)
       3. Validate results
       4. If execute: insert into DB
       5. Collect results for report
@@ -466,9 +523,16 @@ def process_venues(
         )
         page = context.new_page()
 
+        # LLM calls run in the background while Playwright keeps fetching the
+        # next venues.  About max_pending extractions stay outstanding;
+        # finished ones are validated and inserted as the loop goes, in venue
+        # order, so page text does not pile up in memory.
+        max_pending = provider_concurrency()
+        llm_pool = ThreadPoolExecutor(max_workers=max_pending, thread_name_prefix="recurring-llm")
+        pending: deque[tuple[dict, str, str, Future]] = deque()
+
         total = len(venues)
         for idx, venue in enumerate(venues, start=1):
-            venue_id = venue["id"]
             venue_name = venue["name"]
             venue_slug = venue["slug"]
             website = (venue.get("website") or "").strip()
@@ -496,60 +560,24 @@ def process_venues(
                 page_url = website
 
             # Call LLM
-            time.sleep(CLAUDE_DELAY_SECONDS)
-            raw_events = extract_recurring_events(
+            future = llm_pool.submit(
+                extract_recurring_events,
                 venue_name=venue_name,
                 website=website,
                 page_url=page_url,
                 page_text=page_text,
             )
+            pending.append((venue, website, extraction_source, future))
+            while pending and (len(pending) > max_pending or pending[0][3].done()):
+                results.append(_finish_venue(*pending.popleft(), execute))
 
-            # Validate
-            valid_events = []
-            for raw in raw_events:
-                ok, reason = validate_extracted_event(raw)
-                if ok:
-                    valid_events.append(raw)
-                else:
-                    logger.debug(f"  Dropped invalid event: {reason} — {raw}")
-
-            logger.info(
-                f"  Extracted {len(raw_events)} events, "
-                f"{len(valid_events)} valid (source: {extraction_source})"
-            )
-
-            # Execute mode: insert into DB
-            total_attempted = 0
-            total_inserted = 0
-            if execute and valid_events:
-                for extracted in valid_events:
-                    attempted, inserted = insert_recurring_event(
-                        venue_record=venue,
-                        extracted=extracted,
-                    )
-                    total_attempted += attempted
-                    total_inserted += inserted
-                logger.info(
-                    f"  Inserted {total_inserted}/{total_attempted} occurrences"
-                )
-
-            result_entry: dict = {
-                "place_id": venue_id,
-                "venue_name": venue_name,
-                "venue_slug": venue_slug,
-                "website": website,
-                "extraction_source": extraction_source,
-                "extracted_events": valid_events,
-            }
-            if execute:
-                result_entry["insert_attempted"] = total_attempted
-                result_entry["insert_succeeded"] = total_inserted
-
-            results.append(result_entry)
-
-            # Rate limit between venues
+            # Rate limit between venue fetches
             time.sleep(FETCH_DELAY_SECONDS)
 
+        while pending:
+            results.append(_finish_venue(*pending.popleft(), execute))
+
+        llm_pool.shutdown()
         page.close()
         context.close()
         browser.close()
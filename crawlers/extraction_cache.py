@@ -0,0 +1,260 @@
+"""
+Content-addressed memo for extractor results.
+
+Many pages come back byte-identical (or identical up to nonces, CSRF tokens and
+"generated at" comments) from one night to the next, yet every extractor
+re-parses them.  Extractors decorated with ``@memoized_extractor`` are keyed by
+(normalized content hash, extractor name, extractor version, other arguments)
+and their JSON-serializable result is stored in a SQLite file, so an unchanged
+page costs a hash and a lookup.
+
+  * Bumping an extractor's ``version`` invalidates its entries (the old keys
+    are never looked up again and age out).
+  * The file is capped at ``MAX_CACHE_BYTES``; least-recently-used entries are
+    evicted first.  ``last_used`` is refreshed at most hourly per entry so hot
+    reads don't turn into writes.
+  * The memo is off unless enabled with ``configure_extraction_cache()`` or
+    CRAWLER_EXTRACTION_CACHE=1 (``main.py`` and ``pipeline_main.py`` turn it
+    on), so tests and one-off scripts always run the extractors.  The setting
+    (and CRAWLER_EXTRACTION_CACHE_PATH) lives in the environment, so
+    extraction worker processes inherit it.
+  * SQLite in WAL mode is safe to share between the crawl process and its
+    extraction worker processes; each process opens its own connection.
+
+``.cache/extraction_cache.db`` by default.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DB_PATH = str(Path(__file__).resolve().parent / ".cache" / "extraction_cache.db")
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+# Eviction runs every this many writes, trimming to EVICT_TARGET of the cap.
+EVICT_EVERY = 200
+EVICT_TARGET = 0.9
+TOUCH_INTERVAL_SECONDS = 3600
+
+_ENV_FLAG = "CRAWLER_EXTRACTION_CACHE"
+_ENV_PATH = "CRAWLER_EXTRACTION_CACHE_PATH"
+
+# Per-request noise that changes the bytes but not the content.
+_VOLATILE_PATTERNS = (
+    re.compile(r"<!--.*?-->", re.DOTALL),
+    re.compile(r"""\snonce=(["'])[^"']*\1""", re.IGNORECASE),
+    re.compile(
+        r"""(<(?:meta|input)\b[^>]*\bname=(["'])(?:csrf[-_]?token|_token|_wpnonce|authenticity_token)\2[^>]*>)""",
+        re.IGNORECASE,
+    ),
+    re.compile(r"""\b(?:data-)?(?:nonce|csrf)[-_]?\w*=(["'])[^"']*\1""", re.IGNORECASE),
+    re.compile(r'"(?:_?wpnonce|nonce|csrf[-_]?token)"\s*:\s*"[^"]*"', re.IGNORECASE),
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_html(html: str) -> str:
+    """Strip comments, nonces and CSRF tokens and collapse whitespace."""
+    for pattern in _VOLATILE_PATTERNS:
+        html = pattern.sub("", html)
+    return _WHITESPACE_RE.sub(" ", html).strip()
+
+
+@functools.lru_cache(maxsize=64)
+def content_hash(html: str) -> str:
+    """SHA-256 of the normalized page (memoized: several extractors see the same page)."""
+    return hashlib.sha256(normalize_html(html).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class _MemoStore:
+    """One SQLite connection per process; thread-safe."""
+
+    def __init__(self, path: str, max_bytes: int = MAX_CACHE_BYTES):
+        self.path = path
+        self.pid = os.getpid()
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self.conn.execute("PRAGMA busy_timeout = 10000")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS extractions (
+                key TEXT PRIMARY KEY,
+                extractor TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_extractions_last_used ON extractions(last_used)")
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT payload, last_used FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if now - row[1] > TOUCH_INTERVAL_SECONDS:
+                self.conn.execute("UPDATE extractions SET last_used = ? WHERE key = ?", (now, key))
+            return row[0]
+
+    def put(self, key: str, extractor: str, payload: str) -> None:
+        now = time.time()
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, extractor, payload, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, extractor, payload, len(payload), now, now),
+            )
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self._evict()
+
+    def _evict(self) -> None:
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Keep the most recently used entries whose running size fits the target.
+        self.conn.execute(
+            """
+            DELETE FROM extractions WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY last_used DESC, key) AS running
+                    FROM extractions
+                ) WHERE running > ?
+            )
+            """,
+            (int(self.max_bytes * EVICT_TARGET),),
+        )
+        logger.debug(f"Extraction cache evicted down to {EVICT_TARGET:.0%} of {self.max_bytes} bytes")
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+_STORE: Optional[_MemoStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    return os.getenv(_ENV_FLAG, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def configure_extraction_cache(enabled: bool = True, path: Optional[str] = None) -> None:
+    """Turn the memo on or off for this process and the workers it spawns."""
+    os.environ[_ENV_FLAG] = "1" if enabled else "0"
+    if path is not None:
+        os.environ[_ENV_PATH] = str(path)
+
+
+def _store() -> _MemoStore:
+    """The process-wide store for the configured path (reopened after fork)."""
+    global _STORE
+    path = os.getenv(_ENV_PATH) or CACHE_DB_PATH
+    with _STORE_LOCK:
+        store = _STORE
+        if store is not None and store.path == path and store.pid == os.getpid():
+            return store
+        if store is not None and store.pid == os.getpid():
+            store.close()
+        _STORE = _MemoStore(path, MAX_CACHE_BYTES)
+        return _STORE
+
+
+def extraction_cache_stats() -> dict[str, int]:
+    store = _STORE
+    if store is None or store.pid != os.getpid():
+        return {"hits": 0, "misses": 0}
+    return {"hits": store.hits, "misses": store.misses}
+
+
+def prompt_version(version: str, prompt: str) -> str:
+    """Version string for an LLM extractor: any prompt edit invalidates it too."""
+    return f"{version}-{hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:10]}"
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def memoized_extractor(
+    name: str,
+    version: str,
+    *,
+    dump: Callable[[Any], Any] = _identity,
+    load: Callable[[Any], Any] = _identity,
+    cache_empty: bool = True,
+    key_extra: Optional[Callable[[], str]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize an extractor whose first argument is the page HTML.
+
+    The remaining arguments are part of the key.  ``dump``/``load`` convert the
+    result to and from JSON-compatible data.  Set ``cache_empty=False`` for
+    extractors that return an empty result on transient failure (LLM calls) so
+    the failure isn't replayed.  ``key_extra`` adds run context to the key for
+    extractors whose output depends on more than their arguments (e.g. today's
+    date for year inference).
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(html: Any, *args: Any, **kwargs: Any) -> Any:
+            if not html or not isinstance(html, str) or not cache_enabled():
+                return fn(html, *args, **kwargs)
+
+            try:
+                params = json.dumps([args, kwargs], sort_keys=True, default=repr)
+                extra = key_extra() if key_extra else ""
+                key = hashlib.sha256(
+                    f"{name}\0{version}\0{content_hash(html)}\0{params}\0{extra}".encode("utf-8")
+                ).hexdigest()
+                store = _store()
+                payload = store.get(key)
+            except Exception as e:
+                logger.debug(f"Extraction cache unavailable for {name}: {e}")
+                return fn(html, *args, **kwargs)
+
+            if payload is not None:
+                return load(json.loads(payload))
+
+            result = fn(html, *args, **kwargs)
+            if result or cache_empty:
+                try:
+                    data = dump(result)
+                    payload = json.dumps(data)
+                    # Only store results that survive the JSON round trip unchanged
+                    # (no tuples, datetimes or non-string keys), so a hit returns
+                    # exactly what a miss would.
+                    if json.loads(payload) == data:
+                        store.put(key, name, payload)
+                except Exception as e:
+                    logger.debug(f"Extraction cache write failed for {name}: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
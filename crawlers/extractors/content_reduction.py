@@ -0,0 +1,481 @@
+"""
+Shared content reduction for LLM extraction inputs.
+
+LLM callers used to send truncated raw HTML (``cleaned[:50000]``), which is
+mostly markup, and the truncation often cut off the schedule itself.
+``reduce_html`` turns a page into compact markdown-like text and fits it to a
+token budget:
+
+  1. convert to lines with structural hints -- ``#`` headings, ``-`` list
+     items, ``|`` table rows, ``[text](url)`` links, ``![alt](src)`` images,
+     ``<time datetime>`` values -- plus the page title, meta description and
+     any JSON-LD events;
+  2. drop nav/footer/aside lines repeated across a site's pages (menus,
+     footers, cookie banners), learned per host as pages go by; lines that
+     mention a date, time or price, or sit next to one, are never dropped --
+     a recurring event's title repeats on every listing page too;
+  3. split into sections at headings (long runs are chunked) and score each by
+     event-likelihood (dates, times, prices, event vocabulary; nav/footer and
+     legal/newsletter boilerplate score low);
+  4. keep the best sections that fit ``token_budget`` and emit them in page
+     order, with ``…`` marking gaps.
+
+Token counts are estimated at ``CHARS_PER_TOKEN`` characters per token.
+Bytes and tokens in/out are tallied per caller; see ``reduction_stats``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Optional
+from urllib.parse import urljoin, urlparse
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+DEFAULT_TOKEN_BUDGET = 8000
+MAX_SECTION_LINES = 40
+MAX_JSONLD_CHARS = 4000
+
+_DROP_TAGS = ("script", "style", "noscript", "svg", "iframe", "template", "head", "link", "meta", "canvas", "select")
+_BLOCK_TAGS = frozenset(
+    "p div section article main aside header footer nav ul ol li table thead tbody tfoot tr td th "
+    "h1 h2 h3 h4 h5 h6 dl dt dd blockquote pre figure figcaption address details summary form fieldset".split()
+)
+_LOW_VALUE_TAGS = frozenset(("nav", "footer", "aside"))
+
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE_RE = re.compile(
+    rf"\b{_MONTH}\s+\d{{1,2}}\b|\b\d{{1,2}}(?:st|nd|rd|th)?\s+{_MONTH}|\b\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?\b"
+    r"|\b\d{4}-\d{2}-\d{2}\b|\b(?:mon|tues?|wed(?:nes)?|thu(?:rs)?|fri|sat(?:ur)?|sun)(?:day)?s?\b",
+    re.IGNORECASE,
+)
+_TIME_RE = re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:[ap]\.?m\.?)(?![a-z])|\b(?:noon|midnight)\b|\b\d{1,2}:\d{2}\b", re.IGNORECASE)
+_PRICE_RE = re.compile(r"\$\s?\d|\bfree\b", re.IGNORECASE)
+_EVENT_WORDS_RE = re.compile(
+    r"\b(?:tickets?|register|registration|rsvp|doors|lineup|schedule|session|showtimes?|admission|"
+    r"performance|concert|workshop|festival|events?|class(?:es)?|tour|screening|happy hour|special)\b",
+    re.IGNORECASE,
+)
+_BOILERPLATE_RE = re.compile(
+    r"\b(?:cookies?|privacy policy|terms of (?:use|service)|newsletter|subscribe|all rights reserved|"
+    r"sign in|log ?in|my account|cart|accessibility statement)\b|©",
+    re.IGNORECASE,
+)
+_LOOKS_LIKE_HTML_RE = re.compile(r"<(?:!doctype|html|body|div|p|a|span|table|ul|section)\b", re.IGNORECASE)
+_WS_RE = re.compile(r"[ \t\r\f\v ]+")
+
+
+@dataclass
+class ReducedContent:
+    text: str
+    input_bytes: int
+    output_bytes: int
+    input_tokens: int
+    output_tokens: int
+    sections_total: int
+    sections_kept: int
+    template_lines_dropped: int
+    truncated: bool
+
+
+@dataclass
+class ReductionStats:
+    pages: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.input_tokens - self.output_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def has_event_signal(text: str) -> bool:
+    return bool(_DATE_RE.search(text) or _TIME_RE.search(text) or _PRICE_RE.search(text))
+
+
+# ---------------------------------------------------------------------------
+# Cross-page template memory
+# ---------------------------------------------------------------------------
+
+
+class TemplateMemory:
+    """Per-host counts of lines seen across pages, to spot site template blocks.
+
+    A line is template once the host has ``min_pages`` pages and the line was
+    on at least ``ratio`` of them.  Bounded in hosts and lines per host.
+    """
+
+    def __init__(self, min_pages: int = 3, ratio: float = 0.6, max_hosts: int = 256, max_lines: int = 5000):
+        self.min_pages = min_pages
+        self.ratio = ratio
+        self.max_hosts = max_hosts
+        self.max_lines = max_lines
+        self._hosts: OrderedDict[str, tuple[list[int], dict[str, int]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def line_key(line: str) -> str:
+        return hashlib.blake2b(line.lower().encode("utf-8", "replace"), digest_size=8).hexdigest()
+
+    def observe(self, host: str, keys: set[str]) -> set[str]:
+        """Record one page's line keys; return the keys that are now template."""
+        with self._lock:
+            entry = self._hosts.get(host)
+            if entry is None:
+                entry = self._hosts[host] = ([0], {})
+                while len(self._hosts) > self.max_hosts:
+                    self._hosts.popitem(last=False)
+            else:
+                self._hosts.move_to_end(host)
+            pages, counts = entry
+            pages[0] += 1
+            for key in keys:
+                counts[key] = counts.get(key, 0) + 1
+            if len(counts) > self.max_lines:
+                for key in [k for k, n in counts.items() if n <= 1]:
+                    del counts[key]
+            if pages[0] < self.min_pages:
+                return set()
+            threshold = max(self.min_pages, self.ratio * pages[0])
+            return {key for key in keys if counts.get(key, 0) >= threshold}
+
+
+_TEMPLATES = TemplateMemory()
+
+
+# ---------------------------------------------------------------------------
+# HTML -> lines
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _Line:
+    text: str
+    heading: int = 0
+    low_value: bool = False
+    page_meta: bool = False
+
+
+def _clean(text: str) -> str:
+    return _WS_RE.sub(" ", text).strip()
+
+
+def _absolute(href: str, base_url: Optional[str]) -> Optional[str]:
+    href = (href or "").strip()
+    if not href or href.startswith(("#", "javascript:", "mailto:", "tel:", "data:")):
+        return None
+    return urljoin(base_url, href) if base_url else href
+
+
+def _is_icon(img: Tag, src: str) -> bool:
+    lowered = src.lower()
+    if any(token in lowered for token in ("icon", "logo", "sprite", "pixel", "spacer")):
+        return True
+    for attr in ("width", "height"):
+        value = str(img.get(attr) or "")
+        if value.isdigit() and int(value) < 50:
+            return True
+    return False
+
+
+def _inline_node(child, base_url: Optional[str], parts: list[str]) -> None:
+    if isinstance(child, NavigableString):
+        # Comments, CDATA and doctype are NavigableString subclasses.
+        if type(child) is NavigableString:
+            parts.append(str(child))
+        return
+    if not isinstance(child, Tag):
+        return
+    name = child.name
+    if name == "br":
+        parts.append("\n")
+    elif name == "a":
+        text = _clean(child.get_text(" "))
+        href = _absolute(child.get("href"), base_url)
+        if text and href:
+            parts.append(f" [{text}]({href}) ")
+        elif text:
+            parts.append(f" {text} ")
+        else:
+            _inline(child, base_url, parts)
+    elif name == "img":
+        src = _absolute(child.get("src") or child.get("data-src") or "", base_url)
+        if src and not _is_icon(child, src):
+            parts.append(f" ![{_clean(child.get('alt') or '')}]({src}) ")
+    elif name == "time":
+        text = _clean(child.get_text(" "))
+        stamp = (child.get("datetime") or "").strip()
+        parts.append(f" {text} ({stamp}) " if stamp and stamp not in text else f" {text} ")
+    else:
+        _inline(child, base_url, parts)
+
+
+def _inline(node: Tag, base_url: Optional[str], parts: list[str]) -> None:
+    for child in node.children:
+        _inline_node(child, base_url, parts)
+
+
+def _has_block_child(node: Tag) -> bool:
+    return any(isinstance(child, Tag) and child.name in _BLOCK_TAGS for child in node.children)
+
+
+def _walk(node: Tag, base_url: Optional[str], low_value: bool, out: list[_Line]) -> None:
+    name = node.name
+    low_value = low_value or name in _LOW_VALUE_TAGS or node.get("role") == "navigation"
+
+    if name == "tr":
+        cells = []
+        for cell in node.find_all(("td", "th"), recursive=False):
+            parts: list[str] = []
+            _inline(cell, base_url, parts)
+            cells.append(_clean(" ".join("".join(parts).split("\n"))))
+        if any(cells):
+            out.append(_Line("| " + " | ".join(cells) + " |", low_value=low_value))
+        return
+
+    if not _has_block_child(node):
+        parts = []
+        _inline(node, base_url, parts)
+        prefix = ""
+        heading = 0
+        if name in ("h1", "h2", "h3", "h4", "h5", "h6"):
+            heading = int(name[1])
+            prefix = "#" * heading + " "
+        elif name == "li":
+            prefix = "- "
+        for i, piece in enumerate("".join(parts).split("\n")):
+            text = _clean(piece)
+            if text:
+                out.append(_Line(prefix + text if i == 0 or not prefix.startswith("#") else text, heading if i == 0 else 0, low_value))
+        return
+
+    # Mixed content: inline runs between block children become their own lines.
+    run: list[str] = []
+
+    def flush() -> None:
+        text = _clean("".join(run))
+        if text:
+            out.append(_Line(("- " if name == "li" else "") + text, low_value=low_value))
+        run.clear()
+
+    for child in node.children:
+        if isinstance(child, Tag) and child.name in _BLOCK_TAGS:
+            flush()
+            _walk(child, base_url, low_value, out)
+        else:
+            _inline_node(child, base_url, run)
+    flush()
+
+
+def _jsonld_events(soup: BeautifulSoup) -> list[str]:
+    lines: list[str] = []
+    for script in soup.find_all("script", attrs={"type": re.compile("ld\\+json", re.IGNORECASE)}):
+        raw = script.string or script.get_text() or ""
+        try:
+            data = json.loads(raw)
+        except (TypeError, ValueError):
+            continue
+        items = data if isinstance(data, list) else data.get("@graph", [data]) if isinstance(data, dict) else []
+        for item in items:
+            if isinstance(item, dict) and "Event" in str(item.get("@type", "")):
+                lines.append(json.dumps(item, separators=(",", ":"), ensure_ascii=False)[:MAX_JSONLD_CHARS])
+    return lines
+
+
+def html_to_lines(html: str, base_url: Optional[str] = None) -> list[_Line]:
+    """Convert a page to text lines with structural hints (no budgeting)."""
+    if not _LOOKS_LIKE_HTML_RE.search(html[:5000]):
+        return [_Line(_clean(line)) for line in html.splitlines() if _clean(line)]
+
+    soup = BeautifulSoup(html, "lxml")
+    lines: list[_Line] = []
+    title = _clean(soup.title.get_text(" ")) if soup.title else ""
+    if title:
+        lines.append(_Line(f"Page title: {title}", page_meta=True))
+    meta = soup.find("meta", attrs={"name": "description"}) or soup.find("meta", attrs={"property": "og:description"})
+    if meta and _clean(meta.get("content") or ""):
+        lines.append(_Line(f"Page description: {_clean(meta['content'])}", page_meta=True))
+    jsonld = _jsonld_events(soup)
+    if jsonld:
+        lines.append(_Line("## Structured event data (JSON-LD)", heading=2, page_meta=True))
+        lines.extend(_Line(item, page_meta=True) for item in jsonld)
+
+    for tag in soup.find_all(_DROP_TAGS):
+        tag.decompose()
+    root = soup.body or soup
+    try:
+        _walk(root, base_url, False, lines)
+    except RecursionError:
+        lines.extend(_Line(_clean(t)) for t in root.get_text("\n").splitlines() if _clean(t))
+    return lines
+
+
+# ---------------------------------------------------------------------------
+# Sections, scoring, budgeting
+# ---------------------------------------------------------------------------
+
+
+def _section_score(lines: list[_Line]) -> float:
+    text = "\n".join(line.text for line in lines)
+    score = (
+        3.0 * min(len(_DATE_RE.findall(text)), 20)
+        + 2.0 * min(len(_TIME_RE.findall(text)), 20)
+        + 1.0 * min(len(_PRICE_RE.findall(text)), 10)
+        + 1.0 * min(len({m.lower() for m in _EVENT_WORDS_RE.findall(text)}), 8)
+        - 3.0 * len(_BOILERPLATE_RE.findall(text))
+    )
+    if lines[0].page_meta:
+        score += 50.0
+    link_chars = sum(len(m.group(0)) for m in re.finditer(r"\[[^\]]*\]\([^)]*\)", text))
+    if text and link_chars / len(text) > 0.7:
+        score *= 0.5
+    if all(line.low_value for line in lines):
+        score = score * 0.3 - 1.0
+    return score
+
+
+def _sections(lines: list[_Line]) -> list[list[_Line]]:
+    sections: list[list[_Line]] = []
+    current: list[_Line] = []
+    for line in lines:
+        # Page chrome (nav/footer) and page metadata never share a section with content.
+        if current and (
+            line.heading
+            or len(current) >= MAX_SECTION_LINES
+            or line.low_value != current[-1].low_value
+            or line.page_meta != current[-1].page_meta
+        ):
+            sections.append(current)
+            current = []
+        current.append(line)
+    if current:
+        sections.append(current)
+    return sections
+
+
+_STATS: dict[str, ReductionStats] = {}
+_STATS_LOCK = threading.Lock()
+
+
+def reduce_html(
+    html: str,
+    url: Optional[str] = None,
+    *,
+    token_budget: int = DEFAULT_TOKEN_BUDGET,
+    caller: str = "default",
+    templates: Optional[TemplateMemory] = _TEMPLATES,
+) -> ReducedContent:
+    """Reduce a page (HTML or plain text) to budgeted, event-focused text."""
+    html = html or ""
+    lines = html_to_lines(html, url)
+
+    dropped = 0
+    host = urlparse(url).netloc.lower() if url else ""
+    if templates is not None and host:
+        keys = [TemplateMemory.line_key(line.text) for line in lines]
+        template_keys = templates.observe(host, set(keys))
+        if template_keys:
+            signals = [has_event_signal(line.text) for line in lines]
+            kept_lines = []
+            for i, (line, key) in enumerate(zip(lines, keys)):
+                near_signal = any(signals[max(0, i - 1) : i + 2])
+                if key in template_keys and line.low_value and not line.heading and not near_signal:
+                    dropped += 1
+                    continue
+                kept_lines.append(line)
+            lines = kept_lines
+
+    sections = _sections(lines)
+    rendered = ["\n".join(line.text for line in section) for section in sections]
+    ranked = sorted(range(len(sections)), key=lambda i: (-_section_score(sections[i]), i))
+
+    budget_chars = max(0, token_budget) * CHARS_PER_TOKEN
+    used = 0
+    chosen: dict[int, str] = {}
+    truncated = False
+    for index in ranked:
+        text = rendered[index]
+        cost = len(text) + 2
+        if used + cost <= budget_chars:
+            chosen[index] = text
+            used += cost
+            continue
+        truncated = True
+        remaining = budget_chars - used
+        if remaining > 200:
+            # Take the leading lines of the best section that doesn't fit whole.
+            partial: list[str] = []
+            size = 0
+            for line in text.split("\n"):
+                if size + len(line) + 1 > remaining - 2:
+                    break
+                partial.append(line)
+                size += len(line) + 1
+            if partial:
+                chosen[index] = "\n".join(partial)
+                used += size + 2
+
+    out: list[str] = []
+    previous = -1
+    for index in sorted(chosen):
+        if previous >= 0 and index != previous + 1:
+            out.append("…")
+        out.append(chosen[index])
+        previous = index
+    text = "\n\n".join(out)
+
+    result = ReducedContent(
+        text=text,
+        input_bytes=len(html.encode("utf-8", "replace")),
+        output_bytes=len(text.encode("utf-8", "replace")),
+        input_tokens=estimate_tokens(html),
+        output_tokens=estimate_tokens(text),
+        sections_total=len(sections),
+        sections_kept=len(chosen),
+        template_lines_dropped=dropped,
+        truncated=truncated,
+    )
+    with _STATS_LOCK:
+        stats = _STATS.setdefault(caller, ReductionStats())
+        stats.pages += 1
+        stats.input_bytes += result.input_bytes
+        stats.output_bytes += result.output_bytes
+        stats.input_tokens += result.input_tokens
+        stats.output_tokens += result.output_tokens
+    return result
+
+
+def reduction_stats() -> dict[str, dict]:
+    """Per-caller totals: pages, bytes and estimated tokens in/out and saved."""
+    with _STATS_LOCK:
+        return {
+            caller: {**asdict(stats), "tokens_saved": stats.tokens_saved}
+            for caller, stats in _STATS.items()
+        }
+
+
+def log_reduction_stats() -> None:
+    for caller, stats in sorted(reduction_stats().items()):
+        logger.info(
+            "LLM input reduction [%s]: %d pages, %d -> %d bytes, ~%d tokens saved",
+            caller,
+            stats["pages"],
+            stats["input_bytes"],
+            stats["output_bytes"],
+            stats["tokens_saved"],
+        )
@@ -12,6 +12,7 @@ from urllib.parse import urlparse
 from bs4 import BeautifulSoup
 
 from description_fetcher import extract_description_from_html
+from extraction_cache import memoized_extractor
 from extractors.lineup import split_lineup_text
 from utils import is_likely_non_event_image
 
@@ -391,6 +392,7 @@ def _find_lineup_text(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
+@memoized_extractor("heuristic", version="1")
 def extract_heuristic_fields(html: str) -> dict:
     """Extract description, ticket_url, image_url, price fields from HTML."""
     if not html:
@@ -8,6 +8,8 @@ from __future__ import annotations
 import json
 import logging
 
+from extraction_cache import memoized_extractor, prompt_version
+from extractors.content_reduction import reduce_html
 from llm_client import generate_text
 
 logger = logging.getLogger(__name__)
@@ -38,20 +40,26 @@ OUTPUT JSON:
 }
 """
 
+# A detail page's fields fit well within this many estimated tokens.
+DETAIL_TOKEN_BUDGET = 3000
 
+
+# Empty results are LLM/parse failures: never replay them.
+@memoized_extractor("llm_detail", version=prompt_version("2", DETAIL_PROMPT), cache_empty=False)
 def extract_detail_with_llm(html: str, url: str, source_name: str) -> dict:
     if not html:
         return {}
 
+    reduced = reduce_html(html, url, token_budget=DETAIL_TOKEN_BUDGET, caller="llm_detail")
     user_message = f"""Source: {source_name}
 URL: {url}
 
 Content:
-{html[:50000]}
+{reduced.text}
 """
 
     try:
-        response_text = generate_text(DETAIL_PROMPT, user_message)
+        response_text = generate_text(DETAIL_PROMPT, user_message, caller="llm_detail")
         json_str = response_text
         if "```json" in response_text:
             json_str = response_text.split("```json")[1].split("```")[0]
@@ -0,0 +1,304 @@
+"""
+Process-pool offload for CPU-bound HTML extraction.
+
+BeautifulSoup/lxml parsing and the regex-heavy extractors hold the GIL, so with
+several crawl threads running the parsing serializes and the network
+concurrency is wasted.  ``ExtractionPool`` keeps a persistent pool of worker
+processes (spawned once, extractor modules imported up front) and runs
+extraction jobs -- ``(extractor, html, url, *args)`` -- returning their plain
+results (dicts, strings, lists).
+
+Jobs run in the calling thread instead when the pool is disabled (the default
+outside ``main.py``), when the page is small enough that pickling it costs
+more than parsing it, or when a worker process dies, so callers have a single
+code path:
+
+    from extractors.offload import run_extraction
+    fields = run_extraction("detail", html, url, source_name, detail_config)
+
+Enable with ``configure_extraction_pool(n)`` or CRAWLER_EXTRACT_PROCESSES (a
+process count, or "auto" for one per core minus one).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from importlib import import_module
+from typing import Any, Callable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Pages below this size are parsed in-thread: shipping them to a worker costs
+# about as much as parsing them.
+MIN_OFFLOAD_BYTES = 20_000
+# Recycle workers periodically so lxml/BeautifulSoup fragmentation can't grow
+# a worker without bound over a nightly run.
+MAX_TASKS_PER_CHILD = 500
+
+# name -> (module:function target, whether the function takes the page URL)
+EXTRACTORS: dict[str, tuple[str, bool]] = {}
+# target -> module:function predicate; jobs it accepts run in the calling thread
+_INLINE_IF: dict[str, str] = {}
+
+Extractor = Union[str, Callable[..., Any]]
+
+
+def register_extractor(name: str, target: str, *, takes_url: bool = True, inline_if: Optional[str] = None) -> None:
+    """Register a module-level extraction function under a job name.
+
+    ``target`` is ``"module:function"``; the function is called as
+    ``fn(html, url, *args)`` (or ``fn(html, *args)`` when ``takes_url`` is
+    False) and must return something picklable.  ``inline_if`` names a
+    predicate called with the job's ``*args``; jobs it accepts are never
+    offloaded (e.g. detail jobs that call the LLM, whose rate limits and
+    provider slots are per process).
+    """
+    EXTRACTORS[name] = (target, takes_url)
+    if inline_if:
+        _INLINE_IF[target] = inline_if
+
+
+register_extractor("jsonld", "extractors.structured:extract_jsonld_event_fields", takes_url=False)
+register_extractor("open_graph", "extractors.structured:extract_open_graph_fields", takes_url=False)
+register_extractor("heuristic", "extractors.heuristic:extract_heuristic_fields", takes_url=False)
+register_extractor("description", "description_fetcher:extract_description_from_html", takes_url=False)
+register_extractor(
+    "detail",
+    "pipeline.detail_enrich:enrich_from_detail",
+    inline_if="pipeline.detail_enrich:detail_job_calls_llm",
+)
+register_extractor("detail_stages", "pipeline.detail_enrich:extract_detail_stages")
+register_extractor("festival_sessions", "crawl_festival_schedule:extract_sessions_structured")
+
+
+def _resolve(target: str) -> Callable[..., Any]:
+    module_name, _, attr = target.partition(":")
+    obj: Any = import_module(module_name)
+    for part in attr.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _job_spec(extractor: Extractor) -> tuple[str, bool]:
+    if callable(extractor):
+        return f"{extractor.__module__}:{extractor.__qualname__}", True
+    try:
+        return EXTRACTORS[extractor]
+    except KeyError:
+        raise ValueError(f"Unknown extractor: {extractor!r}") from None
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_worker_functions: dict[str, Callable[..., Any]] = {}
+
+
+def _warm_worker(targets: list[str]) -> None:
+    """Pool initializer: import the extractor modules once per worker."""
+    for target in targets:
+        try:
+            _worker_functions[target] = _resolve(target)
+        except Exception as e:
+            logging.getLogger(__name__).debug(f"Extractor warm-up failed for {target}: {e}")
+
+
+def _run_job(target: str, takes_url: bool, html: str, url: Optional[str], args: tuple, kwargs: dict) -> Any:
+    fn = _worker_functions.get(target)
+    if fn is None:
+        fn = _worker_functions[target] = _resolve(target)
+    if takes_url:
+        return fn(html, url, *args, **kwargs)
+    return fn(html, *args, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+class ExtractionPool:
+    """Persistent worker processes for extraction jobs, with in-thread fallback."""
+
+    def __init__(self, processes: int = 0, *, min_offload_bytes: int = MIN_OFFLOAD_BYTES):
+        self.processes = max(0, processes)
+        self.min_offload_bytes = min_offload_bytes
+        self.offloaded = 0
+        self.inline = 0
+        self.fallbacks = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.processes > 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the parent has crawl threads, HTTP pools and
+                # Playwright handles that must not be duplicated mid-use.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_warm_worker,
+                    initargs=(sorted({target for target, _ in EXTRACTORS.values()}),),
+                    max_tasks_per_child=MAX_TASKS_PER_CHILD,
+                )
+            return self._executor
+
+    def _discard_executor(self, broken: ProcessPoolExecutor, reason: BaseException) -> None:
+        with self._lock:
+            self.fallbacks += 1
+            if self._executor is not broken:
+                return
+            self._executor = None
+        logger.warning(f"Extraction pool failed ({reason!r}); restarting, job runs in-thread")
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _run_inline(self, extractor: Extractor, html: str, url: Optional[str], args: tuple, kwargs: dict) -> Future:
+        with self._lock:
+            self.inline += 1
+        out: Future = Future()
+        try:
+            if callable(extractor):
+                out.set_result(extractor(html, url, *args, **kwargs))
+            else:
+                # Resolved per call so tests and callers can patch the target.
+                target, takes_url = _job_spec(extractor)
+                fn = _resolve(target)
+                out.set_result(fn(html, url, *args, **kwargs) if takes_url else fn(html, *args, **kwargs))
+        except Exception as e:
+            out.set_exception(e)
+        return out
+
+    def submit(self, extractor: Extractor, html: str, url: Optional[str] = None, *args: Any, **kwargs: Any) -> Future:
+        """Schedule an extraction job; the returned future holds its result.
+
+        ``extractor`` is a registered name or a module-level function.  Jobs
+        that are not offloaded have already run by the time this returns.
+        """
+        target, takes_url = _job_spec(extractor)
+        if not self.enabled or not html or len(html) < self.min_offload_bytes or "<locals>" in target:
+            return self._run_inline(extractor, html, url, args, kwargs)
+        inline_if = _INLINE_IF.get(target)
+        if inline_if and _resolve(inline_if)(*args, **kwargs):
+            return self._run_inline(extractor, html, url, args, kwargs)
+
+        executor = self._get_executor()
+        try:
+            submitted = executor.submit(_run_job, target, takes_url, html, url, args, kwargs)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._discard_executor(executor, e)
+            return self._run_inline(extractor, html, url, args, kwargs)
+        with self._lock:
+            self.offloaded += 1
+
+        out: Future = Future()
+
+        def on_done(done: Future) -> None:
+            if done.cancelled():
+                out.cancel()
+                return
+            exc = done.exception()
+            if isinstance(exc, (BrokenProcessPool, pickle.PicklingError)):
+                # A worker died (or the job couldn't be shipped): redo it here.
+                self._discard_executor(executor, exc)
+                inline = self._run_inline(extractor, html, url, args, kwargs)
+                exc = inline.exception()
+                if exc is None:
+                    out.set_result(inline.result())
+                    return
+            if exc is not None:
+                out.set_exception(exc)
+            else:
+                out.set_result(done.result())
+
+        submitted.add_done_callback(on_done)
+        return out
+
+    def run(self, extractor: Extractor, html: str, url: Optional[str] = None, *args: Any, **kwargs: Any) -> Any:
+        """Run an extraction job and wait for its result."""
+        return self.submit(extractor, html, url, *args, **kwargs).result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if self.offloaded or self.fallbacks:
+            logger.info(
+                f"Extraction pool: {self.offloaded} offloaded, {self.inline} in-thread, "
+                f"{self.fallbacks} fallbacks"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Process-wide pool
+# ---------------------------------------------------------------------------
+
+_pool: Optional[ExtractionPool] = None
+_pool_lock = threading.Lock()
+_atexit_registered = False
+
+
+def default_process_count(default: int = 0) -> int:
+    """Worker count from CRAWLER_EXTRACT_PROCESSES ("auto" = cores - 1)."""
+    raw = os.getenv("CRAWLER_EXTRACT_PROCESSES", "").strip().lower()
+    if not raw:
+        return default
+    if raw == "auto":
+        return max(1, (os.cpu_count() or 2) - 1)
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning(f"Ignoring invalid CRAWLER_EXTRACT_PROCESSES={raw!r}")
+        return default
+
+
+def get_extraction_pool() -> ExtractionPool:
+    """Return the process-wide pool (disabled unless configured or set via env)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractionPool(default_process_count())
+        return _pool
+
+
+def configure_extraction_pool(processes: Optional[int] = None) -> ExtractionPool:
+    """Replace the process-wide pool; None means env, else one per core minus one."""
+    global _pool, _atexit_registered
+    if processes is None:
+        processes = default_process_count(default=max(1, (os.cpu_count() or 2) - 1))
+    pool = ExtractionPool(processes)
+    with _pool_lock:
+        previous, _pool = _pool, pool
+        if not _atexit_registered:
+            atexit.register(shutdown_extraction_pool)
+            _atexit_registered = True
+    if previous is not None:
+        previous.shutdown()
+    if processes:
+        logger.info(f"Extraction offload enabled: {processes} worker processes")
+    return pool
+
+
+def shutdown_extraction_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+def run_extraction(extractor: Extractor, html: str, url: Optional[str] = None, *args: Any, **kwargs: Any) -> Any:
+    """Run an extraction job on the process-wide pool (or in-thread)."""
+    return get_extraction_pool().run(extractor, html, url, *args, **kwargs)
@@ -19,6 +19,7 @@ from dateutil import parser as dateparser
 from bs4 import BeautifulSoup
 
 from description_quality import classify_description
+from extraction_cache import memoized_extractor
 from extractors.lineup import dedupe_artists, split_lineup_text
 from show_signals import extract_ticket_status
 from utils import is_likely_non_event_image
@@ -487,6 +488,7 @@ def _extract_performers(event_obj: dict) -> list[str]:
     return dedupe_artists(performers)
 
 
+@memoized_extractor("jsonld", version="1")
 def extract_jsonld_event_fields(html: str) -> dict:
     """Extract detail fields from JSON-LD Event objects."""
     if not html:
@@ -604,6 +606,7 @@ def extract_jsonld_event_fields(html: str) -> dict:
     return result
 
 
+@memoized_extractor("open_graph", version="1")
 def extract_open_graph_fields(html: str) -> dict:
     """Extract Open Graph / Twitter fields."""
     if not html:
@@ -24,8 +24,9 @@ import argparse
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Iterator, Optional
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 from supabase import Client
 
@@ -33,7 +34,7 @@ from db import get_client, insert_event, find_event_by_hash, update_source_healt
 from db.exhibitions import insert_exhibition
 from dedupe import generate_content_hash
 from exhibition_utils import build_exhibition_record
-from extract import extract_events
+from extract import extract_events, extract_events_by_page
 from utils import setup_logging, extract_text_content
 
 logger = logging.getLogger(__name__)
@@ -92,9 +93,13 @@ def detect_health_tags(content: str, error: str | None = None) -> list[str]:
 
     return tags
 
-# Rate limiting between LLM calls (seconds)
+# Rate limiting between LLM calls (seconds) for single-venue crawl_venue();
+# batched crawls are paced by llm_client's provider slots instead
 LLM_RATE_LIMIT = 1.0
 
+# Venues fetched per LLM extraction batch
+LLM_BATCH_SIZE = 8
+
 # Maximum pages to crawl per venue (reduced for speed)
 MAX_PAGES_PER_VENUE = 2
 
@@ -282,60 +287,50 @@ def find_events_page(website: str) -> tuple[str, str, str | None]:
     return best_content, best_url, last_error
 
 
-def crawl_venue(
+def _fetch_venue_page(venue: dict) -> tuple[str, str, list[str]]:
+    """
+    Fetch a venue's best events page.
+
+    Returns:
+        Tuple of (content, source_url, health_tags); content is empty when
+        there is nothing worth sending to the LLM
+    """
+    content, source_url, fetch_error = find_events_page(venue["website"])
+
+    # Detect health tags based on fetch results
+    health_tags = detect_health_tags(content, fetch_error)
+
+    if not content or len(content) < 100:
+        logger.warning(f"No content found for {venue['name']}")
+        if fetch_error and not health_tags:
+            # Add generic error tag if we have an error but no specific tag
+            health_tags.append(HEALTH_TAG_NO_EVENTS)
+        return "", source_url, health_tags
+    return content, source_url, health_tags
+
+
+def _store_venue_events(
     venue: dict,
     source_id: int,
+    source_url: str,
+    extracted_events: list,
+    health_tags: list[str],
     dry_run: bool = False,
-    update_health_tags: bool = True,
 ) -> tuple[int, int, int, list[str]]:
     """
-    Crawl a single venue website and extract events.
+    Insert a venue's extracted events.
 
     Returns:
         Tuple of (events_found, events_new, events_updated, health_tags)
     """
     venue_id = venue["id"]
     venue_name = venue["name"]
-    website = venue["website"]
 
-    logger.info(f"Crawling {venue_name}: {website}")
-
-    events_found = 0
+    events_found = len(extracted_events)
     events_new = 0
     events_updated = 0
-    health_tags: list[str] = []
 
     try:
-        # Find the best events page
-        content, source_url, fetch_error = find_events_page(website)
-
-        # Detect health tags based on fetch results
-        health_tags = detect_health_tags(content, fetch_error)
-
-        if not content or len(content) < 100:
-            logger.warning(f"No content found for {venue_name}")
-            if fetch_error and not health_tags:
-                # Add generic error tag if we have an error but no specific tag
-                health_tags.append(HEALTH_TAG_NO_EVENTS)
-            return 0, 0, 0, health_tags
-
-        # Rate limit before LLM call
-        time.sleep(LLM_RATE_LIMIT)
-
-        # Extract events using LLM
-        try:
-            extracted_events = extract_events(
-                raw_content=content,
-                source_url=source_url,
-                source_name=venue_name,
-            )
-        except Exception as e:
-            logger.error(f"LLM extraction failed for {venue_name}: {e}")
-            if HEALTH_TAG_PARSE_ERROR not in health_tags:
-                health_tags.append(HEALTH_TAG_PARSE_ERROR)
-            return 0, 0, 0, health_tags
-
-        events_found = len(extracted_events)
         logger.info(f"Extracted {events_found} events from {venue_name}")
 
         # If we got content but no events, mark as no-events
@@ -448,6 +443,104 @@ def crawl_venue(
     return events_found, events_new, events_updated, health_tags
 
 
+def crawl_venue(
+    venue: dict,
+    source_id: int,
+    dry_run: bool = False,
+    update_health_tags: bool = True,
+) -> tuple[int, int, int, list[str]]:
+    """
+    Crawl a single venue website and extract events.
+
+    Returns:
+        Tuple of (events_found, events_new, events_updated, health_tags)
+    """
+    venue_name = venue["name"]
+    logger.info(f"Crawling {venue_name}: {venue['website']}")
+
+    health_tags: list[str] = []
+    try:
+        content, source_url, health_tags = _fetch_venue_page(venue)
+        if not content:
+            return 0, 0, 0, health_tags
+
+        # Rate limit before LLM call
+        time.sleep(LLM_RATE_LIMIT)
+
+        # Extract events using LLM
+        try:
+            extracted_events = extract_events(
+                raw_content=content,
+                source_url=source_url,
+                source_name=venue_name,
+            )
+        except Exception as e:
+            logger.error(f"LLM extraction failed for {venue_name}: {e}")
+            if HEALTH_TAG_PARSE_ERROR not in health_tags:
+                health_tags.append(HEALTH_TAG_PARSE_ERROR)
+            return 0, 0, 0, health_tags
+
+    except Exception as e:
+        logger.error(f"Error crawling {venue_name}: {e}")
+        return 0, 0, 0, health_tags
+
+    return _store_venue_events(venue, source_id, source_url, extracted_events, health_tags, dry_run)
+
+
+def crawl_venues(
+    venues: list[dict],
+    source_id: int,
+    dry_run: bool = False,
+    batch_size: int = LLM_BATCH_SIZE,
+) -> Iterator[tuple[dict, tuple[int, int, int, list[str]]]]:
+    """
+    Crawl venues in batches: pages are fetched one venue at a time while the
+    previous batch is extracted by the LLM (packed and concurrent, see
+    extract.extract_events_by_page).
+
+    Yields:
+        (venue, (events_found, events_new, events_updated, health_tags)) in venue order
+    """
+
+    def extract_batch(fetched: list[tuple[dict, str, str, list[str]]]) -> list[list]:
+        items = [(content, source_url, venue["name"]) for venue, content, source_url, _ in fetched if content]
+        extracted = iter(extract_events_by_page(items))
+        return [next(extracted) if content else [] for _, content, _, _ in fetched]
+
+    def finish(fetched, future):
+        try:
+            extracted_lists = future.result()
+        except Exception as e:
+            logger.error(f"LLM extraction failed for batch of {len(fetched)} venues: {e}")
+            extracted_lists = None
+        for (venue, content, source_url, health_tags), extracted in zip(fetched, extracted_lists or [None] * len(fetched)):
+            if not content:
+                yield venue, (0, 0, 0, health_tags)
+            elif extracted is None:
+                if HEALTH_TAG_PARSE_ERROR not in health_tags:
+                    health_tags.append(HEALTH_TAG_PARSE_ERROR)
+                yield venue, (0, 0, 0, health_tags)
+            else:
+                yield venue, _store_venue_events(venue, source_id, source_url, extracted, health_tags, dry_run)
+
+    pending = None
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="venue-llm") as pool:
+        for start in range(0, len(venues), max(1, batch_size)):
+            fetched = []
+            for venue in venues[start:start + max(1, batch_size)]:
+                logger.info(f"Crawling {venue['name']}: {venue['website']}")
+                try:
+                    fetched.append((venue, *_fetch_venue_page(venue)))
+                except Exception as e:
+                    logger.error(f"Error crawling {venue['name']}: {e}")
+                    fetched.append((venue, "", venue["website"], []))
+            if pending is not None:
+                yield from finish(*pending)
+            pending = (fetched, pool.submit(extract_batch, fetched))
+        if pending is not None:
+            yield from finish(*pending)
+
+
 def get_or_create_generic_source(client: Client) -> int:
     """Get or create the generic venue crawler source."""
 
@@ -499,6 +592,12 @@ def main():
         action="store_true",
         help="Extract events but don't insert into database",
     )
+    parser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=LLM_BATCH_SIZE,
+        help=f"Venues per LLM extraction batch (default: {LLM_BATCH_SIZE}; 1 = one request per venue)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -545,32 +644,27 @@ def main():
     failed = 0
     all_health_tags: dict[str, int] = {}  # Track tag occurrences
 
-    for i, venue in enumerate(venues, 1):
-        logger.info(f"\n[{i}/{len(venues)}] Processing {venue['name']}...")
+    crawled = crawl_venues(venues, source_id, dry_run=args.dry_run, batch_size=args.llm_batch_size)
+    for i, (venue, (found, new, updated, health_tags)) in enumerate(crawled, 1):
+        logger.info(f"[{i}/{len(venues)}] Processed {venue['name']}")
 
-        try:
-            found, new, updated, health_tags = crawl_venue(venue, source_id, dry_run=args.dry_run)
-            total_found += found
-            total_new += new
-            total_updated += updated
-
-            # Track health tags
-            for tag in health_tags:
-                all_health_tags[tag] = all_health_tags.get(tag, 0) + 1
-
-            if found > 0:
-                successful += 1
-            else:
-                failed += 1
+        total_found += found
+        total_new += new
+        total_updated += updated
 
-            # Log detected health tags
-            if health_tags:
-                logger.info(f"  Health tags: {', '.join(health_tags)}")
+        # Track health tags
+        for tag in health_tags:
+            all_health_tags[tag] = all_health_tags.get(tag, 0) + 1
 
-        except Exception as e:
-            logger.error(f"Failed to crawl {venue['name']}: {e}")
+        if found > 0:
+            successful += 1
+        else:
             failed += 1
 
+        # Log detected health tags
+        if health_tags:
+            logger.info(f"  Health tags: {', '.join(health_tags)}")
+
     # Update source health tags based on aggregated results
     if not args.dry_run and all_health_tags:
         # Determine overall source health tags based on majority of venues
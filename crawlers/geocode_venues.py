@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 """
 Geocode venues using OpenStreetMap Nominatim (free, no API key required).
-Rate limited to 1 request per second per Nominatim usage policy.
+Rate limited to 1 request per second per Nominatim usage policy; lookups go
+through the shared geocode cache (geocoding.py), so only addresses that were
+never tried spend that budget and an interrupted run resumes where it stopped.
 """
 
-import time
+import argparse
 import logging
 from typing import Optional, Tuple
-import requests
 
 from db import get_client
+from geocoding import Geocoder, get_geocoder
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,51 +19,27 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
-USER_AGENT = "LostCity Event Discovery (contact@lostcity.ai)"
-
 
 def geocode_address(address: str, city: str, state: str) -> Optional[Tuple[float, float]]:
     """
-    Geocode an address using OpenStreetMap Nominatim.
+    Geocode an address using OpenStreetMap Nominatim (via the shared cache).
     Returns (lat, lng) or None if not found.
     """
-    full_address = f"{address}, {city}, {state}"
-
-    try:
-        response = requests.get(
-            NOMINATIM_URL,
-            params={
-                "q": full_address,
-                "format": "json",
-                "limit": 1,
-                "countrycodes": "us",
-            },
-            headers={"User-Agent": USER_AGENT},
-            timeout=10,
-        )
-        response.raise_for_status()
-
-        results = response.json()
-        if results:
-            lat = float(results[0]["lat"])
-            lng = float(results[0]["lon"])
-            return (lat, lng)
-
-        # No results — do NOT fall back to city center. City-center coordinates
-        # are worse than NULL because they silently place venues at the wrong
-        # location and look valid to any downstream consumer. Leave lat/lng NULL
-        # so we can identify and re-attempt these venues later.
-        logger.warning(f"No geocoding result for: {full_address}")
-        return None
-
-    except Exception as e:
-        logger.error(f"Geocoding error for {full_address}: {e}")
-        return None
+    return get_geocoder().geocode(address, city, state).coords
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Geocode venues missing coordinates")
+    parser.add_argument("--dry-run", action="store_true", help="Preview without DB updates")
+    parser.add_argument(
+        "--retry-misses",
+        action="store_true",
+        help="Re-query addresses Nominatim previously had no result for",
+    )
+    args = parser.parse_args()
+
     client = get_client()
+    geocoder = Geocoder(retry_misses=True) if args.retry_misses else get_geocoder()
 
     # Get venues without coordinates
     result = client.table("places").select("*").is_("lat", "null").execute()
@@ -72,37 +50,31 @@ def main():
     geocoded = 0
     failed = 0
 
-    for i, venue in enumerate(venues):
+    for venue in venues:
         if not venue.get("address"):
             logger.warning(f"Skipping {venue['name']} - no address")
             failed += 1
-            continue
 
-        logger.info(f"[{i+1}/{len(venues)}] Geocoding: {venue['name']}")
+    for i, (venue, geo) in enumerate(geocoder.geocode_batch(venues), start=1):
+        logger.info(f"[{i}] Geocoding: {venue['name']}{' (cached)' if geo.cached else ''}")
 
-        coords = geocode_address(
-            venue["address"],
-            venue.get("city", "Atlanta"),
-            venue.get("state", "GA")
-        )
+        if geo.found:
+            updates = {"lat": geo.lat, "lng": geo.lng}
+            if geo.neighborhood and not venue.get("neighborhood"):
+                updates["neighborhood"] = geo.neighborhood
+            if not args.dry_run:
+                client.table("places").update(updates).eq("id", venue["id"]).execute()
 
-        if coords:
-            lat, lng = coords
-            client.table("places").update({
-                "lat": lat,
-                "lng": lng
-            }).eq("id", venue["id"]).execute()
-
-            logger.info(f"  -> {lat}, {lng}")
+            logger.info(f"  -> {geo.lat}, {geo.lng}")
             geocoded += 1
         else:
             logger.warning("  -> Could not geocode")
             failed += 1
 
-        # Rate limit: 1 request per second (Nominatim policy)
-        time.sleep(1.1)
-
-    logger.info(f"\nComplete: {geocoded} geocoded, {failed} failed")
+    logger.info(
+        f"\nComplete: {geocoded} geocoded, {failed} failed "
+        f"({geocoder.lookups} Nominatim lookups, {geocoder.hits} cache hits)"
+    )
 
 
 if __name__ == "__main__":
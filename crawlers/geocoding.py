@@ -0,0 +1,288 @@
+"""
+Cached Nominatim geocoding shared by the venue backfill scripts.
+
+Nominatim allows one request per second, so every lookup we can avoid matters.
+Results are kept in ``.cache/geocode_cache.json`` keyed by a normalized
+address (case, punctuation, street-suffix spelling and suite/unit numbers are
+folded away), so:
+
+  * the places sharing one building (food halls, malls, multi-room venues)
+    cost a single lookup
+  * re-running a backfill after a partial failure only queries addresses that
+    were never tried
+  * misses are remembered too and retried after ``NEGATIVE_TTL_DAYS``
+
+Each cache entry also records the neighborhood inferred from its coordinates,
+so neighborhood assignment reads from the same cache instead of recomputing.
+
+Usage:
+    from geocoding import get_geocoder
+
+    result = get_geocoder().geocode("675 Ponce de Leon Ave NE", "Atlanta", "GA")
+    if result.found:
+        lat, lng, neighborhood = result.lat, result.lng, result.neighborhood
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import requests
+
+from neighborhood_lookup import infer_neighborhood_from_coords
+
+logger = logging.getLogger(__name__)
+
+NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
+USER_AGENT = "LostCity Event Discovery (contact@lostcity.ai)"
+MIN_REQUEST_INTERVAL_SECONDS = 1.1  # Nominatim policy: max 1 req/s
+NEGATIVE_TTL_DAYS = 30
+SAVE_EVERY = 25
+
+CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "geocode_cache.json"
+
+_STREET_SUFFIXES = {
+    "street": "st",
+    "avenue": "ave",
+    "av": "ave",
+    "road": "rd",
+    "drive": "dr",
+    "boulevard": "blvd",
+    "lane": "ln",
+    "court": "ct",
+    "place": "pl",
+    "parkway": "pkwy",
+    "highway": "hwy",
+    "circle": "cir",
+    "terrace": "ter",
+    "trail": "trl",
+    "square": "sq",
+    "north": "n",
+    "south": "s",
+    "east": "e",
+    "west": "w",
+    "northeast": "ne",
+    "northwest": "nw",
+    "southeast": "se",
+    "southwest": "sw",
+}
+_UNIT_RE = re.compile(r"\b(?:suite|ste|unit|apt|bldg|building|floor|fl|room|rm)\b\.?\s*[\w-]+|#\s*[\w-]+", re.I)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+
+
+def normalize_address(address: str, city: str = "", state: str = "") -> str:
+    """Cache key for an address: lowercased, unit-free, suffixes abbreviated."""
+    parts = []
+    for part in (address, city, state):
+        text = _UNIT_RE.sub(" ", (part or "").lower())
+        text = _NON_WORD_RE.sub(" ", text)
+        parts.append(" ".join(_STREET_SUFFIXES.get(tok, tok) for tok in text.split()))
+    return "|".join(parts)
+
+
+@dataclass(frozen=True)
+class GeocodeResult:
+    lat: Optional[float]
+    lng: Optional[float]
+    neighborhood: Optional[str] = None
+    cached: bool = False
+
+    @property
+    def found(self) -> bool:
+        return self.lat is not None and self.lng is not None
+
+    @property
+    def coords(self) -> Optional[tuple[float, float]]:
+        return (self.lat, self.lng) if self.found else None
+
+
+def _nominatim_lookup(query: str) -> Optional[tuple[float, float]]:
+    """Single Nominatim search. Raises on transport errors so they aren't cached."""
+    response = requests.get(
+        NOMINATIM_URL,
+        params={
+            "q": query,
+            "format": "json",
+            "limit": 1,
+            "countrycodes": "us",
+        },
+        headers={"User-Agent": USER_AGENT},
+        timeout=10,
+    )
+    response.raise_for_status()
+    results = response.json()
+    if not results:
+        return None
+    return float(results[0]["lat"]), float(results[0]["lon"])
+
+
+class Geocoder:
+    """Normalized-address geocode cache in front of a rate-limited lookup."""
+
+    def __init__(
+        self,
+        path: Path = CACHE_PATH,
+        lookup: Callable[[str], Optional[tuple[float, float]]] = _nominatim_lookup,
+        min_interval: float = MIN_REQUEST_INTERVAL_SECONDS,
+        retry_misses: bool = False,
+    ):
+        self._path = path
+        self._lookup = lookup
+        self._min_interval = min_interval
+        self._retry_misses = retry_misses
+        self._lock = threading.Lock()
+        self._request_lock = threading.Lock()
+        self._last_request = 0.0
+        self._entries: dict[str, dict] = {}
+        self._unsaved = 0
+        self.lookups = 0
+        self.hits = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._unsaved:
+                return
+            snapshot = dict(self._entries)
+            self._unsaved = 0
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f, sort_keys=True)
+            tmp_path.replace(self._path)
+        except OSError as exc:
+            logger.warning("Could not save geocode cache: %s", exc)
+
+    def _cached(self, key: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.get("lat") is None:
+            age_days = (time.time() - float(entry.get("fetched_at") or 0)) / 86400
+            if self._retry_misses or age_days >= NEGATIVE_TTL_DAYS:
+                return None
+        return entry
+
+    def _wait_for_slot(self) -> None:
+        wait = self._last_request + self._min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+    def geocode(self, address: str, city: str = "Atlanta", state: str = "GA") -> GeocodeResult:
+        """Coordinates (and inferred neighborhood) for an address, cached by normalized form."""
+        key = normalize_address(address, city, state)
+        entry = self._cached(key)
+        if entry is None:
+            # One lookup at a time: concurrent callers asking for the same
+            # address wait here and then find it cached.
+            with self._request_lock:
+                entry = self._cached(key)
+                if entry is None:
+                    entry = self._fetch(key, f"{address}, {city}, {state}", city)
+                    if entry is None:
+                        return GeocodeResult(None, None)
+                    return GeocodeResult(entry["lat"], entry["lng"], entry.get("neighborhood"))
+        self.hits += 1
+        return GeocodeResult(entry.get("lat"), entry.get("lng"), entry.get("neighborhood"), cached=True)
+
+    def _fetch(self, key: str, query: str, city: str) -> Optional[dict]:
+        self._wait_for_slot()
+        self.lookups += 1
+        try:
+            coords = self._lookup(query)
+        except Exception as e:
+            logger.error(f"Geocoding error for {query}: {e}")
+            return None
+
+        entry: dict = {"lat": None, "lng": None, "neighborhood": None, "fetched_at": time.time()}
+        if coords:
+            lat, lng = coords
+            entry.update(
+                lat=lat,
+                lng=lng,
+                neighborhood=infer_neighborhood_from_coords(lat, lng, city or "Atlanta"),
+            )
+        else:
+            # No results — do NOT fall back to city center. City-center
+            # coordinates silently place venues at the wrong location; the miss
+            # is cached so the next run doesn't spend its budget on it again.
+            logger.warning(f"No geocoding result for: {query}")
+
+        with self._lock:
+            self._entries[key] = entry
+            self._unsaved += 1
+            should_save = self._unsaved >= SAVE_EVERY
+        if should_save:
+            self.save()
+        return entry
+
+    def neighborhood_for(self, address: str, city: str = "Atlanta", state: str = "GA") -> Optional[str]:
+        """Neighborhood from the cached geocode for an address, without a network call."""
+        entry = self._cached(normalize_address(address, city, state))
+        return entry.get("neighborhood") if entry else None
+
+    def geocode_batch(
+        self,
+        places: Iterable[dict],
+        default_city: str = "Atlanta",
+        default_state: str = "GA",
+    ) -> Iterator[tuple[dict, GeocodeResult]]:
+        """Geocode places grouped by normalized address, one lookup per distinct address.
+
+        Places without an address are skipped.  The cache is saved as the batch
+        progresses, so an interrupted backfill resumes where it stopped.
+        """
+        groups: dict[str, list[dict]] = {}
+        for place in places:
+            if not place.get("address"):
+                continue
+            city = place.get("city") or default_city
+            state = place.get("state") or default_state
+            groups.setdefault(normalize_address(place["address"], city, state), []).append(place)
+
+        try:
+            for members in groups.values():
+                first = members[0]
+                result = self.geocode(
+                    first["address"],
+                    first.get("city") or default_city,
+                    first.get("state") or default_state,
+                )
+                for place in members:
+                    yield place, result
+        finally:
+            self.save()
+
+
+_GEOCODER: Optional[Geocoder] = None
+_GEOCODER_LOCK = threading.Lock()
+
+
+def get_geocoder() -> Geocoder:
+    """Process-wide geocoder backed by the on-disk cache."""
+    global _GEOCODER
+    with _GEOCODER_LOCK:
+        if _GEOCODER is None:
+            _GEOCODER = Geocoder()
+            atexit.register(_GEOCODER.save)
+        return _GEOCODER
@@ -33,21 +33,9 @@ PAGE_SIZE = 1000
 
 
 def _fetch_all_pages(client, table, select, filters):
-    """Paginate through Supabase results (default limit is 1000)."""
-    all_rows = []
-    offset = 0
-    while True:
-        query = client.table(table).select(select)
-        for method, args in filters:
-            query = getattr(query, method)(*args)
-        query = query.range(offset, offset + PAGE_SIZE - 1)
-        result = query.execute()
-        rows = result.data or []
-        all_rows.extend(rows)
-        if len(rows) < PAGE_SIZE:
-            break
-        offset += PAGE_SIZE
-    return all_rows
+    """Stream rows by id keyset (safe while the loop updates the rows it reads)."""
+    from db.table_reader import iter_rows
+    return iter_rows(table, select, filters, page_size=PAGE_SIZE, client=client)
 
 
 def _future_active_events(client, select):
@@ -0,0 +1,540 @@
+"""
+Run-wide source health analytics snapshot.
+
+The post-crawl health phase used to ask the database the same questions once
+per source: ``watchdog`` read the last ten ``crawl_logs`` rows for every active
+source, ``data_quality`` pulled each source's recent events to score field
+completeness (twice over, for the trend comparison), and ``health_digest`` then
+stacked both on top.  With ~1,000 sources that was thousands of sequential
+REST calls.
+
+This module computes every per-source aggregate those reports need in a few
+windowed SQL queries over direct Postgres:
+
+  * last-N successful run counts per source (``row_number()`` window)
+  * field completeness, TBA/placeholder and "coming soon" counts over the
+    quality window, plus the 7-day/previous-7-day split for trends
+  * upcoming-event counts by category and by source
+
+When no direct database URL is configured it falls back to a handful of
+paginated PostgREST scans aggregated in Python.  The snapshot is kept in
+process and persisted to ``.cache/source_health_snapshot.json`` for a short
+while, so the watchdog, the quality report, the HTML dashboard and the digest
+all read the same numbers.
+
+Usage:
+    from health_analytics import load_source_health_snapshot
+
+    snapshot = load_source_health_snapshot(refresh=True)  # after a crawl
+    snapshot.run_history()          # watchdog input
+    snapshot.quality[source_id]     # completeness counts
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+import psycopg2
+
+from config import get_config
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "source_health_snapshot.json"
+SNAPSHOT_MAX_AGE_SECONDS = 15 * 60
+
+RUN_HISTORY_LIMIT = 10
+# REST fallback only: how far back to scan crawl_logs for run history.
+RUN_HISTORY_LOOKBACK_DAYS = 60
+TREND_WINDOW_DAYS = 7
+UPCOMING_WINDOW_DAYS = 30
+_PAGE_SIZE = 1000
+
+# Keys of a per-source quality counts dict.
+QUALITY_FIELDS = (
+    "total",
+    "with_time",
+    "with_image",
+    "with_description",
+    "with_price",
+    "tba",
+    "coming_soon",
+    "missing_time",
+    "desc_len_sum",
+    "desc_count",
+    "recent_total",
+    "recent_with_time",
+    "recent_with_image",
+    "recent_with_description",
+    "previous_total",
+    "previous_with_time",
+    "previous_with_image",
+    "previous_with_description",
+)
+
+
+@dataclass
+class SourceHealthSnapshot:
+    """Per-source aggregates for one point in time."""
+
+    days: int
+    sources: list[dict]
+    run_counts: dict[int, list[int]]
+    quality: dict[int, dict[str, float]]
+    category_coverage: dict[str, int]
+    producing_source_ids: list[int]
+    captured_at: float = field(default_factory=time.time)
+
+    @property
+    def active_sources(self) -> int:
+        return len(self.sources)
+
+    def run_history(self) -> list[dict]:
+        """Run stats per active source with history, in ``watchdog`` row format."""
+        results = []
+        for source in self.sources:
+            counts = self.run_counts.get(source["id"])
+            if not counts:
+                continue
+            consecutive_zeros = 0
+            for c in counts:
+                if c != 0:
+                    break
+                consecutive_zeros += 1
+            slug = source.get("slug") or ""
+            results.append(
+                {
+                    "slug": slug,
+                    "name": source.get("name") or slug,
+                    "recent_avg": sum(counts) / len(counts),
+                    "last_found": counts[0],
+                    "consecutive_zeros": consecutive_zeros,
+                    "health_tags": source.get("health_tags") or [],
+                    "active_months": source.get("active_months") or [],
+                }
+            )
+        return results
+
+    def quality_for(self, source_id: int) -> dict[str, float]:
+        return self.quality.get(source_id) or dict.fromkeys(QUALITY_FIELDS, 0)
+
+    def to_json(self) -> dict:
+        return {
+            "days": self.days,
+            "captured_at": self.captured_at,
+            "sources": self.sources,
+            "run_counts": {str(k): v for k, v in self.run_counts.items()},
+            "quality": {str(k): v for k, v in self.quality.items()},
+            "category_coverage": self.category_coverage,
+            "producing_source_ids": self.producing_source_ids,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "SourceHealthSnapshot":
+        return cls(
+            days=int(data["days"]),
+            sources=list(data.get("sources") or []),
+            run_counts={int(k): list(v) for k, v in (data.get("run_counts") or {}).items()},
+            quality={int(k): dict(v) for k, v in (data.get("quality") or {}).items()},
+            category_coverage=dict(data.get("category_coverage") or {}),
+            producing_source_ids=list(data.get("producing_source_ids") or []),
+            captured_at=float(data.get("captured_at") or 0.0),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Windows
+# ---------------------------------------------------------------------------
+
+
+def _windows(days: int, now: Optional[datetime] = None) -> dict[str, datetime]:
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
+    week_ago = now - timedelta(days=TREND_WINDOW_DAYS)
+    two_weeks_ago = now - timedelta(days=2 * TREND_WINDOW_DAYS)
+    return {
+        "now": now,
+        "cutoff": cutoff,
+        "week_ago": week_ago,
+        "two_weeks_ago": two_weeks_ago,
+        "scan_from": min(cutoff, two_weeks_ago),
+    }
+
+
+def _parse_ts(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def quality_counts(
+    events: Iterable[dict],
+    cutoff: datetime,
+    week_ago: Optional[datetime] = None,
+    two_weeks_ago: Optional[datetime] = None,
+) -> dict[str, float]:
+    """Aggregate event rows into the per-source quality counts.
+
+    Rows need ``title, description, start_time, image_url, price_min, is_free,
+    is_all_day, created_at``.  Trend buckets are only filled when both trend
+    boundaries are given.
+    """
+    from data_quality import detect_tba_content
+
+    counts: dict[str, float] = dict.fromkeys(QUALITY_FIELDS, 0)
+    for e in events:
+        created = _parse_ts(e.get("created_at"))
+        description = e.get("description") or ""
+        has_time = bool(e.get("start_time"))
+        has_image = bool(e.get("image_url"))
+        has_description = len(description) > 20
+
+        if created is None or created >= cutoff:
+            counts["total"] += 1
+            counts["with_time"] += has_time
+            counts["with_image"] += has_image
+            counts["with_description"] += has_description
+            counts["with_price"] += e.get("price_min") is not None or bool(e.get("is_free"))
+            if detect_tba_content(e.get("title") or "") or detect_tba_content(description):
+                counts["tba"] += 1
+            if "coming soon" in description.lower():
+                counts["coming_soon"] += 1
+            if not has_time and not e.get("is_all_day"):
+                counts["missing_time"] += 1
+            if description:
+                counts["desc_len_sum"] += len(description)
+                counts["desc_count"] += 1
+
+        if week_ago is None or two_weeks_ago is None or created is None:
+            continue
+        if created >= week_ago:
+            bucket = "recent"
+        elif created >= two_weeks_ago:
+            bucket = "previous"
+        else:
+            continue
+        counts[f"{bucket}_total"] += 1
+        counts[f"{bucket}_with_time"] += has_time
+        counts[f"{bucket}_with_image"] += has_image
+        counts[f"{bucket}_with_description"] += has_description
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Direct Postgres
+# ---------------------------------------------------------------------------
+
+_RUN_HISTORY_SQL = """
+SELECT source_id, array_agg(events_found ORDER BY rn)
+FROM (
+    SELECT cl.source_id,
+           COALESCE(cl.events_found, 0) AS events_found,
+           row_number() OVER (PARTITION BY cl.source_id ORDER BY cl.started_at DESC) AS rn
+    FROM crawl_logs cl
+    WHERE cl.status = 'success' AND cl.source_id = ANY(%(source_ids)s)
+) ranked
+WHERE rn <= %(limit)s
+GROUP BY source_id
+"""
+
+_QUALITY_SQL = """
+WITH e AS (
+    SELECT source_id,
+           created_at,
+           start_time IS NOT NULL AS has_time,
+           COALESCE(image_url, '') <> '' AS has_image,
+           length(COALESCE(description, '')) > 20 AS has_description,
+           (price_min IS NOT NULL OR COALESCE(is_free, false)) AS has_price,
+           (lower(COALESCE(title, '')) LIKE ANY(%(tba)s)
+            OR lower(COALESCE(description, '')) LIKE ANY(%(tba)s)) AS is_tba,
+           lower(COALESCE(description, '')) LIKE %(coming_soon)s AS is_coming_soon,
+           (start_time IS NULL AND NOT COALESCE(is_all_day, false)) AS is_missing_time,
+           length(COALESCE(description, '')) AS desc_len
+    FROM events
+    WHERE source_id IS NOT NULL AND created_at >= %(scan_from)s
+)
+SELECT source_id,
+       count(*) FILTER (WHERE created_at >= %(cutoff)s),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND has_time),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND has_image),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND has_description),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND has_price),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND is_tba),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND is_coming_soon),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND is_missing_time),
+       COALESCE(sum(desc_len) FILTER (WHERE created_at >= %(cutoff)s), 0),
+       count(*) FILTER (WHERE created_at >= %(cutoff)s AND desc_len > 0),
+       count(*) FILTER (WHERE created_at >= %(week_ago)s),
+       count(*) FILTER (WHERE created_at >= %(week_ago)s AND has_time),
+       count(*) FILTER (WHERE created_at >= %(week_ago)s AND has_image),
+       count(*) FILTER (WHERE created_at >= %(week_ago)s AND has_description),
+       count(*) FILTER (WHERE created_at >= %(two_weeks_ago)s AND created_at < %(week_ago)s),
+       count(*) FILTER (WHERE created_at >= %(two_weeks_ago)s AND created_at < %(week_ago)s AND has_time),
+       count(*) FILTER (WHERE created_at >= %(two_weeks_ago)s AND created_at < %(week_ago)s AND has_image),
+       count(*) FILTER (WHERE created_at >= %(two_weeks_ago)s AND created_at < %(week_ago)s AND has_description)
+FROM e
+GROUP BY source_id
+"""
+
+_UPCOMING_SQL = """
+SELECT COALESCE(category_id, 'uncategorized'), source_id, count(*)
+FROM events
+WHERE is_active AND start_date >= %(start)s AND start_date <= %(end)s
+GROUP BY 1, 2
+"""
+
+
+def _tba_like_patterns() -> list[str]:
+    from data_quality import TBA_PATTERNS
+
+    return [f"%{pattern}%" for pattern in TBA_PATTERNS]
+
+
+def _build_via_sql(days: int) -> SourceHealthSnapshot:
+    database_url = get_config().database.active_database_url
+    if not database_url:
+        raise RuntimeError("No active DATABASE_URL configured")
+    w = _windows(days)
+    with psycopg2.connect(database_url) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT id, slug, name, health_tags, active_months FROM sources WHERE is_active"
+            )
+            sources = [
+                {
+                    "id": row[0],
+                    "slug": row[1],
+                    "name": row[2],
+                    "health_tags": list(row[3] or []),
+                    "active_months": list(row[4] or []),
+                }
+                for row in cur.fetchall()
+            ]
+
+            cur.execute(
+                _RUN_HISTORY_SQL,
+                {"source_ids": [s["id"] for s in sources], "limit": RUN_HISTORY_LIMIT},
+            )
+            run_counts = {source_id: [int(c) for c in counts] for source_id, counts in cur.fetchall()}
+
+            cur.execute(
+                _QUALITY_SQL,
+                {
+                    **w,
+                    "tba": _tba_like_patterns(),
+                    "coming_soon": "%coming soon%",
+                },
+            )
+            quality = {
+                row[0]: {name: float(value or 0) for name, value in zip(QUALITY_FIELDS, row[1:])}
+                for row in cur.fetchall()
+            }
+
+            cur.execute(
+                _UPCOMING_SQL,
+                {
+                    "start": w["now"].strftime("%Y-%m-%d"),
+                    "end": (w["now"] + timedelta(days=UPCOMING_WINDOW_DAYS)).strftime("%Y-%m-%d"),
+                },
+            )
+            coverage: dict[str, int] = {}
+            producing: set[int] = set()
+            for category, source_id, count in cur.fetchall():
+                coverage[category] = coverage.get(category, 0) + int(count)
+                if source_id:
+                    producing.add(source_id)
+
+    return SourceHealthSnapshot(
+        days=days,
+        sources=sources,
+        run_counts=run_counts,
+        quality=quality,
+        category_coverage=coverage,
+        producing_source_ids=sorted(producing),
+    )
+
+
+# ---------------------------------------------------------------------------
+# PostgREST fallback
+# ---------------------------------------------------------------------------
+
+
+def _fetch_paged(build_query: Callable[[], Any]) -> list[dict]:
+    rows: list[dict] = []
+    offset = 0
+    while True:
+        page = build_query().range(offset, offset + _PAGE_SIZE - 1).execute().data or []
+        rows.extend(page)
+        if len(page) < _PAGE_SIZE:
+            return rows
+        offset += _PAGE_SIZE
+
+
+def _build_via_rest(days: int) -> SourceHealthSnapshot:
+    from db.client import get_client
+
+    client = get_client()
+    w = _windows(days)
+
+    sources = _fetch_paged(
+        lambda: client.table("sources")
+        .select("id, slug, name, health_tags, active_months")
+        .eq("is_active", True)
+        .order("id")
+    )
+    active_ids = {s["id"] for s in sources}
+
+    lookback = (w["now"] - timedelta(days=RUN_HISTORY_LOOKBACK_DAYS)).isoformat()
+    logs = _fetch_paged(
+        lambda: client.table("crawl_logs")
+        .select("source_id, events_found")
+        .eq("status", "success")
+        .gte("started_at", lookback)
+        .order("started_at", desc=True)
+        .order("id", desc=True)
+    )
+    run_counts: dict[int, list[int]] = {}
+    for row in logs:
+        source_id = row.get("source_id")
+        if source_id not in active_ids:
+            continue
+        counts = run_counts.setdefault(source_id, [])
+        if len(counts) < RUN_HISTORY_LIMIT:
+            counts.append(row.get("events_found") or 0)
+
+    events = _fetch_paged(
+        lambda: client.table("events")
+        .select(
+            "id, source_id, title, description, start_time, image_url, price_min, "
+            "is_free, is_all_day, created_at"
+        )
+        .gte("created_at", w["scan_from"].isoformat())
+        .order("id")
+    )
+    by_source: dict[int, list[dict]] = {}
+    for event in events:
+        if event.get("source_id"):
+            by_source.setdefault(event["source_id"], []).append(event)
+    quality = {
+        source_id: quality_counts(rows, w["cutoff"], w["week_ago"], w["two_weeks_ago"])
+        for source_id, rows in by_source.items()
+    }
+
+    upcoming = _fetch_paged(
+        lambda: client.table("events")
+        .select("id, category_id, source_id")
+        .eq("is_active", True)
+        .gte("start_date", w["now"].strftime("%Y-%m-%d"))
+        .lte("start_date", (w["now"] + timedelta(days=UPCOMING_WINDOW_DAYS)).strftime("%Y-%m-%d"))
+        .order("id")
+    )
+    coverage: dict[str, int] = {}
+    producing: set[int] = set()
+    for row in upcoming:
+        category = row.get("category_id") or "uncategorized"
+        coverage[category] = coverage.get(category, 0) + 1
+        if row.get("source_id"):
+            producing.add(row["source_id"])
+
+    return SourceHealthSnapshot(
+        days=days,
+        sources=sources,
+        run_counts=run_counts,
+        quality=quality,
+        category_coverage=coverage,
+        producing_source_ids=sorted(producing),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+_SNAPSHOTS: dict[int, SourceHealthSnapshot] = {}
+_SNAPSHOT_LOCK = threading.Lock()
+
+
+def _cache_key(days: int) -> str:
+    return f"{get_config().database.active_target}:{days}"
+
+
+def _read_cached(key: str, path: Path) -> Optional[SourceHealthSnapshot]:
+    try:
+        with open(path) as f:
+            entry = (json.load(f) or {}).get(key)
+    except (OSError, ValueError):
+        return None
+    if not entry:
+        return None
+    snapshot = SourceHealthSnapshot.from_json(entry)
+    if time.time() - snapshot.captured_at > SNAPSHOT_MAX_AGE_SECONDS:
+        return None
+    return snapshot
+
+
+def _write_cached(key: str, snapshot: SourceHealthSnapshot, path: Path) -> None:
+    try:
+        with open(path) as f:
+            data = json.load(f) or {}
+    except (OSError, ValueError):
+        data = {}
+    data[key] = snapshot.to_json()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.debug("Could not persist source health snapshot: %s", e)
+
+
+def load_source_health_snapshot(
+    days: int = 30, refresh: bool = False, path: Optional[Path] = None
+) -> SourceHealthSnapshot:
+    """Return the health snapshot for a ``days`` quality window, building it if needed.
+
+    ``refresh`` rebuilds from the database (call it once after a crawl batch);
+    otherwise the in-process snapshot, then a recent on-disk one, is reused.
+    """
+    path = path or SNAPSHOT_CACHE_PATH
+    with _SNAPSHOT_LOCK:
+        snapshot = None if refresh else _SNAPSHOTS.get(days)
+        if snapshot is not None and time.time() - snapshot.captured_at <= SNAPSHOT_MAX_AGE_SECONDS:
+            return snapshot
+
+        key = _cache_key(days)
+        snapshot = None if refresh else _read_cached(key, path)
+        if snapshot is None:
+            started = time.monotonic()
+            try:
+                snapshot = _build_via_sql(days)
+            except Exception as e:
+                logger.debug("Source health SQL aggregation failed, using REST scans: %s", e)
+                snapshot = _build_via_rest(days)
+            logger.info(
+                "Source health snapshot: %d sources, %d with run history (%.1fs)",
+                snapshot.active_sources,
+                len(snapshot.run_counts),
+                time.monotonic() - started,
+            )
+            _write_cached(key, snapshot, path)
+        _SNAPSHOTS[days] = snapshot
+        return snapshot
+
+
+def clear_source_health_snapshot() -> None:
+    """Forget in-process snapshots (the on-disk cache is left alone)."""
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOTS.clear()
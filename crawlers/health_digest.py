@@ -13,7 +13,7 @@ import json
 import logging
 import os
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Optional
 
 from watchlist import WatchlistAlert, get_watchlist_status
@@ -115,32 +115,14 @@ class HealthDigest:
 
 
 def _get_category_coverage() -> dict:
-    """Query events in the next 30 days and return counts by category_id.
+    """Counts of events in the next 30 days by category_id (from the health snapshot).
 
-    Returns an empty dict if the query fails (non-fatal).
+    Returns an empty dict if the snapshot can't be built (non-fatal).
     """
     try:
-        from db.client import get_client
-
-        client = get_client()
-        now = datetime.now(timezone.utc)
-        cutoff = now + timedelta(days=30)
-
-        resp = (
-            client.table("events")
-            .select("category_id")
-            .eq("is_active", True)
-            .gte("start_date", now.strftime("%Y-%m-%d"))
-            .lte("start_date", cutoff.strftime("%Y-%m-%d"))
-            .execute()
-        )
-
-        counts: dict = {}
-        for row in resp.data or []:
-            cat = row.get("category_id") or "uncategorized"
-            counts[cat] = counts.get(cat, 0) + 1
+        from health_analytics import load_source_health_snapshot
 
-        return counts
+        return dict(load_source_health_snapshot().category_coverage)
     except Exception as exc:
         logger.debug("_get_category_coverage failed (non-fatal): %s", exc)
         return {}
@@ -153,34 +135,10 @@ def _count_active_sources() -> tuple[int, int]:
     Returns (0, 0) on failure (non-fatal).
     """
     try:
-        from db.client import get_client
-
-        client = get_client()
-        now = datetime.now(timezone.utc)
-        cutoff = now + timedelta(days=30)
-
-        # Count active sources
-        active_resp = (
-            client.table("sources")
-            .select("id", count="exact")
-            .eq("is_active", True)
-            .execute()
-        )
-        active_count = active_resp.count or 0
-
-        # Count sources with upcoming events (distinct source_ids)
-        events_resp = (
-            client.table("events")
-            .select("source_id")
-            .eq("is_active", True)
-            .gte("start_date", now.strftime("%Y-%m-%d"))
-            .lte("start_date", cutoff.strftime("%Y-%m-%d"))
-            .execute()
-        )
-        producing_ids = {row["source_id"] for row in (events_resp.data or []) if row.get("source_id")}
-        producing_count = len(producing_ids)
+        from health_analytics import load_source_health_snapshot
 
-        return active_count, producing_count
+        snapshot = load_source_health_snapshot()
+        return snapshot.active_sources, len(snapshot.producing_source_ids)
     except Exception as exc:
         logger.debug("_count_active_sources failed (non-fatal): %s", exc)
         return 0, 0
@@ -1,11 +1,34 @@
 """
 LLM client wrapper with provider selection (Anthropic or OpenAI).
+
+Every request goes through the same process-wide controls, so parallel crawl
+threads, classification and enrichment share one view of each provider:
+
+  * request slots per provider (LLM_MAX_CONCURRENCY);
+  * a request- and token-per-minute limiter per provider/model
+    (LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE, 0 = unlimited), which
+    also pauses the whole provider/model when it answers 429 with Retry-After;
+  * retries with jittered exponential backoff that honor Retry-After, drawn
+    from a per-provider retry budget so an outage can't multiply the load;
+  * a hedge: when the alternate provider is configured and a request misses
+    the latency SLO (LLM_HEDGE_AFTER_SECONDS, 0 = off), the same request is
+    sent there too and the first good answer wins.
+
+Latency (p50/p95), tokens and errors are tallied per caller; see
+``llm_metrics()`` and ``log_llm_metrics()``.
 """
 
 from __future__ import annotations
 
+import email.utils
 import logging
-from typing import Optional
+import random
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
 
 from config import get_config
 
@@ -14,6 +37,20 @@ logger = logging.getLogger(__name__)
 _anthropic_client = None
 _openai_client = None
 
+_provider_slots: dict[str, threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+# Backoff between attempts: full jitter over BASE * 2**attempt, capped.
+RETRY_BACKOFF_BASE_SECONDS = 1.0
+RETRY_BACKOFF_CAP_SECONDS = 60.0
+# Each request earns RETRY_BUDGET_RATIO retries; RETRY_BUDGET_RESERVE covers quiet periods.
+RETRY_BUDGET_RATIO = 0.2
+RETRY_BUDGET_RESERVE = 10.0
+_RETRYABLE_STATUS = frozenset((408, 409, 429, 500, 502, 503, 504, 529))
+# Billing/auth failures look like 429s but never clear up on retry.
+_NON_RETRYABLE_MARKERS = ("insufficient_quota", "credit balance", "api key", "authentication")
+LATENCY_SAMPLES = 2048
+
 
 def _llm_timeout_seconds() -> float:
     cfg = get_config()
@@ -35,6 +72,291 @@ def _llm_max_retries() -> int:
     return max(0, parsed)
 
 
+def _llm_setting(name: str, default: float) -> float:
+    cfg = get_config()
+    raw = getattr(cfg.llm, name, default)
+    try:
+        return max(0.0, float(raw))
+    except (TypeError, ValueError):
+        return default
+
+
+def provider_concurrency(provider: Optional[str] = None) -> int:
+    """Max in-flight requests per provider (LLM_MAX_CONCURRENCY, default 4).
+
+    Batch callers size their worker pools with this; extra workers would only
+    queue on the provider slot.
+    """
+    cfg = get_config()
+    raw = getattr(cfg.llm, "max_concurrency", 4)
+    try:
+        parsed = int(raw)
+    except (TypeError, ValueError):
+        return 4
+    return max(1, parsed)
+
+
+def _provider_slot(provider: str) -> threading.BoundedSemaphore:
+    with _provider_slots_lock:
+        slot = _provider_slots.get(provider)
+        if slot is None:
+            slot = _provider_slots[provider] = threading.BoundedSemaphore(provider_concurrency(provider))
+        return slot
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting and retry budget
+# ---------------------------------------------------------------------------
+
+
+class _RateLimiter:
+    """Request and token buckets for one provider/model, refilled per minute.
+
+    Token cost is estimated up front and settled against the reported usage
+    afterwards (the bucket may go into debt).  ``pause`` stops all callers,
+    e.g. for a 429's Retry-After.
+    """
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.rpm = requests_per_minute
+        self.tpm = tokens_per_minute
+        self.requests = float(requests_per_minute)
+        self.tokens = float(tokens_per_minute)
+        self.paused_until = 0.0
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.updated = now
+        if self.rpm:
+            self.requests = min(self.rpm, self.requests + elapsed * self.rpm / 60.0)
+        if self.tpm:
+            self.tokens = min(self.tpm, self.tokens + elapsed * self.tpm / 60.0)
+
+    def acquire(self, tokens: int) -> float:
+        """Block until the request may go out; returns seconds waited."""
+        # A request larger than a minute's tokens still has to run eventually.
+        tokens = min(tokens, self.tpm) if self.tpm else tokens
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                delay = self.paused_until - now
+                if delay <= 0 and self.rpm and self.requests < 1:
+                    delay = (1 - self.requests) * 60.0 / self.rpm
+                if delay <= 0 and self.tpm and self.tokens < tokens:
+                    delay = (tokens - self.tokens) * 60.0 / self.tpm
+                if delay <= 0:
+                    if self.rpm:
+                        self.requests -= 1
+                    if self.tpm:
+                        self.tokens -= tokens
+                    return waited
+            time.sleep(delay)
+            waited += delay
+
+    def settle(self, estimated: int, actual: int) -> None:
+        if self.tpm and actual:
+            with self.lock:
+                self.tokens -= actual - estimated
+
+    def pause(self, seconds: float) -> None:
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def paused(self) -> bool:
+        return self.paused_until > time.monotonic()
+
+
+class _RetryBudget:
+    """Retries are only allowed while they stay a small fraction of requests."""
+
+    def __init__(self, ratio: float = RETRY_BUDGET_RATIO, reserve: float = RETRY_BUDGET_RESERVE):
+        self.ratio = ratio
+        self.cap = max(reserve, 100 * ratio)
+        self.balance = reserve
+        self.lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self.lock:
+            self.balance = min(self.cap, self.balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self.lock:
+            if self.balance < 1:
+                return False
+            self.balance -= 1
+            return True
+
+
+_limiters: dict[tuple[str, str], _RateLimiter] = {}
+_retry_budgets: dict[str, _RetryBudget] = {}
+_limits_lock = threading.Lock()
+
+
+def _rate_limiter(provider: str, model: str) -> _RateLimiter:
+    with _limits_lock:
+        limiter = _limiters.get((provider, model))
+        if limiter is None:
+            limiter = _limiters[(provider, model)] = _RateLimiter(
+                _llm_setting("requests_per_minute", 0.0),
+                _llm_setting("tokens_per_minute", 0.0),
+            )
+        return limiter
+
+
+def _retry_budget(provider: str) -> _RetryBudget:
+    with _limits_lock:
+        budget = _retry_budgets.get(provider)
+        if budget is None:
+            budget = _retry_budgets[provider] = _RetryBudget()
+        return budget
+
+
+def _status_code(exc: Exception) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        millis = headers.get("retry-after-ms")
+        if millis:
+            return max(0.0, float(millis) / 1000.0)
+        raw = headers.get("retry-after")
+        if not raw:
+            return None
+        try:
+            return max(0.0, float(raw))
+        except ValueError:
+            parsed = email.utils.parsedate_to_datetime(raw)
+            return max(0.0, parsed.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_retryable(exc: Exception) -> bool:
+    text = str(exc).lower()
+    if any(marker in text for marker in _NON_RETRYABLE_MARKERS):
+        return False
+    status = _status_code(exc)
+    if status is not None:
+        return status in _RETRYABLE_STATUS
+    name = type(exc).__name__.lower()
+    return any(marker in name for marker in ("timeout", "connection")) or any(
+        marker in text for marker in ("rate limit", "overloaded", "temporarily unavailable")
+    )
+
+
+def _backoff_seconds(attempt: int, retry_after: Optional[float]) -> float:
+    jittered = random.uniform(0, min(RETRY_BACKOFF_CAP_SECONDS, RETRY_BACKOFF_BASE_SECONDS * 2 ** attempt))
+    if retry_after is not None:
+        return min(RETRY_BACKOFF_CAP_SECONDS, retry_after + jittered / 4)
+    return jittered
+
+
+def _estimate_tokens(*texts: str) -> int:
+    return sum(len(text or "") for text in texts) // 4 + 1
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+class _CallerMetrics:
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.hedges = 0
+        self.fallbacks = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.rate_limited_seconds = 0.0
+        self.errors: dict[str, int] = {}
+        self.latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+
+_metrics: dict[str, _CallerMetrics] = {}
+_metrics_lock = threading.Lock()
+
+
+def _record(caller: str, update: Callable[[_CallerMetrics], None]) -> None:
+    with _metrics_lock:
+        metrics = _metrics.get(caller)
+        if metrics is None:
+            metrics = _metrics[caller] = _CallerMetrics()
+        update(metrics)
+
+
+def _error_key(provider: str, exc: Exception) -> str:
+    status = _status_code(exc)
+    return f"{provider}:{status if status is not None else type(exc).__name__}"
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def llm_metrics() -> dict[str, dict]:
+    """Per-caller request counts, p50/p95 latency (ms), tokens and error counters.
+
+    Latency covers the provider call only; time waiting on our own rate
+    limiter and provider slots is reported as ``rate_limited_seconds``.
+    """
+    with _metrics_lock:
+        snapshot = {}
+        for caller, metrics in _metrics.items():
+            latencies = sorted(metrics.latencies)
+            snapshot[caller] = {
+                "requests": metrics.requests,
+                "retries": metrics.retries,
+                "hedges": metrics.hedges,
+                "fallbacks": metrics.fallbacks,
+                "input_tokens": metrics.input_tokens,
+                "output_tokens": metrics.output_tokens,
+                "rate_limited_seconds": round(metrics.rate_limited_seconds, 1),
+                "errors": dict(metrics.errors),
+                "p50_ms": round(_percentile(latencies, 0.50) * 1000),
+                "p95_ms": round(_percentile(latencies, 0.95) * 1000),
+            }
+        return snapshot
+
+
+def log_llm_metrics() -> None:
+    for caller, stats in sorted(llm_metrics().items()):
+        errors = sum(stats["errors"].values())
+        logger.info(
+            f"LLM [{caller}]: {stats['requests']} requests, p50 {stats['p50_ms']}ms, "
+            f"p95 {stats['p95_ms']}ms, {stats['input_tokens']}+{stats['output_tokens']} tokens, "
+            f"{errors} errors, {stats['retries']} retries, {stats['hedges']} hedges, "
+            f"{stats['fallbacks']} fallbacks"
+        )
+
+
+def _caller_name(depth: int = 2) -> str:
+    """Module that called into llm_client, as the default metrics caller."""
+    try:
+        return sys._getframe(depth).f_globals.get("__name__", "unknown")
+    except ValueError:
+        return "unknown"
+
+
+# ---------------------------------------------------------------------------
+# Providers
+# ---------------------------------------------------------------------------
+
+
 def _normalize_provider(raw_provider: Optional[str]) -> str:
     provider = (raw_provider or "anthropic").strip().lower()
     if provider in ("", "auto"):
@@ -103,10 +425,11 @@ def _get_anthropic_client():
         cfg = get_config()
         if not cfg.llm.anthropic_api_key:
             raise RuntimeError("ANTHROPIC_API_KEY is not set")
+        # Retries are handled here (budgeted, shared backoff), not by the SDK.
         _anthropic_client = Anthropic(
             api_key=cfg.llm.anthropic_api_key,
             timeout=_llm_timeout_seconds(),
-            max_retries=_llm_max_retries(),
+            max_retries=0,
         )
     return _anthropic_client
 
@@ -124,22 +447,126 @@ def _get_openai_client():
         _openai_client = OpenAI(
             api_key=cfg.llm.openai_api_key,
             timeout=_llm_timeout_seconds(),
-            max_retries=_llm_max_retries(),
+            max_retries=0,
         )
     return _openai_client
 
 
+def _model_for(provider: str, model_override: Optional[str]) -> str:
+    cfg = get_config()
+    if model_override:
+        return model_override
+    if provider == "openai":
+        return cfg.llm.openai_model or "gpt-4o-mini"
+    return cfg.llm.model
+
+
+def _usage_tokens(response) -> tuple[int, int]:
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return 0, 0
+    prompt = getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", None) or 0
+    completion = getattr(usage, "output_tokens", None) or getattr(usage, "completion_tokens", None) or 0
+    return int(prompt), int(completion)
+
+
+def _run_request(
+    provider: str,
+    model: str,
+    caller: str,
+    estimated_tokens: int,
+    call: Callable[[], tuple[str, int, int]],
+    sent: Optional[threading.Event] = None,
+) -> str:
+    """Run one provider request under the limiter, slots and retry budget.
+
+    ``sent`` is set once the first attempt holds a provider slot and goes out.
+    """
+    limiter = _rate_limiter(provider, model)
+    budget = _retry_budget(provider)
+    max_retries = _llm_max_retries()
+    attempt = 0
+    while True:
+        waited = limiter.acquire(estimated_tokens)
+        budget.deposit()
+        # Latency is timed from when the request holds a provider slot; time
+        # queued for the slot counts as self-imposed waiting, like the limiter.
+        queued = time.monotonic()
+        started = None
+        try:
+            with _provider_slot(provider):
+                started = time.monotonic()
+                waited += started - queued
+                if sent is not None:
+                    sent.set()
+                text, input_tokens, output_tokens = call()
+        except Exception as exc:
+            elapsed = time.monotonic() - (started or queued)
+            key = _error_key(provider, exc)
+
+            def count_error(m: _CallerMetrics) -> None:
+                m.requests += 1
+                m.rate_limited_seconds += waited
+                m.latencies.append(elapsed)
+                m.errors[key] = m.errors.get(key, 0) + 1
+
+            _record(caller, count_error)
+            retry_after = _retry_after_seconds(exc)
+            if _status_code(exc) == 429 and retry_after:
+                # Everyone on this provider/model backs off, not just this thread.
+                limiter.pause(retry_after)
+            if attempt >= max_retries or not _is_retryable(exc) or not budget.withdraw():
+                raise
+            delay = _backoff_seconds(attempt, retry_after)
+            logger.debug(f"LLM {provider}/{model} request failed ({key}); retry {attempt + 1} in {delay:.1f}s")
+            _record(caller, lambda m: setattr(m, "retries", m.retries + 1))
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        elapsed = time.monotonic() - started
+        limiter.settle(estimated_tokens, input_tokens + output_tokens)
+
+        def count_success(m: _CallerMetrics) -> None:
+            m.requests += 1
+            m.rate_limited_seconds += waited
+            m.latencies.append(elapsed)
+            m.input_tokens += input_tokens
+            m.output_tokens += output_tokens
+
+        _record(caller, count_success)
+        return text
+
+
 def _generate_with_provider(
     provider: str,
     system_prompt: str,
     user_message: str,
     model_override: Optional[str] = None,
+    caller: str = "unknown",
+    sent: Optional[threading.Event] = None,
 ) -> str:
+    model = _model_for(provider, model_override)
+    return _run_request(
+        provider,
+        model,
+        caller,
+        _estimate_tokens(system_prompt, user_message),
+        lambda: _call_provider(provider, system_prompt, user_message, model),
+        sent,
+    )
+
+
+def _call_provider(
+    provider: str,
+    system_prompt: str,
+    user_message: str,
+    model: str,
+) -> tuple[str, int, int]:
     cfg = get_config()
 
     if provider == "openai":
         client = _get_openai_client()
-        model = model_override or cfg.llm.openai_model or "gpt-4o-mini"
         response = client.chat.completions.create(
             model=model,
             temperature=cfg.llm.temperature,
@@ -151,12 +578,12 @@ def _generate_with_provider(
             ],
         )
         content = response.choices[0].message.content if response.choices else ""
-        return content or ""
+        return (content or "", *_usage_tokens(response))
 
     if provider == "anthropic":
         client = _get_anthropic_client()
         response = client.messages.create(
-            model=model_override or cfg.llm.model,
+            model=model,
             max_tokens=cfg.llm.max_tokens,
             temperature=cfg.llm.temperature,
             system=system_prompt,
@@ -164,48 +591,125 @@ def _generate_with_provider(
             timeout=_llm_timeout_seconds(),
         )
         if response.content:
-            return response.content[0].text
-        return ""
+            return (response.content[0].text, *_usage_tokens(response))
+        return ("", *_usage_tokens(response))
 
     raise RuntimeError(f"Unknown LLM provider: {provider}")
 
 
+# ---------------------------------------------------------------------------
+# Hedging
+# ---------------------------------------------------------------------------
+
+_hedge_pool: Optional[ThreadPoolExecutor] = None
+_hedge_pool_lock = threading.Lock()
+
+
+def _get_hedge_pool() -> ThreadPoolExecutor:
+    global _hedge_pool
+    with _hedge_pool_lock:
+        if _hedge_pool is None:
+            _hedge_pool = ThreadPoolExecutor(max_workers=64, thread_name_prefix="llm-hedge")
+        return _hedge_pool
+
+
+def _first_success(futures: list[Future]) -> str:
+    """Result of the first future to succeed; the last error if all fail."""
+    pending = set(futures)
+    error: Optional[BaseException] = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            exc = future.exception()
+            if exc is None:
+                return future.result()
+            error = exc
+    raise error
+
+
+def _generate_hedged(
+    provider: str,
+    alternate: str,
+    system_prompt: str,
+    user_message: str,
+    model_override: Optional[str],
+    caller: str,
+    hedge_after: float,
+    hedged: list[str],
+) -> str:
+    pool = _get_hedge_pool()
+    sent = threading.Event()
+    primary = pool.submit(_generate_with_provider, provider, system_prompt, user_message, model_override, caller, sent)
+    primary.add_done_callback(lambda _: sent.set())
+    # Time spent queued on our own limiter or provider slots is not provider
+    # latency; start the SLO clock only once the request is actually out.
+    sent.wait()
+    wait([primary], timeout=hedge_after)
+    if primary.done():
+        return primary.result()
+    # Hedging into a 429 pause would only queue a duplicate behind it.
+    limiters = (
+        _rate_limiter(provider, _model_for(provider, model_override)),
+        _rate_limiter(alternate, _model_for(alternate, None)),
+    )
+    if any(limiter.paused() for limiter in limiters):
+        return primary.result()
+
+    logger.info(f"LLM provider '{provider}' missed the {hedge_after:.0f}s latency SLO; hedging with '{alternate}'")
+    _record(caller, lambda m: setattr(m, "hedges", m.hedges + 1))
+    hedged.append(alternate)
+    hedge = pool.submit(_generate_with_provider, alternate, system_prompt, user_message, None, caller)
+    return _first_success([primary, hedge])
+
+
 def generate_text(
     system_prompt: str,
     user_message: str,
     provider_override: Optional[str] = None,
     model_override: Optional[str] = None,
+    caller: Optional[str] = None,
 ) -> str:
     """
     Generate text from the configured LLM provider.
     Returns raw text output.
+
+    ``caller`` labels the request in ``llm_metrics()`` (default: the calling
+    module).
     """
+    caller = caller or _caller_name()
     provider = _resolve_provider(provider_override)
+    alternate = _alternate_provider(provider)
+    alternate_ready = bool(alternate and _provider_is_configured(alternate))
+    hedge_after = _llm_setting("hedge_after_seconds", 0.0) if alternate_ready else 0.0
+    hedged: list[str] = []
     try:
+        if hedge_after:
+            return _generate_hedged(
+                provider, alternate, system_prompt, user_message, model_override, caller, hedge_after, hedged
+            )
         return _generate_with_provider(
             provider,
             system_prompt=system_prompt,
             user_message=user_message,
             model_override=model_override,
+            caller=caller,
         )
     except Exception as exc:
-        alternate = _alternate_provider(provider)
-        if (
-            alternate
-            and _provider_is_configured(alternate)
-            and _should_fallback_to_alternate_provider(exc)
-        ):
+        # A hedged request already tried the alternate provider.
+        if alternate_ready and not hedged and _should_fallback_to_alternate_provider(exc):
             logger.warning(
                 "LLM provider '%s' failed (%s); falling back to '%s'",
                 provider,
                 exc,
                 alternate,
             )
+            _record(caller, lambda m: setattr(m, "fallbacks", m.fallbacks + 1))
             return _generate_with_provider(
                 alternate,
                 system_prompt=system_prompt,
                 user_message=user_message,
                 model_override=None,
+                caller=caller,
             )
         raise
 
@@ -215,6 +719,7 @@ def generate_text_with_images(
     user_message: str,
     image_urls: list,
     model: Optional[str] = None,
+    caller: Optional[str] = None,
 ) -> str:
     """
     Generate text from images using OpenAI GPT-4o vision API.
@@ -224,6 +729,7 @@ def generate_text_with_images(
         user_message: Text prompt to accompany the images.
         image_urls: List of image URLs or base64 data URIs.
         model: OpenAI model to use (default: gpt-4o).
+        caller: Label for ``llm_metrics()`` (default: the calling module).
 
     Returns:
         Raw text output from the model.
@@ -231,6 +737,7 @@ def generate_text_with_images(
     cfg = get_config()
     client = _get_openai_client()
     model = model or "gpt-4o"
+    caller = caller or _caller_name()
 
     # Build content array with text + images
     content: list[dict] = [{"type": "text", "text": user_message}]
@@ -240,15 +747,20 @@ def generate_text_with_images(
             "image_url": {"url": url, "detail": "high"},
         })
 
-    response = client.chat.completions.create(
-        model=model,
-        temperature=cfg.llm.temperature,
-        max_tokens=cfg.llm.max_tokens,
-        timeout=_llm_timeout_seconds(),
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": content},
-        ],
-    )
-    result = response.choices[0].message.content if response.choices else ""
-    return result or ""
+    def call() -> tuple[str, int, int]:
+        response = client.chat.completions.create(
+            model=model,
+            temperature=cfg.llm.temperature,
+            max_tokens=cfg.llm.max_tokens,
+            timeout=_llm_timeout_seconds(),
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": content},
+            ],
+        )
+        result = response.choices[0].message.content if response.choices else ""
+        return (result or "", *_usage_tokens(response))
+
+    # Images are billed at roughly a thousand tokens each at "high" detail.
+    estimated = _estimate_tokens(system_prompt, user_message) + 1000 * len(image_urls)
+    return _run_request("openai", model, caller, estimated, call)
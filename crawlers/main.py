@@ -17,12 +17,10 @@ import random
 import re
 import subprocess
 import sys
+import threading
 import time
-from concurrent.futures import (
-    ThreadPoolExecutor,
-    as_completed,
-    TimeoutError as FuturesTimeoutError,
-)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from importlib import import_module
 from typing import Optional
@@ -50,11 +48,17 @@ from db import (
     writes_enabled,
     reset_client,
     refresh_search_suggestions,
+    load_source_registry,
+    load_schema_capabilities,
 )
 from config import set_database_target, get_config
 from crawl_context import set_crawl_context, CrawlContext
+from series import series_registry_scope
 from crawl_lock import hold_crawl_run_lock, CrawlRunLockError
 from utils import setup_logging
+from extractors.offload import configure_extraction_pool
+from extraction_cache import configure_extraction_cache, extraction_cache_stats
+from llm_client import log_llm_metrics
 from fetch_logos import fetch_logos
 from crawler_health import (
     record_crawl_start as health_record_start,
@@ -67,6 +71,17 @@ from crawler_health import (
     get_all_circuit_states,
     get_system_health_summary,
     print_health_report,
+    get_duration_history,
+)
+from crawl_scheduler import (
+    CrawlScheduler,
+    POOL_PLAYWRIGHT,
+    POOL_REQUESTS,
+    RESOURCE_LLM,
+    RESOURCE_PLAYWRIGHT,
+    RESOURCE_REQUESTS,
+    llm_profile_slugs,
+    predict_durations,
 )
 from data_quality import print_quality_report
 from post_crawl_report import save_report as save_html_report
@@ -104,6 +119,15 @@ MAX_REQUESTS_WORKERS = (
     8  # Reduced from 10 — keeps total socket pressure lower on the same run
 )
 
+# LLM-discovery profile sources share the requests pool but are capped so they
+# don't all hit the model provider at once.
+MAX_LLM_WORKERS = 3
+
+# Festival schedule pass — festivals run concurrently, but each host only sees
+# one request at a time so small festival sites aren't hammered.
+FESTIVAL_SCHEDULE_WORKERS = 6
+FESTIVAL_SCHEDULE_PER_HOST_LIMIT = 1
+
 # Populated once at startup by _classify_sources().
 PLAYWRIGHT_SOURCES: set[str] = set()
 
@@ -534,7 +558,8 @@ def run_source(slug: str, skip_circuit_breaker: bool = False) -> bool:
     health_run_id = health_record_start(slug)
 
     try:
-        found, new, updated = run_crawler_with_retry(source)
+        with series_registry_scope(source["id"]):
+            found, new, updated = run_crawler_with_retry(source)
 
         # Get validation statistics
         stats = get_validation_stats()
@@ -591,11 +616,14 @@ def run_festival_schedules(portal_slug: Optional[str] = None) -> dict:
     to find individual sessions on festival websites and link them via series.
     No LLM calls — fast and cheap. Runs after individual source crawlers.
 
+    Festivals are processed concurrently (per-host request limits, shared
+    Playwright browsers) and stats are merged in festival order.
+
     Returns:
         Dict with stats: festivals_processed, festivals_with_data,
         sessions_found, sessions_inserted
     """
-    from crawl_festival_schedule import crawl_festival_schedule
+    from crawl_festival_schedule import start_playwright_pool, stop_playwright_pool
     from db import get_client, get_portal_id_by_slug
 
     client = get_client()
@@ -664,39 +692,115 @@ def run_festival_schedules(portal_slug: Optional[str] = None) -> dict:
         except Exception as e:
             logger.debug("Could not load source URLs for festival schedules: %s", e)
 
-    for f in festivals:
-        slug = f["slug"]
-        website = f["website"]
-        stats["festivals_processed"] += 1
+    host_limiter = _HostConcurrencyLimiter(FESTIVAL_SCHEDULE_PER_HOST_LIMIT)
+    outcomes: list[tuple[int, int]] = [(0, 0)] * len(festivals)
 
-        profile_urls: list[str] = []
-        render_js = False
+    if festivals:
+        # Cheap: browsers launch only when a render_js festival first fetches.
+        start_playwright_pool(size=MAX_PLAYWRIGHT_WORKERS)
         try:
-            from pipeline.loader import load_profile
+            with ThreadPoolExecutor(
+                max_workers=min(FESTIVAL_SCHEDULE_WORKERS, len(festivals))
+            ) as pool:
+                future_to_index = {
+                    pool.submit(
+                        _crawl_festival_schedule_candidates,
+                        festival,
+                        source_url_by_slug.get(festival["slug"]),
+                        host_limiter,
+                    ): index
+                    for index, festival in enumerate(festivals)
+                }
+                for future in as_completed(future_to_index):
+                    index = future_to_index[future]
+                    try:
+                        outcomes[index] = future.result()
+                    except Exception as e:
+                        logger.debug(
+                            "  Festival %s schedule pass failed: %s",
+                            festivals[index]["slug"],
+                            e,
+                        )
+        finally:
+            stop_playwright_pool()
+
+    # Merge in festival order so stats don't depend on completion order.
+    for festival_found, festival_new in outcomes:
+        stats["festivals_processed"] += 1
+        stats["sessions_found"] += festival_found
+        stats["sessions_inserted"] += festival_new
+        if festival_found > 0:
+            stats["festivals_with_data"] += 1
 
-            profile = load_profile(slug)
-            profile_urls = list(profile.discovery.urls or [])
-            render_js = bool(
-                getattr(profile.discovery.fetch, "render_js", False)
-                or getattr(profile.detail.fetch, "render_js", False)
-            )
-        except Exception:
-            profile_urls = []
-            render_js = False
-
-        source_url = source_url_by_slug.get(slug)
-        candidate_urls = _build_festival_schedule_candidate_urls(
-            website=website,
-            source_url=source_url,
-            profile_urls=profile_urls,
-            discover_links=True,
+    return stats
+
+
+class _HostConcurrencyLimiter:
+    """Caps in-flight requests per host across festival schedule workers."""
+
+    def __init__(self, per_host: int):
+        self._per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        host = _normalized_host(urlparse(url).netloc)
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self._per_host)
+                self._semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+
+def _crawl_festival_schedule_candidates(
+    festival: dict,
+    source_url: Optional[str],
+    host_limiter: _HostConcurrencyLimiter,
+) -> tuple[int, int]:
+    """Try a festival's schedule candidate URLs until one yields sessions.
+
+    Candidates run in priority order and the rest are abandoned as soon as one
+    returns sessions, so a festival never inserts from two competing pages.
+
+    Returns:
+        (sessions_found, sessions_new) for the festival.
+    """
+    from crawl_festival_schedule import crawl_festival_schedule
+
+    slug = festival["slug"]
+    website = festival["website"]
+
+    profile_urls: list[str] = []
+    render_js = False
+    try:
+        from pipeline.loader import load_profile
+
+        profile = load_profile(slug)
+        profile_urls = list(profile.discovery.urls or [])
+        render_js = bool(
+            getattr(profile.discovery.fetch, "render_js", False)
+            or getattr(profile.detail.fetch, "render_js", False)
         )
+    except Exception:
+        profile_urls = []
+        render_js = False
 
-        festival_found = 0
-        festival_new = 0
+    candidate_urls = _build_festival_schedule_candidate_urls(
+        website=website,
+        source_url=source_url,
+        profile_urls=profile_urls,
+        discover_links=True,
+    )
+
+    festival_found = 0
+    festival_new = 0
 
-        for candidate_url in candidate_urls:
-            try:
+    for candidate_url in candidate_urls:
+        try:
+            with host_limiter.slot(candidate_url):
                 found, new, _skipped = crawl_festival_schedule(
                     slug=slug,
                     url=candidate_url,
@@ -704,32 +808,25 @@ def run_festival_schedules(portal_slug: Optional[str] = None) -> dict:
                     use_llm=False,
                     dry_run=False,
                 )
-            except Exception as e:
-                logger.debug(
-                    "  Festival %s candidate failed (%s): %s", slug, candidate_url, e
-                )
-                continue
-
-            festival_found += found
-            festival_new += new
-            if found > 0:
-                logger.info(
-                    "  Festival %s: %s sessions, %s new (%s)",
-                    slug,
-                    found,
-                    new,
-                    candidate_url,
-                )
-                break
-
-        stats["sessions_found"] += festival_found
-        stats["sessions_inserted"] += festival_new
-        if festival_found > 0:
-            stats["festivals_with_data"] += 1
+        except Exception as e:
+            logger.debug(
+                "  Festival %s candidate failed (%s): %s", slug, candidate_url, e
+            )
+            continue
 
-        time.sleep(0.5)
+        festival_found += found
+        festival_new += new
+        if found > 0:
+            logger.info(
+                "  Festival %s: %s sessions, %s new (%s)",
+                slug,
+                found,
+                new,
+                candidate_url,
+            )
+            break
 
-    return stats
+    return festival_found, festival_new
 
 
 _FESTIVAL_SCHEDULE_HINTS = (
@@ -1346,6 +1443,15 @@ def run_post_crawl_tasks(
     except Exception as e:
         logger.warning(f"Analytics snapshot failed: {e}")
 
+    # Per-source health aggregates for the report, watchdog and digest below,
+    # computed once for the whole fleet.
+    try:
+        from health_analytics import load_source_health_snapshot
+
+        load_source_health_snapshot(refresh=True)
+    except Exception as e:
+        logger.warning(f"Source health snapshot failed: {e}")
+
     # 7. Generate HTML report
     logger.info("Generating post-crawl report...")
     try:
@@ -1413,6 +1519,8 @@ def run_all_sources(
     Returns:
         Dict mapping source slug to success status
     """
+    # One bulk snapshot of sources/portals serves every per-event lookup this run.
+    load_source_registry()
     sources = get_active_sources()
     results = {}
 
@@ -1501,19 +1609,31 @@ def run_all_sources(
     return results
 
 
+def _source_resource_class(slug: str, modules: Optional[dict[str, str]] = None) -> str:
+    """Scheduler resource class: Playwright module, LLM profile discovery, or requests."""
+    if slug in PLAYWRIGHT_SOURCES:
+        return RESOURCE_PLAYWRIGHT
+    modules = modules if modules is not None else get_source_modules()
+    if slug not in modules and slug in llm_profile_slugs():
+        return RESOURCE_LLM
+    return RESOURCE_REQUESTS
+
+
 def _run_split_pool(
     sources: list[dict],
     pw_workers: int = MAX_PLAYWRIGHT_WORKERS,
     req_workers: int = MAX_REQUESTS_WORKERS,
 ) -> dict[str, bool]:
-    """Run sources in two separate thread pools — one for Playwright, one for requests.
+    """Run sources on a Playwright pool and a requests pool, longest predicted first.
 
     Playwright launches a full browser process per thread; keeping its pool small
-    (default 3) avoids exhausting file descriptors and RAM.  Requests-only crawlers
-    are I/O-lightweight and can run at higher concurrency (default 10).
+    (default 2) avoids exhausting file descriptors and RAM.  Requests-only crawlers
+    are I/O-lightweight and can run at higher concurrency (default 8).
 
-    Both pools execute concurrently.  Results are merged and returned with the same
-    {slug: bool} shape as the single-pool path.
+    Durations are predicted from crawl_runs history (see crawl_scheduler) so the
+    slow sources start first; Playwright workers steal requests work once their
+    own queue drains, and LLM profile sources share MAX_LLM_WORKERS slots.
+    Predicted and actual makespan are logged at the end.
 
     Args:
         sources:    List of source dicts (must have a ``slug`` key).
@@ -1523,71 +1643,60 @@ def _run_split_pool(
     Returns:
         Dict mapping source slug → True (success) / False (failure).
     """
-    # Split by Playwright classification.  Unknown slugs (e.g. profile-backed
-    # sources that don't have a .py module) default to the requests pool since
-    # they don't launch browsers.
-    pw_sources = [s for s in sources if s["slug"] in PLAYWRIGHT_SOURCES]
-    req_sources = [s for s in sources if s["slug"] not in PLAYWRIGHT_SOURCES]
+    slugs = [s["slug"] for s in sources]
+    modules = get_source_modules()
+    try:
+        history = get_duration_history()
+    except Exception as e:
+        logger.warning("Could not load crawl duration history: %s", e)
+        history = {}
+    estimates = predict_durations(
+        slugs, history, lambda slug: _source_resource_class(slug, modules)
+    )
+    by_class: dict[str, int] = {}
+    for est in estimates:
+        by_class[est.resource_class] = by_class.get(est.resource_class, 0) + 1
 
     logger.info(
         "Split pool: %s Playwright sources (max %s workers), "
-        "%s requests sources (max %s workers)",
-        len(pw_sources),
+        "%s requests sources and %s LLM sources (max %s workers); "
+        "%s/%s with duration history",
+        by_class.get(RESOURCE_PLAYWRIGHT, 0),
         pw_workers,
-        len(req_sources),
+        by_class.get(RESOURCE_REQUESTS, 0),
+        by_class.get(RESOURCE_LLM, 0),
         req_workers,
+        sum(1 for e in estimates if e.has_history),
+        len(estimates),
     )
 
-    results: dict[str, bool] = {}
-
-    # Guard against empty pools — ThreadPoolExecutor(max_workers=0) raises ValueError.
-    actual_pw_workers = min(pw_workers, len(pw_sources)) if pw_sources else 1
-    actual_req_workers = min(req_workers, len(req_sources)) if req_sources else 1
-
-    batch_slugs = [s["slug"] for s in sources]
-    batch_timeout = get_batch_timeout_seconds(batch_slugs)
-
-    with (
-        ThreadPoolExecutor(max_workers=actual_pw_workers) as pw_pool,
-        ThreadPoolExecutor(max_workers=actual_req_workers) as req_pool,
-    ):
-        future_to_slug: dict = {}
-        for source in pw_sources:
-            future_to_slug[pw_pool.submit(run_source, source["slug"], True)] = source[
-                "slug"
-            ]
-        for source in req_sources:
-            future_to_slug[req_pool.submit(run_source, source["slug"], True)] = source[
-                "slug"
-            ]
-
-        try:
-            for future in as_completed(future_to_slug, timeout=batch_timeout):
-                slug = future_to_slug[future]
-                try:
-                    results[slug] = future.result()
-                except Exception as e:
-                    logger.error("Parallel execution failed for %s: %s", slug, e)
-                    results[slug] = False
-        except FuturesTimeoutError:
-            logger.error(
-                "Split-pool crawl batch exceeded timeout budget (%ss). "
-                "Marking unfinished sources as failed.",
-                batch_timeout,
-            )
-            for future, slug in future_to_slug.items():
-                if slug in results:
-                    continue
-                if future.done():
-                    try:
-                        results[slug] = future.result()
-                    except Exception as e:
-                        logger.error("Parallel execution failed for %s: %s", slug, e)
-                        results[slug] = False
-                else:
-                    future.cancel()
-                    results[slug] = False
+    scheduler = CrawlScheduler(
+        estimates,
+        pool_sizes={
+            POOL_PLAYWRIGHT: min(pw_workers, len(sources)),
+            POOL_REQUESTS: min(req_workers, len(sources)),
+        },
+        class_limits={RESOURCE_LLM: MAX_LLM_WORKERS},
+    )
+    results = scheduler.run(
+        lambda slug: run_source(slug, True),
+        timeout=get_batch_timeout_seconds(slugs),
+    )
 
+    report = scheduler.report
+    logger.info(
+        "Scheduler: predicted makespan %.0fs (database order would be %.0fs), actual %.0fs",
+        report["predicted_makespan_seconds"],
+        report["baseline_predicted_makespan_seconds"],
+        report["actual_makespan_seconds"],
+    )
+    for miss in report["largest_misses"]:
+        logger.debug(
+            "Scheduler estimate miss: %s predicted %.0fs, took %.0fs",
+            miss["slug"],
+            miss["predicted"],
+            miss["actual"],
+        )
     return results
 
 
@@ -1637,6 +1746,7 @@ def _run_source_list(
 
 def run_smart_crawl(args) -> dict[str, bool]:
     """Smart mode: only crawl sources due based on crawl_frequency."""
+    load_source_registry()
     due_sources = get_sources_due_for_crawl()
 
     # Count by cadence for logging
@@ -1688,6 +1798,7 @@ def run_smart_crawl(args) -> dict[str, bool]:
 
 def run_cadence_crawl(args) -> dict[str, bool]:
     """Run all sources with a specific crawl_frequency cadence."""
+    load_source_registry()
     sources = get_sources_by_cadence(args.cadence)
     logger.info(f"Cadence mode: {len(sources)} sources with frequency '{args.cadence}'")
 
@@ -1820,6 +1931,21 @@ def main():
         default=MAX_WORKERS,
         help=f"Number of parallel workers (default: {MAX_WORKERS})",
     )
+    parser.add_argument(
+        "--extract-processes",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for HTML extraction offload (0 = parse in crawl "
+            "threads). Default: CRAWLER_EXTRACT_PROCESSES, else one per core "
+            "minus one for multi-source runs and 0 for --source runs."
+        ),
+    )
+    parser.add_argument(
+        "--no-extraction-cache",
+        action="store_true",
+        help="Re-run every extractor instead of reusing results for unchanged pages",
+    )
     parser.add_argument(
         "--force",
         "-f",
@@ -2006,6 +2132,13 @@ def main():
         "enabled" if should_write else "disabled",
     )
 
+    # One schema introspection per run (cached on disk per target/migration);
+    # the events_support_* probes fall back to trial queries if this fails.
+    try:
+        load_schema_capabilities()
+    except Exception as e:
+        logger.warning("Schema capability snapshot unavailable: %s", e)
+
     if should_write:
         cancel_stale_runs(max_age_minutes=120)
 
@@ -2144,6 +2277,12 @@ def main():
                 )
                 return 0
 
+            # CPU-bound parsing goes to worker processes so the crawl threads
+            # keep the network busy; single-source runs don't amortize startup.
+            if args.extract_processes is not None or not args.source:
+                configure_extraction_pool(args.extract_processes)
+            configure_extraction_cache(enabled=not args.no_extraction_cache)
+
             # Single source
             if args.source:
                 success = run_source(args.source, skip_circuit_breaker=args.force)
@@ -2194,6 +2333,11 @@ def main():
                 tba_hydration_limit=args.tba_hydration_limit,
             )
             failed = sum(1 for v in results.values() if not v)
+            logger.info(
+                "Extraction cache (main process): %(hits)d hits, %(misses)d misses",
+                extraction_cache_stats(),
+            )
+            log_llm_metrics()
             return 1 if failed > 0 else 0
     except CrawlRunLockError as exc:
         logger.error(str(exc))
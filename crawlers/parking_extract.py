@@ -24,12 +24,10 @@ import logging
 from typing import Optional
 from urllib.parse import urljoin
 
-import requests
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
-HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; LostCity/1.0)"}
 TIMEOUT = 8
 
 # ---------------------------------------------------------------------------
@@ -81,14 +79,14 @@ PARKING_NOTE_NOISE_RE = re.compile(
 
 
 def _fetch_soup(url: str) -> Optional[BeautifulSoup]:
-    """Fetch a URL and return parsed soup, or None on failure."""
+    """Fetch a URL through the shared venue corpus and return parsed soup, or None."""
+    from venue_corpus import get_venue_corpus
+
     try:
-        resp = requests.get(
-            url, headers=HEADERS, timeout=TIMEOUT, allow_redirects=True
-        )
-        if resp.status_code != 200:
+        html = get_venue_corpus().get(url, timeout=TIMEOUT, allow_playwright=False)
+        if not html:
             return None
-        return BeautifulSoup(resp.text, "html.parser")
+        return BeautifulSoup(html, "html.parser")
     except Exception:
         return None
 
@@ -5,7 +5,6 @@ API adapters for the pipeline.
 from __future__ import annotations
 
 import logging
-import time
 from datetime import datetime
 from typing import Any
 from html.parser import HTMLParser
@@ -16,6 +15,7 @@ from sources import ticketmaster as tm
 from sources import ticketmaster_nashville as tm_nash
 from sources import eventbrite as eb
 from sources import eventbrite_nashville as eb_nash
+from sources._eventbrite_base import get_api as get_eventbrite_api
 
 logger = logging.getLogger(__name__)
 
@@ -137,8 +137,7 @@ def _discover_eventbrite(limit: int | None = None) -> list[dict[str, Any]]:
         logger.warning("Eventbrite: no event IDs discovered")
         return events
 
-    for event_id in event_ids:
-        raw = eb.fetch_event_from_api(event_id)
+    for _event_id, raw in get_eventbrite_api().fetch_events(event_ids):
         if not raw:
             continue
         parsed = eb.parse_event_for_pipeline(raw)
@@ -146,7 +145,6 @@ def _discover_eventbrite(limit: int | None = None) -> list[dict[str, Any]]:
             events.append(parsed)
             if limit and len(events) >= limit:
                 return events
-        time.sleep(0.2)
 
     return events
 
@@ -163,8 +161,7 @@ def _discover_eventbrite_nashville(limit: int | None = None) -> list[dict[str, A
         logger.warning("Eventbrite Nashville: no event IDs discovered")
         return events
 
-    for event_id in event_ids:
-        raw = eb_nash.fetch_event_from_api(event_id)
+    for _event_id, raw in get_eventbrite_api().fetch_events(event_ids):
         if not raw:
             continue
         parsed = eb_nash.parse_event_for_pipeline(raw)
@@ -172,7 +169,6 @@ def _discover_eventbrite_nashville(limit: int | None = None) -> list[dict[str, A
             events.append(parsed)
             if limit and len(events) >= limit:
                 return events
-        time.sleep(0.2)
 
     return events
 
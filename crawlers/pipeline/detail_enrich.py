@@ -22,6 +22,7 @@ from extractors.lineup import (
 from extractors.selectors import extract_all, extract_first
 from extractors.heuristic import extract_heuristic_fields
 from extractors.llm_detail import extract_detail_with_llm
+from extractors.offload import run_extraction
 from pipeline.models import DetailConfig, SelectorSet
 from show_signals import extract_ticket_status
 from utils import is_likely_non_event_image, normalize_time_format, parse_date_range, parse_price
@@ -822,6 +823,34 @@ def _collect_links(
             existing["source"] = source
 
 
+def extract_detail_stages(
+    html: str,
+    url: str,
+    source_name: str,
+    config: DetailConfig,
+) -> list[tuple[str, dict]]:
+    """Parse-only part of ``enrich_from_detail``: sanitized fields per
+    extractor, in merge order.  No LLM call, so it can run in an extraction
+    worker process."""
+    stages: list[tuple[str, dict]] = []
+    if config.use_jsonld or config.jsonld_only:
+        stages.append(("jsonld", _sanitize_extracted_fields(extract_jsonld_event_fields(html), url)))
+    if config.jsonld_only:
+        return stages
+    if config.use_open_graph:
+        stages.append(("open_graph", _sanitize_extracted_fields(extract_open_graph_fields(html), url)))
+    if config.selectors:
+        stages.append(("selectors", _sanitize_extracted_fields(_extract_selector_fields(html, config.selectors), url)))
+    if config.use_heuristic:
+        stages.append(("heuristic", _sanitize_extracted_fields(extract_heuristic_fields(html), url)))
+    return stages
+
+
+def detail_job_calls_llm(source_name: str, config: DetailConfig, *args: Any, **kwargs: Any) -> bool:
+    """Offload predicate: keep detail jobs that may call the LLM in the parent."""
+    return bool(config.use_llm and not config.jsonld_only)
+
+
 def enrich_from_detail(
     html: str,
     url: str,
@@ -832,6 +861,13 @@ def enrich_from_detail(
     if not html:
         return {}
 
+    if detail_job_calls_llm(source_name, config):
+        # The LLM gap-fill must run in this process, under llm_client's
+        # limits; only the parsing goes to an extraction worker.
+        stages = run_extraction("detail_stages", html, url, source_name, config)
+    else:
+        stages = extract_detail_stages(html, url, source_name, config)
+
     enriched: dict[str, Any] = {}
     field_provenance: dict[str, Any] = {}
     field_confidence: dict[str, float] = {}
@@ -840,17 +876,14 @@ def enrich_from_detail(
     links_by_key: dict[tuple[str, str], dict] = {}
     link_order: list[tuple[str, str]] = []
 
-    jsonld_present = False
-    if config.use_jsonld or config.jsonld_only:
-        jsonld = _sanitize_extracted_fields(extract_jsonld_event_fields(html), url)
-        jsonld_present = bool(jsonld)
-        for k, v in jsonld.items():
-            _merge_and_track(k, enriched.get(k), v, "jsonld", url, enriched, field_provenance, field_confidence)
-        _collect_images(jsonld, "jsonld", url, images_by_url, image_order)
-        _collect_links(jsonld, "jsonld", url, links_by_key, link_order)
+    for source, fields in stages:
+        for k, v in fields.items():
+            _merge_and_track(k, enriched.get(k), v, source, url, enriched, field_provenance, field_confidence)
+        _collect_images(fields, source, url, images_by_url, image_order)
+        _collect_links(fields, source, url, links_by_key, link_order)
 
     if config.jsonld_only:
-        if not jsonld_present:
+        if not any(source == "jsonld" and fields for source, fields in stages):
             return {"_skip": True, "extraction_version": EXTRACTION_VERSION}
 
         enriched = _normalize_urls(enriched, url)
@@ -869,27 +902,6 @@ def enrich_from_detail(
         enriched["extraction_version"] = EXTRACTION_VERSION
         return enriched
 
-    if config.use_open_graph:
-        og = _sanitize_extracted_fields(extract_open_graph_fields(html), url)
-        for k, v in og.items():
-            _merge_and_track(k, enriched.get(k), v, "open_graph", url, enriched, field_provenance, field_confidence)
-        _collect_images(og, "open_graph", url, images_by_url, image_order)
-        _collect_links(og, "open_graph", url, links_by_key, link_order)
-
-    if config.selectors:
-        sel = _sanitize_extracted_fields(_extract_selector_fields(html, config.selectors), url)
-        for k, v in sel.items():
-            _merge_and_track(k, enriched.get(k), v, "selectors", url, enriched, field_provenance, field_confidence)
-        _collect_images(sel, "selectors", url, images_by_url, image_order)
-        _collect_links(sel, "selectors", url, links_by_key, link_order)
-
-    if config.use_heuristic:
-        heur = _sanitize_extracted_fields(extract_heuristic_fields(html), url)
-        for k, v in heur.items():
-            _merge_and_track(k, enriched.get(k), v, "heuristic", url, enriched, field_provenance, field_confidence)
-        _collect_images(heur, "heuristic", url, images_by_url, image_order)
-        _collect_links(heur, "heuristic", url, links_by_key, link_order)
-
     if config.use_llm:
         # Only invoke LLM when prior steps left gaps — saves API tokens
         desc = enriched.get("description") or ""
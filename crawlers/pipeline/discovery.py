@@ -5,14 +5,13 @@ Discovery-phase extraction from list pages using selectors.
 from __future__ import annotations
 
 import logging
-import re
 from datetime import datetime
 from typing import Optional
 
 from bs4 import BeautifulSoup
 from dateutil import parser as dateparser
 
-from date_utils import parse_human_date
+from date_utils import parse_human_date, parse_time_text
 from extractors.selectors import extract_from_element
 from pipeline.models import DiscoveryConfig, SelectorSet
 
@@ -26,19 +25,10 @@ def _parse_date(text: Optional[str]) -> Optional[str]:
 def _parse_time(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
+    parsed = parse_time_text(text)
+    if parsed:
+        return parsed
     try:
-        # Prefer the first time if a range is provided
-        match = re.search(r"(\d{1,2}):?(\d{2})?\s*(AM|PM)", text, re.IGNORECASE)
-        if match:
-            hour, minute, period = match.groups()
-            hour = int(hour)
-            minute = int(minute or 0)
-            if period.upper() == "PM" and hour != 12:
-                hour += 12
-            elif period.upper() == "AM" and hour == 12:
-                hour = 0
-            return f"{hour:02d}:{minute:02d}"
-
         dt = dateparser.parse(text, fuzzy=True, default=datetime.now())
         if not dt:
             return None
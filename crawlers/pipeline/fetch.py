@@ -4,7 +4,9 @@ HTML fetch utilities for the pipeline.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
 from typing import Optional, Tuple
 
 import httpx
@@ -15,6 +17,48 @@ from utils import validate_url, random_user_agent
 
 logger = logging.getLogger(__name__)
 
+_LOCAL = threading.local()
+# Every thread-local client with its owning thread, so pools can be closed.
+_CLIENTS: list[tuple[threading.Thread, httpx.Client]] = []
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _http_client(timeout_s: float) -> httpx.Client:
+    """Return this thread's keep-alive client for the given timeout."""
+    clients = getattr(_LOCAL, "clients", None)
+    if clients is None:
+        clients = _LOCAL.clients = {}
+    client = clients.get(timeout_s)
+    if client is None or client.is_closed:
+        client = httpx.Client(timeout=timeout_s, follow_redirects=True)
+        clients[timeout_s] = client
+        with _CLIENTS_LOCK:
+            _CLIENTS.append((threading.current_thread(), client))
+        # Clients of threads that exited without a pool shutdown hook.
+        close_http_clients(finished_threads_only=True)
+    return client
+
+
+def close_http_clients(finished_threads_only: bool = False) -> int:
+    """Close pooled keep-alive clients; returns how many were closed.
+
+    With ``finished_threads_only``, only clients whose thread has exited
+    (e.g. a shut-down fetch pool's workers) are closed, so live threads keep
+    theirs.
+    """
+    with _CLIENTS_LOCK:
+        closing = [(t, c) for t, c in _CLIENTS if not (finished_threads_only and t.is_alive())]
+        _CLIENTS[:] = [(t, c) for t, c in _CLIENTS if finished_threads_only and t.is_alive()]
+    for _thread, client in closing:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug(f"Closing HTTP client failed: {e}")
+    return len(closing)
+
+
+atexit.register(close_http_clients)
+
 
 def fetch_html(url: str, fetch: Optional[FetchConfig] = None) -> Tuple[str, Optional[str]]:
     """
@@ -56,13 +100,8 @@ def fetch_html(url: str, fetch: Optional[FetchConfig] = None) -> Tuple[str, Opti
             return "", str(e)
 
     try:
-        with httpx.Client(
-            timeout=cfg.timeout_ms / 1000.0,
-            headers={"User-Agent": ua},
-            follow_redirects=True,
-        ) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            return resp.text, None
+        resp = _http_client(cfg.timeout_ms / 1000.0).get(url, headers={"User-Agent": ua})
+        resp.raise_for_status()
+        return resp.text, None
     except Exception as e:
         return "", str(e)
@@ -0,0 +1,159 @@
+"""
+Detail freshness index: skip re-enriching detail pages that have not changed.
+
+Every profile run used to re-fetch and re-extract every detail page, including
+the LLM fallback, even when the discovery seed was identical to yesterday's and
+the event was already fully enriched.  The index remembers, per detail URL:
+
+  * ``fingerprint`` — hash of the discovery seed that pointed at the page
+  * ``extraction_version`` — ``EXTRACTION_VERSION`` the page was enriched with
+  * ``completeness`` — share of the key detail fields the extraction filled
+  * ``fetched_at`` — when the page was last fetched
+  * ``enriched`` — the extraction result, replayed to the writer on a hit
+
+A page is reused while its seed fingerprint and extraction version match and
+it is younger than the profile's ``detail.refresh_ttl_hours``.  Pages that came
+back incomplete are retried sooner (a quarter of the TTL) so the LLM fallback
+gets another chance without running every night.  ``--refresh-details`` (or
+``force_refresh=True``) bypasses the index but still records fresh results.
+
+One JSON file per profile under ``.cache/detail_freshness/``.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from pipeline.detail_enrich import EXTRACTION_VERSION
+
+logger = logging.getLogger(__name__)
+
+FRESHNESS_DIR = Path(__file__).resolve().parents[1] / ".cache" / "detail_freshness"
+COMPLETENESS_FIELDS = ("description", "start_time", "image_url", "ticket_url", "price")
+COMPLETE_THRESHOLD = 0.8
+INCOMPLETE_TTL_FRACTION = 0.25
+# Entries not seen for this long are dropped on save.
+PRUNE_AFTER_SECONDS = 30 * 24 * 3600
+
+
+def seed_fingerprint(seed: dict) -> str:
+    """Stable hash of a discovery seed."""
+    payload = json.dumps(seed, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def field_completeness(enriched: dict) -> float:
+    """Share of ``COMPLETENESS_FIELDS`` present in an extraction result."""
+    if not enriched:
+        return 0.0
+    filled = 0
+    for field in COMPLETENESS_FIELDS:
+        if field == "price":
+            filled += bool(
+                enriched.get("price_min") is not None
+                or enriched.get("price_note")
+                or enriched.get("is_free")
+            )
+        else:
+            filled += bool(enriched.get(field))
+    return filled / len(COMPLETENESS_FIELDS)
+
+
+class DetailFreshnessIndex:
+    """Per-profile detail URL index. Thread-safe; persisted with ``save()``."""
+
+    def __init__(
+        self,
+        slug: str,
+        ttl_hours: float,
+        force_refresh: bool = False,
+        directory: Optional[Path] = None,
+    ):
+        self._path = (directory or FRESHNESS_DIR) / f"{slug}.json"
+        self._ttl_seconds = max(0.0, ttl_hours) * 3600
+        self._force_refresh = force_refresh
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def lookup(self, seed: dict) -> Optional[dict]:
+        """Return the cached extraction for a seed's detail page, or None to fetch."""
+        detail_url = seed.get("detail_url")
+        if not detail_url or self._force_refresh or self._ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(detail_url)
+            if entry is not None and self._is_fresh(entry, seed):
+                entry["seen_at"] = time.time()
+                self._dirty = True
+                self.hits += 1
+                return copy.deepcopy(entry.get("enriched") or {})
+            self.misses += 1
+            return None
+
+    def _is_fresh(self, entry: dict, seed: dict) -> bool:
+        if entry.get("extraction_version") != EXTRACTION_VERSION:
+            return False
+        if entry.get("fingerprint") != seed_fingerprint(seed):
+            return False
+        ttl = self._ttl_seconds
+        if float(entry.get("completeness") or 0.0) < COMPLETE_THRESHOLD:
+            ttl *= INCOMPLETE_TTL_FRACTION
+        return time.time() - float(entry.get("fetched_at") or 0.0) < ttl
+
+    def record(self, seed: dict, enriched: dict) -> None:
+        """Remember a freshly fetched page's extraction."""
+        detail_url = seed.get("detail_url")
+        if not detail_url or not enriched:
+            return
+        now = time.time()
+        entry = {
+            "fingerprint": seed_fingerprint(seed),
+            "extraction_version": enriched.get("extraction_version") or EXTRACTION_VERSION,
+            "completeness": field_completeness(enriched),
+            "fetched_at": now,
+            "seen_at": now,
+            "enriched": copy.deepcopy(enriched),
+        }
+        with self._lock:
+            self._entries[detail_url] = entry
+            self._dirty = True
+
+    def save(self) -> None:
+        cutoff = time.time() - PRUNE_AFTER_SECONDS
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = {
+                url: entry
+                for url, entry in self._entries.items()
+                if float(entry.get("seen_at") or 0.0) >= cutoff
+            }
+            self._dirty = False
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f, default=str)
+            tmp_path.replace(self._path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning("Could not save detail freshness index to %s: %s", self._path, exc)
@@ -58,6 +58,7 @@ class DetailConfig(BaseModel):
     use_heuristic: bool = True
     use_llm: bool = True
     jsonld_only: bool = False
+    refresh_ttl_hours: float = 72
     fetch: FetchConfig = Field(default_factory=FetchConfig)
 
 
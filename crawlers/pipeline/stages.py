@@ -0,0 +1,157 @@
+"""
+Staged detail enrichment for the profile pipeline.
+
+``run_profile`` used to fetch, parse and persist one seed at a time, so network
+waits, BeautifulSoup parsing and DB writes never overlapped.  ``iter_enriched``
+splits that into three stages:
+
+  1. detail fetch — a bounded thread pool (pooled httpx connections, see
+     ``pipeline.fetch``)
+  2. extraction — ``enrich_from_detail`` on a small thread pool, or on worker
+     processes (``extractors.offload``) for the BeautifulSoup-heavy extractors:
+     the process-wide extraction pool when it is enabled, or a private one
+     when ``extract_processes`` > 0
+  3. persist — the caller's loop body, consuming results on its own thread
+
+Results are yielded in seed order, so ``CrawlResult`` counts and insert order
+match the sequential runner.  At most ``max_in_flight`` seeds are fetched or
+extracted ahead of the writer, which keeps memory bounded when the DB stage is
+the slow one.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Optional
+
+from extractors.offload import ExtractionPool, get_extraction_pool
+from pipeline.fetch import close_http_clients
+
+logger = logging.getLogger(__name__)
+
+DETAIL_FETCH_WORKERS = 6
+RENDER_JS_FETCH_WORKERS = 2
+EXTRACT_THREAD_WORKERS = 2
+MAX_IN_FLIGHT = 24
+
+
+def _chain(source: Future, target: Future) -> None:
+    if source.cancelled():
+        target.cancel()
+        return
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+    else:
+        target.set_result(source.result())
+
+
+def iter_enriched(
+    seeds: Iterable[dict],
+    profile,
+    fetch: Callable,
+    extract: Callable,
+    fetch_workers: Optional[int] = None,
+    extract_processes: int = 0,
+    max_in_flight: int = MAX_IN_FLIGHT,
+    freshness=None,
+) -> Iterator[tuple[dict, dict]]:
+    """Yield ``(seed, enriched)`` in seed order with detail work run ahead.
+
+    ``fetch(url, fetch_config)`` returns ``(html, error)`` like
+    ``pipeline.fetch.fetch_html``; ``extract(html, url, source_name, config)``
+    is ``enrich_from_detail`` (it must be a module-level function when worker
+    processes are used).  Seeds without a ``detail_url``, or profiles with detail disabled,
+    yield an empty dict without touching the pools.  Extraction errors are
+    re-raised to the consumer when it reaches that seed.
+
+    With a ``DetailFreshnessIndex`` as ``freshness``, unchanged pages are
+    answered from the index and fresh extractions are recorded into it.
+    """
+    detail = profile.detail
+    if not detail.enabled:
+        for seed in seeds:
+            yield seed, {}
+        return
+
+    if fetch_workers is None:
+        fetch_workers = RENDER_JS_FETCH_WORKERS if detail.fetch.render_js else DETAIL_FETCH_WORKERS
+    max_in_flight = max(1, max_in_flight)
+
+    fetch_pool = ThreadPoolExecutor(max_workers=max(1, fetch_workers), thread_name_prefix="detail-fetch")
+    extract_threads: Optional[ThreadPoolExecutor] = None
+    private_pool: Optional[ExtractionPool] = None
+    if extract_processes > 0:
+        private_pool = ExtractionPool(extract_processes)
+        offload: Optional[ExtractionPool] = private_pool
+    else:
+        shared = get_extraction_pool()
+        offload = shared if shared.enabled else None
+    if offload is None:
+        extract_threads = ThreadPoolExecutor(max_workers=EXTRACT_THREAD_WORKERS, thread_name_prefix="detail-extract")
+
+    def submit_extract(html: str, detail_url: str) -> Future:
+        if offload is not None:
+            # Small pages run inline on this fetch thread; large ones go to a worker.
+            return offload.submit(extract, html, detail_url, profile.name, detail)
+        return extract_threads.submit(extract, html, detail_url, profile.name, detail)
+
+    def schedule(seed: dict) -> tuple[Future, bool]:
+        out: Future = Future()
+        detail_url = seed.get("detail_url")
+        if not detail_url:
+            out.set_result({})
+            return out, False
+        cached = freshness.lookup(seed) if freshness is not None else None
+        if cached is not None:
+            out.set_result(cached)
+            return out, True
+
+        def on_fetched(fetched: Future) -> None:
+            if fetched.cancelled():
+                out.cancel()
+                return
+            try:
+                html, err = fetched.result()
+            except Exception as e:
+                html, err = "", str(e)
+            if err:
+                logger.debug(f"Detail fetch failed: {detail_url} - {err}")
+                out.set_result({})
+                return
+            try:
+                extracted = submit_extract(html, detail_url)
+            except RuntimeError as e:  # pool shut down while the consumer bailed out
+                out.set_exception(e)
+                return
+            extracted.add_done_callback(lambda f: _chain(f, out))
+
+        fetch_pool.submit(fetch, detail_url, detail.fetch).add_done_callback(on_fetched)
+        return out, False
+
+    pending: deque[tuple[dict, Future, bool]] = deque()
+    seed_iter = iter(seeds)
+    try:
+        for seed in seed_iter:
+            pending.append((seed, *schedule(seed)))
+            if len(pending) >= max_in_flight:
+                break
+        while pending:
+            seed, future, from_index = pending.popleft()
+            enriched = future.result()
+            if freshness is not None and not from_index:
+                freshness.record(seed, enriched)
+            next_seed = next(seed_iter, None)
+            if next_seed is not None:
+                pending.append((next_seed, *schedule(next_seed)))
+            yield seed, enriched
+    finally:
+        fetch_pool.shutdown(wait=True, cancel_futures=True)
+        # The fetch workers' keep-alive clients die with them.
+        close_http_clients(finished_threads_only=True)
+        if extract_threads is not None:
+            extract_threads.shutdown(wait=True, cancel_futures=True)
+        if private_pool is not None:
+            private_pool.shutdown()
@@ -35,11 +35,15 @@ from db import (
 from dedupe import generate_content_hash
 from crawler_health import record_crawl_start, record_crawl_success, record_crawl_failure
 from utils import setup_logging, slugify
+from extractors.offload import configure_extraction_pool
+from extraction_cache import configure_extraction_cache
 
 from pipeline.loader import load_profile
 from pipeline.fetch import fetch_html
 from pipeline.discovery import discover_from_list
 from pipeline.detail_enrich import enrich_from_detail
+from pipeline.stages import iter_enriched
+from pipeline.freshness import DetailFreshnessIndex
 from pipeline.feed_discovery import discover_from_feed
 from pipeline.html_discovery import discover_from_html
 from pipeline.api_adapters import discover_events as discover_api_events
@@ -413,7 +417,41 @@ def _should_skip_jsonld_only(profile, detail_url: str | None, enriched: dict) ->
     return False
 
 
-def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
+def _iter_detail_enriched(
+    seeds: list[dict],
+    profile,
+    extract_processes: int = 0,
+    freshness: DetailFreshnessIndex | None = None,
+):
+    """Fetch and enrich detail pages ahead of the (single-threaded) writer loop."""
+    return iter_enriched(
+        seeds,
+        profile,
+        fetch=fetch_html,
+        extract=enrich_from_detail,
+        extract_processes=extract_processes,
+        freshness=freshness,
+    )
+
+
+def _save_freshness(profile, freshness: DetailFreshnessIndex | None) -> None:
+    if freshness is None:
+        return
+    freshness.save()
+    if freshness.hits:
+        logger.info(
+            f"{profile.slug}: reused {freshness.hits} unchanged detail pages "
+            f"({freshness.misses} fetched)"
+        )
+
+
+def run_profile(
+    slug: str,
+    dry_run: bool,
+    limit: int | None,
+    extract_processes: int = 0,
+    refresh_details: bool = False,
+) -> CrawlResult:
     result = CrawlResult()
     profile = load_profile(slug)
     source = get_source_by_slug(slug)
@@ -425,6 +463,15 @@ def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
         return result
 
     default_venue_id = _get_or_create_default_venue(profile)
+    freshness = (
+        DetailFreshnessIndex(
+            profile.slug,
+            ttl_hours=profile.detail.refresh_ttl_hours,
+            force_refresh=refresh_details,
+        )
+        if profile.detail.enabled
+        else None
+    )
 
     if profile.discovery.type == "api":
         if not profile.discovery.api:
@@ -466,19 +513,11 @@ def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
 
         logger.info(f"{slug}: {len(all_seeds)} feed events discovered")
 
-        for seed in all_seeds:
+        for seed, enriched in _iter_detail_enriched(all_seeds, profile, extract_processes, freshness):
             detail_url = seed.get("detail_url")
             source_url = detail_url or profile.discovery.urls[0]
             title = seed.get("title")
 
-            enriched: dict = {}
-            if detail_url and profile.detail.enabled:
-                html, err = fetch_html(detail_url, profile.detail.fetch)
-                if err:
-                    logger.debug(f"Detail fetch failed: {detail_url} - {err}")
-                else:
-                    enriched = enrich_from_detail(html, detail_url, profile.name, profile.detail)
-
             if _should_skip_jsonld_only(profile, detail_url, enriched):
                 logger.debug("Skipping (jsonld-only): %s", detail_url or title)
                 continue
@@ -620,10 +659,21 @@ def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
                     logger.info(f"Inserted: {title} ({start_date})")
                 except Exception as e:
                     logger.warning(f"Insert failed: {title} - {e}")
+        _save_freshness(profile, freshness)
         return result
 
     if profile.discovery.type == "html":
-        _process_llm_discovery(profile, source, default_venue_id, dry_run=dry_run, limit=limit, result=result)
+        _process_llm_discovery(
+            profile,
+            source,
+            default_venue_id,
+            dry_run=dry_run,
+            limit=limit,
+            result=result,
+            extract_processes=extract_processes,
+            freshness=freshness,
+        )
+        _save_freshness(profile, freshness)
         return result
 
     # List-based discovery
@@ -654,19 +704,11 @@ def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
 
     logger.info(f"{slug}: {len(all_seeds)} seeds discovered")
 
-    for seed in all_seeds:
+    for seed, enriched in _iter_detail_enriched(all_seeds, profile, extract_processes, freshness):
         detail_url = seed.get("detail_url")
         source_url = detail_url or profile.discovery.urls[0]
         title = seed.get("title")
 
-        enriched: dict = {}
-        if detail_url and profile.detail.enabled:
-            html, err = fetch_html(detail_url, profile.detail.fetch)
-            if err:
-                logger.debug(f"Detail fetch failed: {detail_url} - {err}")
-            else:
-                enriched = enrich_from_detail(html, detail_url, profile.name, profile.detail)
-
         if _should_skip_jsonld_only(profile, detail_url, enriched):
             logger.debug("Skipping (jsonld-only): %s", detail_url or title)
             continue
@@ -809,10 +851,11 @@ def run_profile(slug: str, dry_run: bool, limit: int | None) -> CrawlResult:
             except Exception as e:
                 logger.warning(f"Insert failed: {title} - {e}")
 
+    _save_freshness(profile, freshness)
     return result
 
 
-def _process_llm_discovery(profile, source, default_venue_id: int | None, dry_run: bool, limit: int | None, result: CrawlResult | None = None) -> None:
+def _process_llm_discovery(profile, source, default_venue_id: int | None, dry_run: bool, limit: int | None, result: CrawlResult | None = None, extract_processes: int = 0, freshness: DetailFreshnessIndex | None = None) -> None:
     if result is None:
         result = CrawlResult()
     all_events: list[dict] = []
@@ -838,21 +881,18 @@ def _process_llm_discovery(profile, source, default_venue_id: int | None, dry_ru
 
     logger.info(f"{profile.slug}: {len(all_events)} LLM events discovered")
 
-    for event in all_events:
-        event = _normalize_discovery_seed_urls(event, profile.discovery.urls[0])
+    all_events = [
+        event
+        for event in (
+            _normalize_discovery_seed_urls(event, profile.discovery.urls[0]) for event in all_events
+        )
+        if event.get("title") and event.get("start_date")
+    ]
+
+    for event, enriched in _iter_detail_enriched(all_events, profile, extract_processes, freshness):
         title = event.get("title")
         start_date = event.get("start_date")
-        if not title or not start_date:
-            continue
-
         detail_url = event.get("detail_url")
-        enriched = {}
-        if detail_url and profile.detail.enabled:
-            html, err = fetch_html(detail_url, profile.detail.fetch)
-            if err:
-                logger.debug(f"Detail fetch failed: {detail_url} - {err}")
-            else:
-                enriched = enrich_from_detail(html, detail_url, profile.name, profile.detail)
         if _should_skip_jsonld_only(profile, detail_url, enriched):
             logger.debug("Skipping (jsonld-only): %s", detail_url or title)
             continue
@@ -1146,6 +1186,22 @@ def main() -> None:
     parser.add_argument("--source", action="append", help="Source slug (repeatable)")
     parser.add_argument("--insert", action="store_true", help="Insert events into DB")
     parser.add_argument("--limit", type=int, default=0, help="Limit seeds per source")
+    parser.add_argument(
+        "--extract-processes",
+        type=int,
+        default=0,
+        help="Run detail extraction in N persistent worker processes (0 = threads)",
+    )
+    parser.add_argument(
+        "--no-extraction-cache",
+        action="store_true",
+        help="Re-run every extractor instead of reusing results for unchanged pages",
+    )
+    parser.add_argument(
+        "--refresh-details",
+        action="store_true",
+        help="Re-fetch every detail page, ignoring the freshness index",
+    )
     parser.add_argument("--post-crawl", action="store_true", help="Run post-crawl health report and HTML dashboard")
     args = parser.parse_args()
 
@@ -1164,6 +1220,10 @@ def main() -> None:
         parser.error("--source is required unless --post-crawl is used")
 
     dry_run = not args.insert
+    configure_extraction_cache(enabled=not args.no_extraction_cache)
+    if args.extract_processes > 0:
+        # One warm pool shared by every --source instead of a pool per profile.
+        configure_extraction_pool(args.extract_processes)
 
     for slug in args.source:
         source = get_source_by_slug(slug)
@@ -1179,7 +1239,12 @@ def main() -> None:
                 logger.debug(f"Could not create crawl_log: {e}")
 
         try:
-            result = run_profile(slug, dry_run=dry_run, limit=args.limit or None)
+            result = run_profile(
+                slug,
+                dry_run=dry_run,
+                limit=args.limit or None,
+                refresh_details=args.refresh_details,
+            )
             record_crawl_success(run_id, result.events_found, result.events_new, result.events_updated)
             if crawl_log_id:
                 update_crawl_log(
@@ -13,9 +13,10 @@ import requests
 from typing import Optional
 from dotenv import load_dotenv
 from db import get_client
-from utils import fetch_page, extract_text_content
+from utils import extract_text_content
 from config import get_config
 from llm_client import generate_text
+from venue_corpus import get_venue_corpus
 from tags import VALID_VIBES, VALID_VENUE_TYPES as CANONICAL_VENUE_TYPES
 
 logger = logging.getLogger(__name__)
@@ -378,8 +379,11 @@ def extract_venue_info_from_website(website_url: str) -> Optional[dict]:
     get_config()
 
     try:
-        # Fetch the website HTML
-        html = fetch_page(website_url)
+        # Fetch the website HTML (shared with the other place enrichers)
+        html = get_venue_corpus().get(website_url)
+        if not html:
+            logger.warning(f"Could not fetch {website_url}")
+            return None
         text_content = extract_text_content(html)
 
         # Truncate if too long
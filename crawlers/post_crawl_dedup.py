@@ -21,6 +21,7 @@ import re
 from datetime import date, timedelta
 
 from db.client import get_client, writes_enabled
+from db.table_reader import iter_rows
 
 logger = logging.getLogger(__name__)
 
@@ -56,47 +57,43 @@ def find_duplicate_clusters(days_ahead: int = 30) -> list[list[dict]]:
     Returns list of clusters, where each cluster is a list of event dicts.
     Only returns clusters with 2+ events from different sources.
 
-    Note: this function fetches all active, non-linked future events in the window
-    and groups them in-process. For large windows (> 90 days) on a large dataset,
-    consider chunking by date range.
+    Events are streamed in (start_date, id) order and grouped one date at a
+    time — every cluster key includes start_date — so only a single day's
+    events are held in memory regardless of the window size.
     """
     client = get_client()
     today = date.today().isoformat()
     future = (date.today() + timedelta(days=days_ahead)).isoformat()
 
-    # Paginate to avoid Supabase default 1,000 row limit
-    PAGE_SIZE = 1000
-    events: list[dict] = []
-    offset = 0
-    while True:
-        result = (
-            client.table("events")
-            .select(
-                "id, title, start_date, start_time, place_id, source_id, "
-                "canonical_event_id, image_url, description, ticket_url, "
-                "created_at, is_active, data_quality"
-            )
-            .gte("start_date", today)
-            .lte("start_date", future)
-            .eq("is_active", True)
-            .is_("canonical_event_id", "null")
-            .order("start_date")
-            .range(offset, offset + PAGE_SIZE - 1)
-            .execute()
-        )
-        page = result.data or []
-        events.extend(page)
-        if len(page) < PAGE_SIZE:
-            break
-        offset += PAGE_SIZE
-
-    logger.info("Loaded %d future active events for dedup analysis", len(events))
+    rows = iter_rows(
+        "events",
+        "id, title, start_date, start_time, place_id, source_id, "
+        "canonical_event_id, image_url, description, ticket_url, "
+        "created_at, is_active, data_quality",
+        [
+            ("gte", ("start_date", today)),
+            ("lte", ("start_date", future)),
+            ("eq", ("is_active", True)),
+            ("is_", ("canonical_event_id", "null")),
+        ],
+        order_by=("start_date", "id"),
+        client=client,
+    )
 
-    # Group by (normalized_title, start_date, place_id)
+    clusters: list[list[dict]] = []
     groups: dict[tuple, list[dict]] = {}
-    for event in events:
-        norm = normalize_title(event.get("title") or "")
+    current_date = None
+    loaded = 0
+    for event in rows:
+        loaded += 1
         start_date = event.get("start_date")
+        if start_date != current_date:
+            clusters.extend(_cross_source_clusters(groups))
+            groups = {}
+            current_date = start_date
+
+        # Group by (normalized_title, start_date, place_id)
+        norm = normalize_title(event.get("title") or "")
         place_id = event.get("place_id") or event.get("venue_id")
 
         # Skip if any key component is missing — can't reliably match
@@ -105,8 +102,14 @@ def find_duplicate_clusters(days_ahead: int = 30) -> list[list[dict]]:
 
         key = (norm, start_date, place_id)
         groups.setdefault(key, []).append(event)
+    clusters.extend(_cross_source_clusters(groups))
+
+    logger.info("Scanned %d future active events for dedup analysis", loaded)
+    return clusters
 
-    # Filter to clusters with events from at least 2 distinct sources
+
+def _cross_source_clusters(groups: dict[tuple, list[dict]]) -> list[list[dict]]:
+    """Filter to clusters with events from at least 2 distinct sources."""
     clusters = []
     for key, group in groups.items():
         source_ids = {e["source_id"] for e in group}
@@ -118,7 +121,6 @@ def find_duplicate_clusters(days_ahead: int = 30) -> list[list[dict]]:
                 source_ids,
                 [e["id"] for e in group],
             )
-
     return clusters
 
 
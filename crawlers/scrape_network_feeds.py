@@ -24,12 +24,19 @@ Usage:
 
     # Prune stale posts (default retention: 7 days)
     python3 scrape_network_feeds.py --retention-days 7
+
+    # Ignore stored ETag/Last-Modified state and re-download every feed
+    python3 scrape_network_feeds.py --full-refresh
+
+Feeds are downloaded concurrently (pooled connections, per-domain pacing) and
+then parsed and inserted one source at a time in name order, so cross-source
+title dedup behaves exactly as in a serial run.
 """
 
 import sys
-import time
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Optional
@@ -42,6 +49,7 @@ load_dotenv(env_path)
 
 sys.path.insert(0, str(Path(__file__).parent))
 from db import get_client
+from feed_fetcher import FeedFetcher, FeedStateStore
 
 try:
     import feedparser
@@ -63,6 +71,10 @@ HEADERS = {
     "Accept": "application/rss+xml, application/atom+xml, application/xml, text/xml, */*",
 }
 
+# Feed downloads in flight at once; requests to one domain stay 1s apart.
+MAX_CONCURRENT_FETCHES = 8
+FETCH_DOMAIN_INTERVAL_SECONDS = 1.0
+
 # Max chars for raw_description storage
 MAX_DESCRIPTION_CHARS = 5000
 DEFAULT_RETENTION_DAYS = 30
@@ -673,15 +685,42 @@ def prune_old_posts(
 # ── Feed fetching & parsing ──────────────────────────────────────────
 
 
-def fetch_feed(feed_url: str, timeout: int = 30) -> Optional[str]:
-    """Fetch raw feed content via HTTP."""
+_FETCHER: Optional[FeedFetcher] = None
+
+
+def _get_fetcher() -> FeedFetcher:
+    global _FETCHER
+    if _FETCHER is None:
+        _FETCHER = FeedFetcher(HEADERS, min_interval=FETCH_DOMAIN_INTERVAL_SECONDS)
+    return _FETCHER
+
+
+class _NotModified:
+    """Sentinel returned by fetch_feed when the server answered 304."""
+
+
+NOT_MODIFIED = _NotModified()
+
+
+def fetch_feed(
+    feed_url: str,
+    timeout: int = 30,
+    state: Optional[FeedStateStore] = None,
+    scope: str = "",
+):
+    """Fetch raw feed content via HTTP.
+
+    Returns the body text, ``NOT_MODIFIED`` when ``state`` holds validators the
+    server accepted, or None on failure.
+    """
     try:
-        resp = requests.get(feed_url, headers=HEADERS, timeout=timeout)
-        resp.raise_for_status()
-        return resp.text
+        resp = _get_fetcher().get_if_changed(feed_url, state, scope, timeout=timeout)
     except requests.RequestException as e:
-        logger.error(f"  Fetch failed: {e}")
+        logger.error(f"  Fetch failed ({feed_url}): {e}")
         return None
+    if resp is None:
+        return NOT_MODIFIED
+    return resp.text
 
 
 def is_wp_json_endpoint(feed_url: str) -> bool:
@@ -747,11 +786,20 @@ class _SyntheticFeed:
         self.bozo_exception = None
 
 
-def fetch_and_parse(feed_url: str):
-    """Return a feedparser-like object for either RSS/Atom or WP-JSON sources."""
-    raw = fetch_feed(feed_url)
+def fetch_and_parse(
+    feed_url: str,
+    state: Optional[FeedStateStore] = None,
+    scope: str = "",
+):
+    """Return a feedparser-like object for either RSS/Atom or WP-JSON sources.
+
+    An unchanged feed (304) comes back as ``(NOT_MODIFIED, None)``.
+    """
+    raw = fetch_feed(feed_url, state=state, scope=scope)
     if raw is None:
         return None, None
+    if raw is NOT_MODIFIED:
+        return NOT_MODIFIED, None
     if is_wp_json_endpoint(feed_url):
         entries = parse_wp_json_posts(raw)
         return raw, _SyntheticFeed(entries)
@@ -890,8 +938,13 @@ def process_source(
     limit: int = 20,
     dry_run: bool = False,
     min_published_at: Optional[datetime] = None,
+    fetched: Optional[tuple] = None,
 ) -> tuple:
-    """Fetch and process a single network source. Returns (found, new)."""
+    """Fetch and process a single network source. Returns (found, new).
+
+    ``fetched`` is a ``fetch_and_parse`` result downloaded ahead of time by
+    the concurrent fetch phase; without it the feed is fetched inline.
+    """
     name = source["name"]
     feed_url = source["feed_url"]
 
@@ -899,7 +952,12 @@ def process_source(
     logger.info(f"  {name}")
     logger.info(f"  {feed_url}")
 
-    raw_xml, parsed_feed = fetch_and_parse(feed_url)
+    raw_xml, parsed_feed = fetched if fetched is not None else fetch_and_parse(feed_url)
+    if raw_xml is NOT_MODIFIED:
+        logger.info("  Feed unchanged since last run")
+        if not dry_run:
+            update_source_status(source["id"])
+        return 0, 0
     if not raw_xml or parsed_feed is None:
         if not dry_run:
             update_source_status(source["id"], error="Fetch failed")
@@ -1004,6 +1062,8 @@ def main():
         default=DEFAULT_RETENTION_DAYS,
         help=f"Prune posts older than this many days (default: {DEFAULT_RETENTION_DAYS}, 0 disables)",
     )
+    parser.add_argument("--full-refresh", action="store_true",
+                        help="Ignore stored ETag/Last-Modified state and re-download every feed")
     args = parser.parse_args()
 
     if args.verbose:
@@ -1040,14 +1100,35 @@ def main():
     if args.retention_days > 0:
         min_published_at = datetime.now(timezone.utc) - timedelta(days=args.retention_days)
 
-    for source in sources:
+    # Dry runs never persist validators, so they can't hide posts from a real run.
+    state = None if args.full_refresh or args.dry_run else FeedStateStore()
+
+    def _fetch(source: dict):
+        try:
+            return fetch_and_parse(source["feed_url"], state=state, scope=source["slug"])
+        except Exception as e:
+            logger.error(f"  Fetch failed for {source['name']}: {e}")
+            return None, None
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(sources))) as pool:
+        fetched_feeds = list(pool.map(_fetch, sources))
+
+    for source, fetched in zip(sources, fetched_feeds):
         try:
             found, new = process_source(
                 source,
                 limit=args.limit,
                 dry_run=args.dry_run,
                 min_published_at=min_published_at,
+                fetched=fetched,
             )
+            if state is not None:
+                # A feed that hit --limit still has unimported entries; keep
+                # its validators stale so the next run downloads it again.
+                if new >= args.limit:
+                    state.discard(source["slug"])
+                else:
+                    state.commit(source["slug"])
             total_found += found
             total_new += new
             source_results.append({
@@ -1067,9 +1148,11 @@ def main():
             })
             if not args.dry_run:
                 update_source_status(source["id"], error=str(e)[:200])
+            if state is not None:
+                state.discard(source["slug"])
 
-        # Be polite between sources
-        time.sleep(1)
+    if state is not None:
+        state.save()
 
     source_id_for_prune = sources[0]["id"] if args.source and len(sources) == 1 else None
     pruned = prune_old_posts(
@@ -15,12 +15,10 @@ Usage:
 
 import sys
 import re
-import json
-import time
 import subprocess
+import json
 import logging
 import argparse
-import requests
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -35,17 +33,11 @@ load_dotenv(env_path)
 sys.path.insert(0, str(Path(__file__).parent))
 from db import get_client
 from hours_utils import prepare_hours_update, should_update_hours
+from venue_corpus import close_venue_corpus, get_venue_corpus
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
-# Request settings
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.5",
-}
-
 # Day name mappings
 DAY_NAMES = {
     "monday": "mon",
@@ -424,20 +416,20 @@ def get_hours_from_text(soup: BeautifulSoup) -> Optional[dict]:
 def scrape_hours_from_website(url: str) -> Optional[dict]:
     """Scrape operating hours from a website."""
     try:
-        try:
-            response = requests.get(
-                url, headers=HEADERS, timeout=10, allow_redirects=True
-            )
-            response.raise_for_status()
-            html = response.text
-        except requests.exceptions.RequestException:
-            # Some venues block requests-based clients but allow curl/browser fetches.
+        # The shared corpus handles caching, pacing and the browser fallback
+        # for venues that block requests-based clients.
+        corpus = get_venue_corpus()
+        html = corpus.get(url)
+        if not html and corpus.last_fetch_failed():
+            # Some venues drop requests-based connections but allow curl fetches.
             html = subprocess.run(
                 ["curl", "-L", "--max-time", "20", "--silent", "--show-error", url],
                 capture_output=True,
                 text=True,
                 check=True,
             ).stdout
+        if not html:
+            return None
 
         soup = BeautifulSoup(html, "html.parser")
 
@@ -462,9 +454,6 @@ def scrape_hours_from_website(url: str) -> Optional[dict]:
 
         return None
 
-    except requests.exceptions.Timeout:
-        logger.debug(f"    Timeout: {url}")
-        return None
     except Exception as e:
         logger.debug(f"    Error: {e}")
         return None
@@ -620,8 +609,7 @@ def main():
             logger.info(f"  NO HOURS: {name} ({website[:40]}...)")
             failed += 1
 
-        # Be nice to servers
-        time.sleep(1)
+    close_venue_corpus()
 
     logger.info("")
     logger.info("=" * 60)
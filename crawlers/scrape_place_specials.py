@@ -34,18 +34,15 @@ Usage:
 import re
 import sys
 import json
-import time
 import math
 import logging
 import argparse
-import xml.etree.ElementTree as ET
 import html as html_lib
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
-import requests
 from playwright.sync_api import sync_playwright
 
 env_path = Path(__file__).parent.parent / ".env"
@@ -56,8 +53,10 @@ load_dotenv(env_path)
 sys.path.insert(0, str(Path(__file__).parent))
 from config import get_config
 from db import get_client, insert_event
+from extractors.content_reduction import CHARS_PER_TOKEN, reduce_html
 from llm_client import generate_text
 from hours_utils import prepare_hours_update, should_update_hours
+from venue_corpus import close_venue_corpus, get_venue_corpus
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -395,24 +394,17 @@ def _close_browser():
 
 
 def fetch_page_playwright(url: str) -> Optional[str]:
-    """Fetch a page using headless Chromium. Used as fallback for bot-protected sites."""
-    try:
-        browser = _get_browser()
-        context = browser.new_context(
-            user_agent=HEADERS["User-Agent"],
-            viewport={"width": 1920, "height": 1080},
-        )
-        try:
-            page = context.new_page()
-            page.goto(url, wait_until="domcontentloaded", timeout=30000)
-            page.wait_for_timeout(2000)
-            html = page.content()
-            return html
-        finally:
-            context.close()
-    except Exception as e:
-        logger.debug(f"  Playwright fetch failed: {e}")
-        return None
+    """Fetch a page using headless Chromium. Used as fallback for bot-protected sites.
+
+    Rendered pages are stored in the shared venue corpus, so other enrichers
+    reuse them instead of launching their own browser.
+    """
+    global _playwright_fallback_count
+    corpus = get_venue_corpus()
+    html = corpus.get(url, render_js=True)
+    if html and corpus.last_source() == "playwright":
+        _playwright_fallback_count += 1
+    return html
 
 
 def _normalize_day(day_str: str) -> Optional[str]:
@@ -1384,52 +1376,39 @@ def _extract_popmenu_embedded_text(html: str) -> list[str]:
 def fetch_page(
     url: str, timeout: int = 10, use_playwright: bool = True
 ) -> Optional[str]:
-    """Fetch a URL and return HTML. Falls back to Playwright on 403."""
-    global _playwright_fallback_count
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=timeout, allow_redirects=True)
-        if resp.status_code == 200:
-            return resp.text
-        if resp.status_code == 403 and use_playwright:
-            logger.debug("  Retrying with browser (got 403)")
-            html = fetch_page_playwright(url)
-            if html:
-                _playwright_fallback_count += 1
-            return html
-        return None
-    except (requests.ConnectionError, requests.Timeout) as e:
-        if use_playwright:
-            logger.debug(
-                f"  Connection failed ({e.__class__.__name__}), trying browser"
-            )
-            html = fetch_page_playwright(url)
-            if html:
-                _playwright_fallback_count += 1
-            return html
-        return None
-    except Exception:
-        return None
-
+    """Fetch a URL and return HTML. Falls back to Playwright on 403.
 
-def extract_page_content(html: str, max_chars: int = 12000) -> str:
-    """Extract meaningful text from HTML, stripping scripts/styles/nav."""
-    popmenu_lines = _extract_popmenu_embedded_text(html)
-    soup = BeautifulSoup(html, "html.parser")
+    Served from the shared venue corpus when the page was fetched within the
+    freshness window (by this or any other place enricher).
+    """
+    global _playwright_fallback_count
+    corpus = get_venue_corpus()
+    html = corpus.get(url, timeout=timeout, allow_playwright=use_playwright)
+    # Count real browser renders only, not corpus hits on pages rendered earlier.
+    if html and corpus.last_source() == "playwright":
+        _playwright_fallback_count += 1
+    return html
 
-    # Remove non-content elements
-    for tag in soup.find_all(
-        ["script", "style", "nav", "footer", "header", "noscript", "iframe"]
-    ):
-        tag.decompose()
 
-    text = soup.get_text(separator="\n", strip=True)
+def extract_page_content(html: str, max_chars: int = 12000, url: Optional[str] = None) -> str:
+    """Reduce HTML to the text most likely to hold specials/hours, within max_chars.
 
-    # Collapse multiple newlines
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    text = "\n".join(lines)
+    Uses the shared LLM-input reducer (scripts/styles dropped, site template
+    lines and nav/footer ranked last); embedded Popmenu items are appended.
+    """
+    popmenu_lines = _extract_popmenu_embedded_text(html)
+    popmenu_text = "\n".join(popmenu_lines)
+    budget_chars = max(0, max_chars - len(popmenu_text) - 1) if popmenu_lines else max_chars
+    reduced = reduce_html(
+        html,
+        url,
+        token_budget=budget_chars // CHARS_PER_TOKEN,
+        caller="place_specials",
+    )
+    text = reduced.text
 
     if popmenu_lines:
-        text = text + "\n" + "\n".join(popmenu_lines)
+        text = text + "\n" + popmenu_text
 
     return text[:max_chars]
 
@@ -1452,24 +1431,7 @@ def _fetch_sitemap_urls(base_url: str) -> list[str]:
     that list every page — more reliable than parsing <a> tags from JS-heavy sites.
     Returns empty list on 404 or parse failure.
     """
-    sitemap_url = base_url.rstrip("/") + "/sitemap.xml"
-    base_netloc = urlparse(base_url).netloc
-    try:
-        resp = requests.get(sitemap_url, headers=HEADERS, timeout=5)
-        if resp.status_code != 200:
-            return []
-        root = ET.fromstring(resp.text)
-        urls = []
-        # Handle namespaced and non-namespaced sitemaps
-        for elem in root.iter():
-            if elem.tag.endswith("loc") and elem.text:
-                url = elem.text.strip()
-                parsed = urlparse(url)
-                if parsed.netloc == base_netloc:
-                    urls.append(url)
-        return urls
-    except Exception:
-        return []
+    return get_venue_corpus().sitemap_urls(base_url)
 
 
 def discover_relevant_pages(html: str, base_url: str, max_pages: int = 5) -> list[str]:
@@ -2247,16 +2209,13 @@ def fetch_venue_content(
     if not main_html and use_playwright:
         logger.info("  Using browser fallback (got 403)")
         main_html = fetch_page_playwright(website)
-        global _playwright_fallback_count
-        if main_html:
-            _playwright_fallback_count += 1
     if not main_html:
         logger.info("  Could not fetch main page")
         return None
 
     # Extract meta info and links from HTML
     meta = extract_meta_and_links(main_html, website)
-    main_text = extract_page_content(main_html, max_chars=10000)
+    main_text = extract_page_content(main_html, max_chars=10000, url=website)
     if _looks_like_parked_site(main_text) or _looks_like_parked_site(main_html):
         logger.info("  Website appears to be a parked or placeholder domain; skipping")
         return None
@@ -2283,7 +2242,7 @@ def fetch_venue_content(
             break
         html = fetch_page(url, timeout=5, use_playwright=use_playwright)
         if html:
-            text = extract_page_content(html, max_chars=3000)
+            text = extract_page_content(html, max_chars=3000, url=url)
             if (
                 len(text) > 100 and text != main_text[: len(text)]
             ):  # Skip if same as main
@@ -2300,7 +2259,7 @@ def fetch_venue_content(
             logger.debug(f"  Fetching FB about page: {fb_url}")
             fb_html = _fetch_fb_about_html(fb_url)
             if fb_html:
-                fb_text = extract_page_content(fb_html, max_chars=2000)
+                fb_text = extract_page_content(fb_html, max_chars=2000, url=fb_url)
                 if fb_text and len(fb_text) < 50:
                     fb_text = None
                 # Store HTML for structured bio extraction later (after LLM pass)
@@ -3078,10 +3037,9 @@ def main():
 
                 logger.info(f"  Saved {len(combined)} chars → {dump_file.name}")
                 dumped += 1
-
-                time.sleep(1)
         finally:
             _close_browser()
+            close_venue_corpus()
 
         logger.info("=" * 60)
         logger.info(f"Done! Dumped {dumped} venues, {failed} failed")
@@ -3205,11 +3163,9 @@ def main():
             totals["holiday_specials"] += stats["holiday_specials_added"]
             if stats["venue_updated"]:
                 totals["venues_updated"] += 1
-
-            # Be polite — 1 second between requests
-            time.sleep(1)
     finally:
         _close_browser()
+        close_venue_corpus()
 
     totals["playwright_fallbacks"] = _playwright_fallback_count
 
@@ -18,7 +18,6 @@ Usage:
 """
 
 import sys
-import time
 import json
 import re
 import logging
@@ -26,7 +25,6 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
-import requests
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
@@ -36,6 +34,7 @@ load_dotenv(env_path)
 
 sys.path.insert(0, str(Path(__file__).parent))
 from db.client import get_client
+from venue_corpus import close_venue_corpus, get_venue_corpus
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -55,14 +54,6 @@ T1_TYPES = {
     "stadium", "convention_center", "aquarium", "zoo", "farmers_market",
 }
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.5",
-}
 
 MAX_DESCRIPTION_LEN = 500
 
@@ -269,22 +260,14 @@ def scrape_description(url: str, venue_name: str = "") -> Optional[str]:
         logger.debug(f"  Skipping social URL: {url}")
         return None
 
-    try:
-        resp = requests.get(url, headers=HEADERS, timeout=12, allow_redirects=True)
-        resp.raise_for_status()
-        # Skip non-HTML responses
-        content_type = resp.headers.get("content-type", "")
-        if "html" not in content_type.lower():
-            return None
-    except requests.exceptions.Timeout:
-        logger.debug(f"  Timeout: {url}")
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.debug(f"  Request error ({url}): {e}")
+    # Non-HTML responses are recorded as misses by the corpus.
+    html = get_venue_corpus().get(url, timeout=12)
+    if not html:
+        logger.debug(f"  No HTML: {url}")
         return None
 
     try:
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
     except Exception as e:
         logger.debug(f"  Parse error ({url}): {e}")
         return None
@@ -395,8 +378,7 @@ def main():
                     logger.info(f"{prefix} DB ERROR   {name}")
                     errors += 1
 
-        # Polite crawl delay
-        time.sleep(0.75)
+    close_venue_corpus()
 
     logger.info("")
     logger.info("=" * 65)
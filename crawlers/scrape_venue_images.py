@@ -14,10 +14,8 @@ Usage:
 """
 
 import sys
-import time
 import logging
 import argparse
-import requests
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin, urlparse
@@ -31,17 +29,11 @@ load_dotenv(env_path)
 # Add parent to path for db module
 sys.path.insert(0, str(Path(__file__).parent))
 from db import get_client
+from venue_corpus import close_venue_corpus, get_venue_corpus
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
-# Request settings
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-    "Accept-Language": "en-US,en;q=0.5",
-}
-
 # Minimum image dimensions to consider
 MIN_WIDTH = 400
 MIN_HEIGHT = 300
@@ -234,10 +226,11 @@ def get_large_image(soup: BeautifulSoup, base_url: str) -> Optional[str]:
 def scrape_image_from_website(url: str) -> Optional[str]:
     """Scrape a hero/og image from a website."""
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10, allow_redirects=True)
-        response.raise_for_status()
+        html = get_venue_corpus().get(url)
+        if not html:
+            return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(html, "html.parser")
 
         # Try methods in order of reliability
         image = get_og_image(soup, url)
@@ -254,12 +247,6 @@ def scrape_image_from_website(url: str) -> Optional[str]:
 
         return None
 
-    except requests.exceptions.Timeout:
-        logger.debug(f"    Timeout: {url}")
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.debug(f"    Request error: {e}")
-        return None
     except Exception as e:
         logger.debug(f"    Error: {e}")
         return None
@@ -360,8 +347,7 @@ def main():
             logger.info(f"  NO IMAGE: {name} ({website[:40]}...)")
             failed += 1
 
-        # Be nice to servers
-        time.sleep(1)
+    close_venue_corpus()
 
     logger.info("")
     logger.info("=" * 60)
@@ -50,6 +50,7 @@ from scrape_place_specials import (
     _get_browser,
     HEADERS,
 )
+from venue_corpus import close_venue_corpus
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -224,7 +225,7 @@ def dump_menu_pages(venues, dump_dir, use_playwright=True, enhanced=False):
                     failed += 1
                     continue
 
-            text = extract_page_content(html, max_chars=MENU_MAX_CHARS)
+            text = extract_page_content(html, max_chars=MENU_MAX_CHARS, url=menu_url)
             if len(text.strip()) < 50:
                 logger.info(f"  Too little content ({len(text)} chars), skipping")
                 failed += 1
@@ -254,10 +255,12 @@ def dump_menu_pages(venues, dump_dir, use_playwright=True, enhanced=False):
             logger.info(f"  Saved {len(text)} chars → {dump_file.name}")
             dumped += 1
 
-            # Be polite to servers
-            time.sleep(1)
+            # Corpus fetches are paced per domain; the enhanced browser path is not.
+            if enhanced:
+                time.sleep(1)
     finally:
         _close_browser()
+        close_venue_corpus()
 
     return dumped, failed, skipped
 
@@ -26,6 +26,7 @@ load_dotenv(ROOT / ".env")
 sys.path.insert(0, str(ROOT))
 
 from db import get_client
+from db.table_reader import iter_rows
 
 
 TRAIL_NAME_RE = re.compile(r"\b(trail|trailhead|greenway|path|beltline|riverwalk)\b", re.IGNORECASE)
@@ -37,26 +38,7 @@ STATE_PARK_RE = re.compile(r"\bstate park\b", re.IGNORECASE)
 
 
 def fetch_rows(client: Any, table: str, fields: str) -> list[dict[str, Any]]:
-    rows: list[dict[str, Any]] = []
-    offset = 0
-    page_size = 1000
-    while True:
-        batch = (
-            client.table(table)
-            .select(fields)
-            .order("id")
-            .range(offset, offset + page_size - 1)
-            .execute()
-            .data
-            or []
-        )
-        if not batch:
-            break
-        rows.extend(batch)
-        if len(batch) < page_size:
-            break
-        offset += page_size
-    return rows
+    return list(iter_rows(table, fields, client=client))
 
 
 def fmt_examples(rows: list[dict[str, Any]], limit: int = 12) -> list[str]:
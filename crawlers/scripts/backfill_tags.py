@@ -5,7 +5,7 @@ One-time script to add inferred tags to events already in the database.
 """
 
 import logging
-from db import get_all_events, get_venue_by_id, update_event_tags
+from db import get_all_events, get_venue_by_id, update_event_tags_bulk
 from tag_inference import infer_tags
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
@@ -38,6 +38,7 @@ def backfill_tags(dry_run: bool = False, batch_size: int = 100) -> dict:
         if not events:
             break
 
+        pending: dict[int, list[str]] = {}
         for event in events:
             stats["total"] += 1
             event_id = event["id"]
@@ -55,7 +56,7 @@ def backfill_tags(dry_run: bool = False, batch_size: int = 100) -> dict:
                             "place_type": venue.get("place_type") if venue else None,
                         }
                     venue_vibes = venue_cache[venue_id]["vibes"]
-                    venue_type = venue_cache[venue_id]["venue_type"]
+                    venue_type = venue_cache[venue_id]["place_type"]
                 else:
                     venue_type = None
 
@@ -70,7 +71,7 @@ def backfill_tags(dry_run: bool = False, batch_size: int = 100) -> dict:
                             f"[DRY RUN] Event {event_id}: {old_tags} -> {new_tags}"
                         )
                     else:
-                        update_event_tags(event_id, new_tags)
+                        pending[event_id] = new_tags
                         logger.info(f"Updated event {event_id}: {old_tags} -> {new_tags}")
                     stats["updated"] += 1
                 else:
@@ -80,6 +81,15 @@ def backfill_tags(dry_run: bool = False, batch_size: int = 100) -> dict:
                 logger.error(f"Error processing event {event_id}: {e}")
                 stats["errors"] += 1
 
+        # One write per batch (a single UPDATE on the direct write backend).
+        if pending:
+            try:
+                update_event_tags_bulk(pending)
+            except Exception as e:
+                logger.error(f"Error writing tags for {len(pending)} events: {e}")
+                stats["updated"] -= len(pending)
+                stats["errors"] += len(pending)
+
         offset += batch_size
         logger.info(f"Processed {offset} events...")
 
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for representative crawlers, replayed offline.
+
+Each source is replayed from its cassette (see crawl_replay.py) so the numbers
+reflect parsing and the insert pipeline, not the network or the database.
+Reports events/sec and where the time went: HTTP/page serving, DB stand-in,
+each insert-pipeline step (excluding DB calls made from inside it), and the
+remainder — the crawler's own fetching/parsing code.
+
+The default set covers the main crawler families:
+  atlanta-history-center    Tribe Events API base
+  cobb-adult-swim-lessons   Rec1 base
+  eventbrite                Eventbrite API aggregator
+  regal-atlanta             chain cinema base (Playwright)
+  13-stories                profile-only source (pipeline fallback)
+
+Usage:
+  python3 crawl_replay.py record atlanta-history-center regal-atlanta   # once, live
+  python3 scripts/benchmark_crawlers.py
+  python3 scripts/benchmark_crawlers.py --repeat 3 --allocations --json out.json
+  python3 scripts/benchmark_crawlers.py --baseline out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from crawl_replay import CASSETTE_DIR, Cassette, ReplayStats, cassette_path, replaying, run_source_crawl
+
+DEFAULT_SLUGS = (
+    "atlanta-history-center",
+    "cobb-adult-swim-lessons",
+    "eventbrite",
+    "regal-atlanta",
+    "13-stories",
+)
+
+
+@contextmanager
+def _timed_pipeline(stats: ReplayStats) -> Iterator[dict[str, float]]:
+    """Time each INSERT_PIPELINE step in place; DB time inside a step is excluded."""
+    from db import events
+
+    timings: dict[str, float] = defaultdict(float)
+    original = list(events.INSERT_PIPELINE)
+
+    def wrap(step):
+        name = step.__name__.removeprefix("_step_")
+
+        def timed(event_data, ctx):
+            db_before = stats.db_seconds
+            started = time.perf_counter()
+            try:
+                return step(event_data, ctx)
+            finally:
+                timings[name] += time.perf_counter() - started - (stats.db_seconds - db_before)
+
+        return timed
+
+    events.INSERT_PIPELINE[:] = [wrap(step) for step in original]
+    try:
+        yield timings
+    finally:
+        events.INSERT_PIPELINE[:] = original
+
+
+def bench_source(slug: str, root: Path, allocations: bool) -> dict:
+    from db import configure_write_mode
+
+    cassette = Cassette.load(cassette_path(slug, root))
+    configure_write_mode(True)
+    if allocations:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with replaying(cassette) as session, _timed_pipeline(session.stats) as steps:
+        found, new, updated = run_source_crawl(slug)
+    elapsed = time.perf_counter() - started
+    peak = None
+    if allocations:
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    stats = session.stats
+    pipeline = sum(steps.values())
+    return {
+        "slug": slug,
+        "events": found,
+        "new": new,
+        "updated": updated,
+        "seconds": elapsed,
+        "events_per_sec": found / elapsed if elapsed else 0.0,
+        "peak_bytes": peak,
+        "stages": {
+            "http": stats.http_seconds,
+            "db": stats.db_seconds,
+            "pipeline": pipeline,
+            "crawler": max(0.0, elapsed - stats.http_seconds - stats.db_seconds - pipeline),
+        },
+        "pipeline_steps": dict(sorted(steps.items(), key=lambda kv: -kv[1])),
+        "misses": {"http": stats.http_misses, "db_reads": stats.db_read_misses},
+    }
+
+
+def _best(runs: list[dict]) -> dict:
+    return min(runs, key=lambda r: r["seconds"])
+
+
+def _print_result(result: dict, baseline: Optional[dict], top_steps: int) -> None:
+    line = (
+        f"{result['slug']:<28} {result['events']:>6} events  {result['seconds']:7.2f}s  "
+        f"{result['events_per_sec']:8.1f} ev/s"
+    )
+    if result["peak_bytes"] is not None:
+        line += f"  peak {result['peak_bytes'] / (1024 * 1024):7.1f} MiB"
+    if baseline and baseline.get("events_per_sec"):
+        change = result["events_per_sec"] / baseline["events_per_sec"] - 1
+        line += f"  ({change:+.1%} vs baseline)"
+    print(line)
+
+    total = result["seconds"] or 1.0
+    stages = "  ".join(f"{name} {secs / total:5.1%}" for name, secs in result["stages"].items())
+    print(f"    {stages}")
+    for name, secs in list(result["pipeline_steps"].items())[:top_steps]:
+        print(f"      {name:<24} {secs * 1000:9.1f} ms")
+    if result["misses"]["http"] or result["misses"]["db_reads"]:
+        print(
+            f"    cassette misses: {result['misses']['http']} http, "
+            f"{result['misses']['db_reads']} db reads (re-record if the crawler changed)"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Offline crawler throughput benchmark.")
+    parser.add_argument("slugs", nargs="*", default=list(DEFAULT_SLUGS))
+    parser.add_argument("--cassette-dir", default=str(CASSETTE_DIR))
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per source; the fastest is reported.")
+    parser.add_argument("--allocations", action="store_true", help="Track peak Python allocations.")
+    parser.add_argument("--top-steps", type=int, default=5, help="Slowest pipeline steps to list.")
+    parser.add_argument("--json", dest="json_out", help="Write results to this JSON file.")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    root = Path(args.cassette_dir)
+    baseline = {}
+    if args.baseline:
+        baseline = {r["slug"]: r for r in json.loads(Path(args.baseline).read_text())}
+
+    results = []
+    for slug in args.slugs:
+        if not cassette_path(slug, root).exists():
+            print(f"{slug:<28} no cassette — run: python3 crawl_replay.py record {slug}")
+            continue
+        runs = [bench_source(slug, root, args.allocations) for _ in range(max(1, args.repeat))]
+        result = _best(runs)
+        results.append(result)
+        _print_result(result, baseline.get(slug), args.top_steps)
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark and cross-check date parsing against the plain dateutil path.
+
+Builds a corpus of date-like strings (string literals harvested from crawler
+sources and tests, or a file with one string per line), then:
+  - verifies the fast path in date_utils.parse_human_date returns exactly
+    what the uncached dateutil path returns, listing any mismatches;
+  - times the dateutil path, the fast path with caching disabled, and the
+    cached path (one cold and one warm pass), in microseconds per string.
+
+Usage:
+  python3 scripts/benchmark_date_parsing.py
+  python3 scripts/benchmark_date_parsing.py --corpus dates.txt --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import re
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Callable, Iterable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import date_utils  # noqa: E402
+from date_utils import MAX_FUTURE_DAYS_DEFAULT, ROLLOVER_GRACE_DAYS_DEFAULT  # noqa: E402
+
+_DATE_LIKE_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+\d{1,2}\b"
+    r"|\b\d{1,2}(?:st|nd|rd|th)?\s+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)"
+    r"|^\d{4}-\d{2}-\d{2}|^\d{1,2}/\d{1,2}/\d{2,4}$",
+    re.IGNORECASE,
+)
+
+
+def harvest_corpus(paths: Iterable[Path], max_len: int = 60) -> list[str]:
+    """Collect short date-like string literals from Python files."""
+    seen: dict[str, None] = {}
+    for path in paths:
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                value = node.value.strip()
+                if value and len(value) <= max_len and _DATE_LIKE_RE.search(value):
+                    seen.setdefault(value, None)
+    return list(seen)
+
+
+def _dateutil_only(value: str, today: date) -> str | None:
+    return date_utils._parse_human_date(
+        value, None, today, MAX_FUTURE_DAYS_DEFAULT, ROLLOVER_GRACE_DAYS_DEFAULT, fast=False
+    )
+
+
+def _fast_uncached(value: str, today: date) -> str | None:
+    return date_utils._parse_human_date(value, None, today, MAX_FUTURE_DAYS_DEFAULT, ROLLOVER_GRACE_DAYS_DEFAULT)
+
+
+def _cached(value: str, today: date) -> str | None:
+    return date_utils.parse_human_date(value, today=today)
+
+
+def _time_per_item(fn: Callable[[str, date], object], corpus: list[str], today: date, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for value in corpus:
+            fn(value, today)
+        best = min(best, time.perf_counter() - started)
+    return best / max(len(corpus), 1) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, help="File with one date string per line")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing passes (best is reported)")
+    parser.add_argument("--today", default=None, help="Reference date (YYYY-MM-DD); defaults to today")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = [line.strip() for line in args.corpus.read_text(encoding="utf-8").splitlines() if line.strip()]
+    else:
+        corpus = harvest_corpus(sorted((ROOT / "sources").glob("*.py")) + sorted((ROOT / "tests").glob("*.py")))
+    today = date.fromisoformat(args.today) if args.today else date.today()
+    if not corpus:
+        print("empty corpus")
+        return 1
+
+    fast_hits = sum(
+        1
+        for value in corpus
+        if date_utils._fast_parse_date(value, today.year) is not None
+    )
+    mismatches = [
+        (value, expected, actual)
+        for value in corpus
+        if (expected := _dateutil_only(value, today)) != (actual := _fast_uncached(value, today))
+    ]
+
+    print(f"corpus: {len(corpus)} strings, fast path handles {fast_hits} ({fast_hits / len(corpus):.0%})")
+    print(f"mismatches vs dateutil: {len(mismatches)}")
+    for value, expected, actual in mismatches[:20]:
+        print(f"  {value!r}: dateutil={expected} fast={actual}")
+
+    dateutil_us = _time_per_item(_dateutil_only, corpus, today, args.repeat)
+    fast_us = _time_per_item(_fast_uncached, corpus, today, args.repeat)
+    date_utils._parse_human_date_cached.cache_clear()
+    cold_us = _time_per_item(_cached, corpus, today, 1)
+    warm_us = _time_per_item(_cached, corpus, today, args.repeat)
+
+    print(f"{'path':<22}{'us/string':>10}{'speedup':>9}")
+    for label, us in (
+        ("dateutil", dateutil_us),
+        ("fast path, uncached", fast_us),
+        ("cached, cold", cold_us),
+        ("cached, warm", warm_us),
+    ):
+        print(f"{label:<22}{us:>10.2f}{dateutil_us / us if us else float('inf'):>8.1f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: prefetched events as dicts vs compact EventRecords.
+
+Simulates prefetch_events_by_source() for a high-volume cinema source
+(20k showtimes by default, every events column selected) and reports the
+resident size of the content_hash index in each representation.
+
+Usage:
+  python3 scripts/benchmark_event_records.py
+  python3 scripts/benchmark_event_records.py --rows 50000 --columns 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from db.event_records import RecordTable
+
+BASE_COLUMNS = [
+    "id", "source_id", "place_id", "title", "description", "start_date", "start_time",
+    "end_date", "end_time", "is_all_day", "category_id", "tags", "genres", "price_min",
+    "price_max", "price_note", "is_free", "source_url", "ticket_url", "image_url",
+    "content_hash", "is_active", "series_id", "canonical_event_id", "data_quality",
+    "created_at", "updated_at", "film_title", "film_release_year", "film_imdb_id",
+]
+
+
+def _showtime_rows(count: int, columns: int) -> list[dict]:
+    extra = [f"extra_col_{i}" for i in range(max(0, columns - len(BASE_COLUMNS)))]
+    films = [f"Film {n}" for n in range(40)]
+    start = date(2026, 1, 1)
+    rows = []
+    for i in range(count):
+        film = films[i % len(films)]
+        row = {col: None for col in BASE_COLUMNS + extra}
+        row.update(
+            id=100_000 + i,
+            source_id=42,
+            place_id=7,
+            title=film,
+            description=f"{film} in 35mm.",
+            start_date=(start + timedelta(days=i // 60)).isoformat(),
+            start_time=f"{12 + i % 10:02d}:00:00",
+            category_id="film",
+            tags=["film", "showtime"],
+            source_url=f"https://cinema.example/showtimes/{i}",
+            content_hash=f"{i:032x}",
+            is_active=True,
+            data_quality=80,
+            film_title=film,
+        )
+        rows.append(row)
+    return rows
+
+
+def _measure(build) -> tuple[object, int]:
+    tracemalloc.start()
+    result = build()
+    size, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare dict vs EventRecord prefetch memory.")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--columns", type=int, default=95, help="Columns per select * row.")
+    args = parser.parse_args()
+
+    _, dict_bytes = _measure(
+        lambda: {r["content_hash"]: r for r in _showtime_rows(args.rows, args.columns)}
+    )
+    _, record_bytes = _measure(
+        lambda: RecordTable.from_rows(_showtime_rows(args.rows, args.columns)).index_by("content_hash")
+    )
+
+    mib = 1024 * 1024
+    print(f"rows={args.rows} columns={args.columns}")
+    print(f"  dict rows:     {dict_bytes / mib:8.1f} MiB")
+    print(f"  EventRecords:  {record_bytes / mib:8.1f} MiB")
+    print(f"  reduction:     {1 - record_bytes / dict_bytes:8.1%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
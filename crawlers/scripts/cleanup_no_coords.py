@@ -16,7 +16,6 @@ Usage:
 """
 
 import re
-import time
 import argparse
 import logging
 from typing import Optional
@@ -228,7 +227,6 @@ def phase2_geocode(client, venues: list[dict], dry_run: bool = False,
         if not result:
             stats["failed"] += 1
             logger.warning(f"[{i}/{total}] Failed: {name} — {address}, {city}, {state}")
-            time.sleep(1.1)
             continue
 
         lat, lng = result
@@ -237,7 +235,6 @@ def phase2_geocode(client, venues: list[dict], dry_run: bool = False,
         if is_city_center_fallback(lat, lng):
             stats["skipped_city_center"] += 1
             logger.info(f"[{i}/{total}] Skipped city-center fallback: {name} -> ({lat}, {lng})")
-            time.sleep(1.1)
             continue
 
         client.table("places").update({"lat": lat, "lng": lng}).eq("id", vid).execute()
@@ -245,8 +242,6 @@ def phase2_geocode(client, venues: list[dict], dry_run: bool = False,
         stats["details"].append({"id": vid, "name": name, "lat": lat, "lng": lng})
         logger.info(f"[{i}/{total}] Geocoded: {name} -> ({lat:.4f}, {lng:.4f})")
 
-        time.sleep(1.1)  # Nominatim rate limit
-
     return stats
 
 
@@ -6,12 +6,14 @@ Usage:
   python3 scripts/festival_extraction_benchmark.py
   python3 scripts/festival_extraction_benchmark.py --providers openai,anthropic
   python3 scripts/festival_extraction_benchmark.py --update-overrides
+  python3 scripts/festival_extraction_benchmark.py --reduction-report
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import re
 import sys
 from dataclasses import dataclass
 from datetime import date
@@ -33,6 +35,8 @@ from crawl_festival_schedule import (
     extract_sessions_wp_events_calendar,
     fetch_html,
 )
+from extract import EXTRACTION_TOKEN_BUDGET
+from extractors.content_reduction import estimate_tokens, reduce_html, reduction_stats
 
 DEFAULT_EVAL_SET = Path(__file__).resolve().parents[1] / "config" / "festival_extraction_eval_set.json"
 DEFAULT_OVERRIDES = Path(__file__).resolve().parents[1] / "config" / "festival_llm_provider_overrides.json"
@@ -146,6 +150,50 @@ def _evaluate_case(case: dict[str, Any], providers: list[str]) -> tuple[str, dic
     return slug, scores, structured_summary
 
 
+_SIGNAL_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.? \d{1,2}\b|\b\d{1,2}(?::\d{2})? ?[ap]\.?m\b",
+    re.IGNORECASE,
+)
+
+
+def _legacy_llm_input(html: str) -> str:
+    """What extract_events sent before content reduction: stripped HTML, cut at 50k chars."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup.find_all(["script", "style", "noscript", "link", "meta", "svg", "iframe"]):
+        tag.decompose()
+    if soup.head:
+        soup.head.decompose()
+    for tag in soup.find_all(["nav", "footer"]):
+        tag.decompose()
+    return str(soup)[:50000]
+
+
+def _signals(text: str) -> set[str]:
+    return {re.sub(r"\W+", "", match).lower() for match in _SIGNAL_RE.findall(text)}
+
+
+def _reduction_report(cases: list[dict[str, Any]]) -> None:
+    """Compare legacy and reduced LLM inputs per case: size and date/time signals kept."""
+    from bs4 import BeautifulSoup
+
+    print("slug|html_bytes|legacy_tokens|reduced_tokens|signals|legacy_kept|reduced_kept")
+    for case in cases:
+        slug = str(case.get("slug", "")).strip()
+        url = str(case.get("url", "")).strip()
+        html = fetch_html(url, render_js=False) or ""
+        page_signals = _signals(BeautifulSoup(html, "lxml").get_text(" ")) if html else set()
+        legacy = _legacy_llm_input(html) if html else ""
+        reduced = reduce_html(html, url, token_budget=EXTRACTION_TOKEN_BUDGET, caller="benchmark")
+        legacy_text = BeautifulSoup(legacy, "lxml").get_text(" ") if legacy else ""
+        print(
+            f"{slug}|{len(html.encode('utf-8', 'replace'))}|{estimate_tokens(legacy)}|{reduced.output_tokens}|"
+            f"{len(page_signals)}|{len(page_signals & _signals(legacy_text))}|"
+            f"{len(page_signals & _signals(reduced.text))}"
+        )
+
+
 def _pick_winner(scores: dict[str, ProviderScore], providers: list[str]) -> str:
     best_provider: str | None = None
     best: ProviderScore | None = None
@@ -209,6 +257,11 @@ def main() -> int:
         default="",
         help="Optional comma-separated slug subset to benchmark.",
     )
+    parser.add_argument(
+        "--reduction-report",
+        action="store_true",
+        help="Compare LLM input size and date/time signal retention before/after content reduction (no LLM calls).",
+    )
     args = parser.parse_args()
 
     eval_path = Path(args.eval_set)
@@ -228,6 +281,10 @@ def main() -> int:
     if not cases:
         raise SystemExit(f"No benchmark cases found in {eval_path}")
 
+    if args.reduction_report:
+        _reduction_report(cases)
+        return 0
+
     print("slug|winner|structured_counts|" + "|".join(f"{p}_score,{p}_accepted,{p}_timed,{p}_gate" for p in providers))
 
     winners: dict[str, str] = {}
@@ -255,6 +312,10 @@ def main() -> int:
         _update_overrides(Path(args.overrides_path), winners)
         print(f"updated_overrides|{args.overrides_path}|{len(winners)}")
 
+    stats = reduction_stats().get("extract_events")
+    if stats:
+        print(f"llm_input|{stats['pages']}|{stats['input_tokens']}|{stats['output_tokens']}|{stats['tokens_saved']}")
+
     return 0
 
 
@@ -6,8 +6,10 @@ Identifies when events belong to the same series and manages series records.
 import html as html_module
 import re
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterator, Optional
 from supabase import Client
 from tags import VALID_CATEGORIES, VALID_FESTIVAL_TYPES
 
@@ -351,11 +353,54 @@ def create_series(client: Client, series_data: dict) -> dict:
     return result.data[0]
 
 
+def _series_touch_updates(
+    existing: dict, series_hint: dict, series_type: str, festival_id: Optional[str]
+) -> dict:
+    """last_verified_at plus metadata from the hint that the series is missing."""
+    touch_updates = {"last_verified_at": datetime.now(timezone.utc).isoformat()}
+    if festival_id and _is_blank_series_value(existing.get("festival_id")):
+        touch_updates["festival_id"] = festival_id
+    if series_type == "film":
+        for field in (
+            "director",
+            "runtime_minutes",
+            "year",
+            "rating",
+            "description",
+            "image_url",
+            "imdb_id",
+        ):
+            if not _is_blank_series_value(
+                series_hint.get(field)
+            ) and _is_blank_series_value(existing.get(field)):
+                touch_updates[field] = series_hint[field]
+    if series_type in ("recurring_show", "class_series", "festival_program"):
+        for field in (
+            "frequency",
+            "day_of_week",
+            "start_time",
+            "description",
+            "image_url",
+            "price_note",
+            "confidence",
+        ):
+            if not _is_blank_series_value(
+                series_hint.get(field)
+            ) and _is_blank_series_value(existing.get(field)):
+                touch_updates[field] = series_hint[field]
+    if not _is_blank_series_value(
+        series_hint.get("genres")
+    ) and _is_blank_series_value(existing.get("genres")):
+        touch_updates["genres"] = series_hint["genres"]
+    return touch_updates
+
+
 def get_or_create_series(
     client: Client,
     series_hint: dict,
     category: str = None,
     venue_id: Optional[int] = None,
+    registry: Optional["SeriesRegistry"] = None,
 ) -> Optional[str]:
     """
     Get an existing series or create a new one based on series hints.
@@ -364,6 +409,10 @@ def get_or_create_series(
     venue_id is used to scope matching for class_series and recurring_show
     types so that identically-named classes at different venues (e.g. "Yoga
     Basics" at two rec centers) produce separate series records.
+
+    With a ``registry`` (see series_registry_scope), festivals and series are
+    resolved from the run's in-memory cache and the last_verified_at touch is
+    deferred to the registry's end-of-source flush.
     """
     if not series_hint:
         return None
@@ -382,13 +431,16 @@ def get_or_create_series(
         series_title = decoded
 
     # Resolve festival link if provided
-    festival_id = series_hint.get("festival_id") or resolve_festival_id(
-        client,
-        series_hint.get("festival_name"),
-        festival_type=series_hint.get("festival_type"),
-        website=series_hint.get("festival_website"),
-        create_if_missing=True,
-    )
+    festival_id = series_hint.get("festival_id")
+    if not festival_id:
+        resolve = registry.resolve_festival_id if registry is not None else resolve_festival_id
+        festival_id = resolve(
+            client,
+            series_hint.get("festival_name"),
+            festival_type=series_hint.get("festival_type"),
+            website=series_hint.get("festival_website"),
+            create_if_missing=True,
+        )
 
     # Prefer venue_id from the hint; fall back to the parameter.
     hint_venue_id = series_hint.get("venue_id") or venue_id
@@ -398,7 +450,11 @@ def get_or_create_series(
     # and day_of_week so that "Team Trivia" on Wednesday at Bar A is a
     # separate series from "Team Trivia" on Sunday at Bar B.
     hint_day = series_hint.get("day_of_week")
-    existing = find_series_by_title(
+    hint_key = SeriesRegistry.hint_key(
+        series_title, series_type, festival_id, hint_day, hint_venue_id
+    )
+    find = registry.find_series_by_title if registry is not None else find_series_by_title
+    existing = find(
         client,
         series_title,
         series_type,
@@ -408,42 +464,11 @@ def get_or_create_series(
     )
     if existing:
         # Touch last_verified_at + backfill missing metadata from the new hint.
-        touch_updates = {"last_verified_at": datetime.now(timezone.utc).isoformat()}
-        if festival_id and _is_blank_series_value(existing.get("festival_id")):
-            touch_updates["festival_id"] = festival_id
-        if series_type == "film":
-            for field in (
-                "director",
-                "runtime_minutes",
-                "year",
-                "rating",
-                "description",
-                "image_url",
-                "imdb_id",
-            ):
-                if not _is_blank_series_value(
-                    series_hint.get(field)
-                ) and _is_blank_series_value(existing.get(field)):
-                    touch_updates[field] = series_hint[field]
-        if series_type in ("recurring_show", "class_series", "festival_program"):
-            for field in (
-                "frequency",
-                "day_of_week",
-                "start_time",
-                "description",
-                "image_url",
-                "price_note",
-                "confidence",
-            ):
-                if not _is_blank_series_value(
-                    series_hint.get(field)
-                ) and _is_blank_series_value(existing.get(field)):
-                    touch_updates[field] = series_hint[field]
-        if not _is_blank_series_value(
-            series_hint.get("genres")
-        ) and _is_blank_series_value(existing.get("genres")):
-            touch_updates["genres"] = series_hint["genres"]
-        client.table("series").update(touch_updates).eq("id", existing["id"]).execute()
+        touch_updates = _series_touch_updates(existing, series_hint, series_type, festival_id)
+        if registry is not None:
+            registry.touch(existing["id"], touch_updates)
+        else:
+            client.table("series").update(touch_updates).eq("id", existing["id"]).execute()
         logger.debug(f"Found existing series: {series_title}")
         return existing["id"]
 
@@ -452,6 +477,8 @@ def get_or_create_series(
     if imdb_id:
         existing = find_series_by_imdb(client, imdb_id)
         if existing:
+            if registry is not None:
+                registry.add(existing, hint_key=hint_key)
             return existing["id"]
 
     # Validate category
@@ -533,6 +560,8 @@ def get_or_create_series(
             logger.debug(f"Could not fetch venue image for series fallback: {exc}")
 
     new_series = create_series(client, series_data)
+    if registry is not None:
+        registry.add(new_series, hint_key=hint_key)
     return new_series["id"]
 
 
@@ -578,6 +607,292 @@ def update_series_metadata(client: Client, series_id: str, updates: dict) -> boo
     return True
 
 
+class SeriesRegistry:
+    """Run-scoped series and festival cache for one source crawl.
+
+    A cinema with 40 films and 300 showtimes sends the same 40 series hints
+    thousands of times; each used to cost festival resolution, up to four
+    find_series_by_title queries and a last_verified_at update.  The registry
+    preloads the series the source's upcoming events already link to, matches
+    hints in memory with the same title / slug / day-of-week / venue scoping as
+    find_series_by_title (falling back to the database on a miss), memoizes
+    festival resolution, and coalesces touch and backfill writes per series
+    until ``flush()`` at the end of the source.
+    """
+
+    _PRELOAD_CHUNK = 200
+
+    def __init__(self, client: Optional[Client] = None):
+        self._client = client
+        self._lock = threading.RLock()
+        self._rows: dict[str, dict] = {}
+        self._index: dict[tuple, list[str]] = {}
+        self._hint_ids: dict[tuple, str] = {}
+        self._festivals: dict[tuple, Optional[str]] = {}
+        self._pending: dict[str, dict] = {}
+        self.db_lookups = 0
+
+    @property
+    def client(self) -> Client:
+        if self._client is None:
+            from db import get_client
+
+            self._client = get_client()
+        return self._client
+
+    # -- loading ---------------------------------------------------------
+
+    def add(self, row: dict, hint_key: Optional[tuple] = None) -> dict:
+        """Cache a series row (and optionally the hint that resolved to it)."""
+        if not row or not row.get("id"):
+            return row
+        with self._lock:
+            cached = self._rows.get(row["id"])
+            if cached is None:
+                cached = dict(row)
+                self._rows[row["id"]] = cached
+                series_type = cached.get("series_type")
+                for field in ("title", "slug"):
+                    if cached.get(field):
+                        self._index.setdefault((series_type, field, cached[field]), []).append(
+                            cached["id"]
+                        )
+            if hint_key is not None:
+                self._hint_ids[hint_key] = cached["id"]
+            return cached
+
+    def preload_source(self, source_id: int) -> int:
+        """Load every series linked to the source's upcoming active events."""
+        from datetime import date
+
+        from db.table_reader import iter_rows
+
+        series_ids = {
+            row["series_id"]
+            for row in iter_rows(
+                "events",
+                "id,series_id",
+                [
+                    ("eq", ("source_id", source_id)),
+                    ("eq", ("is_active", True)),
+                    ("gte", ("start_date", date.today().isoformat())),
+                ],
+                client=self.client,
+            )
+            if row.get("series_id")
+        }
+        ids = sorted(series_ids)
+        for i in range(0, len(ids), self._PRELOAD_CHUNK):
+            chunk = ids[i : i + self._PRELOAD_CHUNK]
+            result = self.client.table("series").select("*").in_("id", chunk).execute()
+            for row in result.data or []:
+                self.add(row)
+        return len(ids)
+
+    def get(self, series_id: str) -> Optional[dict]:
+        """Cached series row, fetched once on first use."""
+        with self._lock:
+            row = self._rows.get(series_id)
+            if row is not None:
+                return row
+            self.db_lookups += 1
+            result = self.client.table("series").select("*").eq("id", series_id).execute()
+            return self.add(result.data[0]) if result.data else None
+
+    # -- resolution ------------------------------------------------------
+
+    @staticmethod
+    def hint_key(
+        title: str,
+        series_type: str,
+        festival_id: Optional[str] = None,
+        day_of_week: Optional[str] = None,
+        venue_id: Optional[int] = None,
+    ) -> tuple:
+        return (title, series_type, festival_id, (day_of_week or "").strip().lower(), venue_id)
+
+    def resolve_festival_id(
+        self,
+        client: Client,
+        festival_name: Optional[str],
+        festival_type: Optional[str] = None,
+        website: Optional[str] = None,
+        create_if_missing: bool = False,
+    ) -> Optional[str]:
+        """Memoized resolve_festival_id (one lookup/update per festival per run)."""
+        if not festival_name:
+            return None
+        key = (festival_name, festival_type, website, create_if_missing)
+        with self._lock:
+            if key not in self._festivals:
+                self.db_lookups += 1
+                self._festivals[key] = resolve_festival_id(
+                    client,
+                    festival_name,
+                    festival_type=festival_type,
+                    website=website,
+                    create_if_missing=create_if_missing,
+                )
+            return self._festivals[key]
+
+    def find_series_by_title(
+        self,
+        client: Client,
+        title: str,
+        series_type: str,
+        festival_id: Optional[str] = None,
+        day_of_week: Optional[str] = None,
+        venue_id: Optional[int] = None,
+    ) -> Optional[dict]:
+        """find_series_by_title against the cache first, then the database."""
+        use_day = bool(day_of_week) and series_type in ("recurring_show", "class_series")
+        use_venue = venue_id is not None and series_type in ("recurring_show", "class_series")
+        venue_column = _detect_series_venue_column(client) if use_venue else None
+        day = day_of_week.strip().lower() if use_day else None
+        slug = slugify(normalize_title(title))
+        key = self.hint_key(title, series_type, festival_id, day_of_week, venue_id)
+
+        def _matches(row: dict, want_day) -> bool:
+            if series_type == "festival_program" and festival_id and row.get("festival_id") != festival_id:
+                return False
+            if venue_column and row.get(venue_column) != venue_id:
+                return False
+            if want_day is _NULL_DAY:
+                return row.get("day_of_week") is None
+            return want_day is None or row.get("day_of_week") == want_day
+
+        def _cached(want_day) -> Optional[str]:
+            for field, value in (("title", title), ("slug", slug)):
+                for candidate_id in self._index.get((series_type, field, value), ()):
+                    if _matches(self._rows[candidate_id], want_day):
+                        return candidate_id
+            return None
+
+        with self._lock:
+            series_id = self._hint_ids.get(key)
+            if series_id and series_id in self._rows:
+                return self._rows[series_id]
+            series_id = _cached(day)
+            if series_id:
+                self._hint_ids[key] = series_id
+                return self._rows[series_id]
+
+            # An exact-day series in the database beats a cached NULL-day row,
+            # as in find_series_by_title.
+            self.db_lookups += 1
+            row = find_series_by_title(
+                client,
+                title,
+                series_type,
+                festival_id=festival_id,
+                day_of_week=day_of_week,
+                venue_id=venue_id,
+            )
+            if row:
+                return self.add(row, hint_key=key)
+            series_id = _cached(_NULL_DAY) if use_day else None
+            if series_id:
+                self._hint_ids[key] = series_id
+                return self._rows[series_id]
+            return None
+
+    # -- deferred writes -------------------------------------------------
+
+    def touch(self, series_id: str, updates: dict) -> None:
+        """Queue column updates for the series; later values win."""
+        if not updates:
+            return
+        with self._lock:
+            self._pending.setdefault(series_id, {}).update(updates)
+            row = self._rows.get(series_id)
+            if row is not None:
+                row.update(updates)
+
+    def backfill(self, series_id: str, updates: dict) -> bool:
+        """update_series_metadata semantics (fill blanks only), deferred to flush."""
+        if not updates:
+            return False
+        row = self.get(series_id)
+        if row is None:
+            return False
+        fields_to_set = {
+            key: value
+            for key, value in updates.items()
+            if not _is_blank_series_value(value) and _is_blank_series_value(row.get(key))
+        }
+        if fields_to_set:
+            logger.debug(f"Backfilling series {row.get('title', series_id)}: {list(fields_to_set)}")
+        fields_to_set["last_verified_at"] = datetime.now(timezone.utc).isoformat()
+        self.touch(series_id, fields_to_set)
+        return True
+
+    def force_day(self, series_id: str, day_of_week: str) -> None:
+        """_force_update_series_day against the cached row."""
+        row = self.get(series_id)
+        if row is None:
+            return
+        current = (row.get("day_of_week") or "").strip().lower()
+        incoming = day_of_week.strip().lower()
+        if current and current != incoming:
+            self.touch(series_id, {"day_of_week": incoming})
+            logger.info(
+                "Corrected series %s day_of_week: %s → %s",
+                series_id[:8], current, incoming,
+            )
+
+    def flush(self) -> int:
+        """Write all queued series updates; returns the number of series written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            from db.pg_writer import bulk_update, direct_writes_enabled
+
+            if direct_writes_enabled():
+                bulk_update("series", "id", [{"id": sid, **updates} for sid, updates in pending.items()])
+            else:
+                for sid, updates in pending.items():
+                    self.client.table("series").update(updates).eq("id", sid).execute()
+        except Exception as exc:
+            logger.warning("Failed to flush %d series updates: %s", len(pending), exc)
+            return 0
+        logger.debug("Flushed updates for %d series", len(pending))
+        return len(pending)
+
+
+_NULL_DAY = object()
+_ACTIVE_REGISTRIES: dict[int, SeriesRegistry] = {}
+_ACTIVE_REGISTRIES_LOCK = threading.Lock()
+
+
+@contextmanager
+def series_registry_scope(source_id: int, client: Optional[Client] = None) -> Iterator[SeriesRegistry]:
+    """Activate a SeriesRegistry for one source crawl and flush it at the end."""
+    registry = SeriesRegistry(client)
+    try:
+        registry.preload_source(source_id)
+    except Exception as exc:
+        logger.debug("Series preload failed for source %s: %s", source_id, exc)
+    with _ACTIVE_REGISTRIES_LOCK:
+        _ACTIVE_REGISTRIES[source_id] = registry
+    try:
+        yield registry
+    finally:
+        with _ACTIVE_REGISTRIES_LOCK:
+            if _ACTIVE_REGISTRIES.get(source_id) is registry:
+                del _ACTIVE_REGISTRIES[source_id]
+        registry.flush()
+
+
+def get_series_registry(source_id: Optional[int]) -> Optional[SeriesRegistry]:
+    """The registry for a source crawl in progress, if any."""
+    if source_id is None:
+        return None
+    with _ACTIVE_REGISTRIES_LOCK:
+        return _ACTIVE_REGISTRIES.get(source_id)
+
+
 def link_event_to_series(client: Client, event_id: int, series_id: str) -> None:
     """Link an event to a series."""
     client.table("events").update({"series_id": series_id}).eq("id", event_id).execute()
@@ -0,0 +1,547 @@
+"""
+Shared Eventbrite ingestion engine for the eventbrite, eventbrite-nashville
+and eventbrite-civic sources.
+
+Each source discovers event IDs by scrolling Eventbrite category browse pages,
+then pulls structured data per ID from the v3 API.  The engine does both
+efficiently:
+
+  1. Browse pages are scrolled in parallel, one Playwright browser per worker
+     (the sync API is not shareable across threads).
+  2. An ``EventIdIndex`` remembers, per event ID, the API ``changed``
+     timestamp, a fingerprint of the fields we ingest, the start date and when
+     the ID was last checked.  Known IDs checked within ``recheck_hours`` are
+     not fetched at all (events starting within ``SOON_DAYS`` are always
+     rechecked); re-fetched IDs whose ``changed``/fingerprint match are not
+     reprocessed, so their detail pages and DB lookups are skipped too.
+  3. API fetches run concurrently behind one ``AdaptiveRateLimiter``: a shared
+     request interval that backs off on 429 (honoring ``Retry-After``) and
+     recovers gradually on success, instead of a fixed ``sleep(0.2)`` and a
+     30s stall per 429.
+  4. Fetched events are processed and written serially in discovery order,
+     pipelined behind the fetch workers.
+
+The index is one JSON file per source under ``.cache/eventbrite/`` and only
+advances after a crawl with DB writes enabled finishes.  Set
+``EVENTBRITE_FULL_REFRESH=1`` to ignore it for a run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import get_config
+from db import insert_event, writes_enabled
+
+logger = logging.getLogger(__name__)
+
+API_BASE = "https://www.eventbriteapi.com/v3/"
+API_EXPAND = "venue,organizer,category,format,ticket_availability"
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+STATE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "eventbrite"
+DEFAULT_RECHECK_HOURS = 72.0
+SOON_DAYS = 2
+API_WORKERS = 4
+DISCOVERY_WORKERS = 3
+
+# API fields that feed process_event; ticket_availability churns constantly
+# and is deliberately left out.
+FINGERPRINT_FIELDS = (
+    "name",
+    "description",
+    "start",
+    "end",
+    "url",
+    "is_free",
+    "logo",
+    "venue",
+    "category",
+    "format",
+    "organizer",
+    "is_series",
+    "series_id",
+    "status",
+)
+
+_EVENT_ID_RE = re.compile(r"/e/[^/]+-(\d+)")
+_LOAD_MORE_SELECTOR = (
+    'button:has-text("See more"), button:has-text("Load more"), [data-testid="load-more-button"]'
+)
+
+
+def get_api_headers() -> dict:
+    """Get API request headers with authentication."""
+    cfg = get_config()
+    api_key = cfg.api.eventbrite_api_key
+    if not api_key:
+        raise ValueError("EVENTBRITE_API_KEY not configured")
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class AdaptiveRateLimiter:
+    """Shared request pacing that backs off on 429 and recovers on success.
+
+    All callers draw slots from one schedule spaced ``interval`` apart.  A 429
+    doubles the interval (up to ``max_interval``) and pauses every caller until
+    the ``Retry-After`` deadline; each success shrinks the interval by 10% back
+    toward ``min_interval``.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.2,
+        max_interval: float = 5.0,
+        default_cooldown: float = 10.0,
+        max_cooldown: float = 120.0,
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_cooldown = default_cooldown
+        self.max_cooldown = max_cooldown
+        self.interval = min_interval
+        self.throttled = 0
+        self._consecutive_429 = 0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._consecutive_429 = 0
+            self.interval = max(self.min_interval, self.interval * 0.9)
+
+    def on_throttle(self, retry_after: Optional[str] = None) -> float:
+        """Record a 429; returns the cooldown applied to all callers."""
+        try:
+            cooldown = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            cooldown = 0.0
+        with self._lock:
+            self.throttled += 1
+            self._consecutive_429 += 1
+            if cooldown <= 0:
+                cooldown = self.default_cooldown * (2 ** (self._consecutive_429 - 1))
+            cooldown = min(cooldown, self.max_cooldown)
+            self.interval = min(self.max_interval, self.interval * 2)
+            self._next_slot = max(self._next_slot, time.monotonic() + cooldown)
+        return cooldown
+
+
+class EventbriteApi:
+    """Concurrent-safe v3 API client: pooled sessions plus a shared limiter."""
+
+    def __init__(self, limiter: Optional[AdaptiveRateLimiter] = None, max_attempts: int = 4):
+        self.limiter = limiter or AdaptiveRateLimiter()
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=API_WORKERS))
+            session.headers.update(get_api_headers())
+            self._local.session = session
+        return session
+
+    def fetch_event(self, event_id: str) -> Optional[dict]:
+        """Fetch one event with venue/organizer/category/format expanded."""
+        url = f"{API_BASE}events/{event_id}/"
+        params = {"expand": API_EXPAND}
+        for attempt in range(1, self.max_attempts + 1):
+            self.limiter.acquire()
+            try:
+                response = self._session().get(url, params=params, timeout=15)
+            except requests.RequestException as e:
+                if attempt == self.max_attempts:
+                    logger.error(f"Error fetching event {event_id}: {e}")
+                    return None
+                time.sleep(attempt)
+                continue
+
+            if response.status_code == 404:
+                logger.debug(f"Event {event_id} not found (may be private or ended)")
+                return None
+            if response.status_code == 429:
+                cooldown = self.limiter.on_throttle(response.headers.get("Retry-After"))
+                logger.warning(
+                    f"Eventbrite rate limited; pausing {cooldown:.0f}s, "
+                    f"interval now {self.limiter.interval:.2f}s"
+                )
+                continue
+            if response.status_code >= 500 and attempt < self.max_attempts:
+                time.sleep(attempt)
+                continue
+            try:
+                response.raise_for_status()
+                data = response.json()
+            except (requests.RequestException, ValueError) as e:
+                logger.error(f"Error fetching event {event_id}: {e}")
+                return None
+            self.limiter.on_success()
+            return data
+
+        logger.error(f"Giving up on event {event_id} after {self.max_attempts} attempts")
+        return None
+
+    def fetch_events(self, event_ids: Iterable[str], workers: int = API_WORKERS) -> Iterator[tuple[str, Optional[dict]]]:
+        """Yield ``(event_id, payload)`` in input order while fetches run ahead.
+
+        Closing the generator early cancels fetches that have not started.
+        """
+        event_ids = list(event_ids)
+        pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        try:
+            yield from zip(event_ids, pool.map(self.fetch_event, event_ids))
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+_DEFAULT_API: Optional[EventbriteApi] = None
+_DEFAULT_API_LOCK = threading.Lock()
+
+
+def get_api() -> EventbriteApi:
+    """Process-wide client, so concurrent Eventbrite sources share one limiter."""
+    global _DEFAULT_API
+    with _DEFAULT_API_LOCK:
+        if _DEFAULT_API is None:
+            _DEFAULT_API = EventbriteApi()
+        return _DEFAULT_API
+
+
+# ---------------------------------------------------------------------------
+# Change detection
+# ---------------------------------------------------------------------------
+
+
+def event_fingerprint(payload: dict) -> str:
+    """Stable hash of the API fields that feed ingestion."""
+    subset = {key: payload.get(key) for key in FINGERPRINT_FIELDS}
+    return hashlib.sha1(json.dumps(subset, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _start_date(payload: dict) -> Optional[str]:
+    local = (payload.get("start") or {}).get("local") or ""
+    return local[:10] or None
+
+
+class EventIdIndex:
+    """Per-source memory of Eventbrite IDs already ingested.
+
+    Entries are staged with ``record`` and only become visible to
+    ``needs_fetch``/``is_unchanged`` on a later run after ``commit()``, so a
+    crawl that dies half-way or runs without writes never hides events from
+    the next run.
+    """
+
+    def __init__(
+        self,
+        slug: str,
+        recheck_hours: float = DEFAULT_RECHECK_HOURS,
+        full_refresh: bool = False,
+        directory: Optional[Path] = None,
+    ):
+        self._path = (directory or STATE_DIR) / f"{slug}.json"
+        self._recheck_seconds = max(0.0, recheck_hours) * 3600
+        self._full_refresh = full_refresh
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._pending: dict[str, dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self._path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def needs_fetch(self, event_id: str, today: Optional[date] = None) -> bool:
+        """False for IDs checked recently that are not about to happen."""
+        if self._full_refresh:
+            return True
+        with self._lock:
+            entry = self._entries.get(event_id)
+        if not entry:
+            return True
+        today = today or date.today()
+        start = entry.get("start_date")
+        if start and start <= (today + timedelta(days=SOON_DAYS)).isoformat():
+            return True
+        return time.time() - float(entry.get("checked_at") or 0.0) >= self._recheck_seconds
+
+    def is_unchanged(self, event_id: str, payload: dict) -> bool:
+        """True when the API reports no change since the ID was last ingested."""
+        if self._full_refresh:
+            return False
+        with self._lock:
+            entry = self._entries.get(event_id)
+        if not entry:
+            return False
+        changed = payload.get("changed")
+        if changed and changed == entry.get("changed"):
+            return True
+        return entry.get("fingerprint") == event_fingerprint(payload)
+
+    def record(self, event_id: str, payload: dict) -> None:
+        entry = {
+            "changed": payload.get("changed"),
+            "fingerprint": event_fingerprint(payload),
+            "start_date": _start_date(payload),
+            "checked_at": time.time(),
+        }
+        with self._lock:
+            self._pending[event_id] = entry
+
+    def commit(self) -> None:
+        with self._lock:
+            self._entries.update(self._pending)
+            self._pending.clear()
+
+    def save(self) -> None:
+        today = date.today().isoformat()
+        with self._lock:
+            # Events that already happened never come back.
+            snapshot = {
+                event_id: entry
+                for event_id, entry in self._entries.items()
+                if not entry.get("start_date") or entry["start_date"] >= today
+            }
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(snapshot, f)
+            tmp_path.replace(self._path)
+        except OSError as exc:
+            logger.warning("Could not save Eventbrite ID index to %s: %s", self._path, exc)
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def _scroll_collect(page, browse_url: str, max_events: int, max_scrolls: int) -> list[str]:
+    """Scroll one browse page, collecting event IDs in the order they appear."""
+    found: dict[str, None] = {}
+    try:
+        page.goto(browse_url, wait_until="domcontentloaded", timeout=30000)
+        page.wait_for_timeout(3000)
+    except Exception as e:
+        logger.warning(f"Failed to load {browse_url}: {e}")
+        return []
+
+    scroll_count = 0
+    last_count = 0
+    no_new_count = 0
+    while scroll_count < max_scrolls and len(found) < max_events:
+        for link in page.query_selector_all('a[href*="/e/"]'):
+            href = link.get_attribute("href")
+            if href:
+                match = _EVENT_ID_RE.search(href)
+                if match:
+                    found.setdefault(match.group(1))
+
+        if len(found) == last_count:
+            no_new_count += 1
+            try:
+                load_more = page.query_selector(_LOAD_MORE_SELECTOR)
+                if load_more and load_more.is_visible():
+                    load_more.click()
+                    page.wait_for_timeout(2000)
+                    no_new_count = 0
+                    continue
+            except Exception:
+                pass
+            if no_new_count >= 5:
+                break
+        else:
+            no_new_count = 0
+            last_count = len(found)
+
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        page.wait_for_timeout(2000)
+        scroll_count += 1
+
+    logger.info(f"{browse_url}: {len(found)} event IDs after {scroll_count} scrolls")
+    return list(found)
+
+
+def _discovery_worker(urls: list[str], max_events: int, max_scrolls: int) -> dict[str, list[str]]:
+    from playwright.sync_api import sync_playwright
+
+    results: dict[str, list[str]] = {}
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context = browser.new_context(
+                user_agent=USER_AGENT,
+                viewport={"width": 1920, "height": 1080},
+            )
+            page = context.new_page()
+            for url in urls:
+                results[url] = _scroll_collect(page, url, max_events, max_scrolls)
+        finally:
+            browser.close()
+    return results
+
+
+def discover_event_ids(
+    browse_urls: list[str],
+    max_events: int = 500,
+    max_scrolls: int = 30,
+    workers: int = DISCOVERY_WORKERS,
+) -> list[str]:
+    """Scroll browse pages in parallel browsers; IDs keep browse-URL priority."""
+    if not browse_urls:
+        return []
+    workers = max(1, min(workers, len(browse_urls)))
+    # Round-robin so each browser gets a mix of broad and narrow categories.
+    shards = [browse_urls[i::workers] for i in range(workers)]
+    per_url: dict[str, list[str]] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(lambda urls: _discovery_worker(urls, max_events, max_scrolls), shards):
+            per_url.update(result)
+
+    event_ids: dict[str, None] = {}
+    for url in browse_urls:
+        for event_id in per_url.get(url, ()):
+            event_ids.setdefault(event_id)
+    logger.info(f"Discovered {len(event_ids)} unique event IDs across {len(browse_urls)} category pages")
+    return list(event_ids)[:max_events]
+
+
+# ---------------------------------------------------------------------------
+# Crawl
+# ---------------------------------------------------------------------------
+
+
+def crawl_eventbrite(
+    source: dict,
+    *,
+    browse_urls: list[str],
+    process_event: Callable[[dict], Optional[dict]],
+    label: str = "Eventbrite",
+    max_events: int = 500,
+    max_scrolls: int = 30,
+    prefetch: Optional[Callable[[dict], None]] = None,
+    recheck_hours: float = DEFAULT_RECHECK_HOURS,
+    api: Optional[EventbriteApi] = None,
+    index: Optional[EventIdIndex] = None,
+) -> tuple[int, int, int]:
+    """Discover, fetch new/changed IDs concurrently, and write serially.
+
+    ``process_event(payload)`` returns an event record to insert,
+    ``{"status": "exists"}`` after updating an existing event, None to
+    skip (filtered out), or ``{"status": "error"}`` when processing failed.
+    Only processed or filtered IDs are recorded in the index; failed ones are
+    retried next run.  ``prefetch(payload)`` runs on the fetch worker for events that will
+    be processed (e.g. warming a detail-page cache).
+    """
+    api = api or get_api()
+    index = index or EventIdIndex(
+        source["slug"],
+        recheck_hours=recheck_hours,
+        full_refresh=os.getenv("EVENTBRITE_FULL_REFRESH", "").lower() in ("1", "true", "yes"),
+    )
+
+    logger.info(f"{label}: discovering events from {len(browse_urls)} browse pages...")
+    event_ids = discover_event_ids(browse_urls, max_events, max_scrolls)
+    if not event_ids:
+        logger.warning(f"{label}: no event IDs discovered")
+        return 0, 0, 0
+
+    to_fetch = [event_id for event_id in event_ids if index.needs_fetch(event_id)]
+    fresh = len(event_ids) - len(to_fetch)
+    logger.info(f"{label}: fetching {len(to_fetch)} of {len(event_ids)} events ({fresh} checked recently)")
+
+    def fetch(event_id: str) -> tuple[Optional[dict], bool]:
+        payload = api.fetch_event(event_id)
+        if payload is None:
+            return None, False
+        unchanged = index.is_unchanged(event_id, payload)
+        if not unchanged and prefetch is not None:
+            try:
+                prefetch(payload)
+            except Exception as e:
+                logger.debug(f"{label}: prefetch failed for {event_id}: {e}")
+        return payload, unchanged
+
+    events_found = fresh
+    events_new = 0
+    events_updated = 0
+    unchanged_count = 0
+
+    with ThreadPoolExecutor(max_workers=API_WORKERS) as pool:
+        for i, (event_id, (payload, unchanged)) in enumerate(zip(to_fetch, pool.map(fetch, to_fetch))):
+            if i > 0 and i % 50 == 0:
+                logger.info(f"{label} progress: {i}/{len(to_fetch)} fetched, {events_new} new")
+            if not payload:
+                continue
+            events_found += 1
+            if unchanged:
+                unchanged_count += 1
+                index.record(event_id, payload)
+                continue
+
+            result = process_event(payload)
+            if not result:
+                index.record(event_id, payload)
+                continue
+            if result.get("status") == "error":
+                continue
+            if result.get("status") == "exists":
+                events_updated += 1
+                index.record(event_id, payload)
+                continue
+
+            try:
+                insert_event(result, series_hint=result.pop("_series_hint", None))
+                events_new += 1
+                index.record(event_id, payload)
+                logger.debug(f"Added: {result['title'][:50]}... on {result['start_date']}")
+            except Exception as e:
+                logger.error(f"Failed to insert: {result.get('title', '')[:50]}: {e}")
+
+    if writes_enabled():
+        index.commit()
+        index.save()
+
+    logger.info(
+        f"{label} crawl complete: {events_found} found, {events_new} new, {events_updated} existing, "
+        f"{fresh + unchanged_count} unchanged, {api.limiter.throttled} throttled"
+    )
+    return events_found, events_new, events_updated
@@ -11,18 +11,14 @@ from __future__ import annotations
 import json
 import logging
 import re
-import time
 import requests
 from datetime import datetime
 from functools import lru_cache
 from typing import Optional
-from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 
-from config import get_config
 from db import (
     get_or_create_place,
-    insert_event,
     find_event_by_hash,
     smart_update_existing_event,
     get_portal_id_by_slug,
@@ -34,11 +30,14 @@ from aggregator_utils import (
     override_category_from_title,
     build_series_hint_from_recurring,
 )
+from sources._eventbrite_base import (
+    crawl_eventbrite,
+    discover_event_ids,
+    get_api,
+)
 
 logger = logging.getLogger(__name__)
 
-API_BASE = "https://www.eventbriteapi.com/v3/"
-
 # Civic-relevant Eventbrite category pages for Atlanta metro
 CIVIC_BROWSE_URLS = [
     "https://www.eventbrite.com/d/ga--atlanta/community/",
@@ -271,116 +270,13 @@ def _build_description(
     return " ".join(parts)[:EVENTBRITE_DESCRIPTION_MAX_LENGTH]
 
 
-def _get_api_headers() -> dict:
-    cfg = get_config()
-    api_key = cfg.api.eventbrite_api_key
-    if not api_key:
-        raise ValueError("EVENTBRITE_API_KEY not configured")
-    return {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-
-
 def _discover_event_ids(max_events: int = 300) -> list[str]:
     """Browse civic Eventbrite category pages and collect event IDs."""
-    event_ids: set[str] = set()
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080},
-        )
-        page = context.new_page()
-
-        for browse_url in CIVIC_BROWSE_URLS:
-            if len(event_ids) >= max_events:
-                break
-
-            logger.info("Browsing civic page: %s", browse_url)
-            try:
-                page.goto(browse_url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
-            except Exception as e:
-                logger.warning("Failed to load %s: %s", browse_url, e)
-                continue
-
-            scroll_count = 0
-            max_scrolls = 25
-            last_count = len(event_ids)
-            no_new_count = 0
-
-            while scroll_count < max_scrolls and len(event_ids) < max_events:
-                links = page.query_selector_all('a[href*="/e/"]')
-                for link in links:
-                    href = link.get_attribute("href")
-                    if href:
-                        match = re.search(r"/e/[^/]+-(\d+)", href)
-                        if match:
-                            event_ids.add(match.group(1))
-
-                if len(event_ids) == last_count:
-                    no_new_count += 1
-                    try:
-                        load_more = page.query_selector(
-                            'button:has-text("See more"), button:has-text("Load more"), [data-testid="load-more-button"]'
-                        )
-                        if load_more and load_more.is_visible():
-                            load_more.click()
-                            page.wait_for_timeout(2000)
-                            no_new_count = 0
-                            continue
-                    except Exception:
-                        pass
-                    if no_new_count >= 5:
-                        break
-                else:
-                    no_new_count = 0
-                    last_count = len(event_ids)
-
-                logger.info(
-                    "Scroll %d: %d civic event IDs found",
-                    scroll_count + 1,
-                    len(event_ids),
-                )
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(2000)
-                scroll_count += 1
-
-            logger.info(
-                "After %s: %d total civic event IDs", browse_url, len(event_ids)
-            )
-
-        browser.close()
-
-    logger.info(
-        "Discovered %d unique civic event IDs across %d category pages",
-        len(event_ids),
-        len(CIVIC_BROWSE_URLS),
-    )
-    return list(event_ids)[:max_events]
+    return discover_event_ids(CIVIC_BROWSE_URLS, max_events=max_events, max_scrolls=25)
 
 
 def _fetch_event_from_api(event_id: str) -> Optional[dict]:
-    try:
-        url = f"{API_BASE}events/{event_id}/"
-        params = {"expand": "venue,organizer,category,format,ticket_availability"}
-        response = requests.get(
-            url, headers=_get_api_headers(), params=params, timeout=15
-        )
-        if response.status_code == 404:
-            logger.debug("Event %s not found (may be private or ended)", event_id)
-            return None
-        elif response.status_code == 429:
-            logger.warning("Rate limited, waiting 30 seconds...")
-            time.sleep(30)
-            return _fetch_event_from_api(event_id)
-        response.raise_for_status()
-        return response.json()
-    except Exception as e:
-        logger.error("Error fetching event %s: %s", event_id, e)
-        return None
+    return get_api().fetch_event(event_id)
 
 
 def _parse_datetime(dt_str: str) -> tuple[Optional[str], Optional[str]]:
@@ -558,7 +454,14 @@ def _process_event(
         return event_record
     except Exception as e:
         logger.error("Error processing civic event: %s", e)
-        return None
+        return {"status": "error"}
+
+
+def _prefetch_detail_enrichment(event_data: dict) -> None:
+    """Warm the detail-page cache on a fetch worker for short API blurbs."""
+    description = _clean_text((event_data.get("description") or {}).get("text"))
+    if len(description) < EVENTBRITE_DESCRIPTION_ENRICH_MIN_LENGTH:
+        _fetch_detail_enrichment(event_data.get("url", ""))
 
 
 def crawl(source: dict) -> tuple[int, int, int]:
@@ -574,77 +477,18 @@ def crawl(source: dict) -> tuple[int, int, int]:
         )
         return 0, 0, 0
 
-    events_found = 0
-    events_new = 0
-    events_updated = 0
-
     try:
-        logger.info(
-            "Eventbrite civic: discovering events from community/government/charity pages..."
-        )
-        event_ids = _discover_event_ids(max_events=300)
-
-        if not event_ids:
-            logger.warning(
-                "Eventbrite civic: no event IDs discovered from civic category pages"
-            )
-            return 0, 0, 0
-
-        logger.info(
-            "Eventbrite civic: fetching %d event IDs from API...", len(event_ids)
-        )
-
-        for i, event_id in enumerate(event_ids):
-            if i > 0 and i % 50 == 0:
-                logger.info(
-                    "Eventbrite civic progress: %d/%d events processed, %d new",
-                    i,
-                    len(event_ids),
-                    events_new,
-                )
-
-            event_data = _fetch_event_from_api(event_id)
-            if not event_data:
-                continue
-
-            events_found += 1
-
-            result = _process_event(
+        return crawl_eventbrite(
+            source,
+            browse_urls=CIVIC_BROWSE_URLS,
+            process_event=lambda event_data: _process_event(
                 event_data, source_id, producer_id, helpatl_portal_id
-            )
-            if not result:
-                continue
-
-            if result.get("status") == "exists":
-                events_updated += 1
-                continue
-
-            try:
-                insert_event(result, series_hint=result.pop("_series_hint", None))
-                events_new += 1
-                logger.debug(
-                    "Civic event added: %s on %s",
-                    result["title"][:50],
-                    result["start_date"],
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to insert civic event %s: %s",
-                    result.get("title", "")[:50],
-                    e,
-                )
-
-            time.sleep(0.2)
-
-        logger.info(
-            "Eventbrite civic crawl complete: %d found, %d new, %d existing",
-            events_found,
-            events_new,
-            events_updated,
+            ),
+            prefetch=_prefetch_detail_enrichment,
+            label="Eventbrite civic",
+            max_events=300,
+            max_scrolls=25,
         )
-
     except Exception as e:
         logger.error("Eventbrite civic crawl failed: %s", e)
         raise
-
-    return events_found, events_new, events_updated
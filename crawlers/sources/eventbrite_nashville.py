@@ -7,22 +7,21 @@ from __future__ import annotations
 
 import logging
 import re
-import time
-import requests
 from datetime import datetime
 from typing import Optional
-from playwright.sync_api import sync_playwright
 
-from config import get_config
-from db import get_or_create_place, insert_event, find_event_by_hash, smart_update_existing_event, get_portal_id_by_slug
+from db import get_or_create_place, find_event_by_hash, smart_update_existing_event, get_portal_id_by_slug
 from dedupe import generate_content_hash
+from sources._eventbrite_base import (
+    crawl_eventbrite,
+    discover_event_ids as _discover_event_ids,
+    get_api,
+)
 
 PORTAL_SLUG = "nashville"
 
 logger = logging.getLogger(__name__)
 
-API_BASE = "https://www.eventbriteapi.com/v3/"
-
 # Browse multiple category-filtered URLs to surface events the generic page buries
 BROWSE_URLS = [
     "https://www.eventbrite.com/d/tn--nashville/events/",
@@ -57,110 +56,14 @@ CATEGORY_MAP = {
 }
 
 
-def get_api_headers() -> dict:
-    """Get API request headers with authentication."""
-    cfg = get_config()
-    api_key = cfg.api.eventbrite_api_key
-    if not api_key:
-        raise ValueError("EVENTBRITE_API_KEY not configured")
-    return {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-    }
-
-
 def discover_event_ids(max_events: int = 500) -> list[str]:
     """Discover event IDs by browsing multiple Eventbrite Nashville category pages."""
-    event_ids = set()
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            viewport={"width": 1920, "height": 1080},
-        )
-        page = context.new_page()
-
-        for browse_url in BROWSE_URLS:
-            if len(event_ids) >= max_events:
-                break
-
-            logger.info(f"Browsing {browse_url} ...")
-            try:
-                page.goto(browse_url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
-            except Exception as e:
-                logger.warning(f"Failed to load {browse_url}: {e}")
-                continue
-
-            scroll_count = 0
-            max_scrolls = 30
-            last_count = len(event_ids)
-            no_new_count = 0
-
-            while scroll_count < max_scrolls and len(event_ids) < max_events:
-                links = page.query_selector_all('a[href*="/e/"]')
-
-                for link in links:
-                    href = link.get_attribute("href")
-                    if href:
-                        match = re.search(r'/e/[^/]+-(\d+)', href)
-                        if match:
-                            event_ids.add(match.group(1))
-
-                if len(event_ids) == last_count:
-                    no_new_count += 1
-                    try:
-                        load_more = page.query_selector('button:has-text("See more"), button:has-text("Load more"), [data-testid="load-more-button"]')
-                        if load_more and load_more.is_visible():
-                            load_more.click()
-                            page.wait_for_timeout(2000)
-                            no_new_count = 0
-                            continue
-                    except Exception:
-                        pass
-
-                    if no_new_count >= 5:
-                        break
-                else:
-                    no_new_count = 0
-                    last_count = len(event_ids)
-
-                logger.info(f"Scroll {scroll_count + 1}: Found {len(event_ids)} unique events so far")
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                page.wait_for_timeout(2000)
-                scroll_count += 1
-
-            logger.info(f"After {browse_url}: {len(event_ids)} total unique events")
-
-        browser.close()
-
-    logger.info(f"Discovered {len(event_ids)} unique event IDs across {len(BROWSE_URLS)} category pages")
-    return list(event_ids)[:max_events]
+    return _discover_event_ids(BROWSE_URLS, max_events=max_events)
 
 
 def fetch_event_from_api(event_id: str) -> Optional[dict]:
     """Fetch event details from Eventbrite API."""
-    try:
-        url = f"{API_BASE}events/{event_id}/"
-        params = {"expand": "venue,organizer,category,format,ticket_availability"}
-
-        response = requests.get(url, headers=get_api_headers(), params=params, timeout=15)
-
-        if response.status_code == 404:
-            logger.debug(f"Event {event_id} not found (may be private or ended)")
-            return None
-        elif response.status_code == 429:
-            logger.warning("Rate limited, waiting 30 seconds...")
-            time.sleep(30)
-            return fetch_event_from_api(event_id)  # Retry once
-
-        response.raise_for_status()
-        return response.json()
-
-    except Exception as e:
-        logger.error(f"Error fetching event {event_id}: {e}")
-        return None
+    return get_api().fetch_event(event_id)
 
 
 def parse_datetime(dt_str: str) -> tuple[Optional[str], Optional[str]]:
@@ -302,7 +205,7 @@ def process_event(event_data: dict, source_id: int, producer_id: Optional[int],
         return event_record
     except Exception as e:
         logger.error(f"Error processing event: {e}")
-        return None
+        return {"status": "error"}
 
 
 def parse_event_for_pipeline(event_data: dict) -> dict | None:
@@ -374,65 +277,19 @@ def parse_event_for_pipeline(event_data: dict) -> dict | None:
 
 
 def crawl(source: dict) -> tuple[int, int, int]:
-    """Hybrid crawl: discover via website, fetch via API."""
+    """Hybrid crawl: discover via website, fetch new/changed events via API."""
     source_id = source["id"]
     producer_id = source.get("producer_id")
-
-    events_found = 0
-    events_new = 0
-    events_updated = 0
-
     portal_id = get_portal_id_by_slug(PORTAL_SLUG)
 
     try:
-        # Step 1: Discover event IDs from website
-        logger.info("Step 1: Discovering events from Eventbrite Nashville website...")
-        event_ids = discover_event_ids(max_events=500)
-
-        if not event_ids:
-            logger.warning("No event IDs discovered")
-            return 0, 0, 0
-
-        # Step 2: Fetch each event from API
-        logger.info(f"Step 2: Fetching {len(event_ids)} events from API...")
-
-        for i, event_id in enumerate(event_ids):
-            if i > 0 and i % 50 == 0:
-                logger.info(f"Progress: {i}/{len(event_ids)} events processed, {events_new} new")
-
-            # Fetch from API
-            event_data = fetch_event_from_api(event_id)
-            if not event_data:
-                continue
-
-            events_found += 1
-
-            # Process into our format
-            result = process_event(event_data, source_id, producer_id, portal_id)
-            if not result:
-                continue
-
-            if result.get("status") == "exists":
-                events_updated += 1
-                continue
-
-            # Insert
-            try:
-                insert_event(result)
-                events_new += 1
-                logger.debug(f"Added: {result['title'][:50]}... on {result['start_date']}")
-            except Exception as e:
-                logger.error(f"Failed to insert: {result['title'][:50]}: {e}")
-
-            # Small delay to be nice to API
-            time.sleep(0.2)
-
-        logger.info(
-            f"Eventbrite Nashville crawl complete: {events_found} found, {events_new} new, {events_updated} existing"
+        return crawl_eventbrite(
+            source,
+            browse_urls=BROWSE_URLS,
+            process_event=lambda event_data: process_event(event_data, source_id, producer_id, portal_id),
+            label="Eventbrite Nashville",
+            max_events=500,
         )
-
     except Exception as e:
         logger.error(f"Failed to crawl Eventbrite Nashville: {e}")
         raise
-
-    return events_found, events_new, events_updated
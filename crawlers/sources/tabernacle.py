@@ -17,7 +17,7 @@ from db import get_or_create_place, insert_event, find_event_by_hash, smart_upda
 from dedupe import generate_content_hash
 from utils import extract_images_from_page, enrich_event_record, find_event_url
 from description_fetcher import fetch_detail_html_playwright
-from pipeline.detail_enrich import enrich_from_detail
+from extractors.offload import run_extraction
 from pipeline.models import DetailConfig
 
 logger = logging.getLogger(__name__)
@@ -273,7 +273,7 @@ def crawl(source: dict) -> tuple[int, int, int]:
                 if detail_url and detail_fetches < 20:
                     html = fetch_detail_html_playwright(detail_page, detail_url)
                     if html:
-                        fields = enrich_from_detail(html, detail_url, "Tabernacle", detail_config)
+                        fields = run_extraction("detail", html, detail_url, "Tabernacle", detail_config)
                         if fields.get("description"):
                             evt["description"] = fields["description"]
                         if fields.get("start_time") and not evt.get("start_time"):
@@ -30,7 +30,7 @@ from db import (
 from dedupe import generate_content_hash
 from description_fetcher import fetch_detail_html_playwright
 from extractors.doors_time import extract_doors_time
-from pipeline.detail_enrich import enrich_from_detail
+from extractors.offload import run_extraction
 from pipeline.models import DetailConfig
 
 logger = logging.getLogger(__name__)
@@ -269,7 +269,7 @@ def _enrich_from_detail_if_needed(
     if not html:
         return False
 
-    fields = enrich_from_detail(html, detail_url, "Terminal West", detail_config)
+    fields = run_extraction("detail", html, detail_url, "Terminal West", detail_config)
     if not fields:
         return False
 
@@ -17,7 +17,7 @@ from playwright.sync_api import sync_playwright
 from db import get_or_create_place, insert_event, find_event_by_hash, smart_update_existing_event
 from dedupe import generate_content_hash
 from description_fetcher import fetch_detail_html_playwright
-from pipeline.detail_enrich import enrich_from_detail
+from extractors.offload import run_extraction
 from pipeline.models import DetailConfig
 from utils import extract_images_from_page, extract_event_links, find_event_url, enrich_event_record
 
@@ -245,7 +245,7 @@ def crawl(source: dict) -> tuple[int, int, int]:
                 if detail_url and detail_url != EVENTS_URL and detail_fetches < 20:
                     html = fetch_detail_html_playwright(detail_page, detail_url)
                     if html:
-                        fields = enrich_from_detail(html, detail_url, "The Eastern", detail_config)
+                        fields = run_extraction("detail", html, detail_url, "The Eastern", detail_config)
                         if fields.get("ticket_status") and not evt.get("ticket_status"):
                             evt["ticket_status"] = fields["ticket_status"]
                             evt["ticket_status_checked_at"] = datetime.now(timezone.utc).isoformat()
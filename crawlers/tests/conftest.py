@@ -38,6 +38,20 @@ def mock_has_event_extractions_table():
         yield
 
 
+@pytest.fixture(autouse=True)
+def offline_venue_corpus(monkeypatch, tmp_path_factory):
+    """Serve venue pages from an empty offline corpus so tests never hit live
+    sites or write into crawlers/.cache."""
+    try:
+        import venue_corpus
+    except (ImportError, ModuleNotFoundError):
+        yield
+        return
+    root = tmp_path_factory.getbasetemp() / "venue_corpus"
+    monkeypatch.setattr(venue_corpus, "_CORPUS", venue_corpus.VenueCorpus(root=root, offline=True))
+    yield
+
+
 @pytest.fixture
 def mock_supabase_client():
     """Mock Supabase client for database tests."""
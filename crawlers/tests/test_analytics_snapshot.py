@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from analytics_snapshot import (
+    TABLES,
+    Snapshot,
+    compact_table,
+    diff_snapshots,
+    export_table,
+    load_manifest,
+)
+
+
+class _Query:
+    def __init__(self, rows):
+        self.rows = rows
+        self.preds = []
+        self.count = None
+
+    def select(self, _columns):
+        return self
+
+    def gte(self, col, value):
+        self.preds.append(lambda r: (r.get(col) or "") >= value)
+        return self
+
+    def gt(self, col, value):
+        self.preds.append(lambda r: r[col] > value)
+        return self
+
+    def order(self, _col):
+        return self
+
+    def limit(self, n):
+        self.count = n
+        return self
+
+    def execute(self):
+        rows = sorted((r for r in self.rows if all(p(r) for p in self.preds)), key=lambda r: r["id"])
+        return SimpleNamespace(data=[dict(r) for r in rows[: self.count]])
+
+
+class _Client:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def table(self, name):
+        return _Query(self.tables[name])
+
+
+@pytest.fixture
+def events():
+    return [
+        {"id": 1, "start_date": "2026-05-02", "category_id": "music", "updated_at": "2026-01-01T00:00:00+00:00"},
+        {"id": 2, "start_date": "2026-06-10", "category_id": "film", "updated_at": "2026-01-01T00:00:00+00:00",
+         "field_provenance": {"title": "jsonld"}},
+    ]
+
+
+def test_incremental_export_appends_changed_rows_and_reads_latest(tmp_path, events):
+    client = _Client({"events": events})
+    spec = TABLES["events"]
+
+    assert export_table(spec, tmp_path, client=client, page_size=1) == 2
+    first = Snapshot(tmp_path)
+    assert sorted(p.name for p in (tmp_path / "events").iterdir()) == ["month=2026-05", "month=2026-06"]
+    assert {r["id"]: r["category_id"] for r in first.rows("events", "category_id")} == {1: "music", 2: "film"}
+
+    # Event 1 moves to June and changes category; only it is re-exported.
+    events[0].update(start_date="2026-06-01", category_id="comedy", updated_at="2999-01-01T00:00:00+00:00")
+    assert export_table(spec, tmp_path, client=client) == 1
+    assert load_manifest(tmp_path)["events"]["seq"] == 2
+
+    snap = Snapshot(tmp_path)
+    rows = {r["id"]: r for r in snap.rows("events")}
+    assert rows[1]["category_id"] == "comedy" and "_seq" not in rows[1]
+    assert rows[2]["field_provenance"] == '{"title": "jsonld"}'
+    june = snap.rows("events", "id", [("gte", ("start_date", "2026-06-01")), ("in_", ("category_id", ["comedy"]))])
+    assert [r["id"] for r in june] == [1]
+
+    assert diff_snapshots(tmp_path, tmp_path, "events")["changed"] == []
+
+
+def test_compact_folds_parts_and_keeps_latest_rows(tmp_path, events):
+    client = _Client({"events": events})
+    export_table(TABLES["events"], tmp_path, client=client)
+    events[1].update(category_id="theater", updated_at="2999-01-01T00:00:00+00:00")
+    export_table(TABLES["events"], tmp_path, client=client)
+
+    assert compact_table("events", tmp_path) == 2
+    assert len(list((tmp_path / "events").glob("*/part-*"))) == 2  # one per month
+    assert {r["id"]: r["category_id"] for r in Snapshot(tmp_path).rows("events")} == {1: "music", 2: "theater"}
+
+
+def test_full_refresh_tables_replace_previous_export(tmp_path):
+    sources = [{"id": 1, "slug": "a"}, {"id": 2, "slug": "b"}]
+    client = _Client({"sources": sources})
+    export_table(TABLES["sources"], tmp_path, client=client)
+    sources.pop()
+    export_table(TABLES["sources"], tmp_path, client=client)
+
+    assert [r["slug"] for r in Snapshot(tmp_path).rows("sources")] == ["a"]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import compute_data_quality as cdq
+
+
+def test_score_event_accepts_db_category_id():
+    pipeline_payload = {"title": "Jazz Night", "category": "music", "start_time": "20:00"}
+    db_row = {"title": "Jazz Night", "category_id": "music", "start_time": "20:00"}
+
+    assert cdq.score_event(db_row) == cdq.score_event(pipeline_payload)
+    assert cdq.score_event(db_row) == cdq.EVENT_WEIGHTS["category"] + cdq.EVENT_WEIGHTS["start_time"]
+    assert "category" not in db_row
+
+
+def test_compute_table_incremental_filters_by_watermark(monkeypatch, tmp_path: Path):
+    monkeypatch.setattr(cdq, "WATERMARK_PATH", tmp_path / "wm.json")
+    cdq.save_watermark("events", "2026-03-01T00:00:00+00:00", path=cdq.WATERMARK_PATH)
+
+    fetch_calls = []
+
+    def fake_fetch_all(client, table, select, extra_filters=None):
+        fetch_calls.append((table, extra_filters))
+        return [{"id": 7, "title": "Show", "category_id": "music"}]
+
+    applied = {}
+
+    def fake_update(client, table, scores, dry_run=False):
+        applied[table] = dict(scores)
+        return len(scores)
+
+    monkeypatch.setattr(cdq, "fetch_all", fake_fetch_all)
+    monkeypatch.setattr(cdq, "update_scores", fake_update)
+
+    result = cdq.compute_table(object(), "events", incremental=True)
+
+    assert fetch_calls == [("events", [("gte", ("updated_at", "2026-03-01T00:00:00+00:00"))])]
+    assert applied == {"events": {7: cdq.EVENT_WEIGHTS["category"]}}
+    assert result["updated"] == 1
+    assert cdq.load_watermark("events") > "2026-03-01T00:00:00+00:00"
+
+
+def test_compute_table_changed_ids_fetch_in_chunks(monkeypatch):
+    monkeypatch.setattr(cdq, "_ID_CHUNK_SIZE", 2)
+    seen = []
+
+    def fake_fetch_all(client, table, select, extra_filters=None):
+        seen.append(extra_filters)
+        return []
+
+    monkeypatch.setattr(cdq, "fetch_all", fake_fetch_all)
+    monkeypatch.setattr(cdq, "update_scores", lambda *a, **k: 0)
+
+    cdq.compute_table(object(), "venues", ids=[3, 1, 2])
+
+    assert seen == [[("in_", ("id", [1, 2]))], [("in_", ("id", [3]))]]
+
+
+class _FakeCursor:
+    def __init__(self, log):
+        self.log = log
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params=None):
+        self.log.append(("execute", sql))
+        if sql.startswith("UPDATE"):
+            self.rowcount = 2
+
+    def copy_expert(self, sql, buf):
+        self.log.append(("copy", sql, buf.read()))
+
+
+class _FakeConn:
+    def __init__(self, log):
+        self.log = log
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def cursor(self):
+        return _FakeCursor(self.log)
+
+    def close(self):
+        self.log.append(("close",))
+
+
+def test_update_scores_copies_into_temp_table_and_updates_once(monkeypatch):
+    log = []
+    monkeypatch.setattr(cdq, "_database_url", lambda: "postgres://example")
+    monkeypatch.setattr(cdq.psycopg2, "connect", lambda url: _FakeConn(log))
+
+    updated = cdq.update_scores(None, "events", {1: 40, 2: 85})
+
+    assert updated == 2
+    assert ("copy", "COPY _dq_scores (id, score) FROM STDIN", "1\t40\n2\t85\n") in log
+    updates = [entry for entry in log if entry[0] == "execute" and entry[1].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert "FROM _dq_scores" in updates[0][1]
+    assert "IS DISTINCT FROM" in updates[0][1]
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from extractors.content_reduction import TemplateMemory, reduce_html, reduction_stats
+
+
+def _page(body: str, title: str = "Midtown Music Hall") -> str:
+    return (
+        f"<html><head><title>{title}</title><style>.x{{color:red}}</style>"
+        "<script>var tracking = 1;</script></head><body>"
+        "<nav><ul><li><a href='/'>Home</a></li><li><a href='/about'>About us</a></li></ul></nav>"
+        f"<main>{body}</main>"
+        "<footer><p>© 2026 Midtown Music Hall. Privacy policy. Subscribe to our newsletter.</p></footer>"
+        "</body></html>"
+    )
+
+
+def test_html_becomes_compact_structured_text():
+    html = _page(
+        "<h2>Upcoming Shows</h2>"
+        "<p>Friday, March 6 <time datetime='2026-03-06T20:00'>8pm</time> "
+        "<a href='/tickets/42'>Get tickets</a> $25</p>"
+        "<table><tr><th>Time</th><th>Act</th></tr><tr><td>9:00 PM</td><td>The Openers</td></tr></table>"
+        "<img src='/img/poster.jpg' alt='Show poster'><img src='/img/logo.png' alt='Logo'>"
+    )
+
+    text = reduce_html(html, "https://hall.example/events", templates=None).text
+
+    assert "Page title: Midtown Music Hall" in text
+    assert "## Upcoming Shows" in text
+    assert "[Get tickets](https://hall.example/tickets/42)" in text
+    assert "8pm (2026-03-06T20:00)" in text
+    assert "| 9:00 PM | The Openers |" in text
+    assert "![Show poster](https://hall.example/img/poster.jpg)" in text
+    assert "logo.png" not in text
+    assert "tracking" not in text and "color:red" not in text
+
+
+def test_budget_keeps_schedule_over_boilerplate_in_page_order():
+    filler = "".join(f"<p>Our story paragraph {i} about the building and its history.</p>" for i in range(60))
+    html = _page(
+        f"<h2>About</h2>{filler}"
+        "<h2>Schedule</h2><ul><li>Sat, April 4 7:30 pm Jazz Night $15</li>"
+        "<li>Sun, April 5 2 pm Matinee free</li></ul>"
+    )
+
+    result = reduce_html(html, "https://hall.example/", token_budget=150, caller="test-budget", templates=None)
+
+    assert result.truncated and result.output_tokens <= 150
+    assert "Jazz Night" in result.text and "Matinee" in result.text
+    assert result.text.index("Page title") < result.text.index("Jazz Night")
+    assert "Privacy policy" not in result.text
+    stats = reduction_stats()["test-budget"]
+    assert stats["pages"] == 1 and stats["tokens_saved"] > 0
+
+
+def test_repeated_site_template_lines_are_dropped_but_dated_lines_kept():
+    memory = TemplateMemory(min_pages=3, ratio=0.6)
+    chrome = "<aside><p>Book a private party with us</p><p>Ask about gift cards</p><p>Open daily Mon 5 pm</p></aside>"
+    results = [
+        reduce_html(
+            _page(f"{chrome}<h2>Event {i}</h2><p>June {i + 1} 8 pm show number {i}</p>"),
+            f"https://hall.example/event/{i}",
+            templates=memory,
+        )
+        for i in range(4)
+    ]
+
+    assert "Book a private party" in results[0].text
+    last = results[-1]
+    assert last.template_lines_dropped > 0
+    assert "Book a private party" not in last.text
+    assert "Open daily Mon 5 pm" in last.text
+    assert "show number 3" in last.text
+
+
+def test_plain_text_input_passes_through():
+    text = "Doors 7pm\nShow 8pm\n\nTickets $20"
+    assert reduce_html(text, templates=None).text == "Doors 7pm\nShow 8pm\nTickets $20"
+
+
+def test_recurring_event_title_repeated_across_listing_pages_survives():
+    memory = TemplateMemory(min_pages=3, ratio=0.6)
+    results = [
+        reduce_html(
+            _page(f"<p>Open Mic With Sam</p><p>Oct {14 + i}, 8pm</p><p>Also this week: show {i}</p>"),
+            f"https://hall.example/events?page={i}",
+            templates=memory,
+        )
+        for i in range(5)
+    ]
+
+    assert all("Open Mic With Sam" in result.text for result in results)
+    assert "Oct 18, 8pm" in results[-1].text
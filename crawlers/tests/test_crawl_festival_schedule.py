@@ -810,3 +810,28 @@ class TestFindExistingFestivalSession:
 
         assert existing is not None
         assert existing["id"] == 101
+
+
+class TestPlaywrightFetchPool:
+    def test_startup_failure_fails_fetches_instead_of_hanging(self):
+        import builtins
+        from unittest.mock import patch
+
+        import pytest
+
+        real_import = builtins.__import__
+
+        def no_playwright(name, *args, **kwargs):
+            if name.startswith("playwright"):
+                raise ImportError("playwright not installed")
+            return real_import(name, *args, **kwargs)
+
+        pool = festival_crawler.PlaywrightFetchPool(size=2)
+        try:
+            with patch("builtins.__import__", side_effect=no_playwright):
+                with pytest.raises(ImportError):
+                    pool.fetch("https://fest.example/schedule", timeout=5)
+            with pytest.raises(RuntimeError):
+                pool.fetch("https://fest.example/other", timeout=5)
+        finally:
+            pool.shutdown()
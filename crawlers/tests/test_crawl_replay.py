@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import requests
+
+from crawl_replay import Cassette, recording, replaying
+
+
+def _fake_requests_send(self, request, **kwargs):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["content-type"] = "text/html"
+    response._content = b"<html><body>Jazz Night</body></html>"
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _fake_db_send(req):
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json"},
+        content=b'[{"id": 7, "slug": "venue"}]',
+        request=httpx.Request("GET", str(req.path)),
+    )
+
+
+def test_recorded_http_and_db_calls_replay_offline(tmp_path):
+    cassette = Cassette("venue")
+    with patch.object(requests.Session, "send", _fake_requests_send), patch(
+        "postgrest._sync.request_builder.send_with_retry", _fake_db_send
+    ), patch.dict("os.environ", {"SUPABASE_URL": "http://live.invalid", "SUPABASE_SERVICE_KEY": "a.b.c"}):
+        from config import set_database_target
+        from db.client import get_client, reset_client
+
+        set_database_target("production")
+        reset_client()
+        with recording(cassette):
+            requests.get("https://venue.example/events?page=1")
+            get_client().table("sources").select("id,slug").eq("slug", "venue").execute()
+        reset_client()
+    set_database_target("production")
+
+    path = tmp_path / "venue.json.gz"
+    cassette.save(path)
+    loaded = Cassette.load(path)
+
+    with replaying(loaded) as session:
+        from db.client import get_client
+
+        # A moved query string still finds the recorded endpoint.
+        assert "Jazz Night" in requests.get("https://venue.example/events?page=2").text
+        rows = get_client().table("sources").select("id,slug").eq("slug", "venue").execute().data
+        assert rows == [{"id": 7, "slug": "venue"}]
+        assert requests.get("https://elsewhere.example/").status_code == 404
+
+    assert session.stats.http_requests == 2
+    assert session.stats.http_misses == 1
+    assert session.stats.db_reads == 1 and session.stats.db_read_misses == 0
+
+
+def test_replay_writes_land_in_memory_db_and_are_readable():
+    with replaying(Cassette("empty")) as session:
+        from db.client import get_client
+
+        client = get_client()
+        inserted = client.table("events").insert({"title": "Show", "source_id": 3}).execute().data
+        assert inserted[0]["id"]
+        found = client.table("events").select("id,title").eq("source_id", 3).execute().data
+        assert [r["title"] for r in found] == ["Show"]
+        # Filters the stand-in can't evaluate read as empty rather than guessing.
+        assert client.table("events").select("id").gte("start_date", "2026-01-01").execute().data == []
+
+    assert session.stats.db_writes == 1
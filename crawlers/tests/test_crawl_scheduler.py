@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from crawl_scheduler import (
+    POOL_PLAYWRIGHT,
+    POOL_REQUESTS,
+    RESOURCE_LLM,
+    RESOURCE_PLAYWRIGHT,
+    RESOURCE_REQUESTS,
+    CrawlScheduler,
+    SourceEstimate,
+    llm_profile_slugs,
+    predict_durations,
+    simulate_makespan,
+)
+
+
+def _est(slug, seconds, cls=RESOURCE_REQUESTS):
+    return SourceEstimate(slug=slug, predicted_seconds=seconds, resource_class=cls, has_history=True)
+
+
+def test_predict_durations_uses_median_and_fleet_fallback():
+    history = {"amc": [1800.0, 1700.0, 1900.0], "small": [10.0, 30.0, 20.0]}
+    estimates = predict_durations(["amc", "small", "new"], history, lambda slug: RESOURCE_REQUESTS)
+
+    by_slug = {e.slug: e for e in estimates}
+    assert by_slug["amc"].predicted_seconds == 1800.0
+    assert by_slug["small"].predicted_seconds == 20.0
+    assert by_slug["new"].predicted_seconds == (1800.0 + 20.0) / 2
+    assert by_slug["new"].has_history is False
+
+
+def test_longest_first_with_stealing_beats_database_order():
+    estimates = [_est(f"s{i}", 10) for i in range(8)] + [
+        _est("cinema", 100, RESOURCE_PLAYWRIGHT),
+        _est("artcall", 90),
+    ]
+    pools = {POOL_PLAYWRIGHT: 1, POOL_REQUESTS: 2}
+
+    baseline = simulate_makespan(estimates, pools, longest_first=False, work_stealing=False)
+    planned = simulate_makespan(estimates, pools)
+
+    assert planned == 100
+    assert baseline > planned
+
+
+def test_scheduler_runs_longest_first_and_caps_llm_sources():
+    estimates = [
+        _est("short", 1),
+        _est("long", 50),
+        _est("llm-a", 5, RESOURCE_LLM),
+        _est("llm-b", 5, RESOURCE_LLM),
+        _est("llm-c", 5, RESOURCE_LLM),
+    ]
+    order: list[str] = []
+    active_llm = 0
+    max_llm = 0
+    lock = threading.Lock()
+
+    def run(slug):
+        nonlocal active_llm, max_llm
+        with lock:
+            order.append(slug)
+            if slug.startswith("llm"):
+                active_llm += 1
+                max_llm = max(max_llm, active_llm)
+        time.sleep(0.01)
+        with lock:
+            if slug.startswith("llm"):
+                active_llm -= 1
+        return slug != "short"
+
+    scheduler = CrawlScheduler(estimates, {POOL_REQUESTS: 1}, class_limits={RESOURCE_LLM: 1})
+    results = scheduler.run(run)
+
+    assert order[0] == "long"
+    assert order[-1] == "short"
+    assert max_llm == 1
+    assert results == {"long": True, "llm-a": True, "llm-b": True, "llm-c": True, "short": False}
+    assert scheduler.report["predicted_makespan_seconds"] == 66.0
+
+
+def test_requests_workers_never_take_playwright_sources():
+    estimates = [_est("browser", 10, RESOURCE_PLAYWRIGHT)] + [_est(f"r{i}", 1) for i in range(4)]
+    threads: dict[str, str] = {}
+
+    def run(slug):
+        threads[slug] = threading.current_thread().name
+        return True
+
+    CrawlScheduler(estimates, {POOL_PLAYWRIGHT: 1, POOL_REQUESTS: 2}).run(run)
+
+    assert threads["browser"].startswith("crawl-playwright")
+
+
+def test_timeout_marks_unfinished_sources_failed():
+    release = threading.Event()
+
+    def run(slug):
+        if slug == "stuck":
+            release.wait(1)
+        return True
+
+    scheduler = CrawlScheduler(
+        [_est("stuck", 10), _est("queued", 1)], {POOL_REQUESTS: 1}
+    )
+    timer = threading.Timer(0.3, release.set)
+    timer.start()
+    results = scheduler.run(run, timeout=0.05)
+    timer.cancel()
+
+    assert results == {"stuck": False, "queued": False}
+
+
+def test_llm_profile_slugs_detects_html_discovery(tmp_path):
+    (tmp_path / "llm-venue.yaml").write_text(
+        "slug: llm-venue\ndiscovery:\n  enabled: true\n  type: html\n  urls: []\n"
+    )
+    (tmp_path / "list-venue.yaml").write_text(
+        "slug: list-venue\ndiscovery:\n  type: list\ndetail:\n  type: html\n"
+    )
+
+    assert llm_profile_slugs(tmp_path) == frozenset({"llm-venue"})
@@ -128,3 +128,63 @@ def test_cancel_stale_runs_marks_old_running_rows_cancelled(monkeypatch, tmp_pat
     assert rows[1]["source_slug"] == "stale-source"
     assert rows[1]["status"] == "cancelled"
     assert rows[1]["error_type"] == "cancelled"
+
+
+def test_run_events_update_in_memory_health_and_batch_commits(monkeypatch, tmp_path):
+    import sqlite3
+
+    import crawler_health as ch
+
+    db_path = tmp_path / "crawler_health.db"
+    monkeypatch.setattr(ch, "HEALTH_DB_PATH", str(db_path))
+    monkeypatch.setattr(ch, "FLUSH_INTERVAL_SECONDS", 60)
+
+    ok_run = ch.record_crawl_start("terminal-west")
+    ch.record_crawl_success(ok_run, 12, 3, 9)
+    bad_run = ch.record_crawl_start("flaky-source")
+    ch.record_crawl_failure(bad_run, "Connection reset by peer")
+
+    # Not committed yet: another connection sees nothing.
+    with sqlite3.connect(db_path) as other:
+        assert other.execute("SELECT COUNT(*) FROM crawl_runs").fetchone()[0] == 0
+
+    health = ch.get_source_health("flaky-source")
+    assert health.consecutive_failures == 1
+    assert health.health_score == 95.0
+    assert ch.get_source_health("terminal-west").successful_crawls == 1
+
+    ch.flush_health_writes()
+    with sqlite3.connect(db_path) as other:
+        rows = other.execute("SELECT source_slug, status FROM crawl_runs ORDER BY id").fetchall()
+        scores = dict(other.execute("SELECT source_slug, health_score FROM source_health").fetchall())
+    assert rows == [("terminal-west", "success"), ("flaky-source", "failed")]
+    assert scores == {"terminal-west": 100.0, "flaky-source": 95.0}
+
+
+def test_cleanup_rolls_old_runs_up_instead_of_deleting(monkeypatch, tmp_path):
+    import crawler_health as ch
+
+    monkeypatch.setattr(ch, "HEALTH_DB_PATH", str(tmp_path / "crawler_health.db"))
+    old_day = (datetime.utcnow() - timedelta(days=90)).strftime("%Y-%m-%d")
+    with ch.get_db() as conn:
+        for found, status in ((10, "success"), (14, "success"), (0, "failed")):
+            conn.execute(
+                """
+                INSERT INTO crawl_runs (source_slug, started_at, status, events_found, duration_seconds)
+                VALUES ('amc', ?, ?, ?, 60)
+                """,
+                (f"{old_day}T03:00:00", status, found),
+            )
+        conn.commit()
+    run_id = ch.record_crawl_start("amc")
+    ch.record_crawl_success(run_id, 20, 0, 20)
+
+    ch.cleanup_old_data(days_to_keep=30)
+
+    trend = {row["day"]: row for row in ch.get_daily_trend("amc")}
+    assert trend[old_day]["runs"] == 3
+    assert trend[old_day]["successes"] == 2
+    assert trend[old_day]["events_found"] == 24
+    assert sum(row["runs"] for row in trend.values()) == 4
+    with ch.get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM crawl_runs").fetchone()[0] == 1
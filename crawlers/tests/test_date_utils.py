@@ -1,6 +1,9 @@
 from datetime import date
 
-from date_utils import normalize_iso_date, parse_human_date
+import pytest
+
+import date_utils
+from date_utils import normalize_iso_date, parse_human_date, parse_time_text
 
 
 def test_parse_human_date_rolls_to_next_year_near_year_end():
@@ -37,3 +40,61 @@ def test_normalize_iso_date_rejects_unhealable_far_future():
         today=date(2026, 2, 10),
     )
     assert normalized is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Fri, Mar 6",
+        "Tue. Jun 2",
+        "Thurs, Jun 4",
+        "MARCH 6",
+        "Sept 6",
+        "March 6th, 2026",
+        "6th March",
+        "6 March 2026",
+        "3/6/2026",
+        "2026-03-06T19:00:00-05:00",
+        "Feb 30",
+        "Jan 15",
+    ],
+)
+def test_fast_path_matches_dateutil(text):
+    today = date(2026, 2, 10)
+    args = (text, None, today, date_utils.MAX_FUTURE_DAYS_DEFAULT, date_utils.ROLLOVER_GRACE_DAYS_DEFAULT)
+    assert date_utils._parse_human_date(*args) == date_utils._parse_human_date(*args, fast=False)
+
+
+def test_parse_human_date_cache_is_keyed_by_reference_date():
+    assert parse_human_date("Jan 15", today=date(2026, 12, 10)) == "2027-01-15"
+    assert parse_human_date("Jan 15", today=date(2026, 2, 10)) == "2026-01-15"
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("7pm", "19:00"),
+        ("7:30 p.m.", "19:30"),
+        ("12am", "00:00"),
+        ("19:30", "19:30"),
+        ("noon", "12:00"),
+        ("7-10pm", "19:00"),
+        ("10-4pm", "10:00"),
+        ("11-1pm", "11:00"),
+        ("11-12pm", "11:00"),
+        ("12-3pm", "12:00"),
+        ("9 - 2am", "21:00"),
+        ("March 6 - 7pm", "19:00"),
+        ("Mar 6 – 8pm", "20:00"),
+        ("May 2 - 10am", "10:00"),
+        ("June 5 to 6 pm", "18:00"),
+        ("Sat, Mar 14 - 7:00 PM", "19:00"),
+        ("Saturday 14 - 8pm", "20:00"),
+        ("14 - 7pm", "19:00"),
+        ("Doors 7pm / Show 8pm", "20:00"),
+        ("Doors: 6:30 | Show: 7:30", "19:30"),
+        ("TBA", None),
+    ],
+)
+def test_parse_time_text(text, expected):
+    assert parse_time_text(text) == expected
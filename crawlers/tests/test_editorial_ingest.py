@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import editorial_ingest as ei
+from feed_fetcher import FeedStateStore
+
+SUB_SITEMAP = "https://atlanta.eater.com/sitemaps/entries/2026/3"
+
+
+def test_sub_sitemap_lastmod_is_kept_until_every_article_fetch_succeeds(tmp_path, monkeypatch):
+    state = FeedStateStore(tmp_path / "state.json")
+    articles = ["https://atlanta.eater.com/a", "https://atlanta.eater.com/b"]
+    upserted: list[str] = []
+    failing = {"https://atlanta.eater.com/b"}
+
+    def fake_index_entries(source_config, cutoff_dt, state, scope):
+        state.stage(scope, SUB_SITEMAP, lastmod="2026-03-31")
+        return [{"title": "t", "url": url, "published_at": None, "snippet": None} for url in articles]
+
+    def fake_fetch(url):
+        if url in failing:
+            return None, None, None
+        return "Title", "body", None
+
+    monkeypatch.setattr(ei, "fetch_sitemap_index_entries", fake_index_entries)
+    monkeypatch.setattr(ei, "fetch_article_text", fake_fetch)
+    monkeypatch.setattr(ei, "get_existing_article_urls", lambda key: set(upserted))
+    monkeypatch.setattr(ei, "match_venues", lambda title, body: (set(), set()))
+    monkeypatch.setattr(ei, "upsert_mention", lambda mention: upserted.append(mention["article_url"]) or True)
+    monkeypatch.setattr(ei, "writes_enabled", lambda: True)
+
+    config = {"method": "sitemap_index", "display_name": "Eater"}
+    cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    ei.ingest_source("eater", config, cutoff, state=state)
+    assert upserted == ["https://atlanta.eater.com/a"]
+    assert not state.is_unchanged(SUB_SITEMAP, "2026-03-31")
+
+    failing.clear()
+    ei.ingest_source("eater", config, cutoff, state=state)
+    assert upserted == ["https://atlanta.eater.com/a", "https://atlanta.eater.com/b"]
+    assert state.is_unchanged(SUB_SITEMAP, "2026-03-31")
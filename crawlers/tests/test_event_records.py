@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from db.event_records import EventRecord, RecordTable
+
+
+def test_records_share_one_column_index_and_read_like_dicts():
+    table = RecordTable.from_rows(
+        [
+            {"id": 1, "title": "Film A", "content_hash": "a", "tags": ["film"]},
+            {"id": 2, "title": "Film B", "content_hash": "b", "tags": None},
+        ]
+    )
+    first, second = table
+
+    assert first._index is second._index
+    assert first["title"] == "Film A"
+    assert second.get("tags") is None
+    assert first.get("missing", "default") == "default"
+    assert "content_hash" in first and "missing" not in first
+    assert {**first, "title": "New"} == {"id": 1, "title": "New", "content_hash": "a", "tags": ["film"]}
+    assert first.to_dict() == dict(first)
+
+
+def test_records_are_read_only():
+    (record,) = RecordTable.from_rows([{"id": 1}])
+    with pytest.raises(TypeError):
+        record["id"] = 2
+    with pytest.raises(AttributeError):
+        record.extra = 1
+
+
+def test_projection_and_index_skip_empty_keys():
+    table = RecordTable.from_rows(
+        [{"id": 1, "content_hash": "a", "raw_text": "x" * 1000}, {"id": 2, "content_hash": None}],
+        columns=("id", "content_hash"),
+    )
+
+    index = table.index_by("content_hash")
+    assert list(index) == ["a"]
+    assert "raw_text" not in index["a"]
+
+
+def test_prefetch_events_by_source_returns_compact_records():
+    from db.events import prefetch_events_by_source
+
+    client = MagicMock()
+    client.table.return_value.select.return_value.eq.return_value.eq.return_value.execute.return_value.data = [
+        {"id": 10, "content_hash": "h1", "title": "Show"},
+        {"id": 11, "content_hash": "", "title": "No hash"},
+    ]
+    with patch("db.events.get_client", return_value=client):
+        cached = prefetch_events_by_source(5)
+
+    assert list(cached) == ["h1"]
+    assert isinstance(cached["h1"], EventRecord)
+    assert cached["h1"]["id"] == 10
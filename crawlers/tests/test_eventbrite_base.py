@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from sources._eventbrite_base import (
+    AdaptiveRateLimiter,
+    EventbriteApi,
+    EventIdIndex,
+    crawl_eventbrite,
+)
+
+
+def _payload(event_id: str, start: str = "2099-05-01T19:00:00", changed: str = "2026-01-01T00:00:00Z") -> dict:
+    return {
+        "id": event_id,
+        "name": {"text": f"Event {event_id}"},
+        "start": {"local": start},
+        "changed": changed,
+        "url": f"https://www.eventbrite.com/e/event-{event_id}",
+    }
+
+
+class _FakeApi:
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.fetched: list[str] = []
+        self.limiter = AdaptiveRateLimiter(min_interval=0)
+
+    def fetch_event(self, event_id):
+        self.fetched.append(event_id)
+        return self.payloads.get(event_id)
+
+
+def test_limiter_backs_off_on_throttle_and_recovers():
+    limiter = AdaptiveRateLimiter(min_interval=0.2, max_interval=1.0)
+
+    assert limiter.on_throttle("3") == 3.0
+    assert limiter.interval == 0.4
+    assert limiter.on_throttle(None) == limiter.default_cooldown * 2  # second 429 in a row
+    limiter.on_throttle(None)
+    assert limiter.interval == 1.0  # capped
+
+    for _ in range(50):
+        limiter.on_success()
+    assert limiter.interval == 0.2
+    assert limiter.throttled == 3
+
+
+def test_fetch_event_retries_after_429():
+    responses = [
+        SimpleNamespace(status_code=429, headers={"Retry-After": "0.01"}),
+        SimpleNamespace(status_code=200, headers={}, raise_for_status=lambda: None, json=lambda: {"id": "1"}),
+    ]
+    session = SimpleNamespace(get=lambda *a, **k: responses.pop(0))
+    api = EventbriteApi(AdaptiveRateLimiter(min_interval=0))
+
+    with patch.object(EventbriteApi, "_session", return_value=session):
+        assert api.fetch_event("1") == {"id": "1"}
+    assert api.limiter.throttled == 1
+
+
+def test_crawl_skips_recently_checked_and_unchanged_ids(tmp_path):
+    payloads = {"1": _payload("1"), "2": _payload("2")}
+    processed: list[str] = []
+
+    def process(event_data):
+        processed.append(event_data["id"])
+        return {"title": event_data["name"]["text"], "start_date": "2099-05-01"} if event_data["id"] == "1" else {"status": "exists"}
+
+    def run(api, recheck_hours=72.0):
+        index = EventIdIndex("eventbrite", recheck_hours=recheck_hours, directory=tmp_path)
+        with patch("sources._eventbrite_base.discover_event_ids", return_value=["1", "2"]), patch(
+            "sources._eventbrite_base.insert_event"
+        ) as insert, patch("sources._eventbrite_base.writes_enabled", return_value=True):
+            result = crawl_eventbrite(
+                {"slug": "eventbrite"}, browse_urls=[], process_event=process, api=api, index=index
+            )
+        return result, insert
+
+    api = _FakeApi(payloads)
+    (found, new, updated), insert = run(api)
+    assert (found, new, updated) == (2, 1, 1)
+    assert insert.call_count == 1 and processed == ["1", "2"]
+
+    # Next night: both checked recently, nothing is fetched.
+    api = _FakeApi(payloads)
+    assert run(api)[0] == (2, 0, 0)
+    assert api.fetched == []
+
+    # Past the recheck window: fetched again, but only the changed one is reprocessed.
+    payloads["2"] = _payload("2", changed="2026-02-01T00:00:00Z")
+    payloads["2"]["name"] = {"text": "Renamed"}
+    api = _FakeApi(payloads)
+    processed.clear()
+    assert run(api, recheck_hours=0)[0] == (2, 0, 1)
+    assert sorted(api.fetched) == ["1", "2"]
+    assert processed == ["2"]
+
+
+def test_events_starting_soon_are_always_rechecked(tmp_path):
+    index = EventIdIndex("eb", directory=tmp_path)
+    index.record("soon", _payload("soon", start="2026-05-02T10:00:00"))
+    index.record("later", _payload("later", start="2026-06-30T10:00:00"))
+    index.commit()
+
+    assert index.needs_fetch("soon", today=date(2026, 5, 1))
+    assert not index.needs_fetch("later", today=date(2026, 5, 1))
+    assert index.needs_fetch("unknown", today=date(2026, 5, 1))
+
+
+def test_failed_processing_is_retried_next_run(tmp_path):
+    payloads = {"1": _payload("1")}
+    outcomes = [{"status": "error"}, {"title": "Event 1", "start_date": "2099-05-01"}]
+
+    def run():
+        index = EventIdIndex("eventbrite", directory=tmp_path)
+        with patch("sources._eventbrite_base.discover_event_ids", return_value=["1"]), patch(
+            "sources._eventbrite_base.insert_event"
+        ) as insert, patch("sources._eventbrite_base.writes_enabled", return_value=True):
+            result = crawl_eventbrite(
+                {"slug": "eventbrite"},
+                browse_urls=[],
+                process_event=lambda event_data: outcomes.pop(0),
+                api=_FakeApi(payloads),
+                index=index,
+            )
+        return result, insert
+
+    (found, new, _updated), insert = run()
+    assert (found, new) == (1, 0) and insert.call_count == 0
+
+    (found, new, _updated), insert = run()
+    assert (found, new) == (1, 1) and insert.call_count == 1
+    assert outcomes == []
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import re
+from unittest.mock import patch
+
+import extract
+
+
+def _page(title: str, day: int) -> str:
+    return f"<html><body><h1>{title}</h1><p>March {day}, 2026 at 8pm. Tickets $10.</p></body></html>"
+
+
+def _event(title: str, day: int) -> dict:
+    return {
+        "title": title,
+        "start_date": f"2026-03-{day:02d}",
+        "start_time": "20:00",
+        "category": "music",
+        "venue": {"name": "Hall"},
+        "confidence": 0.9,
+    }
+
+
+def test_batch_packs_small_pages_and_splits_answers_per_page():
+    items = [
+        (_page("Jazz Night", 6), "https://a.example/events", "Venue A"),
+        (_page("Folk Night", 7), "https://b.example/events", "Venue B"),
+        (_page("Blues Night", 8), "https://c.example/events", "Venue C"),
+    ]
+    prompts: list[str] = []
+
+    def fake_generate(system_prompt, user_message, **kwargs):
+        prompts.append(user_message)
+        assert "BATCH MODE" in system_prompt
+        pages = []
+        for n, title, day in re.findall(r"=== PAGE (\d+) .*?===\n.*?# (\w+ Night)\nMarch (\d+)", user_message, re.S):
+            pages.append({"page": int(n), "events": [_event(title, int(day))]})
+        return json.dumps({"pages": pages})
+
+    with patch("extract.generate_text", side_effect=fake_generate):
+        results = extract.extract_events_by_page(items)
+
+    assert len(prompts) == 1
+    assert [[e.title for e in events] for events in results] == [["Jazz Night"], ["Folk Night"], ["Blues Night"]]
+    assert results[1][0].start_date == "2026-03-07"
+
+
+def test_pages_missing_from_batch_answer_are_extracted_individually():
+    items = [
+        (_page("Jazz Night", 6), "https://a.example/events"),
+        (_page("Folk Night", 7), "https://b.example/events"),
+    ]
+    calls: list[str] = []
+
+    def fake_generate(system_prompt, user_message, **kwargs):
+        if "BATCH MODE" in system_prompt:
+            calls.append("batch")
+            return json.dumps({"pages": [{"page": 1, "events": [_event("Jazz Night", 6)]}]})
+        calls.append("single")
+        assert "b.example" in user_message
+        return json.dumps({"events": [_event("Folk Night", 7)]})
+
+    with patch("extract.generate_text", side_effect=fake_generate):
+        events = extract.extract_events_batch(items, "Sweep")
+
+    assert calls == ["batch", "single"]
+    assert sorted(e.title for e in events) == ["Folk Night", "Jazz Night"]
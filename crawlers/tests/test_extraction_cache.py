@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+
+import extraction_cache
+from extraction_cache import _MemoStore, memoized_extractor
+
+_PAGE = """<html><head><!-- generated in 0.{n}s -->
+<meta name="csrf-token" content="tok{n}">
+<script type="application/ld+json">{{"@type": "Event", "name": "Jazz Night", "startDate": "2026-05-01T20:00"}}</script>
+</head><body><p>Jazz Night</p></body></html>"""
+
+
+@pytest.fixture
+def cache_on(monkeypatch, tmp_path):
+    monkeypatch.setenv("CRAWLER_EXTRACTION_CACHE", "1")
+    monkeypatch.setenv("CRAWLER_EXTRACTION_CACHE_PATH", str(tmp_path / "extraction_cache.db"))
+
+
+def _counting(name="test", version="1", **options):
+    calls = []
+
+    @memoized_extractor(name, version=version, **options)
+    def extract(html, url=None):
+        calls.append(url)
+        return {"title": "Jazz Night", "url": url} if "Jazz" in html else {}
+
+    return extract, calls
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("CRAWLER_EXTRACTION_CACHE", raising=False)
+    extract, calls = _counting()
+    extract(_PAGE.format(n=1))
+    extract(_PAGE.format(n=1))
+    assert len(calls) == 2
+
+
+def test_unchanged_page_is_served_from_cache(cache_on):
+    extract, calls = _counting()
+
+    first = extract(_PAGE.format(n=1), "https://example.com/a")
+    # Same content, different per-request noise: still a hit.
+    assert extract(_PAGE.format(n=2), "https://example.com/a") == first
+    assert len(calls) == 1
+
+    extract(_PAGE.format(n=1), "https://example.com/b")  # other arguments are part of the key
+    bumped, bumped_calls = _counting(version="2")
+    bumped(_PAGE.format(n=1), "https://example.com/a")
+    assert len(calls) == 2 and len(bumped_calls) == 1
+
+
+def test_empty_results_not_replayed_when_disabled_for_extractor(cache_on):
+    extract, calls = _counting(name="llm", cache_empty=False)
+    extract("<p>nothing here</p>")
+    extract("<p>nothing here</p>")
+    assert len(calls) == 2
+
+
+def test_real_extractor_round_trips(cache_on):
+    from extractors.structured import extract_jsonld_event_fields
+
+    fresh = extract_jsonld_event_fields(_PAGE.format(n=1))
+    assert fresh and extract_jsonld_event_fields(_PAGE.format(n=3)) == fresh
+    assert extraction_cache.extraction_cache_stats()["hits"] == 1
+
+
+def test_eviction_keeps_most_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(extraction_cache, "EVICT_EVERY", 1)
+    store = _MemoStore(str(tmp_path / "memo.db"), max_bytes=250)
+    for i in range(5):
+        store.put(f"k{i}", "test", "x" * 100)
+
+    assert store.get("k4") is not None
+    assert store.get("k0") is None
+    total = store.conn.execute("SELECT SUM(size) FROM extractions").fetchone()[0]
+    assert total <= 250
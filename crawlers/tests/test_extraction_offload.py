@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from extractors.offload import ExtractionPool
+
+_PAGE = (
+    "<html><head><meta property='og:description' content='A long enough description of the "
+    "evening lineup, with doors at seven and music until late.'></head><body></body></html>"
+)
+
+
+def _crash_outside(html: str, url: str, pid: int) -> dict:
+    if os.getpid() != pid:
+        os._exit(1)  # simulate a worker segfault
+    return {"url": url, "chars": len(html)}
+
+
+def test_disabled_pool_runs_in_thread_and_honors_patches():
+    pool = ExtractionPool(0)
+
+    with patch("description_fetcher.extract_description_from_html", return_value="patched"):
+        assert pool.run("description", _PAGE) == "patched"
+    assert pool.inline == 1 and pool.offloaded == 0
+
+    with pytest.raises(ValueError):
+        pool.submit("no-such-extractor", _PAGE)
+
+
+def test_worker_results_match_in_thread_and_survive_a_dead_worker():
+    expected = ExtractionPool(0).run("description", _PAGE)
+    pool = ExtractionPool(1, min_offload_bytes=0)
+    try:
+        assert pool.run("description", _PAGE) == expected
+        assert pool.offloaded == 1
+
+        # The worker dies mid-job: the job is redone here and the pool restarts.
+        assert pool.run(_crash_outside, _PAGE, "https://example.com", os.getpid()) == {
+            "url": "https://example.com",
+            "chars": len(_PAGE),
+        }
+        assert pool.fallbacks == 1
+        assert pool.run("description", _PAGE) == expected
+    finally:
+        pool.shutdown()
+
+
+def test_detail_jobs_that_call_the_llm_stay_in_the_parent():
+    from pipeline.models import DetailConfig
+
+    pool = ExtractionPool(2, min_offload_bytes=0)
+    config = DetailConfig(enabled=True, use_llm=True)
+    try:
+        llm_fields = {"ticket_url": "https://t.example/1"}
+        with patch("pipeline.detail_enrich.extract_detail_with_llm", return_value=llm_fields) as llm:
+            result = pool.run("detail", _PAGE, "https://venue.example/e/1", "Venue", config)
+    finally:
+        pool.shutdown()
+
+    llm.assert_called_once()
+    assert result["ticket_url"] == "https://t.example/1"
+    assert pool.inline == 1 and pool.offloaded == 0
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import feed_fetcher as ff
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.headers = {}
+
+    def get(self, url, timeout=None, headers=None, **kwargs):
+        self.calls.append((url, dict(headers or {})))
+        return self.responses.pop(0)
+
+
+def _response(status_code=200, headers=None, text="ok"):
+    resp = SimpleNamespace(status_code=status_code, headers=headers or {}, text=text)
+    resp.raise_for_status = lambda: None
+    return resp
+
+
+def test_domain_pacer_spaces_same_domain_only(monkeypatch):
+    now = [100.0]
+    sleeps = []
+    monkeypatch.setattr(ff.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(ff.time, "sleep", lambda seconds: sleeps.append(seconds))
+
+    pacer = ff.DomainPacer(min_interval=1.5)
+    pacer.wait("https://www.example.com/a")
+    pacer.wait("https://other.example.org/feed")
+    pacer.wait("https://example.com/b")
+
+    assert sleeps == [1.5]
+
+
+def test_state_store_only_persists_committed_scopes(tmp_path: Path):
+    path = tmp_path / "feed_state.json"
+    store = ff.FeedStateStore(path)
+    store.stage("eater", "https://eater.example/sitemaps/1", lastmod="2026-03-01")
+    store.stage("infatuation", "https://inf.example/sitemap.xml", etag='"abc"')
+    store.commit("eater")
+    store.discard("infatuation")
+    store.save()
+
+    reloaded = ff.FeedStateStore(path)
+    assert reloaded.is_unchanged("https://eater.example/sitemaps/1", "2026-03-01")
+    assert not reloaded.is_unchanged("https://eater.example/sitemaps/1", "2026-03-02")
+    assert reloaded.get("https://inf.example/sitemap.xml") == {}
+
+
+def test_get_if_changed_sends_validators_and_handles_304(tmp_path: Path):
+    store = ff.FeedStateStore(tmp_path / "feed_state.json")
+    fetcher = ff.FeedFetcher(min_interval=0)
+    session = _FakeSession([
+        _response(headers={"ETag": '"v1"', "Last-Modified": "Tue, 03 Mar 2026 00:00:00 GMT"}),
+        _response(status_code=304),
+    ])
+    fetcher._local.session = session
+
+    first = fetcher.get_if_changed("https://feed.example/rss", store, scope="feed")
+    assert first is not None
+    store.commit("feed")
+
+    second = fetcher.get_if_changed("https://feed.example/rss", store, scope="feed")
+    assert second is None
+    assert session.calls[1][1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 03 Mar 2026 00:00:00 GMT",
+    }
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import time
+
+from geocoding import Geocoder, normalize_address
+
+
+class _Lookup:
+    def __init__(self, results):
+        self.results = results
+        self.queries: list[str] = []
+
+    def __call__(self, query):
+        self.queries.append(query)
+        return self.results.get(query)
+
+
+def test_normalize_address_folds_spelling_and_units():
+    assert normalize_address("675 Ponce de Leon Avenue NE, Suite 100", "Atlanta", "GA") == normalize_address(
+        "675 ponce de leon ave. ne #204", "atlanta", "ga"
+    )
+    assert normalize_address("1 Main St", "Atlanta", "GA") != normalize_address("1 Main St", "Decatur", "GA")
+
+
+def test_shared_addresses_cost_one_lookup_and_feed_neighborhoods(tmp_path):
+    lookup = _Lookup({"675 Ponce de Leon Ave NE, Atlanta, GA": (33.7726, -84.3655)})
+    geocoder = Geocoder(path=tmp_path / "geo.json", lookup=lookup, min_interval=0)
+    places = [
+        {"id": 1, "address": "675 Ponce de Leon Ave NE"},
+        {"id": 2, "address": "675 Ponce De Leon Avenue NE, Suite 9"},
+        {"id": 3, "address": None},
+    ]
+
+    results = list(geocoder.geocode_batch(places))
+
+    assert [place["id"] for place, _ in results] == [1, 2]
+    assert len(lookup.queries) == 1
+    assert all(geo.found for _, geo in results)
+    assert results[0][1].neighborhood == "Old Fourth Ward"
+    assert geocoder.neighborhood_for("675 Ponce de Leon Ave NE") == "Old Fourth Ward"
+
+
+def test_cache_persists_hits_and_misses_across_runs(tmp_path):
+    path = tmp_path / "geo.json"
+    lookup = _Lookup({"1 Real St, Atlanta, GA": (33.75, -84.39)})
+    first = Geocoder(path=path, lookup=lookup, min_interval=0)
+    list(first.geocode_batch([{"address": "1 Real St"}, {"address": "404 Nowhere Rd"}]))
+
+    second = Geocoder(path=path, lookup=lookup, min_interval=0)
+    assert second.geocode("1 Real St").coords == (33.75, -84.39)
+    assert second.geocode("404 Nowhere Road").found is False
+    assert len(lookup.queries) == 2
+    assert second.lookups == 0
+
+    retry = Geocoder(path=path, lookup=lookup, min_interval=0, retry_misses=True)
+    retry.geocode("404 Nowhere Rd")
+    assert len(lookup.queries) == 3
+
+
+def test_stale_misses_and_lookup_errors_are_retried(tmp_path):
+    path = tmp_path / "geo.json"
+    key = normalize_address("404 Nowhere Rd", "Atlanta", "GA")
+    path.write_text(json.dumps({key: {"lat": None, "lng": None, "fetched_at": time.time() - 90 * 86400}}))
+
+    calls: list[str] = []
+
+    def flaky(query):
+        calls.append(query)
+        raise TimeoutError("nominatim down")
+
+    geocoder = Geocoder(path=path, lookup=flaky, min_interval=0)
+    assert geocoder.geocode("404 Nowhere Rd").found is False
+    assert geocoder.geocode("404 Nowhere Rd").found is False
+    assert len(calls) == 2
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import data_quality
+import health_analytics
+import watchdog
+from health_analytics import SourceHealthSnapshot, load_source_health_snapshot, quality_counts
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def _ts(days_ago: float) -> str:
+    return (NOW - timedelta(days=days_ago)).isoformat()
+
+
+class _Query:
+    def __init__(self, rows):
+        self._rows = rows
+        self._range = None
+
+    def __getattr__(self, _name):
+        # select/eq/gte/lte/order: the fake returns every row regardless.
+        return lambda *args, **kwargs: self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def execute(self):
+        start, end = self._range or (0, len(self._rows) - 1)
+        return type("Resp", (), {"data": self._rows[start : end + 1]})()
+
+
+class _Client:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls: list[str] = []
+
+    def table(self, name):
+        self.calls.append(name)
+        return _Query(self.tables.get(name, []))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_snapshot(monkeypatch, tmp_path):
+    monkeypatch.setattr(health_analytics, "SNAPSHOT_CACHE_PATH", tmp_path / "snapshot.json")
+    health_analytics.clear_source_health_snapshot()
+    yield
+    health_analytics.clear_source_health_snapshot()
+
+
+def test_quality_counts_match_metric_fields():
+    events = [
+        {"title": "Show", "description": "A long enough description here.", "start_time": "20:00",
+         "image_url": "x.jpg", "price_min": 10, "created_at": _ts(1)},
+        {"title": "Film TBA", "description": "Coming soon", "start_time": None, "is_all_day": False,
+         "image_url": "", "is_free": True, "created_at": _ts(10)},
+        {"title": "Old", "description": None, "start_time": "19:00", "created_at": _ts(40)},
+    ]
+    w = health_analytics._windows(30, NOW)
+
+    counts = quality_counts(events, w["cutoff"], w["week_ago"], w["two_weeks_ago"])
+    metrics = data_quality.metrics_from_counts("src", "Source", counts)
+
+    assert metrics.total_events == 2
+    assert metrics.events_with_time == 1
+    assert metrics.events_with_image == 1
+    assert metrics.events_with_price == 2
+    assert metrics.tba_count == 1
+    assert metrics.coming_soon_count == 1
+    assert metrics.missing_time_count == 1
+    assert (counts["recent_total"], counts["previous_total"]) == (1, 1)
+
+
+def test_rest_fallback_builds_fleet_snapshot_in_a_few_scans(monkeypatch):
+    sources = [
+        {"id": 1, "slug": "terminal-west", "name": "Terminal West", "health_tags": [], "active_months": []},
+        {"id": 2, "slug": "plaza-theatre", "name": "Plaza Theatre", "health_tags": [], "active_months": []},
+        {"id": 3, "slug": "new-source", "name": "New", "health_tags": [], "active_months": []},
+    ]
+    logs = [{"source_id": 1, "events_found": n} for n in (0, 0, 12, 14, 10)] + [
+        {"source_id": 2, "events_found": 8},
+        {"source_id": 99, "events_found": 3},
+    ]
+    events = [
+        {"id": i, "source_id": 2, "title": f"Film {i}", "description": "x" * 40, "start_time": "19:00",
+         "image_url": "p.jpg", "price_min": 12, "created_at": _ts(i % 12), "category_id": "film"}
+        for i in range(6)
+    ]
+    client = _Client({"sources": sources, "crawl_logs": logs, "events": events})
+    monkeypatch.setattr("db.client.get_client", lambda: client)
+    monkeypatch.setattr(health_analytics, "_build_via_sql", lambda days: (_ for _ in ()).throw(RuntimeError("no db")))
+
+    snapshot = load_source_health_snapshot()
+
+    history = {row["slug"]: row for row in snapshot.run_history()}
+    assert set(history) == {"terminal-west", "plaza-theatre"}
+    assert history["terminal-west"]["consecutive_zeros"] == 2
+    assert history["terminal-west"]["recent_avg"] == pytest.approx(36 / 5)
+    assert snapshot.quality_for(2)["total"] == 6
+    assert snapshot.category_coverage == {"film": 6}
+    assert snapshot.producing_source_ids == [2]
+    assert len(client.calls) == 4
+
+    # Every consumer reads the same snapshot without going back to the DB.
+    assert [r.slug for r in watchdog.detect_regressions()] == ["terminal-west"]
+    assert [m.source_slug for m in data_quality.get_all_source_quality()] == ["plaza-theatre"]
+    assert [s["slug"] for s in data_quality.get_cinema_quality_report()["sources"]] == ["plaza-theatre"]
+    assert len(client.calls) == 4
+
+
+def test_snapshot_is_reused_from_disk_until_refresh(monkeypatch):
+    built: list[int] = []
+
+    def build(days):
+        built.append(days)
+        return SourceHealthSnapshot(
+            days=days,
+            sources=[{"id": 7, "slug": "s", "name": "S"}],
+            run_counts={7: [3, 4]},
+            quality={7: dict.fromkeys(health_analytics.QUALITY_FIELDS, 1)},
+            category_coverage={"music": 2},
+            producing_source_ids=[7],
+        )
+
+    monkeypatch.setattr(health_analytics, "_build_via_sql", build)
+
+    load_source_health_snapshot()
+    health_analytics.clear_source_health_snapshot()
+    restored = load_source_health_snapshot()
+    load_source_health_snapshot(refresh=True)
+
+    assert built == [30, 30]
+    assert restored.run_counts == {7: [3, 4]}
+    assert restored.quality_for(7)["total"] == 1
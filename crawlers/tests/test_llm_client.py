@@ -1,10 +1,13 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from types import SimpleNamespace
 from unittest.mock import patch
 
 import llm_client
 
 
-def _cfg(openai_key: str = "", anthropic_key: str = ""):
+def _cfg(openai_key: str = "", anthropic_key: str = "", **llm_settings):
     return SimpleNamespace(
         llm=SimpleNamespace(
             openai_api_key=openai_key,
@@ -14,6 +17,7 @@ def _cfg(openai_key: str = "", anthropic_key: str = ""):
             openai_model="gpt-4o-mini",
             max_tokens=1024,
             temperature=0.0,
+            **llm_settings,
         ),
         crawler=SimpleNamespace(request_timeout=30, max_retries=2),
     )
@@ -51,3 +55,90 @@ def test_generate_text_does_not_fallback_on_non_provider_bug():
                 assert str(exc) == "prompt parse bug"
             else:
                 raise AssertionError("Expected ValueError to be re-raised")
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+def test_rate_limited_request_is_retried_after_retry_after_and_counted():
+    delays: list[float] = []
+    with patch("llm_client.get_config", return_value=_cfg(anthropic_key="anthropic")), patch(
+        "llm_client._call_provider",
+        side_effect=[_StatusError(429, {"retry-after": "0.05"}), ("ok", 120, 30)],
+    ), patch("llm_client.time.sleep", side_effect=delays.append):
+        result = llm_client.generate_text("system", "user", caller="test-retry")
+
+    assert result == "ok"
+    assert delays and delays[0] >= 0.05
+    metrics = llm_client.llm_metrics()["test-retry"]
+    assert metrics["requests"] == 2 and metrics["retries"] == 1
+    assert metrics["errors"] == {"anthropic:429": 1}
+    assert (metrics["input_tokens"], metrics["output_tokens"]) == (120, 30)
+
+
+def test_slow_primary_is_hedged_to_alternate_provider():
+    release = threading.Event()
+
+    def call(provider, system_prompt, user_message, model):
+        if provider == "anthropic":
+            release.wait(5)
+            return "slow", 1, 1
+        return "fast", 1, 1
+
+    cfg = _cfg(openai_key="openai", anthropic_key="anthropic", hedge_after_seconds=0.05)
+    try:
+        with patch("llm_client.get_config", return_value=cfg), patch("llm_client._call_provider", side_effect=call):
+            result = llm_client.generate_text("system", "user", provider_override="anthropic", caller="test-hedge")
+    finally:
+        release.set()
+
+    assert result == "fast"
+    assert llm_client.llm_metrics()["test-hedge"]["hedges"] == 1
+
+
+def test_hedge_clock_starts_only_once_the_primary_holds_a_slot():
+    calls: list[str] = []
+
+    def call(provider, system_prompt, user_message, model):
+        calls.append(provider)
+        time.sleep(0.2)
+        return provider, 1, 1
+
+    cfg = _cfg(openai_key="openai", anthropic_key="anthropic", hedge_after_seconds=0.3, max_concurrency=1)
+    with patch("llm_client.get_config", return_value=cfg), patch(
+        "llm_client._call_provider", side_effect=call
+    ), patch.dict(llm_client._provider_slots, clear=True):
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(
+                pool.map(
+                    lambda _: llm_client.generate_text(
+                        "system", "user", provider_override="anthropic", caller="test-hedge-contended"
+                    ),
+                    range(6),
+                )
+            )
+
+    assert results == ["anthropic"] * 6
+    assert calls == ["anthropic"] * 6
+    assert llm_client.llm_metrics()["test-hedge-contended"]["hedges"] == 0
+
+
+def test_latency_excludes_time_queued_on_the_provider_slot():
+    def call(provider, system_prompt, user_message, model):
+        time.sleep(0.1)
+        return "ok", 1, 1
+
+    cfg = _cfg(anthropic_key="anthropic", max_concurrency=1)
+    with patch("llm_client.get_config", return_value=cfg), patch(
+        "llm_client._call_provider", side_effect=call
+    ), patch.dict(llm_client._provider_slots, clear=True):
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: llm_client.generate_text("system", "user", caller="test-slot-latency"), range(4)))
+
+    metrics = llm_client.llm_metrics()["test-slot-latency"]
+    assert metrics["p95_ms"] < 250
+    assert metrics["rate_limited_seconds"] >= 0.5
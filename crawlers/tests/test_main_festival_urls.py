@@ -134,3 +134,73 @@ def test_run_festival_schedules_uses_profile_render_js(monkeypatch):
     assert captured["url"] == "https://examplefest.com/program"
     assert captured["render_js"] is True
     assert stats["festivals_with_data"] == 1
+
+
+class _FakeQuery:
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, _name):
+        return lambda *args, **kwargs: self
+
+    @property
+    def not_(self):
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self._data)
+
+
+class _FakeClient:
+    def __init__(self, festivals):
+        self._festivals = festivals
+
+    def table(self, name):
+        return _FakeQuery(self._festivals if name == "festivals" else [])
+
+
+def test_run_festival_schedules_merges_results_and_stops_after_first_hit(monkeypatch):
+    import crawl_festival_schedule
+    import db
+
+    festivals = [
+        {"slug": "alpha-fest", "name": "Alpha Fest", "website": "https://alpha.example"},
+        {"slug": "beta-fest", "name": "Beta Fest", "website": "https://beta.example"},
+        {"slug": "gamma-fest", "name": "Gamma Fest", "website": "https://gamma.example"},
+    ]
+    monkeypatch.setattr(db, "get_client", lambda: _FakeClient(festivals))
+    monkeypatch.setattr(crawl_festival_schedule, "start_playwright_pool", lambda size=2: None)
+    monkeypatch.setattr(crawl_festival_schedule, "stop_playwright_pool", lambda: None)
+    monkeypatch.setattr(
+        main,
+        "_build_festival_schedule_candidate_urls",
+        lambda website, source_url, profile_urls, discover_links=False: [
+            f"{website}/schedule",
+            f"{website}/program",
+        ],
+    )
+
+    calls = []
+
+    def fake_crawl(slug, url, render_js, use_llm, dry_run):
+        calls.append(url)
+        if slug == "alpha-fest":
+            return 4, 2, 2
+        if slug == "beta-fest" and url.endswith("/program"):
+            return 3, 3, 0
+        if slug == "gamma-fest":
+            raise RuntimeError("boom")
+        return 0, 0, 0
+
+    monkeypatch.setattr(crawl_festival_schedule, "crawl_festival_schedule", fake_crawl)
+
+    stats = main.run_festival_schedules()
+
+    assert stats == {
+        "festivals_processed": 3,
+        "festivals_with_data": 2,
+        "sessions_found": 7,
+        "sessions_inserted": 5,
+    }
+    assert "https://alpha.example/program" not in calls
+    assert "https://beta.example/program" in calls
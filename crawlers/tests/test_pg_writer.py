@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import db.events as events
+from db import pg_writer
+
+
+def _config(backend: str, url: str = "postgresql://localhost/lostcity"):
+    database = SimpleNamespace(write_backend=backend, active_database_url=url, write_pool_size=4)
+    return SimpleNamespace(database=database)
+
+
+@pytest.fixture
+def direct(monkeypatch):
+    monkeypatch.setattr(pg_writer, "get_config", lambda: _config("direct"))
+    calls: list[tuple] = []
+    for name in ("upsert_rows", "update_rows", "delete_rows", "bulk_update"):
+        monkeypatch.setattr(
+            pg_writer, name, lambda *args, _n=name, **kwargs: calls.append((_n, args, kwargs)) or 0
+        )
+    client = MagicMock()
+    monkeypatch.setattr(events, "get_client", lambda: client)
+    return SimpleNamespace(calls=calls, client=client)
+
+
+def test_backend_selection_follows_config(monkeypatch):
+    monkeypatch.setattr(pg_writer, "get_config", lambda: _config("rest"))
+    assert pg_writer.direct_writes_enabled() is False
+
+    monkeypatch.setattr(pg_writer, "get_config", lambda: _config("direct", url=""))
+    assert pg_writer.direct_writes_enabled() is False
+
+    monkeypatch.setattr(pg_writer, "get_config", lambda: _config("DIRECT"))
+    assert pg_writer.direct_writes_enabled() is True
+
+
+def test_child_upserts_become_one_multi_row_statement(direct):
+    events.upsert_event_images(7, ["https://x/a.jpg", {"url": "https://x/b.jpg"}, "https://x/a.jpg"])
+    events.upsert_event_links(7, [{"type": "ticket", "url": "https://t/1"}])
+
+    (images, links) = direct.calls
+    assert images[0] == "upsert_rows"
+    assert images[1][0] == "event_images"
+    assert [row["url"] for row in images[1][1]] == ["https://x/a.jpg", "https://x/b.jpg"]
+    assert images[1][2] == ("event_id", "url")
+    assert links[1][2] == ("event_id", "type", "url")
+    direct.client.table.assert_not_called()
+
+
+def test_stale_removal_and_tag_backfill_use_set_based_writes(direct):
+    direct.client.table.return_value.select.return_value.eq.return_value.gte.return_value.execute.return_value = (
+        SimpleNamespace(data=[{"id": 1, "content_hash": "keep"}, {"id": 2, "content_hash": "old"}])
+    )
+
+    events.remove_stale_source_events(5, {"keep"})
+    events.update_event_tags_bulk({1: ["music"], 2: []})
+
+    assert [c[0] for c in direct.calls] == ["update_rows", "delete_rows", "bulk_update"]
+    assert direct.calls[1][1] == ("events", "id", [2])
+    assert direct.calls[2][1][2] == [{"id": 1, "tags": ["music"]}, {"id": 2, "tags": []}]
+    direct.client.table.return_value.delete.assert_not_called()
+
+
+def test_rest_backend_keeps_postgrest_calls(monkeypatch):
+    monkeypatch.setattr(pg_writer, "get_config", lambda: _config("rest"))
+    client = MagicMock()
+    monkeypatch.setattr(events, "get_client", lambda: client)
+
+    assert events.update_event_tags_bulk({1: ["music"], 2: ["art"]}) == 2
+    assert client.table.return_value.update.call_count == 2
+
+
+def test_values_template_casts_to_column_types():
+    types = {"id": "bigint", "tags": "text[]", "field_provenance": "jsonb"}
+    assert pg_writer._template(("id", "tags", "title"), types) == "(%s::bigint, %s::text[], %s)"
+    assert isinstance(pg_writer._adapt({"a": 1}, ""), pg_writer.psycopg2.extras.Json)
+    assert isinstance(pg_writer._adapt(["a"], "jsonb"), pg_writer.psycopg2.extras.Json)
+    assert pg_writer._adapt(["a"], "text[]") == ["a"]
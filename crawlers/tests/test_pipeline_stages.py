@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from pipeline.models import DetailConfig, FetchConfig
+from pipeline.stages import iter_enriched
+
+
+class _Profile:
+    name = "Example Venue"
+
+    def __init__(self, enabled: bool = True):
+        self.detail = DetailConfig(enabled=enabled, fetch=FetchConfig())
+
+
+def _seeds(n: int) -> list[dict]:
+    return [{"title": f"Event {i}", "detail_url": f"https://example.com/e/{i}"} for i in range(n)]
+
+
+def test_yields_in_seed_order_despite_out_of_order_fetches():
+    def fetch(url, _cfg):
+        idx = int(url.rsplit("/", 1)[1])
+        time.sleep(0.02 if idx % 2 == 0 else 0.0)
+        return f"<html>{idx}</html>", None
+
+    def extract(html, url, _name, _cfg):
+        return {"html": html, "url": url}
+
+    results = list(iter_enriched(_seeds(10), _Profile(), fetch=fetch, extract=extract, fetch_workers=4))
+
+    assert [seed["title"] for seed, _ in results] == [f"Event {i}" for i in range(10)]
+    assert all(enriched["url"] == seed["detail_url"] for seed, enriched in results)
+
+
+def test_fetch_errors_and_missing_detail_urls_yield_empty_enrichment():
+    seeds = [{"title": "No URL"}, {"title": "Broken", "detail_url": "https://example.com/broken"}]
+
+    def fetch(url, _cfg):
+        return "", "timeout"
+
+    def extract(*_args):
+        raise AssertionError("extract should not run for failed fetches")
+
+    results = list(iter_enriched(seeds, _Profile(), fetch=fetch, extract=extract))
+
+    assert results == [(seeds[0], {}), (seeds[1], {})]
+
+
+def test_detail_disabled_skips_fetching():
+    def fetch(*_args):
+        raise AssertionError("detail disabled")
+
+    results = list(iter_enriched(_seeds(3), _Profile(enabled=False), fetch=fetch, extract=fetch))
+
+    assert [enriched for _, enriched in results] == [{}, {}, {}]
+
+
+def test_backpressure_bounds_work_ahead_of_consumer():
+    started: list[str] = []
+    lock = threading.Lock()
+
+    def fetch(url, _cfg):
+        with lock:
+            started.append(url)
+        return "<html></html>", None
+
+    gen = iter_enriched(
+        _seeds(20), _Profile(), fetch=fetch, extract=lambda *a: {}, fetch_workers=2, max_in_flight=3
+    )
+    next(gen)
+    time.sleep(0.05)
+    assert len(started) <= 4
+    gen.close()
+
+
+def test_extraction_errors_surface_to_consumer():
+    def extract(html, url, _name, _cfg):
+        raise ValueError("bad markup")
+
+    gen = iter_enriched(_seeds(2), _Profile(), fetch=lambda u, c: ("<p>", None), extract=extract)
+    with pytest.raises(ValueError, match="bad markup"):
+        next(gen)
+
+
+def test_freshness_index_skips_unchanged_detail_pages(tmp_path):
+    from pipeline.freshness import DetailFreshnessIndex
+
+    fetched: list[str] = []
+
+    def fetch(url, _cfg):
+        fetched.append(url)
+        return "<html></html>", None
+
+    def extract(html, url, _name, _cfg):
+        return {"description": f"About {url}", "extraction_version": "pipeline_v3"}
+
+    seeds = _seeds(3)
+    index = DetailFreshnessIndex("example", ttl_hours=24, directory=tmp_path)
+    list(iter_enriched(seeds, _Profile(), fetch=fetch, extract=extract, freshness=index))
+    index.save()
+    assert len(fetched) == 3
+
+    changed = [dict(seeds[0]), dict(seeds[1], start_date="2026-05-01"), dict(seeds[2])]
+    index = DetailFreshnessIndex("example", ttl_hours=24, directory=tmp_path)
+    results = list(iter_enriched(changed, _Profile(), fetch=fetch, extract=extract, freshness=index))
+
+    assert fetched[3:] == [seeds[1]["detail_url"]]
+    assert index.hits == 2
+    assert results[0][1]["description"] == f"About {seeds[0]['detail_url']}"
+
+    forced = DetailFreshnessIndex("example", ttl_hours=24, force_refresh=True, directory=tmp_path)
+    list(iter_enriched(seeds, _Profile(), fetch=fetch, extract=extract, freshness=forced))
+    assert len(fetched) == 7
+
+
+def test_fetch_clients_of_finished_threads_are_closed():
+    from pipeline.fetch import _http_client, close_http_clients
+
+    clients = []
+    worker = threading.Thread(target=lambda: clients.append(_http_client(5.0)))
+    worker.start()
+    worker.join()
+
+    assert close_http_clients(finished_threads_only=True) >= 1
+    assert clients[0].is_closed
+    live = _http_client(5.0)
+    assert close_http_clients(finished_threads_only=True) == 0
+    assert not live.is_closed
+    close_http_clients()
+    assert live.is_closed
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import db.client as client_mod
+import db.schema_capabilities as caps_mod
+
+
+@pytest.fixture(autouse=True)
+def _isolated_snapshot(monkeypatch):
+    caps_mod.clear_schema_capabilities()
+    monkeypatch.setattr(
+        caps_mod,
+        "get_config",
+        lambda: SimpleNamespace(database=SimpleNamespace(active_target="staging")),
+    )
+    monkeypatch.setattr(caps_mod, "latest_migration_version", lambda: "20260419000002")
+    yield
+    caps_mod.clear_schema_capabilities()
+
+
+def _columns(**overrides):
+    columns = {}
+    for req in caps_mod.CAPABILITY_REQUIREMENTS.values():
+        for table, cols in req.items():
+            columns.setdefault(table, set()).update(cols)
+    columns.update(overrides)
+    return columns
+
+
+def test_snapshot_is_persisted_and_reused(monkeypatch, tmp_path):
+    path = tmp_path / "caps.json"
+    calls = []
+
+    def fake_openapi():
+        calls.append(1)
+        return _columns(events={"id", "is_show"})
+
+    monkeypatch.setattr(caps_mod, "_introspect_openapi", fake_openapi)
+
+    snapshot = caps_mod.load_schema_capabilities(path=path)
+    assert snapshot.key == "staging:20260419000002"
+    assert snapshot.supports("events_is_show_column")
+    assert not snapshot.supports("events_image_dim_columns")
+
+    caps_mod.clear_schema_capabilities()
+    caps_mod.load_schema_capabilities(path=path)
+    assert len(calls) == 1
+
+    # A new migration changes the key and forces re-introspection.
+    monkeypatch.setattr(caps_mod, "latest_migration_version", lambda: "20260501000000")
+    caps_mod.load_schema_capabilities(path=path)
+    assert len(calls) == 2
+
+
+def test_falls_back_to_information_schema(monkeypatch, tmp_path):
+    def broken_openapi():
+        raise RuntimeError("no openapi")
+
+    monkeypatch.setattr(caps_mod, "_introspect_openapi", broken_openapi)
+    monkeypatch.setattr(caps_mod, "_introspect_information_schema", lambda: _columns())
+
+    snapshot = caps_mod.load_schema_capabilities(path=tmp_path / "caps.json")
+    assert snapshot is not None
+    assert all(snapshot.supports(name) for name in caps_mod.CAPABILITY_REQUIREMENTS)
+
+
+def test_returns_none_when_introspection_fails(monkeypatch, tmp_path):
+    def broken():
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(caps_mod, "_introspect_openapi", broken)
+    monkeypatch.setattr(caps_mod, "_introspect_information_schema", broken)
+
+    assert caps_mod.load_schema_capabilities(path=tmp_path / "caps.json") is None
+    assert caps_mod.capability_from_snapshot("events_is_show_column") is None
+
+
+def test_client_probes_answer_from_snapshot_after_reset(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        caps_mod,
+        "_introspect_openapi",
+        lambda: _columns(screening_times={"run_id"}),
+    )
+    caps_mod.load_schema_capabilities(path=tmp_path / "caps.json")
+
+    def no_client():
+        raise AssertionError("probe should not query the database")
+
+    monkeypatch.setattr(client_mod, "get_client", no_client)
+    for flag in (
+        "_EVENTS_HAS_IS_SHOW_COLUMN",
+        "_EVENTS_HAS_IMAGE_DIM_COLUMNS",
+        "_HAS_SCREENING_TABLES",
+    ):
+        monkeypatch.setattr(client_mod, flag, None)
+    client_mod.reset_client()
+
+    assert client_mod.events_support_is_show_column() is True
+    assert client_mod.events_support_image_dim_columns() is True
+    assert client_mod.screenings_support_tables() is False
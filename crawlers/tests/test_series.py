@@ -272,3 +272,118 @@ class TestGetOrCreateSeries:
 
         assert result is None
         assert client.table().execute.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# SeriesRegistry — run-scoped resolution
+# ---------------------------------------------------------------------------
+
+def _registry_with(rows, client=None):
+    from series import SeriesRegistry
+
+    registry = SeriesRegistry(client or MagicMock())
+    for row in rows:
+        registry.add(row)
+    return registry
+
+
+def test_registry_resolves_repeat_hints_in_memory_and_flushes_one_touch():
+    client = MagicMock()
+    registry = _registry_with(
+        [{"id": "s-1", "title": "Paris, Texas", "slug": "paris-texas", "series_type": "film", "director": None}],
+        client,
+    )
+    hint = {"series_type": "film", "series_title": "Paris, Texas", "director": "Wim Wenders"}
+
+    ids = {get_or_create_series(client, dict(hint), "film", registry=registry) for _ in range(300)}
+
+    assert ids == {"s-1"}
+    client.table.assert_not_called()
+    assert registry.flush() == 1
+    client.table.return_value.update.assert_called_once()
+    (written,), _ = client.table.return_value.update.call_args
+    assert written["director"] == "Wim Wenders"
+    assert "last_verified_at" in written
+
+
+def test_registry_applies_day_and_venue_scoping_like_the_queries():
+    from unittest.mock import patch
+
+    rows = [
+        {"id": "wed", "title": "Team Trivia", "slug": "team-trivia", "series_type": "recurring_show",
+         "day_of_week": "wednesday", "venue_id": 1},
+        {"id": "sun", "title": "Team Trivia", "slug": "team-trivia", "series_type": "recurring_show",
+         "day_of_week": "sunday", "venue_id": 2},
+        {"id": "open", "title": "Team Trivia", "slug": "team-trivia", "series_type": "recurring_show",
+         "day_of_week": None, "venue_id": 1},
+    ]
+    registry = _registry_with(rows)
+
+    with patch("series._detect_series_venue_column", return_value="venue_id"), patch(
+        "series.find_series_by_title", return_value=None
+    ):
+        find = registry.find_series_by_title
+        assert find(registry.client, "Team Trivia", "recurring_show", day_of_week="Wednesday", venue_id=1)["id"] == "wed"
+        assert find(registry.client, "team trivia", "recurring_show", day_of_week="sunday", venue_id=2)["id"] == "sun"
+        assert registry.db_lookups == 0
+        # No Friday row at venue 1 (cached or in the DB): claims the NULL-day
+        # series, as the DB fallback does.
+        assert find(registry.client, "Team Trivia", "recurring_show", day_of_week="friday", venue_id=1)["id"] == "open"
+        assert find(registry.client, "Team Trivia", "recurring_show", day_of_week="friday", venue_id=1)["id"] == "open"
+
+    assert registry.db_lookups == 1
+
+
+def test_registry_prefers_an_exact_day_series_in_the_db_over_a_cached_null_day_row():
+    from unittest.mock import patch
+
+    registry = _registry_with(
+        [{"id": "open", "title": "Team Trivia", "slug": "team-trivia", "series_type": "recurring_show",
+          "day_of_week": None}]
+    )
+    wednesday = {"id": "wed", "title": "Team Trivia", "slug": "team-trivia", "series_type": "recurring_show",
+                 "day_of_week": "wednesday"}
+
+    with patch("series.find_series_by_title", return_value=wednesday) as db_find:
+        row = registry.find_series_by_title(registry.client, "Team Trivia", "recurring_show", day_of_week="wednesday")
+
+    assert row["id"] == "wed"
+    assert db_find.call_count == 1
+
+
+def test_registry_creates_a_missing_series_once():
+    from unittest.mock import patch
+
+    client = MagicMock()
+    client.table.return_value.insert.return_value.execute.return_value = MagicMock(
+        data=[{"id": "new", "title": "Yoga Basics", "slug": "yoga-basics", "series_type": "class_series"}]
+    )
+    client.table.return_value.select.return_value.eq.return_value.execute.return_value = MagicMock(data=[])
+    registry = _registry_with([], client)
+    hint = {"series_type": "class_series", "series_title": "Yoga Basics"}
+
+    with patch("series.find_series_by_title", return_value=None) as db_find:
+        first = get_or_create_series(client, dict(hint), "fitness", registry=registry)
+        again = [get_or_create_series(client, dict(hint), "fitness", registry=registry) for _ in range(20)]
+
+    assert first == "new" and set(again) == {"new"}
+    assert db_find.call_count == 1
+    client.table.return_value.insert.assert_called_once()
+
+
+def test_registry_backfill_only_fills_blanks_and_coalesces():
+    client = MagicMock()
+    registry = _registry_with(
+        [{"id": "s-1", "title": "Jazz Jam", "series_type": "recurring_show", "description": "Kept", "image_url": None}],
+        client,
+    )
+
+    registry.backfill("s-1", {"description": "Replacement", "image_url": "a.jpg"})
+    registry.backfill("s-1", {"image_url": "b.jpg", "genres": ["jazz"]})
+    registry.flush()
+
+    client.table.return_value.update.assert_called_once()
+    (written,), _ = client.table.return_value.update.call_args
+    assert written["image_url"] == "a.jpg"
+    assert written["genres"] == ["jazz"]
+    assert "description" not in written
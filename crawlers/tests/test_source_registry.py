@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+import db.source_registry as registry_mod
+import db.sources as sources_mod
+
+
+class _Query:
+    def __init__(self, rows, calls):
+        self._rows = rows
+        self._calls = calls
+        self._range = None
+
+    def select(self, *_args, **_kwargs):
+        return self
+
+    def order(self, *_args, **_kwargs):
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        return self
+
+    def execute(self):
+        self._calls.append(self._range)
+        start, end = self._range
+        return SimpleNamespace(data=self._rows[start:end + 1])
+
+
+class _Client:
+    def __init__(self, tables):
+        self.tables = tables
+        self.calls: dict[str, list] = {name: [] for name in tables}
+
+    def table(self, name):
+        return _Query(self.tables[name], self.calls[name])
+
+
+@pytest.fixture
+def loaded_registry(monkeypatch):
+    sources = [
+        {"id": 1, "slug": "terminal-west", "name": "Terminal West", "is_active": True,
+         "producer_id": "live-nation", "health_tags": ["seasonal"], "active_months": [5, 6]},
+        {"id": 2, "slug": "old-venue", "name": "Old Venue", "is_active": False},
+    ]
+    portals = [{"id": "portal-uuid", "slug": "atlanta"}]
+    client = _Client({"sources": sources, "portals": portals})
+    monkeypatch.setattr(registry_mod, "get_client", lambda: client)
+    monkeypatch.setattr(
+        sources_mod,
+        "get_client",
+        lambda: (_ for _ in ()).throw(AssertionError("unexpected DB lookup")),
+    )
+    registry_mod.load_source_registry()
+    yield client
+    registry_mod.invalidate_source_registry()
+
+
+def test_lookups_are_served_from_snapshot(loaded_registry):
+    assert sources_mod.get_source_info(1)["slug"] == "terminal-west"
+    assert sources_mod.get_source_info(2)["is_active"] is False
+    assert sources_mod.get_source_by_slug("terminal-west")["id"] == 1
+    assert sources_mod.get_portal_id_by_slug("atlanta") == "portal-uuid"
+    assert [s["slug"] for s in sources_mod.get_active_sources()] == ["terminal-west"]
+    assert sources_mod.get_producer_id_for_source(1) == "live-nation"
+    assert sources_mod.get_source_health_tags(1) == (["seasonal"], [5, 6])
+    assert loaded_registry.calls == {"sources": [(0, 999)], "portals": [(0, 999)]}
+
+
+def test_invalidated_source_falls_back_to_db(loaded_registry, monkeypatch):
+    registry_mod.invalidate_source(1)
+
+    fallback_rows = [{"id": 1, "slug": "terminal-west", "name": "Terminal West (renamed)"}]
+
+    class _FallbackQuery:
+        def select(self, *_args):
+            return self
+
+        def eq(self, *_args):
+            return self
+
+        def execute(self):
+            return SimpleNamespace(data=fallback_rows)
+
+    monkeypatch.setattr(
+        sources_mod,
+        "get_client",
+        lambda: SimpleNamespace(table=lambda _name: _FallbackQuery()),
+    )
+
+    assert sources_mod.get_source_info(1)["name"] == "Terminal West (renamed)"
+    assert [s["slug"] for s in sources_mod.get_active_sources()] == []
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from db.table_reader import iter_pages, iter_rows
+
+_OR_RE = re.compile(r'(\w+)\.gt\."([^"]*)",and\(\1\.eq\."\2",(\w+)\.gt\."([^"]*)"\)')
+
+
+class _Query:
+    """Just enough PostgREST for keyset scans over an in-memory table."""
+
+    def __init__(self, table):
+        self.table = table
+        self.preds = []
+        self.orders = []
+        self.count = None
+        self.not_ = SimpleNamespace(is_=lambda col, _null: self._add(lambda r: r.get(col) is not None))
+
+    def _add(self, pred):
+        self.preds.append(pred)
+        return self
+
+    def select(self, columns):
+        self.table.selects.append(columns)
+        return self
+
+    def eq(self, col, value):
+        return self._add(lambda r: r.get(col) == value)
+
+    def gte(self, col, value):
+        return self._add(lambda r: r.get(col) is not None and r[col] >= value)
+
+    def gt(self, col, value):
+        return self._add(lambda r: r[col] > value)
+
+    def or_(self, expr):
+        lead, lead_value, tie, tie_value = _OR_RE.fullmatch(expr).groups()
+        return self._add(
+            lambda r: str(r[lead]) > lead_value
+            or (str(r[lead]) == lead_value and r[tie] > int(tie_value))
+        )
+
+    def order(self, col):
+        self.orders.append(col)
+        return self
+
+    def range(self, *_args):
+        raise AssertionError("OFFSET pagination used")
+
+    def limit(self, n):
+        self.count = n
+        return self
+
+    def execute(self):
+        rows = [r for r in self.table.rows if all(p(r) for p in self.preds)]
+        rows.sort(key=lambda r: tuple(r[c] for c in self.orders))
+        self.table.pages += 1
+        return SimpleNamespace(data=[dict(r) for r in rows[: self.count]])
+
+
+class _Client:
+    def __init__(self, rows):
+        self.rows = rows
+        self.selects: list[str] = []
+        self.pages = 0
+
+    def table(self, _name):
+        return _Query(self)
+
+
+@pytest.fixture
+def client():
+    rows = [
+        {"id": i, "start_date": f"2026-05-{1 + (i * 7) % 5:02d}", "is_active": i % 4 != 0}
+        for i in range(1, 24)
+    ]
+    rows.append({"id": 99, "start_date": None, "is_active": True})
+    return _Client(rows)
+
+
+def test_id_keyset_scan_yields_every_row_once_in_pages(client):
+    pages = list(iter_pages("events", "start_date", [("eq", ("is_active", True))], page_size=5, client=client))
+
+    ids = [row["id"] for page in pages for row in page]
+    expected = sorted(r["id"] for r in client.rows if r["is_active"])
+    assert ids == expected
+    assert [len(p) for p in pages] == [5, 5, 5, 4]
+    # The key column is projected even when the caller didn't ask for it.
+    assert client.selects[0] == "start_date,id"
+
+
+def test_composite_keyset_scan_follows_start_date_then_id(client):
+    rows = list(iter_rows("events", "id,start_date", order_by=("start_date", "id"), page_size=4, client=client))
+
+    keys = [(r["start_date"], r["id"]) for r in rows]
+    assert keys == sorted(keys)
+    assert len(keys) == 23  # NULL start_date has no place in the keyset
+
+
+def test_rows_updated_mid_scan_are_not_skipped(client):
+    # With OFFSET pagination, rows that stop matching the filter while the
+    # loop fixes them shift the following pages and get skipped.
+    expected = sorted(r["id"] for r in client.rows if r["is_active"])
+    seen = []
+    for row in iter_rows("events", "id", [("eq", ("is_active", True))], page_size=3, client=client):
+        seen.append(row["id"])
+        next(r for r in client.rows if r["id"] == row["id"])["is_active"] = False
+
+    assert seen == expected
@@ -8,6 +8,7 @@ from utils import (
     slugify,
     parse_price,
     parse_relative_date,
+    parse_date_range,
     validate_event_time,
     normalize_time_format,
     get_date_range,
@@ -147,6 +148,25 @@ class TestParseRelativeDate:
         assert result.date() == expected.date()
 
 
+class TestParseDateRange:
+    """Tests for the parse_date_range function."""
+
+    def test_range_with_shared_year(self):
+        assert parse_date_range("On View February 13 - June 28, 2026") == ("2026-02-13", "2026-06-28")
+
+    def test_range_crossing_year_end(self):
+        assert parse_date_range("Nov 1 - Feb 28, 2026") == ("2025-11-01", "2026-02-28")
+
+    def test_through_month_uses_last_day(self):
+        assert parse_date_range("Through Feb 2028") == (None, "2028-02-29")
+
+    def test_matches_strptime_edge_cases(self):
+        # "Sept" and comma-without-space are not accepted; Feb 29 without a year is rejected.
+        assert parse_date_range("Through Sept 5, 2026") == (None, None)
+        assert parse_date_range("Through May 5,2026") == (None, None)
+        assert parse_date_range("Feb 29 - Mar 10, 2028") == (None, "2028-03-10")
+
+
 class TestValidateEventTime:
     """Tests for the validate_event_time function."""
 
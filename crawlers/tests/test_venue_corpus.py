@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from venue_corpus import VenueCorpus
+
+
+class _Resp:
+    def __init__(self, url, text, status=200, content_type="text/html"):
+        self.url = url
+        self.text = text
+        self.status_code = status
+        self.headers = {"content-type": content_type}
+
+
+class _Session:
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls: list[str] = []
+
+    def get(self, url, timeout=None, allow_redirects=True):
+        self.calls.append(url)
+        status, text, content_type = self.pages.get(url, (404, "", "text/html"))
+        return _Resp(url, text, status, content_type)
+
+
+def _corpus(tmp_path, pages, **kwargs):
+    corpus = VenueCorpus(root=tmp_path, min_interval=0, **kwargs)
+    session = _Session(pages)
+    corpus._session = lambda: session
+    return corpus, session
+
+
+def test_second_read_is_served_from_disk(tmp_path):
+    url = "https://venue.example/"
+    corpus, session = _corpus(tmp_path, {url: (200, "<html>home</html>", "text/html")})
+
+    assert corpus.get(url) == "<html>home</html>"
+    corpus.close()
+
+    reopened, session2 = _corpus(tmp_path, {})
+    assert reopened.get(url) == "<html>home</html>"
+    assert session.calls == [url]
+    assert session2.calls == []
+    assert reopened.corpus_hits == 1
+
+
+def test_misses_and_non_html_are_remembered(tmp_path):
+    pdf = "https://venue.example/menu.pdf"
+    corpus, session = _corpus(tmp_path, {pdf: (200, "%PDF", "application/pdf")})
+
+    assert corpus.get("https://venue.example/gone", allow_playwright=False) is None
+    assert corpus.get(pdf) is None
+    assert corpus.get("https://venue.example/gone", allow_playwright=False) is None
+    assert corpus.get(pdf) is None
+    assert len(session.calls) == 2
+
+
+def test_only_transport_errors_count_as_failed_fetches(tmp_path):
+    import requests
+
+    corpus, session = _corpus(tmp_path, {"https://venue.example/menu.pdf": (200, "%PDF", "application/pdf")})
+    assert corpus.get("https://venue.example/menu.pdf") is None
+    assert not corpus.last_fetch_failed()
+
+    def refuse(url, timeout=None, allow_redirects=True):
+        raise requests.ConnectionError("connection reset")
+
+    session.get = refuse
+    assert corpus.get("https://down.example/", allow_playwright=False) is None
+    assert corpus.last_fetch_failed()
+    # Remembered as a miss: no new fetch, so nothing failed this time.
+    assert corpus.get("https://down.example/", allow_playwright=False) is None
+    assert not corpus.last_fetch_failed()
+
+
+def test_offline_mode_never_touches_the_network(tmp_path):
+    corpus, session = _corpus(tmp_path, {"https://venue.example/": (200, "<p>x</p>", "")}, offline=True)
+
+    assert corpus.get("https://venue.example/") is None
+    assert session.calls == []
+
+
+def test_crawl_site_picks_relevant_same_site_subpages(tmp_path):
+    home = (
+        '<a href="/menu">Menu</a><a href="/hours-and-location">Visit</a>'
+        '<a href="/careers">Jobs</a><a href="https://other.example/menu">Elsewhere</a>'
+    )
+    pages = {
+        "https://venue.example": (200, home, "text/html"),
+        "https://venue.example/menu": (200, "<p>menu</p>", "text/html"),
+        "https://venue.example/hours-and-location": (200, "<p>hours</p>", "text/html"),
+    }
+    corpus, session = _corpus(tmp_path, pages)
+
+    crawled = corpus.crawl_site("https://venue.example")
+
+    assert set(crawled) == {
+        "https://venue.example",
+        "https://venue.example/menu",
+        "https://venue.example/hours-and-location",
+    }
+    assert "https://venue.example/careers" not in session.calls
+    assert "https://other.example/menu" not in session.calls
+
+
+def test_sitemap_served_as_xml_is_parsed(tmp_path):
+    sitemap = "https://venue.example/sitemap.xml"
+    body = (
+        '<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://venue.example/specials</loc></url>"
+        "<url><loc>https://other.example/page</loc></url></urlset>"
+    )
+    corpus, session = _corpus(tmp_path, {sitemap: (200, body, "application/xml; charset=utf-8")})
+
+    assert corpus.get(sitemap) is None
+    assert corpus.sitemap_urls("https://venue.example/") == ["https://venue.example/specials"]
+    assert corpus.sitemap_urls("https://venue.example/") == ["https://venue.example/specials"]
+    assert session.calls == [sitemap, sitemap]
+
+
+def test_browser_start_failure_fails_renders_instead_of_hanging():
+    import builtins
+    from unittest.mock import patch
+
+    from venue_corpus import _BrowserThread
+
+    real_import = builtins.__import__
+
+    def no_playwright(name, *args, **kwargs):
+        if name.startswith("playwright"):
+            raise ImportError("playwright not installed")
+        return real_import(name, *args, **kwargs)
+
+    browser = _BrowserThread()
+    with patch("builtins.__import__", side_effect=no_playwright):
+        assert browser.render("https://venue.example/", timeout_ms=1000) is None
+    assert browser._failed is not None and browser._thread is None
+    assert browser.render("https://venue.example/other", timeout_ms=1000) is None
@@ -10,10 +10,11 @@ import time
 import socket
 import ipaddress
 import logging
-from functools import wraps
+import calendar
+from functools import lru_cache, wraps
 from typing import Callable, TypeVar, Optional, Dict, Tuple
 from typing_extensions import ParamSpec
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import requests
 from bs4 import BeautifulSoup
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -97,6 +98,58 @@ _MONTH_MAP = {
 }
 
 
+_MONTH_NAME = "(" + "|".join(sorted(_MONTH_MAP, key=len, reverse=True)) + ")"
+# Day-of-month as strptime's %d accepts it.
+_DAY_OF_MONTH = r"(3[01]|[12]\d|0[1-9]|[1-9])"
+_MONTH_DAY_YEAR_RE = re.compile(rf"{_MONTH_NAME}\s+{_DAY_OF_MONTH}(?:,\s+|\s+)(\d{{4}})", re.IGNORECASE)
+_MONTH_DAY_RE = re.compile(rf"{_MONTH_NAME}\s+{_DAY_OF_MONTH}", re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(rf"{_MONTH_NAME}\s+(\d{{4}})", re.IGNORECASE)
+
+_DATE_RANGE_RE = re.compile(
+    r"(?:On View\s+|Opens?\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*\d{4})?)"
+    r"\s*[-–—]\s*"
+    r"([A-Za-z]+\s+\d{1,2},?\s*\d{4})",
+    re.IGNORECASE,
+)
+_THROUGH_DATE_RE = re.compile(
+    r"(?:through|thru|until|now through|runs? through)\s+"
+    r"([A-Za-z]+\s+\d{1,2},?\s*\d{4}|[A-Za-z]+\s+\d{4})",
+    re.IGNORECASE,
+)
+
+
+def _parse_month_day_year(s: str) -> Optional[str]:
+    """Parse 'Month DD, YYYY' or 'Month DD YYYY' into YYYY-MM-DD."""
+    m = _MONTH_DAY_YEAR_RE.fullmatch(s.strip().rstrip("."))
+    if not m:
+        return None
+    try:
+        return date(int(m.group(3)), _MONTH_MAP[m.group(1).lower()], int(m.group(2))).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_month_day(s: str, ref_year: int) -> Optional[str]:
+    """Parse 'Month DD' into YYYY-MM-DD using ref_year."""
+    m = _MONTH_DAY_RE.fullmatch(s.strip().rstrip("."))
+    if not m:
+        return None
+    try:
+        # Validated against 1900 (like strptime's default), so Feb 29 is rejected.
+        return date(1900, _MONTH_MAP[m.group(1).lower()], int(m.group(2))).replace(year=ref_year).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_month_year(s: str) -> Optional[str]:
+    """Parse 'Month YYYY' into YYYY-MM-DD (last day of month)."""
+    m = _MONTH_YEAR_RE.fullmatch(s.strip().rstrip("."))
+    if not m:
+        return None
+    year, month = int(m.group(2)), _MONTH_MAP[m.group(1).lower()]
+    return date(year, month, calendar.monthrange(year, month)[1]).isoformat()
+
+
 def parse_date_range(text: str, reference_year: int = None) -> Tuple[Optional[str], Optional[str]]:
     """Parse exhibition/event date ranges into (start_date, end_date).
 
@@ -115,54 +168,15 @@ def parse_date_range(text: str, reference_year: int = None) -> Tuple[Optional[st
     """
     if not text:
         return None, None
+    # The result depends only on the text (years come from the range itself),
+    # and exhibition pages repeat the same strings on every crawl.
+    return _parse_date_range_text(" ".join(text.split()))
 
-    text = " ".join(text.split())  # normalize whitespace
-    reference_year or datetime.now().year
-
-    def _parse_month_day_year(s: str) -> Optional[str]:
-        """Parse 'Month DD, YYYY' or 'Month DD YYYY' into YYYY-MM-DD."""
-        s = s.strip().rstrip(".")
-        for fmt in ["%B %d, %Y", "%b %d, %Y", "%B %d %Y", "%b %d %Y"]:
-            try:
-                return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
-
-    def _parse_month_day(s: str, ref_year: int) -> Optional[str]:
-        """Parse 'Month DD' into YYYY-MM-DD using ref_year."""
-        s = s.strip().rstrip(".")
-        for fmt in ["%B %d", "%b %d"]:
-            try:
-                dt = datetime.strptime(s, fmt).replace(year=ref_year)
-                return dt.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
-
-    def _parse_month_year(s: str) -> Optional[str]:
-        """Parse 'Month YYYY' into YYYY-MM-DD (last day of month)."""
-        s = s.strip().rstrip(".")
-        for fmt in ["%B %Y", "%b %Y"]:
-            try:
-                dt = datetime.strptime(s, fmt)
-                # Use last day of month
-                if dt.month == 12:
-                    last = dt.replace(day=31)
-                else:
-                    last = dt.replace(month=dt.month + 1, day=1) - timedelta(days=1)
-                return last.strftime("%Y-%m-%d")
-            except ValueError:
-                continue
-        return None
 
+@lru_cache(maxsize=4096)
+def _parse_date_range_text(text: str) -> Tuple[Optional[str], Optional[str]]:
     # Pattern 1: "Month DD - Month DD, YYYY" or "Month DD, YYYY - Month DD, YYYY"
-    m = re.search(
-        r"(?:On View\s+|Opens?\s+)?([A-Za-z]+\s+\d{1,2}(?:,\s*\d{4})?)"
-        r"\s*[-–—]\s*"
-        r"([A-Za-z]+\s+\d{1,2},?\s*\d{4})",
-        text, re.IGNORECASE,
-    )
+    m = _DATE_RANGE_RE.search(text)
     if m:
         start_str, end_str = m.group(1).strip(), m.group(2).strip()
         end_date = _parse_month_day_year(end_str)
@@ -171,15 +185,11 @@ def parse_date_range(text: str, reference_year: int = None) -> Tuple[Optional[st
             start_date = _parse_month_day_year(start_str) or _parse_month_day(start_str, end_yr)
             if start_date and start_date > end_date:
                 # Start month is in previous year (e.g., Nov 1 - Feb 28, 2026)
-                start_date = datetime.strptime(start_date, "%Y-%m-%d").replace(year=end_yr - 1).strftime("%Y-%m-%d")
+                start_date = date.fromisoformat(start_date).replace(year=end_yr - 1).isoformat()
             return start_date, end_date
 
     # Pattern 2: "Through/Until/Thru Month DD, YYYY" or "Through Month YYYY"
-    m = re.search(
-        r"(?:through|thru|until|now through|runs? through)\s+"
-        r"([A-Za-z]+\s+\d{1,2},?\s*\d{4}|[A-Za-z]+\s+\d{4})",
-        text, re.IGNORECASE,
-    )
+    m = _THROUGH_DATE_RE.search(text)
     if m:
         end_str = m.group(1).strip()
         end_date = _parse_month_day_year(end_str) or _parse_month_year(end_str)
@@ -845,8 +855,8 @@ def enrich_event_record(event_record: dict, source_name: str = "") -> dict:
 
     try:
         from db import _should_promote_incoming_ticket_url
+        from extractors.offload import run_extraction
         from pipeline.fetch import fetch_html
-        from pipeline.detail_enrich import enrich_from_detail
         from pipeline.models import DetailConfig
 
         html, error = fetch_html(detail_url)
@@ -860,7 +870,7 @@ def enrich_event_record(event_record: dict, source_name: str = "") -> dict:
             use_heuristic=True,
             use_llm=True,
         )
-        enriched = enrich_from_detail(html, detail_url, source_name, config)
+        enriched = run_extraction("detail", html, detail_url, source_name, config)
 
         # Apply enriched fields — only fill gaps
         if not has_good_desc and enriched.get("description"):
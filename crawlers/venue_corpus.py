@@ -0,0 +1,512 @@
+"""
+Shared venue-website corpus for place enrichers.
+
+The place enrichers (specials, hours, images, descriptions, menus, parking,
+logos, LLM place enrichment, and the venue web metadata fetched on place
+creation) each used to download the same venue homepages and subpages, each
+with its own ``time.sleep(1)`` and, for some, its own Playwright browser.
+
+This module fetches a URL once per freshness window and keeps the gzip'd HTML
+under ``.cache/venue_corpus/`` with a JSON index (URL -> file, status, final
+URL, fetch time).  Enrichers call ``get_venue_corpus().get(url)`` and run as
+offline extractors over the stored HTML; only stale or unseen URLs hit the
+network.  Failed fetches are remembered too (for a shorter window) so a dead
+site is not retried by every enricher.
+
+Network fetches share a pooled session with per-domain pacing (different venues
+are fetched in parallel, the same host is never hammered) and fall back to one
+shared headless browser for bot-protected sites.
+
+The corpus stage can also be run up front so the enrichers never touch the
+network:
+
+    python venue_corpus.py --limit 500            # homepage + relevant subpages
+    python venue_corpus.py --max-age-hours 24     # refresh anything older
+
+Set ``VENUE_CORPUS_OFFLINE=1`` to make enrichers read the corpus only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urljoin, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+
+from feed_fetcher import DomainPacer
+
+logger = logging.getLogger(__name__)
+
+CORPUS_DIR = Path(__file__).resolve().parent / ".cache" / "venue_corpus"
+DEFAULT_MAX_AGE_HOURS = 7 * 24
+# Failed fetches are retried sooner than successful pages are refreshed.
+NEGATIVE_MAX_AGE_HOURS = 24
+DEFAULT_MIN_INTERVAL_SECONDS = 1.0
+DEFAULT_TIMEOUT_SECONDS = 10
+SITE_CRAWL_MAX_PAGES = 8
+SITE_CRAWL_WORKERS = 8
+# Slack over a render's page timeout before the caller stops waiting for it.
+BROWSER_RESULT_GRACE_SECONDS = 15
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Subpages the enrichers care about (menus, hours, specials, parking, about...).
+RELEVANT_PATH_KEYWORDS = (
+    "menu", "food", "drink", "happy", "special", "deal", "hour", "visit",
+    "about", "story", "parking", "direction", "location", "contact", "event",
+    "calendar", "brunch", "trivia", "weekly",
+)
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+class _BrowserThread:
+    """One headless Chromium owned by a dedicated thread.
+
+    The sync Playwright API is bound to the thread that started it, so callers
+    on any thread submit URLs through a queue and wait on a Future.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # Set when the browser can't start; later renders give up at once.
+        self._failed: Optional[BaseException] = None
+
+    def render(self, url: str, timeout_ms: int = 30000) -> Optional[str]:
+        future: Future = Future()
+        with self._lock:
+            if self._failed is not None:
+                return None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="venue-corpus-browser", daemon=True
+                )
+                self._thread.start()
+            self._queue.put((url, timeout_ms, future))
+        try:
+            return future.result(timeout=timeout_ms / 1000 + BROWSER_RESULT_GRACE_SECONDS)
+        except Exception as e:
+            logger.debug("Browser fetch failed for %s: %s", url, e)
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join(timeout=30)
+                self._thread = None
+
+    def _run(self) -> None:
+        try:
+            from playwright.sync_api import sync_playwright
+
+            playwright = sync_playwright().start()
+            try:
+                browser = playwright.chromium.launch(headless=True)
+            except Exception:
+                playwright.stop()
+                raise
+        except Exception as e:
+            logger.warning("Venue corpus browser unavailable: %s", e)
+            with self._lock:
+                self._failed = e
+                self._thread = None
+            # Renders are queued under the lock, so everything queued before
+            # _failed was set is drained here and nothing is queued after.
+            self._fail_pending(e)
+            return
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    return
+                url, timeout_ms, future = item
+                try:
+                    context = browser.new_context(
+                        user_agent=USER_AGENT,
+                        viewport={"width": 1920, "height": 1080},
+                    )
+                    try:
+                        page = context.new_page()
+                        page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+                        page.wait_for_timeout(2000)
+                        future.set_result(page.content())
+                    finally:
+                        context.close()
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            browser.close()
+            playwright.stop()
+
+    def _fail_pending(self, exc: Exception) -> None:
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                item[2].set_exception(exc)
+
+
+class VenueCorpus:
+    """Disk-backed, freshness-windowed store of venue website HTML."""
+
+    def __init__(
+        self,
+        root: Path = CORPUS_DIR,
+        max_age_hours: float = DEFAULT_MAX_AGE_HOURS,
+        offline: bool = False,
+        min_interval: float = DEFAULT_MIN_INTERVAL_SECONDS,
+    ):
+        self._root = root
+        self._index_path = root / "index.json"
+        self._max_age_seconds = max_age_hours * 3600
+        self._negative_max_age_seconds = min(max_age_hours, NEGATIVE_MAX_AGE_HOURS) * 3600
+        self.offline = offline
+        self._pacer = DomainPacer(min_interval)
+        self._browser = _BrowserThread()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._index: dict[str, dict] = {}
+        self._unsaved = 0
+        self.network_fetches = 0
+        self.corpus_hits = 0
+        self._load_index()
+
+    # ----- index -----
+
+    def _load_index(self) -> None:
+        try:
+            with open(self._index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict):
+            self._index = {k: v for k, v in data.items() if isinstance(v, dict)}
+
+    def save(self) -> None:
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return
+                snapshot = dict(self._index)
+                self._unsaved = 0
+            try:
+                self._root.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._index_path.with_suffix(".tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(snapshot, f, sort_keys=True)
+                tmp_path.replace(self._index_path)
+            except OSError as exc:
+                logger.warning("Could not save venue corpus index: %s", exc)
+
+    def close(self) -> None:
+        """Persist the index and shut down the shared browser."""
+        self.save()
+        self._browser.close()
+
+    def entry(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._index.get(url)
+            return dict(entry) if entry else None
+
+    def _is_fresh(self, entry: dict, max_age_seconds: Optional[float]) -> bool:
+        age = time.time() - float(entry.get("fetched_at") or 0.0)
+        if entry.get("file"):
+            limit = self._max_age_seconds if max_age_seconds is None else max_age_seconds
+        else:
+            limit = self._negative_max_age_seconds
+        return age < limit
+
+    def _read(self, entry: dict) -> Optional[str]:
+        try:
+            with gzip.open(self._root / entry["file"], "rt", encoding="utf-8") as f:
+                return f.read()
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _store(self, url: str, html: Optional[str], status: int, final_url: str, via: str) -> None:
+        entry = {
+            "fetched_at": time.time(),
+            "status": status,
+            "final_url": final_url,
+            "via": via,
+            "file": None,
+        }
+        if html:
+            name = f"{_url_key(url)}.html.gz"
+            try:
+                self._root.mkdir(parents=True, exist_ok=True)
+                with gzip.open(self._root / name, "wt", encoding="utf-8") as f:
+                    f.write(html)
+                entry["file"] = name
+            except OSError as exc:
+                logger.debug("Could not store corpus page %s: %s", url, exc)
+        with self._lock:
+            self._index[url] = entry
+            self._unsaved += 1
+            should_save = self._unsaved >= 50
+        if should_save:
+            self.save()
+
+    # ----- fetching -----
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            self._local.session = session
+        return session
+
+    def get(
+        self,
+        url: str,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        allow_playwright: bool = True,
+        render_js: bool = False,
+        max_age_hours: Optional[float] = None,
+        accept_xml: bool = False,
+    ) -> Optional[str]:
+        """Return HTML for ``url`` from the corpus, fetching it if stale or unseen.
+
+        ``render_js`` skips the plain HTTP attempt and renders in the shared
+        browser.  Returns None for non-HTML responses (``accept_xml`` also
+        keeps XML ones, e.g. sitemaps) and failed fetches.
+        """
+        if not url:
+            return None
+        max_age_seconds = None if max_age_hours is None else max_age_hours * 3600
+        self._local.transport_failed = False
+        entry = self.entry(url)
+        if accept_xml and entry and not entry.get("file") and entry.get("status") == 200:
+            # Remembered as non-HTML by a caller that did not accept XML.
+            entry = None
+        if entry and (
+            self.offline
+            or (self._is_fresh(entry, max_age_seconds) and (entry.get("file") or not render_js))
+        ):
+            if not entry.get("file"):
+                return None
+            html = self._read(entry)
+            if html is not None:
+                self.corpus_hits += 1
+                self._local.last_source = "corpus"
+                return html
+        self._local.last_source = None
+        if self.offline:
+            return None
+
+        self.network_fetches += 1
+        status, final_url, html = 0, url, None
+        if not render_js:
+            try:
+                self._pacer.wait(url)
+                resp = self._session().get(url, timeout=timeout, allow_redirects=True)
+                status, final_url = resp.status_code, resp.url
+                content_type = resp.headers.get("content-type", "").lower()
+                if status == 200 and (
+                    not content_type or "html" in content_type or (accept_xml and "xml" in content_type)
+                ):
+                    html = resp.text
+                elif status == 200:
+                    self._store(url, None, status, final_url, "requests")
+                    return None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._local.transport_failed = True
+                logger.debug("Corpus fetch failed for %s: %s", url, e.__class__.__name__)
+            except requests.RequestException as e:
+                logger.debug("Corpus fetch failed for %s: %s", url, e)
+
+        via = "requests"
+        if html is None and allow_playwright and (render_js or status in (0, 403)):
+            html = self._browser.render(url)
+            via = "playwright"
+            if html:
+                status = 200
+
+        self._store(url, html, status, final_url, via)
+        self._local.last_source = via if html else None
+        return html
+
+    def last_source(self) -> Optional[str]:
+        """Where this thread's last ``get`` was served from: "corpus",
+        "requests", "playwright" (a real browser render), or None on a miss."""
+        return getattr(self._local, "last_source", None)
+
+    def last_fetch_failed(self) -> bool:
+        """Whether this thread's last ``get`` hit a connection error or timeout
+        (not a cached miss, HTTP error or non-HTML response)."""
+        return getattr(self._local, "transport_failed", False)
+
+    def sitemap_urls(self, base_url: str, timeout: float = 5) -> list[str]:
+        """Same-domain page URLs listed in ``/sitemap.xml`` (corpus-cached)."""
+        sitemap_url = base_url.rstrip("/") + "/sitemap.xml"
+        body = self.get(sitemap_url, timeout=timeout, allow_playwright=False, accept_xml=True)
+        if not body:
+            return []
+        base_netloc = urlparse(base_url).netloc
+        try:
+            root = ET.fromstring(body)
+        except ET.ParseError:
+            return []
+        urls = []
+        for elem in root.iter():
+            if elem.tag.endswith("loc") and elem.text:
+                loc = elem.text.strip()
+                if urlparse(loc).netloc == base_netloc:
+                    urls.append(loc)
+        return urls
+
+    def crawl_site(self, website: str, max_pages: int = SITE_CRAWL_MAX_PAGES) -> dict[str, str]:
+        """Homepage plus the most relevant same-site subpages, as ``{url: html}``."""
+        pages: dict[str, str] = {}
+        homepage = self.get(website)
+        if not homepage:
+            return pages
+        pages[website] = homepage
+
+        base_netloc = urlparse(website).netloc
+        base_normalized = website.rstrip("/")
+        scored: dict[str, int] = {}
+        candidates = list(self.sitemap_urls(website))
+        soup = BeautifulSoup(homepage, "html.parser")
+        candidates.extend(urljoin(website, a["href"]) for a in soup.find_all("a", href=True))
+        for candidate in candidates:
+            parsed = urlparse(candidate)
+            if parsed.scheme not in ("http", "https") or parsed.netloc != base_netloc:
+                continue
+            clean = candidate.split("#")[0].rstrip("/")
+            if clean == base_normalized:
+                continue
+            path = parsed.path.lower()
+            score = sum(1 for kw in RELEVANT_PATH_KEYWORDS if kw in path)
+            if score:
+                scored[clean] = max(scored.get(clean, 0), score)
+
+        for url, _ in sorted(scored.items(), key=lambda kv: kv[1], reverse=True)[:max_pages]:
+            html = self.get(url)
+            if html:
+                pages[url] = html
+        return pages
+
+
+_CORPUS: Optional[VenueCorpus] = None
+_CORPUS_LOCK = threading.Lock()
+
+
+def get_venue_corpus() -> VenueCorpus:
+    """Process-wide corpus shared by every enricher."""
+    global _CORPUS
+    with _CORPUS_LOCK:
+        if _CORPUS is None:
+            offline = os.getenv("VENUE_CORPUS_OFFLINE", "").strip().lower() in ("1", "true", "yes")
+            _CORPUS = VenueCorpus(offline=offline)
+            atexit.register(close_venue_corpus)
+        return _CORPUS
+
+
+def close_venue_corpus() -> None:
+    """Persist the shared corpus index and release its browser."""
+    global _CORPUS
+    with _CORPUS_LOCK:
+        corpus, _CORPUS = _CORPUS, None
+    if corpus is not None:
+        corpus.close()
+
+
+def _venues_with_websites(limit: Optional[int]) -> list[dict]:
+    from db import get_client
+
+    client = get_client()
+    rows: list[dict] = []
+    offset = 0
+    page_size = 1000
+    while True:
+        batch = (
+            client.table("places")
+            .select("id, slug, website")
+            .eq("is_active", True)
+            .not_.is_("website", "null")
+            .order("id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+        ).data or []
+        rows.extend(r for r in batch if (r.get("website") or "").startswith("http"))
+        if len(batch) < page_size or (limit and len(rows) >= limit):
+            break
+        offset += page_size
+    return rows[:limit] if limit else rows
+
+
+def main() -> None:
+    from utils import setup_logging
+
+    parser = argparse.ArgumentParser(description="Crawl venue websites into the shared corpus")
+    parser.add_argument("--limit", type=int, default=0, help="Max venues to crawl")
+    parser.add_argument(
+        "--max-age-hours",
+        type=float,
+        default=DEFAULT_MAX_AGE_HOURS,
+        help="Re-fetch pages older than this",
+    )
+    parser.add_argument("--max-pages", type=int, default=SITE_CRAWL_MAX_PAGES)
+    parser.add_argument("--workers", type=int, default=SITE_CRAWL_WORKERS)
+    args = parser.parse_args()
+
+    setup_logging()
+    global _CORPUS
+    _CORPUS = VenueCorpus(max_age_hours=args.max_age_hours)
+    venues = _venues_with_websites(args.limit or None)
+    logger.info("Crawling %d venue websites into %s", len(venues), CORPUS_DIR)
+
+    pages = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            for crawled in pool.map(
+                lambda v: _CORPUS.crawl_site(v["website"], max_pages=args.max_pages), venues
+            ):
+                pages += len(crawled)
+    finally:
+        corpus = _CORPUS
+        close_venue_corpus()
+
+    logger.info(
+        "Corpus stage done: %d pages across %d venues (%d network fetches, %d corpus hits)",
+        pages,
+        len(venues),
+        corpus.network_fetches,
+        corpus.corpus_hits,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -68,83 +68,23 @@ def _is_in_active_season(active_months: Optional[list[int]]) -> bool:
 
 def _get_source_run_history() -> list[dict]:
     """
-    Query active sources from the `sources` table and compute run stats.
+    Run stats for every active source, read from the shared health snapshot.
 
-    For each active source, fetches the last 10 successful crawl_logs entries
-    and computes:
+    For each active source, the snapshot holds events_found from its last 10
+    successful crawl_logs entries (one windowed query for the whole fleet),
+    from which it computes:
       - recent_avg: mean of events_found across those entries
       - last_found: events_found from the most recent entry
       - consecutive_zeros: how many leading 0s appear from the most recent entry
 
-    Also reads `health_tags` and `active_months` from the source row.
+    Sources without history are skipped; regressions need a baseline.
 
     Returns a list of dicts with keys:
       slug, name, recent_avg, last_found, consecutive_zeros, health_tags, active_months
     """
-    from db.client import get_client
+    from health_analytics import load_source_health_snapshot
 
-    client = get_client()
-
-    # Fetch all active sources.
-    sources_resp = (
-        client.table("sources")
-        .select("id, slug, name, health_tags, active_months")
-        .eq("is_active", True)
-        .execute()
-    )
-
-    sources = sources_resp.data or []
-    results: list[dict] = []
-
-    for source in sources:
-        slug = source.get("slug") or ""
-        name = source.get("name") or slug
-        health_tags: list[str] = source.get("health_tags") or []
-        active_months: list[int] = source.get("active_months") or []
-
-        # Fetch last 10 successful crawl_log entries for this source.
-        source_id = source.get("id")
-        if not source_id:
-            continue
-        logs_resp = (
-            client.table("crawl_logs")
-            .select("events_found")
-            .eq("source_id", source_id)
-            .eq("status", "success")
-            .order("started_at", desc=True)
-            .limit(10)
-            .execute()
-        )
-        logs = logs_resp.data or []
-
-        if not logs:
-            # No history — skip; can't compute regressions without a baseline.
-            continue
-
-        counts = [row.get("events_found") or 0 for row in logs]
-        recent_avg = sum(counts) / len(counts)
-        last_found = counts[0]
-
-        consecutive_zeros = 0
-        for c in counts:
-            if c == 0:
-                consecutive_zeros += 1
-            else:
-                break
-
-        results.append(
-            {
-                "slug": slug,
-                "name": name,
-                "recent_avg": recent_avg,
-                "last_found": last_found,
-                "consecutive_zeros": consecutive_zeros,
-                "health_tags": health_tags,
-                "active_months": active_months,
-            }
-        )
-
-    return results
+    return load_source_health_snapshot().run_history()
 
 
 # --- Public API ---